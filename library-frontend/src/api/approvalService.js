@@ -115,5 +115,53 @@ export const approvalService = {
             console.error("Error reviewing request:", error);
             throw error.response?.data || error;
         }
+    },
+
+    // ============================================================
+    // 📑 PAGINATED QUEUES + BADGE COUNTS (bade backlog ke liye)
+    // ============================================================
+
+    /**
+     * ADMIN: Ek page. kind = 'upload' | 'access'
+     * filters: { status, book_id, ... } | Agla page: nextCursor wapas bhejein.
+     */
+    getQueuePage: async (kind, filters = {}, cursor = null, limit = 50) => {
+        try {
+            const params = { ...filters, limit };
+            if (cursor) params.cursor = cursor;
+            const response = await apiClient.get(`${BASE_URL}/${kind}/queue`, { params });
+            return { items: response.data, nextCursor: response.headers['x-next-cursor'] || null };
+        } catch (error) {
+            console.error("Error fetching request queue:", error);
+            throw error.response?.data || error;
+        }
+    },
+
+    /**
+     * ADMIN: Status-wise counts -> { total, counts: { Pending: n, ... } }
+     */
+    getQueueSummary: async (kind) => {
+        try {
+            const response = await apiClient.get(`${BASE_URL}/${kind}/summary`);
+            return response.data;
+        } catch (error) {
+            console.error("Error fetching request summary:", error);
+            throw error.response?.data || error;
+        }
+    },
+
+    /**
+     * ADMIN: Batch review. kind = 'upload' | 'access'
+     * items: [{ id, status: 'Approved' | 'Rejected', remarks }] (max 500)
+     * Response: { updated, failed, results: [{ id, ok, status, detail }] }
+     */
+    reviewBatch: async (kind, items) => {
+        try {
+            const response = await apiClient.post(`${BASE_URL}/${kind}/review-batch`, { items });
+            return response.data;
+        } catch (error) {
+            console.error("Error in batch review:", error);
+            throw error.response?.data || error;
+        }
     }
 };
\ No newline at end of file
@@ -30,6 +30,17 @@ export const bookService = {
         }
     },
 
+    /**
+     * Delta sync (api/catalogSync.js): `since` ke baad badli / hatayi gayi books.
+     * Returns { token, has_more, reset, changed, deleted, readable_ids }.
+     */
+    async getBookChanges(since = null, limit = 500) {
+        const params = { limit };
+        if (since) params.since = since;
+        const response = await apiClient.get('/api/books/changes', { params });
+        return response.data;
+    },
+
     async getBookById(bookId) {
         try {
             const response = await apiClient.get(`/api/books/${bookId}/`);
@@ -0,0 +1,127 @@
+// src/api/catalogSync.js
+import { bookService } from './bookService';
+import { API_BASE_URL, ACCESS_TOKEN_KEY } from './apiClient';
+
+const DB_NAME = 'kil-catalog';
+const DB_VERSION = 1;
+const BOOKS = 'books';
+const META = 'meta';
+const TOKEN_KEY = 'sync_token';
+
+/**
+ * Catalog ki local copy (IndexedDB) + delta sync (/api/books/changes).
+ * Pehli visit par poora catalog aata hai, uske baad sirf badli hui books -
+ * har page visit par poora catalog dobara download nahi hota.
+ *
+ * `user_has_access` har sync par server ke `readable_ids` se dobara nikalta hai
+ * (access grant hone se book khud nahi badalti).
+ */
+const openDb = () => new Promise((resolve, reject) => {
+    const request = indexedDB.open(DB_NAME, DB_VERSION);
+    request.onupgradeneeded = () => {
+        const db = request.result;
+        if (!db.objectStoreNames.contains(BOOKS)) db.createObjectStore(BOOKS, { keyPath: 'id' });
+        if (!db.objectStoreNames.contains(META)) db.createObjectStore(META);
+    };
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+});
+
+const promisify = (request) => new Promise((resolve, reject) => {
+    request.onsuccess = () => resolve(request.result);
+    request.onerror = () => reject(request.error);
+});
+
+const applyPage = (db, page) => new Promise((resolve, reject) => {
+    const tx = db.transaction([BOOKS, META], 'readwrite');
+    const books = tx.objectStore(BOOKS);
+    if (page.reset) books.clear();
+    page.changed.forEach((book) => books.put(book));
+    page.deleted.forEach((id) => books.delete(id));
+    tx.objectStore(META).put(page.token, TOKEN_KEY);
+    tx.oncomplete = () => resolve();
+    tx.onerror = () => reject(tx.error);
+});
+
+const withAccess = (books, readableIds) => {
+    const readable = readableIds === null ? null : new Set(readableIds);
+    return books
+        .filter((book) => book.is_approved && !book.deleted_at)
+        .map((book) => ({
+            ...book,
+            user_has_access: !book.is_restricted || readable === null || readable.has(book.id),
+        }))
+        .sort((a, b) => b.id - a.id);
+};
+
+/**
+ * Approved books (newest first), local copy ko server ke saath sync karke.
+ * IndexedDB na ho (private mode / purana browser) to seedha full list.
+ */
+export const getCatalog = async () => {
+    if (typeof indexedDB === 'undefined') {
+        return bookService.getAllBooks(true);
+    }
+
+    let db;
+    try {
+        db = await openDb();
+    } catch (error) {
+        console.error("Catalog cache unavailable:", error);
+        return bookService.getAllBooks(true);
+    }
+
+    try {
+        let since = await promisify(db.transaction(META).objectStore(META).get(TOKEN_KEY));
+        let page;
+        do {
+            try {
+                page = await bookService.getBookChanges(since);
+            } catch (error) {
+                if (error.response?.status !== 400 || !since) throw error;
+                page = await bookService.getBookChanges(null);  // Kharab token: full resync
+                page.reset = true;
+            }
+            await applyPage(db, page);
+            since = page.token;
+        } while (page.has_more);
+
+        const books = await promisify(db.transaction(BOOKS).objectStore(BOOKS).getAll());
+        return withAccess(books, page.readable_ids);
+    } finally {
+        db.close();
+    }
+};
+
+/** Logout par local copy hata dein (agla user apna catalog sync karega). */
+export const clearCatalogCache = () => new Promise((resolve) => {
+    if (typeof indexedDB === 'undefined') return resolve();
+    const request = indexedDB.deleteDatabase(DB_NAME);
+    request.onsuccess = request.onerror = request.onblocked = () => resolve();
+});
+
+const isGuest = () => !(localStorage.getItem(ACCESS_TOKEN_KEY) || sessionStorage.getItem(ACCESS_TOKEN_KEY));
+
+const fetchJson = async (path) => {
+    const response = await fetch(`${API_BASE_URL}${path}`);
+    if (!response.ok) throw new Error(`${path}: HTTP ${response.status}`);
+    return response.json();
+};
+
+/**
+ * Guest visitors: public catalog ke static snapshots (/static/catalog, backend
+ * utils/catalog_snapshot). Shard files content-hashed hain => browser / CDN
+ * cache se aati hain; sirf chhota manifest revalidate hota hai.
+ * Login ho, ya snapshot abhi bana na ho, to `getCatalog()`.
+ */
+export const getPublicCatalog = async () => {
+    if (!isGuest()) return getCatalog();
+    try {
+        const manifest = await fetchJson('/static/catalog/manifest.json');
+        const pages = await Promise.all(manifest.pages.map((page) => fetchJson(page.url)));
+        return pages.flat();  // pages newest first, har page ke andar bhi
+    } catch (error) {
+        console.warn("Catalog snapshot unavailable, using API:", error);
+        return getCatalog();
+    }
+};
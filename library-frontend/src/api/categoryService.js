@@ -119,4 +119,20 @@ export const categoryService = {
             handleError(error, 'Failed to delete subcategory');
         }
     },
+
+    // --- Reference Data (forms ke liye saari lookups ek saath) ---
+
+    /**
+     * Fetches languages, categories, subcategories aur locations ek hi request mein
+     * API Endpoint: GET /api/reference-data/
+     * Response mein `version` hai; ETag ki wajah se browser 304 par cached copy use karta hai.
+     */
+    getReferenceData: async () => {
+        try {
+            const response = await apiClient.get('/api/reference-data/');
+            return response.data;
+        } catch (error) {
+            handleError(error, 'Failed to fetch reference data');
+        }
+    },
 };
\ No newline at end of file
@@ -0,0 +1,71 @@
+// src/api/eventStream.js
+import apiClient, { API_BASE_URL, ACCESS_TOKEN_KEY } from './apiClient';
+
+// Backend SSE event types (utils/events.py)
+export const REQUEST_EVENT_TYPES = [
+    'access_request.created', 'access_request.updated',
+    'upload_request.created', 'upload_request.updated',
+    'book_request.created', 'book_request.updated',
+];
+
+// Ticket lene / stream band hone ke baad dobara koshish
+const RECONNECT_DELAY_MS = 5000;
+
+/**
+ * Server-Sent Events: request status changes real-time (polling ki jagah).
+ * EventSource custom headers nahi bhej sakta, aur login JWT URL mein nahi
+ * bhejte (server access logs) - har connection ke liye POST /api/events/ticket
+ * se short-lived ticket query param mein jata hai.
+ * Browser ka auto-reconnect purana (expired) ticket bhejta hai => 401 aur
+ * source CLOSED; tab naya ticket le kar dobara connect.
+ *
+ * @param {(event: {type, request_id, book_id, status}) => void} onEvent
+ * @returns {() => void} unsubscribe / close
+ */
+export const subscribeToRequestEvents = (onEvent) => {
+    const token = localStorage.getItem(ACCESS_TOKEN_KEY) || sessionStorage.getItem(ACCESS_TOKEN_KEY);
+    if (!token || typeof EventSource === 'undefined') return () => {};
+
+    let source = null;
+    let retryTimer = null;
+    let closed = false;
+
+    const handler = (message) => {
+        try {
+            onEvent(JSON.parse(message.data));
+        } catch (error) {
+            console.error("Bad event payload:", error);
+        }
+    };
+
+    const scheduleReconnect = () => {
+        if (source) source.close();
+        source = null;
+        if (!closed) retryTimer = setTimeout(connect, RECONNECT_DELAY_MS);
+    };
+
+    const connect = async () => {
+        try {
+            const { data } = await apiClient.post('/api/events/ticket');
+            if (closed) return;
+            source = new EventSource(`${API_BASE_URL}/api/events/stream?ticket=${encodeURIComponent(data.ticket)}`);
+            REQUEST_EVENT_TYPES.forEach((type) => source.addEventListener(type, handler));
+            source.onerror = () => {
+                if (source && source.readyState === EventSource.CLOSED) scheduleReconnect();
+            };
+        } catch (error) {
+            // 401 = logged out / token expire: dobara koshish bekaar
+            if (error?.response?.status !== 401) scheduleReconnect();
+        }
+    };
+
+    connect();
+
+    return () => {
+        closed = true;
+        clearTimeout(retryTimer);
+        if (source) source.close();
+    };
+};
+
+export default subscribeToRequestEvents;
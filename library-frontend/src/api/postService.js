@@ -30,6 +30,21 @@ const postService = {
     }
   },
 
+  // =================================================
+  // 2b. CURSOR PAGINATION (Load More) - backend X-Next-Cursor header bhejta hai
+  // =================================================
+  getPublicPostsPage: async (cursor = null, limit = 20) => {
+    try {
+      const params = { limit };
+      if (cursor) params.cursor = cursor;
+      const response = await api.get('/api/posts/public', { params });
+      return { posts: response.data, nextCursor: response.headers['x-next-cursor'] || null };
+    } catch (error) {
+      console.error("Error fetching public posts page:", error);
+      throw error;
+    }
+  },
+
   // =================================================
   // 3. CREATE POST (Admin Only)
   // =================================================
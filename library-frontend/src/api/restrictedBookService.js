@@ -144,6 +144,22 @@ const getAllRequests = async () => {
   }
 };
 
+/**
+ * ✅ Status-wise counts (Admin badge) -> { total, counts: { pending: n, ... } }
+ * Backend endpoint:
+ * - GET /api/restricted-requests/summary
+ */
+const getRequestSummary = async () => {
+  try {
+    ensureLoggedIn();
+    const res = await apiClient.get(`${REQUEST_URL}/summary`);
+    return res.data;
+  } catch (error) {
+    console.error("❌ Error fetching request summary:", error);
+    throw new Error(extractErrorMessage(error, "Failed to fetch request summary."));
+  }
+};
+
 /**
  * ✅ Update request status (Admin)
  * Backend endpoint:
@@ -254,6 +270,7 @@ const restrictedBookService = {
 
   // Admin
   getAllRequests,
+  getRequestSummary,
   updateRequestStatus,
 
   // Permissions
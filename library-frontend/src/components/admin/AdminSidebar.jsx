@@ -1,5 +1,6 @@
 import React, { useState, useEffect, useMemo, useCallback } from 'react';
 import restrictedBookService from '../../api/restrictedBookService';
+import { subscribeToRequestEvents } from '../../api/eventStream';
 import { NavLink, useNavigate } from 'react-router-dom';
 import { 
     HomeIcon, BookOpenIcon, UsersIcon, ShieldCheckIcon, 
@@ -47,10 +48,10 @@ const AdminSidebar = ({ mobileClose = () => {} }) => {
             if (!user || !hasPermission('REQUEST_VIEW')) return;
 
             try {
-                const data = await restrictedBookService.getAllRequests();
-                if (isMounted && Array.isArray(data)) {
-                    const pending = data.filter(r => r.status === 'pending').length;
-                    setPendingCount(pending);
+                // Sirf counts (poori list nahi)
+                const summary = await restrictedBookService.getRequestSummary();
+                if (isMounted && summary?.counts) {
+                    setPendingCount(summary.counts.pending || 0);
                 }
             } catch (error) {
                 console.error("Sidebar Count Error:", error);
@@ -59,13 +60,15 @@ const AdminSidebar = ({ mobileClose = () => {} }) => {
 
         fetchPendingCount();
         
-        // Har 30 second mein refresh karein
-        const interval = setInterval(fetchPendingCount, 30000);
+        // Polling ki jagah: restricted request aaye / review ho to hi refresh
+        const unsubscribe = subscribeToRequestEvents((event) => {
+            if (event.type.startsWith('access_request.')) fetchPendingCount();
+        });
 
         // Cleanup function
         return () => {
             isMounted = false;
-            clearInterval(interval);
+            unsubscribe();
         };
     }, [user, hasPermission]);
 
@@ -2,6 +2,7 @@ import React, { useState, useEffect, useRef } from "react";
 import { Bell, CheckCircle2, XCircle, Clock, RotateCcw } from "lucide-react";
 import { motion, AnimatePresence } from "framer-motion";
 import restrictedBookService from "../../api/restrictedBookService";
+import { subscribeToRequestEvents } from "../../api/eventStream";
 
 const NotificationBell = () => {
   const [isOpen, setIsOpen] = useState(false);
@@ -25,9 +26,12 @@ const NotificationBell = () => {
     }
   };
 
-  // 2) Load notifications on first render
+  // 2) Load notifications on first render + live updates (SSE, polling nahi)
   useEffect(() => {
     fetchNotifications();
+    return subscribeToRequestEvents((event) => {
+      if (event.type === "access_request.updated") fetchNotifications();
+    });
   }, []);
 
   // 3) Close dropdown on outside click
@@ -7,6 +7,7 @@ import React, {
 } from "react";
 import { jwtDecode } from "jwt-decode";
 import { authService } from "../api/authService";
+import { clearCatalogCache } from "../api/catalogSync";
 
 // 1. Context Create
 const AuthContext = createContext();
@@ -43,6 +44,7 @@ export const AuthProvider = ({ children }) => {
     } catch (e) {
       console.warn("authService.logout failed:", e);
     }
+    clearCatalogCache();
 
     setUser(null);
     setRole(null);
@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { bookService } from '../api/bookService';
+import { getCatalog } from '../api/catalogSync';
 import { useBookSearch } from '../hooks/useBookSearch';
 import BookCard from '../components/book/BookCard';
 import { MagnifyingGlassIcon, FunnelIcon } from '@heroicons/react/24/outline';
@@ -22,7 +22,7 @@ const UserLibrary = () => {
 
     const fetchBooks = async () => {
         try {
-            const data = await bookService.read_books(0, 100, true); // Approved only
+            const data = await getCatalog(); // Approved only (local copy + delta sync)
             setBooks(data);
         } catch (error) {
             console.error("Error fetching books:", error);
@@ -1,7 +1,7 @@
 // src/pages/PublicBookList.jsx
 import React, { useState, useEffect, useCallback, useMemo } from 'react';
 import { Link } from 'react-router-dom';
-import { bookService } from '../api/bookService';
+import { getPublicCatalog } from '../api/catalogSync';
 import { MagnifyingGlassIcon, ArrowPathIcon, BookOpenIcon } from '@heroicons/react/20/solid';
 import Skeleton from 'react-loading-skeleton';
 import 'react-loading-skeleton/dist/skeleton.css';
@@ -47,7 +47,7 @@ const PublicBookList = () => {
         setError(null);
         try {
             // --- IMPORTANT: Fetches ONLY approved books ---
-            const data = await bookService.getAllBooks(true); 
+            const data = await getPublicCatalog(); // guest: static snapshot, warna local copy + delta sync
             setAllBooks(data || []);
         } catch (err) {
             console.error("Error fetching approved books:", err);
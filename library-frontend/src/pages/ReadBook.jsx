@@ -1,8 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { ArrowLeftIcon } from '@heroicons/react/24/solid';
-import apiClient from '../api/apiClient'; // API client import karein
-import { getCoverUrl } from '../utils/cover'; // PDF URL fix karne ke liye helper
+import apiClient, { API_BASE_URL } from '../api/apiClient'; // API client import karein
 
 const ReadBook = () => {
     const { id } = useParams();
@@ -24,11 +23,11 @@ const ReadBook = () => {
                 
                 setBookTitle(book.title);
 
-                // PDF URL nikalein
-                const rawPdf = book.pdf_url || book.pdf_file;
-                if (rawPdf) {
-                    const fullUrl = getCoverUrl(rawPdf); // Helper use karein URL fix karne ke liye
-                    setPdfUrl(fullUrl);
+                // PDF backend proxy se (access check + range requests).
+                // iframe header nahi bhej sakta, is liye signed short-lived link.
+                if (book.pdf_url || book.pdf_file) {
+                    const link = await apiClient.get(`/api/books/${id}/pdf-link`);
+                    setPdfUrl(`${API_BASE_URL.replace(/\/$/, "")}${link.data.url}`);
                 } else {
                     setError("This book does not have a PDF file attached.");
                 }
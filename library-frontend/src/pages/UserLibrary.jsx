@@ -4,7 +4,7 @@ import { toast } from "react-hot-toast";
 import { useNavigate } from "react-router-dom";
 
 // --- Services + Hooks ---
-import { bookService } from "../api/bookService";
+import { getCatalog } from "../api/catalogSync";
 import { useBookSearch } from "../hooks/useBookSearch";
 import useAuth from "../hooks/useAuth";
 
@@ -323,8 +323,8 @@ const UserLibrary = () => {
   const fetchBooks = async () => {
     setLoading(true);
     try {
-      const data = await bookService.getAllBooks(0, 300);
-      setBooks(Array.isArray(data) ? data : data?.books || []);
+      const data = await getCatalog(); // local copy + delta sync
+      setBooks(Array.isArray(data) ? data : []);
     } catch (error) {
       console.error(error);
       toast.error("Failed to load library.");
@@ -4,12 +4,6 @@ import os
 import sys
 from logging.config import fileConfig
 
-# --- YEH ZAROORI HAI ---
-# .env file ko load karne ke liye
-from dotenv import load_dotenv
-load_dotenv()
-# --- KHATAM ---
-
 from sqlalchemy import engine_from_config
 from sqlalchemy import pool
 from alembic import context
@@ -18,17 +12,22 @@ from alembic import context
 sys.path.insert(0, os.path.realpath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Apne project ke Base object ko import karein
+# (.env config.get_settings() ek hi jagah load karta hai)
+from config import get_settings
 from database import Base
 
-# Apne sabhi models ko yahan import karein
-from models.user_model import User, Role
-from models.book_model import Book, Category, Subcategory
-from models.language_model import Language
-from models.library_management_models import Location, BookCopy, IssuedBook, DigitalAccess
-from models.permission_model import Permission
-from models.request_model import UploadRequest
-from models.log_model import Log
-from models.book_permission_model import BookPermission
+# Apne sabhi models ko yahan import karein (models/__init__ baaki core models register karta hai)
+import models  # noqa: F401
+from models import (  # noqa: F401
+    library_management_models,
+    permission_model,
+    log_model,
+    book_permission_model,
+    request_user_model,
+    post_model,
+    book_content_model,
+    reading_analytics_model,
+)
 
 # Alembic config object
 config = context.config
@@ -44,7 +43,7 @@ target_metadata = Base.metadata
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode."""
     # .env se URL load karein
-    url = os.getenv("DATABASE_URL")
+    url = get_settings().database_url
     if not url:
         raise Exception("DATABASE_URL not found in environment. Check your .env file.")
     context.configure(
@@ -62,7 +61,7 @@ def run_migrations_online() -> None:
     configuration = config.get_section(config.config_ini_section)
     
     # .env se URL load karein
-    db_url = os.getenv("DATABASE_URL")
+    db_url = get_settings().database_url
     if not db_url:
         raise Exception("DATABASE_URL not found in environment. Check your .env file.")
     
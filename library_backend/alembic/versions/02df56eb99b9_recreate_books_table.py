@@ -19,6 +19,21 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    # Ye migration asal mein purani 'books' table manually drop karne ke baad
+    # generate hui thi. Fresh DB par initial_setup wali KHALI books table hoti
+    # hai - sirf wahi drop hoti hai (warna create_table "already exists").
+    # Rows wali table kabhi drop nahi: migration ruk jati hai.
+    bind = op.get_bind()
+    if sa.inspect(bind).has_table('books'):
+        if bind.execute(sa.text('SELECT 1 FROM books LIMIT 1')).first() is not None:
+            raise RuntimeError(
+                "02df56eb99b9 would recreate a non-empty 'books' table. This database already has the "
+                "books schema: stamp it (`python scripts/stamp_existing_schema.py` or "
+                "`alembic stamp 02df56eb99b9`) instead of upgrading through this revision."
+            )
+        # CASCADE sirf dependent FK constraints hatata hai (neeche dobara bante hain)
+        op.execute('DROP TABLE books CASCADE')
+
     # ### commands auto generated by Alembic - please adjust! ###
     op.create_table('books',
     sa.Column('id', sa.Integer(), nullable=False),
@@ -19,6 +19,14 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    # alembic_version ke bina tables maujood = purana create_all DB. Yahan se
+    # upgrade karna galat hai - pehle stamp karein (data ko haath nahi lagta).
+    if sa.inspect(op.get_bind()).has_table('books'):
+        raise RuntimeError(
+            "Tables already exist but the database has no Alembic revision (built by create_all). "
+            "Run `python scripts/stamp_existing_schema.py` before `alembic upgrade head`."
+        )
+
     # ### commands auto generated by Alembic - please adjust! ###
     op.create_table('categories',
     sa.Column('id', sa.Integer(), nullable=False),
@@ -0,0 +1,164 @@
+"""sync schema with models (replaces startup create_all)
+
+Revision ID: 5a7c9e1b3d20
+Revises: 02df56eb99b9
+Create Date: 2026-10-19 10:00:00.000000
+
+Pehle har worker startup par `Base.metadata.create_all` chalta tha aur deploy
+par `alembic stamp head`. Is liye live DBs mein kuch tables/columns aisi hain
+jo migrations mein kabhi nahi aayin. Ye migration idempotent hai: jo cheez
+pehle se maujood ho (create_all wale DBs) use skip karti hai, aur fresh DB par
+missing tables/columns bana deti hai. Is ke baad `alembic upgrade head` hi
+schema ka akela raasta hai.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a7c9e1b3d20'
+down_revision: Union[str, Sequence[str], None] = '02df56eb99b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _inspector():
+    return sa.inspect(op.get_bind())
+
+
+def _has_table(name: str) -> bool:
+    return _inspector().has_table(name)
+
+
+def _has_column(table: str, column: str) -> bool:
+    return column in {c["name"] for c in _inspector().get_columns(table)}
+
+
+def _add_column(table: str, column: sa.Column):
+    if not _has_column(table, column.name):
+        op.add_column(table, column)
+
+
+def upgrade() -> None:
+    # --- 1. Missing columns on existing tables ---
+    _add_column('roles', sa.Column('description', sa.String(length=255), nullable=True))
+    _add_column('users', sa.Column('otp_code', sa.String(length=6), nullable=True))
+    _add_column('users', sa.Column('otp_expires_at', sa.DateTime(), nullable=True))
+    _add_column('languages', sa.Column('LanguageCode', sa.String(length=10), nullable=True))
+    _add_column('locations', sa.Column('rack', sa.String(), nullable=True))
+    _add_column('locations', sa.Column('shelf', sa.String(), nullable=True))
+    _add_column('logs', sa.Column('user_id', sa.Integer(), sa.ForeignKey('users.id'), nullable=True))
+    _add_column('books', sa.Column('txt_file_url', sa.Text(), nullable=True))
+    _add_column('books', sa.Column('total_copies', sa.Integer(), server_default='1', nullable=False))
+    _add_column('books', sa.Column('available_copies', sa.Integer(), server_default='1', nullable=False))
+    _add_column('books', sa.Column(
+        'location_id', sa.Integer(), sa.ForeignKey('locations.id', ondelete='SET NULL'), nullable=True
+    ))
+
+    # Location model mein timestamps nahi hain; migration wale DBs par NOT NULL created_at insert tod deta hai
+    if _has_column('locations', 'created_at') and op.get_bind().dialect.name != 'sqlite':
+        op.alter_column('locations', 'created_at', server_default=sa.text('now()'), existing_type=sa.DateTime())
+
+    # --- 2. Tables that only ever existed via create_all ---
+    if not _has_table('markaz_posts'):
+        op.create_table('markaz_posts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('content', sa.Text(), nullable=True),
+        sa.Column('tags', sa.String(length=255), nullable=True),
+        sa.Column('media_type', sa.String(length=20), nullable=False),
+        sa.Column('file_url', sa.String(length=500), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('author_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['author_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        mysql_engine='InnoDB'
+        )
+        op.create_index(op.f('ix_markaz_posts_id'), 'markaz_posts', ['id'], unique=False)
+
+    if not _has_table('book_requests'):
+        op.create_table('book_requests',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('book_id', sa.Integer(), nullable=False),
+        sa.Column('request_reason', sa.Text(), nullable=False),
+        sa.Column('delivery_address', sa.Text(), nullable=False),
+        sa.Column('contact_number', sa.String(length=20), nullable=True),
+        sa.Column('requested_days', sa.Integer(), nullable=True),
+        sa.Column('status', sa.String(length=50), nullable=True),
+        sa.Column('rejection_reason', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_book_requests_id'), 'book_requests', ['id'], unique=False)
+        op.create_index(op.f('ix_book_requests_status'), 'book_requests', ['status'], unique=False)
+
+    if not _has_table('access_requests_user'):
+        op.create_table('access_requests_user',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('book_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('age', sa.String(length=50), nullable=True),
+        sa.Column('location', sa.String(length=255), nullable=True),
+        sa.Column('whatsapp', sa.String(length=50), nullable=False),
+        sa.Column('qualification', sa.String(length=255), nullable=True),
+        sa.Column('institution', sa.String(length=255), nullable=True),
+        sa.Column('teachers', sa.Text(), nullable=True),
+        sa.Column('is_salafi', sa.Boolean(), nullable=True),
+        sa.Column('purpose', sa.Text(), nullable=True),
+        sa.Column('previous_work', sa.Text(), nullable=True),
+        sa.Column('status', sa.String(length=50), nullable=True),
+        sa.Column('rejection_reason', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        mysql_engine='InnoDB'
+        )
+        op.create_index(op.f('ix_access_requests_user_id'), 'access_requests_user', ['id'], unique=False)
+        op.create_index(op.f('ix_access_requests_user_user_id'), 'access_requests_user', ['user_id'], unique=False)
+        op.create_index(op.f('ix_access_requests_user_book_id'), 'access_requests_user', ['book_id'], unique=False)
+        op.create_index(op.f('ix_access_requests_user_status'), 'access_requests_user', ['status'], unique=False)
+
+    if not _has_table('donation_info'):
+        op.create_table('donation_info',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('qr_code_desktop', sa.String(), nullable=True),
+        sa.Column('qr_code_mobile', sa.String(), nullable=True),
+        sa.Column('appeal_desktop', sa.String(), nullable=True),
+        sa.Column('appeal_mobile', sa.String(), nullable=True),
+        sa.Column('bank_desktop', sa.String(), nullable=True),
+        sa.Column('bank_mobile', sa.String(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f('ix_donation_info_id'), 'donation_info', ['id'], unique=False)
+
+    if not _has_table('issues'):
+        op.create_table('issues',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('book_copy_id', sa.Integer(), nullable=False),
+        sa.Column('issue_date', sa.DateTime(), nullable=True),
+        sa.Column('due_date', sa.DateTime(), nullable=True),
+        sa.Column('return_date', sa.DateTime(), nullable=True),
+        sa.Column('status', sa.String(length=50), nullable=True),
+        sa.ForeignKeyConstraint(['book_copy_id'], ['book_copies.CopyID'], ),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        mysql_engine='InnoDB'
+        )
+        op.create_index(op.f('ix_issues_id'), 'issues', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    # Ye migration create_all wale DBs ko "adopt" karti hai; downgrade par
+    # data wali tables drop karna khatarnak hai, is liye sirf no-op.
+    pass
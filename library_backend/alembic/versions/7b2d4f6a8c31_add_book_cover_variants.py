@@ -0,0 +1,28 @@
+"""add book cover variants and blurhash
+
+Revision ID: 7b2d4f6a8c31
+Revises: 5a7c9e1b3d20
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2d4f6a8c31'
+down_revision: Union[str, Sequence[str], None] = '5a7c9e1b3d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('books', sa.Column('cover_variants', sa.Text(), nullable=True))
+    op.add_column('books', sa.Column('cover_blurhash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('books', 'cover_blurhash')
+    op.drop_column('books', 'cover_variants')
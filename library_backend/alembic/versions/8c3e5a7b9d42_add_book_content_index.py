@@ -0,0 +1,78 @@
+"""add book page content index for full-text search
+
+Revision ID: 8c3e5a7b9d42
+Revises: 7b2d4f6a8c31
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c3e5a7b9d42'
+down_revision: Union[str, Sequence[str], None] = '7b2d4f6a8c31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# models/book_content_model.py ke DDL jaisa (migration self-contained rehti hai)
+POSTGRES_FTS_DDL = [
+    "ALTER TABLE book_pages ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(content, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_book_pages_search_vector ON book_pages USING gin (search_vector)",
+]
+
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS book_pages_fts USING fts5("
+    "content, content='book_pages', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS book_pages_fts_ai AFTER INSERT ON book_pages BEGIN "
+    "INSERT INTO book_pages_fts(rowid, content) VALUES (new.id, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS book_pages_fts_ad AFTER DELETE ON book_pages BEGIN "
+    "INSERT INTO book_pages_fts(book_pages_fts, rowid, content) VALUES ('delete', old.id, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS book_pages_fts_au AFTER UPDATE ON book_pages BEGIN "
+    "INSERT INTO book_pages_fts(book_pages_fts, rowid, content) VALUES ('delete', old.id, old.content); "
+    "INSERT INTO book_pages_fts(rowid, content) VALUES (new.id, new.content); END",
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'book_pages',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('book_id', sa.Integer(), sa.ForeignKey('books.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('page_number', sa.Integer(), nullable=False),
+        sa.Column('content', sa.Text(), nullable=False),
+        sa.UniqueConstraint('book_id', 'page_number', name='uq_book_pages_book_page'),
+    )
+    op.create_index('ix_book_pages_book_id', 'book_pages', ['book_id'])
+
+    op.create_table(
+        'book_index_jobs',
+        sa.Column('book_id', sa.Integer(), sa.ForeignKey('books.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('source_url', sa.Text(), nullable=False),
+        sa.Column('source_kind', sa.String(length=10), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('total_pages', sa.Integer(), nullable=True),
+        sa.Column('pages_done', sa.Integer(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('lease_until', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_book_index_jobs_status', 'book_index_jobs', ['status'])
+
+    dialect = op.get_bind().dialect.name
+    for statement in {"postgresql": POSTGRES_FTS_DDL, "sqlite": SQLITE_FTS_DDL}.get(dialect, []):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        op.execute("DROP TABLE IF EXISTS book_pages_fts")
+    op.drop_index('ix_book_index_jobs_status', table_name='book_index_jobs')
+    op.drop_table('book_index_jobs')
+    op.drop_index('ix_book_pages_book_id', table_name='book_pages')
+    op.drop_table('book_pages')
@@ -0,0 +1,60 @@
+"""add digital access indexes and reading analytics rollup tables
+
+Revision ID: 9d4f6b8c0e53
+Revises: 8c3e5a7b9d42
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f6b8c0e53'
+down_revision: Union[str, Sequence[str], None] = '8c3e5a7b9d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Raw events: user history (keyset) + per-book time range
+    op.create_index('ix_digital_access_client_id_id', 'digital_access', ['ClientID', 'DigitalAccessID'])
+    op.create_index('ix_digital_access_book_id_timestamp', 'digital_access', ['BookID', 'AccessTimestamp'])
+
+    op.create_table(
+        'book_access_rollups',
+        sa.Column('granularity', sa.String(length=8), primary_key=True),
+        sa.Column('bucket_start', sa.DateTime(), primary_key=True),
+        sa.Column('book_id', sa.Integer(), primary_key=True),
+        sa.Column('access_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('denied_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_index('ix_book_access_rollups_book', 'book_access_rollups', ['book_id', 'granularity', 'bucket_start'])
+
+    op.create_table(
+        'user_access_rollups',
+        sa.Column('granularity', sa.String(length=8), primary_key=True),
+        sa.Column('bucket_start', sa.DateTime(), primary_key=True),
+        sa.Column('user_id', sa.Integer(), primary_key=True),
+        sa.Column('access_count', sa.Integer(), nullable=False, server_default='0'),
+    )
+    op.create_index('ix_user_access_rollups_user', 'user_access_rollups', ['user_id', 'granularity', 'bucket_start'])
+
+    op.create_table(
+        'analytics_watermarks',
+        sa.Column('name', sa.String(length=50), primary_key=True),
+        sa.Column('last_event_id', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('analytics_watermarks')
+    op.drop_index('ix_user_access_rollups_user', table_name='user_access_rollups')
+    op.drop_table('user_access_rollups')
+    op.drop_index('ix_book_access_rollups_book', table_name='book_access_rollups')
+    op.drop_table('book_access_rollups')
+    op.drop_index('ix_digital_access_book_id_timestamp', table_name='digital_access')
+    op.drop_index('ix_digital_access_client_id_id', table_name='digital_access')
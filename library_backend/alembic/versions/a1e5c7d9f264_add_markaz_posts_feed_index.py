@@ -0,0 +1,25 @@
+"""add markaz posts feed index for keyset pagination
+
+Revision ID: a1e5c7d9f264
+Revises: 9d4f6b8c0e53
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1e5c7d9f264'
+down_revision: Union[str, Sequence[str], None] = '9d4f6b8c0e53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_markaz_posts_created_at_id', 'markaz_posts', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_markaz_posts_created_at_id', table_name='markaz_posts')
@@ -0,0 +1,49 @@
+"""add pg_trgm / prefix indexes for user typeahead search
+
+Revision ID: a7c1e3f5b8d0
+Revises: f6d0b2c4e7a9
+Create Date: 2026-10-19 21:00:00.000000
+
+Sirf Postgres (GET /api/users/search). pg_trgm extension ke liye DB user ko
+CREATE privilege chahiye (managed Postgres par pg_trgm allow-listed hota hai).
+Indexes CONCURRENTLY bante hain - users table lock nahi hoti.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c1e3f5b8d0'
+down_revision: Union[str, Sequence[str], None] = 'f6d0b2c4e7a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# models/user_model.py jaisa (migration self-contained rehti hai)
+USER_SEARCH_EXPRESSION = """lower("Username" || ' ' || coalesce("FullName", '') || ' ' || "Email")"""
+
+INDEXES = [
+    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_search_trgm ON users "
+    f"USING gin (({USER_SEARCH_EXPRESSION}) gin_trgm_ops) WHERE deleted_at IS NULL",
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_username_prefix ON users '
+    '(lower("Username") text_pattern_ops) WHERE deleted_at IS NULL',
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_users_email_prefix ON users '
+    '(lower("Email") text_pattern_ops) WHERE deleted_at IS NULL',
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for statement in INDEXES:
+            op.execute(statement)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        for name in ('ix_users_email_prefix', 'ix_users_username_prefix', 'ix_users_search_trgm'):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
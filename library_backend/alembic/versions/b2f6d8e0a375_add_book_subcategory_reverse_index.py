@@ -0,0 +1,25 @@
+"""add reverse (subcategory_id, book_id) index on book_subcategory_link
+
+Revision ID: b2f6d8e0a375
+Revises: a1e5c7d9f264
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2f6d8e0a375'
+down_revision: Union[str, Sequence[str], None] = 'a1e5c7d9f264'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_book_subcategory_link_subcategory_book', 'book_subcategory_link', ['subcategory_id', 'book_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_book_subcategory_link_subcategory_book', table_name='book_subcategory_link')
@@ -0,0 +1,44 @@
+"""add book_copies.Barcode + partial unique index for scanner lookup
+
+Revision ID: b8d2f4a6c9e1
+Revises: a7c1e3f5b8d0
+Create Date: 2026-10-19 22:00:00.000000
+
+Nullable column (purani copies ke liye koi backfill nahi). Unique index sirf
+active rows par; Postgres par CONCURRENTLY - book_copies lock nahi hoti.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8d2f4a6c9e1'
+down_revision: Union[str, Sequence[str], None] = 'a7c1e3f5b8d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text('deleted_at IS NULL')
+INDEX = 'ix_book_copies_barcode_active'
+
+
+def upgrade() -> None:
+    op.add_column('book_copies', sa.Column('Barcode', sa.String(length=64), nullable=True))
+
+    if op.get_bind().dialect.name != 'postgresql':
+        op.create_index(INDEX, 'book_copies', ['Barcode'], unique=True, sqlite_where=ACTIVE)
+        return
+
+    with op.get_context().autocommit_block():
+        op.create_index(INDEX, 'book_copies', ['Barcode'], unique=True, postgresql_where=ACTIVE,
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        op.drop_index(INDEX, table_name='book_copies')
+    else:
+        with op.get_context().autocommit_block():
+            op.drop_index(INDEX, table_name='book_copies', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('book_copies', 'Barcode')
@@ -0,0 +1,29 @@
+"""add (status, created_at) indexes for admin request queues
+
+Revision ID: c3a7e9f1b486
+Revises: b2f6d8e0a375
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a7e9f1b486'
+down_revision: Union[str, Sequence[str], None] = 'b2f6d8e0a375'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_upload_requests_status_submitted_at', 'upload_requests', ['status', 'submitted_at'])
+    op.create_index('ix_book_requests_status_created_at', 'book_requests', ['status', 'created_at'])
+    op.create_index('ix_access_requests_user_status_created_at', 'access_requests_user', ['status', 'created_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_access_requests_user_status_created_at', table_name='access_requests_user')
+    op.drop_index('ix_book_requests_status_created_at', table_name='book_requests')
+    op.drop_index('ix_upload_requests_status_submitted_at', table_name='upload_requests')
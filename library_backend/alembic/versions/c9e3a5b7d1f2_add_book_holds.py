@@ -0,0 +1,50 @@
+"""add book_holds reservation queue
+
+Revision ID: c9e3a5b7d1f2
+Revises: b8d2f4a6c9e1
+Create Date: 2026-10-19 23:00:00.000000
+
+Nayi (khali) table - indexes seedha bante hain, CONCURRENTLY ki zaroorat nahi.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e3a5b7d1f2'
+down_revision: Union[str, Sequence[str], None] = 'b8d2f4a6c9e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text("status IN ('Waiting', 'Ready')")
+
+
+def upgrade() -> None:
+    op.create_table(
+        'book_holds',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('book_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('copy_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('ready_at', sa.DateTime(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=True),
+        sa.Column('closed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['book_id'], ['books.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['copy_id'], ['book_copies.CopyID']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_book_holds_queue', 'book_holds', ['book_id', 'status', 'created_at', 'id'])
+    op.create_index('ix_book_holds_user_id_status', 'book_holds', ['user_id', 'status'])
+    op.create_index('ix_book_holds_copy_id', 'book_holds', ['copy_id'])
+    op.create_index('ix_book_holds_status_expires_at', 'book_holds', ['status', 'expires_at'])
+    op.create_index('ix_book_holds_active_user_book', 'book_holds', ['user_id', 'book_id'], unique=True,
+                    postgresql_where=ACTIVE, sqlite_where=ACTIVE)
+
+
+def downgrade() -> None:
+    op.drop_table('book_holds')
@@ -0,0 +1,35 @@
+"""clear cover_variants that point at local /static/covers files
+
+Revision ID: d1f5b7c9e3a4
+Revises: c9e3a5b7d1f2
+Create Date: 2026-10-20 10:00:00.000000
+
+Pehle derivatives worker ki local disk par bante the (static/covers) aur wahi
+URLs DB mein jate the. Deploy par persistent disk nahi, is liye redeploy ke
+baad ye sab 404 hain. Ab derivatives Cloudinary par jate hain; purane local
+references hata dein - frontend original cover (Cloudinary) use karta hai,
+aur cover dobara upload hone par naye variants bante hain. Blurhash DB mein
+hi hai (file nahi), wo rehta hai.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1f5b7c9e3a4'
+down_revision: Union[str, Sequence[str], None] = 'c9e3a5b7d1f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "UPDATE books SET cover_variants = NULL "
+        "WHERE cover_variants LIKE '%/static/covers/%'"
+    )
+
+
+def downgrade() -> None:
+    # Data cleanup - local files waise bhi maujood nahi, wapas laane ko kuch nahi
+    pass
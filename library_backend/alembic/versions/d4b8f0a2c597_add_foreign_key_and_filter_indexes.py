@@ -0,0 +1,76 @@
+"""add missing foreign key and hot filter indexes
+
+Revision ID: d4b8f0a2c597
+Revises: c3a7e9f1b486
+Create Date: 2026-10-19 18:00:00.000000
+
+Postgres par indexes CREATE INDEX CONCURRENTLY se bante hain (table par write
+lock nahi), is liye ye migration transaction ke bahar (autocommit block) chalti
+hai. Beech mein fail ho to dobara chalana safe hai (IF NOT EXISTS).
+Coverage check: `python scripts/check_indexes.py`.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b8f0a2c597'
+down_revision: Union[str, Sequence[str], None] = 'c3a7e9f1b486'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns)
+INDEXES = [
+    # Hot filters (composite)
+    ('ix_book_copies_book_id_status', 'book_copies', ['BookID', 'Status']),
+    ('ix_issued_books_client_id_status', 'issued_books', ['ClientID', 'Status']),
+    ('ix_book_permissions_book_id_user_id', 'book_permissions', ['book_id', 'user_id']),
+    ('ix_logs_action_by_id_timestamp', 'logs', ['action_by_id', 'timestamp']),
+    ('ix_logs_action_type_timestamp', 'logs', ['action_type', 'timestamp']),
+    ('ix_logs_timestamp', 'logs', ['timestamp']),
+    # Foreign keys (joins + parent row delete / ON DELETE checks)
+    ('ix_book_copies_LocationID', 'book_copies', ['LocationID']),
+    ('ix_issued_books_CopyID', 'issued_books', ['CopyID']),
+    ('ix_book_permissions_user_id', 'book_permissions', ['user_id']),
+    ('ix_book_permissions_role_id', 'book_permissions', ['role_id']),
+    ('ix_logs_user_id', 'logs', ['user_id']),
+    ('ix_books_language_id', 'books', ['language_id']),
+    ('ix_books_location_id', 'books', ['location_id']),
+    ('ix_subcategories_category_id', 'subcategories', ['category_id']),
+    ('ix_role_permissions_permission_id', 'role_permissions', ['permission_id']),
+    ('ix_users_RoleID', 'users', ['RoleID']),
+    ('ix_book_requests_user_id', 'book_requests', ['user_id']),
+    ('ix_book_requests_book_id', 'book_requests', ['book_id']),
+    ('ix_upload_requests_submitted_by_id', 'upload_requests', ['submitted_by_id']),
+    ('ix_upload_requests_reviewed_by_id', 'upload_requests', ['reviewed_by_id']),
+    ('ix_markaz_posts_author_id', 'markaz_posts', ['author_id']),
+    ('ix_issues_user_id', 'issues', ['user_id']),
+    ('ix_issues_book_copy_id', 'issues', ['book_copy_id']),
+]
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == 'postgresql'
+
+
+def upgrade() -> None:
+    if not _is_postgres():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    if not _is_postgres():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
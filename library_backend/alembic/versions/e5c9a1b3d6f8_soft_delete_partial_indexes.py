@@ -0,0 +1,71 @@
+"""soft delete aware partial (unique) indexes
+
+Revision ID: e5c9a1b3d6f8
+Revises: d4b8f0a2c597
+Create Date: 2026-10-19 19:00:00.000000
+
+categories.name, roles.name aur books.isbn ab sirf active rows
+(`deleted_at IS NULL`) mein unique hain; full-table unique indexes hata diye.
+Postgres par CONCURRENTLY (pehle naya index, phir purana drop).
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5c9a1b3d6f8'
+down_revision: Union[str, Sequence[str], None] = 'd4b8f0a2c597'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text('deleted_at IS NULL')
+
+# (name, table, columns, unique)
+PARTIAL_INDEXES = [
+    ('ix_categories_name_active', 'categories', ['name'], True),
+    ('ix_roles_name_active', 'roles', ['name'], True),
+    ('ix_books_isbn_active', 'books', ['isbn'], True),
+    ('ix_books_active_approved_id', 'books', ['is_approved', 'id'], False),
+]
+
+# Purane full-table unique indexes (downgrade par wapas)
+FULL_UNIQUE_INDEXES = [
+    ('ix_categories_name', 'categories', ['name']),
+    ('ix_roles_name', 'roles', ['name']),
+    ('ix_books_isbn', 'books', ['isbn']),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, table, columns, unique in PARTIAL_INDEXES:
+            op.create_index(name, table, columns, unique=unique, sqlite_where=ACTIVE)
+        for name, table, _ in FULL_UNIQUE_INDEXES:
+            op.drop_index(name, table_name=table)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in PARTIAL_INDEXES:
+            op.create_index(name, table, columns, unique=unique, postgresql_where=ACTIVE,
+                            postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _ in FULL_UNIQUE_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    # Note: agar active + deleted rows mein duplicate naam / ISBN ban chuke hon to
+    # full unique index nahi banega - pehle purge_deleted chalayein.
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, table, columns in FULL_UNIQUE_INDEXES:
+            op.create_index(name, table, columns, unique=True)
+        for name, table, _, _ in reversed(PARTIAL_INDEXES):
+            op.drop_index(name, table_name=table)
+        return
+
+    with op.get_context().autocommit_block():
+        for name, table, columns in FULL_UNIQUE_INDEXES:
+            op.create_index(name, table, columns, unique=True, postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _, _ in reversed(PARTIAL_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,70 @@
+"""users.Email / users.Username unique only among active rows
+
+Revision ID: e7b3d9f1a5c2
+Revises: d1f5b7c9e3a4
+Create Date: 2026-10-20 12:00:00.000000
+
+Global soft-delete filter (utils/soft_delete) ke baad duplicate checks
+soft-deleted users ko nahi dekhte, lekin full-table unique index unka email /
+username rok leta tha (register par IntegrityError 500). Ab categories / roles /
+ISBN jaisa: partial unique index `WHERE deleted_at IS NULL`.
+Postgres par CONCURRENTLY (pehle naya index, phir purana drop).
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3d9f1a5c2'
+down_revision: Union[str, Sequence[str], None] = 'd1f5b7c9e3a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text('deleted_at IS NULL')
+
+# (name, columns)
+PARTIAL_INDEXES = [
+    ('ix_users_email_active', ['Email']),
+    ('ix_users_username_active', ['Username']),
+]
+
+# Purane full-table unique indexes (downgrade par wapas)
+FULL_UNIQUE_INDEXES = [
+    ('ix_users_Email', ['Email']),
+    ('ix_users_Username', ['Username']),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, columns in PARTIAL_INDEXES:
+            op.create_index(name, 'users', columns, unique=True, sqlite_where=ACTIVE)
+        for name, _ in FULL_UNIQUE_INDEXES:
+            op.drop_index(name, table_name='users')
+        return
+
+    with op.get_context().autocommit_block():
+        for name, columns in PARTIAL_INDEXES:
+            op.create_index(name, 'users', columns, unique=True, postgresql_where=ACTIVE,
+                            postgresql_concurrently=True, if_not_exists=True)
+        for name, _ in FULL_UNIQUE_INDEXES:
+            op.drop_index(name, table_name='users', postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    # Note: agar active + deleted users mein same email / username ban chuka ho to
+    # full unique index nahi banega - pehle purge_deleted chalayein.
+    if op.get_bind().dialect.name != 'postgresql':
+        for name, columns in FULL_UNIQUE_INDEXES:
+            op.create_index(name, 'users', columns, unique=True)
+        for name, _ in reversed(PARTIAL_INDEXES):
+            op.drop_index(name, table_name='users')
+        return
+
+    with op.get_context().autocommit_block():
+        for name, columns in FULL_UNIQUE_INDEXES:
+            op.create_index(name, 'users', columns, unique=True, postgresql_concurrently=True, if_not_exists=True)
+        for name, _ in reversed(PARTIAL_INDEXES):
+            op.drop_index(name, table_name='users', postgresql_concurrently=True, if_exists=True)
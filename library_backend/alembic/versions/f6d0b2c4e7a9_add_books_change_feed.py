@@ -0,0 +1,46 @@
+"""add books.change_seq and change_counters for delta sync
+
+Revision ID: f6d0b2c4e7a9
+Revises: e5c9a1b3d6f8
+Create Date: 2026-10-19 20:00:00.000000
+
+Purani books change_seq = 0 par rehti hain (initial sync mein aati hain).
+Postgres 11+ par constant default wala column add karna metadata-only hai;
+index CONCURRENTLY banta hai.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6d0b2c4e7a9'
+down_revision: Union[str, Sequence[str], None] = 'e5c9a1b3d6f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    counters = op.create_table(
+        'change_counters',
+        sa.Column('name', sa.String(length=50), nullable=False),
+        sa.Column('value', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+    op.bulk_insert(counters, [{'name': 'books', 'value': 0}, {'name': 'books.reset', 'value': 0}])
+    op.add_column('books', sa.Column('change_seq', sa.BigInteger(), nullable=False, server_default='0'))
+
+    if op.get_bind().dialect.name != 'postgresql':
+        op.create_index('ix_books_change_seq_id', 'books', ['change_seq', 'id'])
+        return
+    with op.get_context().autocommit_block():
+        op.create_index('ix_books_change_seq_id', 'books', ['change_seq', 'id'],
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_books_change_seq_id', table_name='books')
+    with op.batch_alter_table('books') as batch_op:
+        batch_op.drop_column('change_seq')
+    op.drop_table('change_counters')
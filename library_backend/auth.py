@@ -1,4 +1,3 @@
-import os
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -7,24 +6,19 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session, joinedload
-from dotenv import load_dotenv
 
 # --- Imports ---
 from models import user_model
-from database import SessionLocal
-
-# ✅ Load .env
-load_dotenv()
+from config import get_settings
+from database import get_db  # noqa: F401  (controllers get_db yahin se import karte hain)
 
 # --- CONFIGURATION ---
-SECRET_KEY = os.getenv("SECRET_KEY", "fallback-secret-key-for-dev-only")
-ALGORITHM = os.getenv("ALGORITHM", "HS256")
+_settings = get_settings()
+SECRET_KEY = _settings.secret_key
+ALGORITHM = _settings.algorithm
 
 # Default: 30 days
-try:
-    ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 43200))
-except ValueError:
-    ACCESS_TOKEN_EXPIRE_MINUTES = 43200
+ACCESS_TOKEN_EXPIRE_MINUTES = _settings.access_token_expire_minutes
 
 # Password Hashing Config
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -67,15 +61,6 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def get_db():
-    """Database dependency."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 # ==========================================================
 # ✅ TOKEN -> USER FETCH
 # ==========================================================
@@ -169,6 +154,27 @@ async def get_current_user(
 # ✅ PERMISSION CHECKER
 # ==========================================================
 
+def user_has_permission(user: user_model.User, permission_code: str) -> bool:
+    """require_permission wala check, endpoint ke andar (e.g. "khud ka ya staff")."""
+    # 1. ✅ Admin Bypass: Super Admins get access to everything
+    if user.role and user.role.name:
+        role_name = user.role.name.lower()
+        if role_name in ["admin", "superadmin", "administrator"]:
+            return True
+
+    # 2. ✅ Collect Permissions from DB
+    user_perms = set()
+    if user.role and user.role.permissions:
+        for p in user.role.permissions:
+            # Support both 'code' and 'name' fields for flexibility
+            if hasattr(p, "code") and p.code:
+                user_perms.add(p.code)
+            elif hasattr(p, "name") and p.name:
+                user_perms.add(p.name)
+
+    return permission_code in user_perms
+
+
 def require_permission(permission_code: str):
     """
     Dependency to check if the current user has a specific permission.
@@ -176,24 +182,8 @@ def require_permission(permission_code: str):
     async def permission_checker(
         current_user: user_model.User = Depends(get_current_user),
     ):
-        # 1. ✅ Admin Bypass: Super Admins get access to everything
-        if current_user.role and current_user.role.name:
-            role_name = current_user.role.name.lower()
-            if role_name in ["admin", "superadmin", "administrator"]:
-                return current_user
-
-        # 2. ✅ Collect Permissions from DB
-        user_perms = set()
-        if current_user.role and current_user.role.permissions:
-            for p in current_user.role.permissions:
-                # Support both 'code' and 'name' fields for flexibility
-                if hasattr(p, "code") and p.code:
-                    user_perms.add(p.code)
-                elif hasattr(p, "name") and p.name:
-                    user_perms.add(p.name)
-
-        # 3. ✅ Check if required permission exists
-        if permission_code not in user_perms:
+        # ✅ Check if required permission exists (admin bypass included)
+        if not user_has_permission(current_user, permission_code):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"You do not have permission: {permission_code}",
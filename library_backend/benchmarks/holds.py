@@ -0,0 +1,245 @@
+# file: benchmarks/holds.py
+"""
+Hold allocation benchmark + correctness check (utils/holds).
+
+Ek book ki N copies issue hoti hain, M members queue mein lagte hain, phir
+saari copies ek saath (concurrent HTTP) return hoti hain. Us ke baad:
+
+- pehle min(N, M) holds (created_at order) Ready hon, har ek ki alag copy
+- har Ready copy "On Hold", bachi copies Available, koi copy do holds ko nahi
+- expiry sweep: Ready holds expire => copies queue ke agle holds ko (FIFO)
+
+Postgres par ye SKIP LOCKED path chalata hai; SQLite par writes serialize
+hote hain (correctness phir bhi check hoti hai).
+
+Usage (library_backend folder se):
+
+    python -m benchmarks.holds --database-url postgresql://.../kil_bench \\
+        --copies 20 --holds 40 --concurrency 20
+
+Exit code 1 agar allocation mein koi gadbad mile.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from benchmarks.run import BACKEND_DIR, BackgroundServer, _free_port, prepare_database
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Hold queue allocation under concurrent returns")
+    parser.add_argument("--database-url", default="sqlite:///./bench.db")
+    parser.add_argument("--scale", type=float, default=0.2, help="Seed data scale factor (copies + holds members chahiye)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--copies", type=int, default=20, help="Copies issued then returned together")
+    parser.add_argument("--holds", type=int, default=40, help="Members in the queue")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--output", default=None, help="Optional JSON report")
+    return parser.parse_args(argv)
+
+
+# ==================================
+# 🏗️ SETUP
+# ==================================
+
+def _isolate_book(book_id: int) -> int:
+    """Book ki seeded copies parking mein - sirf benchmark ki copies count hon. Returns location id."""
+    from sqlalchemy import update
+    from database import SessionLocal
+    from models.library_management_models import BookCopy
+    from models.location_model import Location
+
+    with SessionLocal() as db:
+        db.execute(update(BookCopy).where(BookCopy.book_id == book_id).values(status="Maintenance"))
+        location_id = db.query(Location.id).order_by(Location.id).limit(1).scalar()
+        db.commit()
+    return location_id
+
+
+async def _setup(client, headers, args, ctx) -> dict:
+    members = ctx["member_ids"]
+    if len(members) < args.copies + args.holds:
+        raise SystemExit(f"Need {args.copies + args.holds} members, seed has {len(members)} (increase --scale)")
+    book_id = ctx["public_book_ids"][0]
+    location_id = _isolate_book(book_id)
+
+    issue_ids, copy_ids = [], []
+    due = (datetime.utcnow() + timedelta(days=14)).isoformat()
+    for borrower in members[: args.copies]:
+        copy = (await client.post("/api/copies/", headers=headers,
+                                  json={"book_id": book_id, "location_id": location_id}))
+        copy.raise_for_status()
+        copy_ids.append(copy.json()["id"])
+        issued = await client.post("/api/issues/issue", headers=headers,
+                                   json={"client_id": borrower, "copy_id": copy_ids[-1], "due_date": due})
+        issued.raise_for_status()
+        issue_ids.append(issued.json()["id"])
+
+    # Sequential => queue order (created_at) maloom hai
+    hold_ids = []
+    for member in members[args.copies: args.copies + args.holds]:
+        hold = await client.post("/api/holds/", headers=headers, json={"book_id": book_id, "user_id": member})
+        hold.raise_for_status()
+        hold_ids.append(hold.json()["id"])
+    return {"book_id": book_id, "issue_ids": issue_ids, "copy_ids": copy_ids, "hold_ids": hold_ids}
+
+
+async def _concurrent_returns(client, headers, issue_ids, concurrency) -> tuple:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, errors = [], []
+
+    async def one(issue_id):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(f"/api/issues/return/{issue_id}", headers=headers)
+            if response.status_code == 200:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors.append(f"return {issue_id}: HTTP {response.status_code} {response.text[:200]}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in issue_ids))
+    return latencies, errors, time.perf_counter() - started
+
+
+# ==================================
+# ✅ CHECKS
+# ==================================
+
+def check_allocation(copy_ids: list, hold_ids: list, expected_ready: list, closed: list = ()) -> list:
+    """
+    Violations ki list (khali = sab sahi). `expected_ready` = jin holds ke paas
+    copy honi chahiye, `closed` = expire / cancel ho chuki holds.
+    """
+    from database import SessionLocal
+    from models.hold_model import BookHold, HOLD_READY, HOLD_WAITING
+    from models.library_management_models import BookCopy, ON_HOLD_COPY_STATUS
+
+    problems = []
+    with SessionLocal() as db:
+        holds = {h.id: h for h in db.query(BookHold).filter(BookHold.id.in_(hold_ids))}
+        copies = {c.id: c for c in db.query(BookCopy).filter(BookCopy.id.in_(copy_ids))}
+
+    ready = [h for h in holds.values() if h.status == HOLD_READY]
+    if sorted(h.id for h in ready) != sorted(expected_ready):
+        problems.append(f"ready holds {sorted(h.id for h in ready)} != expected (FIFO) {sorted(expected_ready)}")
+
+    allocated = [h.copy_id for h in ready]
+    if len(set(allocated)) != len(allocated):
+        problems.append(f"copy allocated to more than one hold: {allocated}")
+    for hold in ready:
+        copy = copies.get(hold.copy_id)
+        if copy is None or copy.status != ON_HOLD_COPY_STATUS:
+            problems.append(f"hold {hold.id}: copy {hold.copy_id} status {copy and copy.status}")
+
+    waiting = sorted(h.id for h in holds.values() if h.status == HOLD_WAITING)
+    expected_waiting = sorted(h for h in hold_ids if h not in expected_ready and h not in closed)
+    if waiting != expected_waiting:
+        problems.append(f"waiting holds {waiting} != expected {expected_waiting}")
+
+    for copy in copies.values():
+        if copy.id in allocated:
+            continue
+        if copy.status != "Available":
+            problems.append(f"copy {copy.id} is {copy.status} (expected Available)")
+        elif waiting:
+            problems.append(f"copy {copy.id} Available while {len(waiting)} holds are waiting")
+    for hold_id in closed:
+        if holds[hold_id].status in (HOLD_READY, HOLD_WAITING):
+            problems.append(f"hold {hold_id} should be closed, is {holds[hold_id].status}")
+    return problems
+
+
+def expire_ready_now(hold_ids: list) -> list:
+    """Ready holds ki deadline peeche karke sweep. Returns: expire hone wale hold ids."""
+    from database import SessionLocal
+    from models.hold_model import BookHold, HOLD_READY
+    from utils import holds
+
+    with SessionLocal() as db:
+        ready = db.query(BookHold).filter(BookHold.id.in_(hold_ids), BookHold.status == HOLD_READY).all()
+        for hold in ready:
+            hold.expires_at = datetime.utcnow() - timedelta(minutes=1)
+        db.commit()
+        expired_ids = [h.id for h in ready]
+        holds.sweep(db)
+    return expired_ids
+
+
+async def run(args, ctx: dict, base_url: str) -> dict:
+    import httpx
+    from benchmarks.loadgen import summarize
+    from benchmarks.seed import ADMIN_USERNAME, BENCH_PASSWORD
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        login = await client.post("/api/token", data={"username": ADMIN_USERNAME, "password": BENCH_PASSWORD})
+        login.raise_for_status()
+        headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        setup = await _setup(client, headers, args, ctx)
+        print(f"▶ {args.copies} concurrent returns, {args.holds} holds waiting (book {setup['book_id']})...")
+        latencies, errors, elapsed = await _concurrent_returns(client, headers, setup["issue_ids"], args.concurrency)
+
+    hold_ids = setup["hold_ids"]
+    first_ready = hold_ids[: min(args.copies, args.holds)]
+    problems = errors + check_allocation(setup["copy_ids"], hold_ids, first_ready)
+
+    # Expiry: Ready holds expire => copies queue ke agle members ko
+    expired = expire_ready_now(hold_ids)
+    remaining = [h for h in hold_ids if h not in expired]
+    next_ready = remaining[: min(args.copies, len(remaining))]
+    problems += [f"after expiry: {p}" for p in
+                 check_allocation(setup["copy_ids"], hold_ids, next_ready, closed=expired)]
+
+    return {
+        "returns": summarize(latencies, len(errors), elapsed),
+        "copies": args.copies,
+        "holds": args.holds,
+        "expired": len(expired),
+        "problems": problems,
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ["AUTO_CREATE_SCHEMA"] = "true"
+    # Sweep benchmark khud chalata hai
+    os.environ["HOLD_SWEEP_ENABLED"] = "false"
+    os.chdir(BACKEND_DIR)
+
+    print(f"🌱 Seeding {args.database_url} (scale={args.scale}, seed={args.seed})...")
+    ctx = prepare_database(args)
+
+    port = _free_port()
+    with BackgroundServer(port):
+        result = asyncio.run(run(args, ctx, f"http://127.0.0.1:{port}"))
+
+    from database import engine
+    result["meta"] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "database": engine.dialect.name,
+        "concurrency": args.concurrency,
+    }
+    r = result["returns"]
+    print(f"   returns: p50={r['p50_ms']}ms p95={r['p95_ms']}ms p99={r['p99_ms']}ms "
+          f"throughput={r['throughput_ops_per_s']}/s errors={r['errors']}")
+    if args.output:
+        Path(args.output).resolve().write_text(json.dumps(result, indent=2, default=str))
+
+    if result["problems"]:
+        print("❌ Allocation problems:")
+        for line in result["problems"]:
+            print(f"   - {line}")
+        sys.exit(1)
+    print(f"✅ Allocation correct ({result['expired']} holds expired and re-allocated FIFO).")
+
+
+if __name__ == "__main__":
+    main()
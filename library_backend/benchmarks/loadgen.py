@@ -0,0 +1,84 @@
+# file: benchmarks/loadgen.py
+"""
+Minimal async HTTP load generator.
+
+Har scenario ko `concurrency` workers ke saath chalata hai jab tak
+`duration` seconds ya `max_ops` operations poore na ho jayein, aur har
+operation ki latency record karta hai.
+"""
+import asyncio
+import math
+import random
+import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+ScenarioFn = Callable[[httpx.AsyncClient, dict, random.Random], Awaitable[None]]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (sorted input expected)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, float]:
+    """Latencies (seconds) ko p50/p95/p99 (ms) aur throughput mein convert karta hai."""
+    values = sorted(latencies)
+    total = len(values) + errors
+    return {
+        "operations": total,
+        "errors": errors,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "throughput_ops_per_s": round(len(values) / elapsed, 2) if elapsed > 0 else 0.0,
+        "p50_ms": round(percentile(values, 50) * 1000, 2),
+        "p95_ms": round(percentile(values, 95) * 1000, 2),
+        "p99_ms": round(percentile(values, 99) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+        "mean_ms": round(sum(values) / len(values) * 1000, 2) if values else 0.0,
+    }
+
+
+async def run_scenario(
+    scenario: ScenarioFn,
+    client: httpx.AsyncClient,
+    ctx: dict,
+    concurrency: int = 10,
+    duration: float = 10.0,
+    max_ops: Optional[int] = None,
+    seed: int = 42,
+) -> Dict[str, float]:
+    """
+    Ek scenario ko closed-loop mode mein chalata hai.
+    Har worker ka apna seeded RNG hai, is liye request mix run-to-run same rehta hai.
+    """
+    latencies: List[float] = []
+    errors = 0
+    issued = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(worker_id: int):
+        nonlocal errors, issued
+        rng = random.Random(seed * 1000 + worker_id)
+        while time.perf_counter() < deadline:
+            if max_ops is not None:
+                if issued >= max_ops:
+                    return
+                issued += 1
+
+            started = time.perf_counter()
+            try:
+                await scenario(client, ctx, rng)
+            except (httpx.HTTPError, AssertionError, KeyError, IndexError):
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - wall_start
+
+    return summarize(latencies, errors, elapsed)
@@ -0,0 +1,211 @@
+# file: benchmarks/run.py
+"""
+BookNest load-test / benchmark runner.
+
+Usage (library_backend folder se):
+
+    python -m benchmarks.run --database-url sqlite:///./bench.db --scale 1 \\
+        --concurrency 20 --duration 15 --output bench_results.json
+
+    # Pichle run se compare (p95 ya throughput 10% se zyada bigde to exit code 1)
+    python -m benchmarks.run --baseline bench_results.json --fail-on-regression
+
+Steps: fresh schema -> deterministic seed -> uvicorn (real HTTP) -> har
+scenario ko async load generator se chalana -> JSON report.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="BookNest API benchmark suite")
+    parser.add_argument("--database-url", default="sqlite:///./bench.db",
+                        help="Local Postgres ya SQLite URL (default: sqlite:///./bench.db)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Seed data scale factor")
+    parser.add_argument("--seed", type=int, default=42, help="RNG seed (data + request mix)")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per scenario")
+    parser.add_argument("--max-ops", type=int, default=None, help="Optional cap on operations per scenario")
+    parser.add_argument("--scenarios", default="all", help="Comma separated names (default: all)")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline", default=None, help="Pichle run ki JSON file")
+    parser.add_argument("--regression-threshold", type=float, default=0.10)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    return parser.parse_args(argv)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+
+def prepare_database(args) -> dict:
+    """Schema reset + seed. Returns scenario context (ids, counts)."""
+    from database import engine, SessionLocal, Base
+    import models  # noqa: F401  (saare models register ho jayein)
+    from models import log_model, post_model, book_permission_model, request_user_model  # noqa: F401
+    from auth import get_password_hash
+    from benchmarks.seed import seed_benchmark_data, BENCH_PASSWORD
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        started = time.perf_counter()
+        ctx = seed_benchmark_data(db, get_password_hash(BENCH_PASSWORD), scale=args.scale, seed=args.seed)
+        ctx["seed_seconds"] = round(time.perf_counter() - started, 2)
+    finally:
+        db.close()
+    return ctx
+
+
+class BackgroundServer:
+    """uvicorn ko alag thread mein chalata hai taake load generator real HTTP use kare."""
+
+    def __init__(self, port: int):
+        import uvicorn
+        from main import app
+
+        config = uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+async def run_all(args, ctx: dict, base_url: str) -> dict:
+    import httpx
+    from benchmarks.loadgen import run_scenario
+    from benchmarks.scenarios import SCENARIOS
+    from benchmarks.seed import ADMIN_USERNAME, BENCH_PASSWORD
+
+    names = list(SCENARIOS) if args.scenarios == "all" else [n.strip() for n in args.scenarios.split(",")]
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        raise SystemExit(f"Unknown scenarios: {unknown}. Available: {list(SCENARIOS)}")
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        # Setup (measure nahi hota): admin token + issue desk copy pool
+        login = await client.post("/api/token", data={"username": ADMIN_USERNAME, "password": BENCH_PASSWORD})
+        login.raise_for_status()
+        ctx["admin_headers"] = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        ctx["copy_queue"] = asyncio.Queue()
+        for copy_id in ctx["copy_ids"][: max(args.concurrency * 2, 10)]:
+            ctx["copy_queue"].put_nowait(copy_id)
+
+        results = {}
+        for name in names:
+            print(f"▶ {name} ({args.concurrency} workers, {args.duration}s)...")
+            results[name] = await run_scenario(
+                SCENARIOS[name], client, ctx,
+                concurrency=args.concurrency, duration=args.duration,
+                max_ops=args.max_ops, seed=args.seed,
+            )
+            r = results[name]
+            print(f"   p50={r['p50_ms']}ms p95={r['p95_ms']}ms p99={r['p99_ms']}ms "
+                  f"throughput={r['throughput_ops_per_s']}/s errors={r['errors']}")
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """p95 latency ya throughput agar threshold se zyada bigde to regression list return karta hai."""
+    regressions = []
+    for name, now in current["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        if before["p95_ms"] and now["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p95 {before['p95_ms']}ms -> {now['p95_ms']}ms")
+        if before["throughput_ops_per_s"] and \
+                now["throughput_ops_per_s"] < before["throughput_ops_per_s"] * (1 - threshold):
+            regressions.append(
+                f"{name}: throughput {before['throughput_ops_per_s']}/s -> {now['throughput_ops_per_s']}/s"
+            )
+    return regressions
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    output_path = Path(args.output).resolve()
+    # Baseline pehle hi padh lein (output aur baseline same file ho sakti hai)
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+
+    os.environ["DATABASE_URL"] = args.database_url
+    # Bench DB create_all se banta hai (alembic_version nahi hota) - startup check skip
+    os.environ["AUTO_CREATE_SCHEMA"] = "true"
+    os.chdir(BACKEND_DIR)
+
+    print(f"🌱 Seeding {args.database_url} (scale={args.scale}, seed={args.seed})...")
+    ctx = prepare_database(args)
+    print(f"   done in {ctx['seed_seconds']}s: {ctx['counts']}")
+
+    port = _free_port()
+    with BackgroundServer(port):
+        scenarios = asyncio.run(run_all(args, ctx, f"http://127.0.0.1:{port}"))
+
+    from database import engine
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": _git_revision(),
+            "database": engine.dialect.name,
+            "python": platform.python_version(),
+            "scale": args.scale,
+            "seed": args.seed,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "dataset": ctx["counts"],
+        },
+        "scenarios": scenarios,
+    }
+    output_path.write_text(json.dumps(report, indent=2))
+    print(f"📄 Report written to {output_path}")
+
+    if baseline:
+        regressions = compare(report, baseline, args.regression_threshold)
+        if regressions:
+            print("⚠️ Regressions vs baseline:")
+            for line in regressions:
+                print(f"   - {line}")
+            if args.fail_on_regression:
+                sys.exit(1)
+        else:
+            print("✅ No regressions vs baseline.")
+
+
+if __name__ == "__main__":
+    main()
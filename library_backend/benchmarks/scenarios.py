@@ -0,0 +1,85 @@
+# file: benchmarks/scenarios.py
+"""
+Scripted benchmark scenarios.
+
+Har scenario ek "operation" hai jo asal user flow ko represent karta hai
+(kabhi ek request, kabhi do). `ctx` mein seeded ids aur auth headers hote hain
+jo `run.py` setup ke waqt bharta hai.
+"""
+import random
+from datetime import datetime, timedelta
+
+import httpx
+
+from benchmarks.seed import BENCH_PASSWORD
+
+
+def _ok(response: httpx.Response) -> httpx.Response:
+    response.raise_for_status()
+    return response
+
+
+async def catalog_browse(client: httpx.AsyncClient, ctx: dict, rng: random.Random):
+    """Guest visitor public catalog kholta hai."""
+    _ok(await client.get("/api/books/", params={"approved_only": "true", "skip": rng.randint(0, 5) * 20, "limit": 20}))
+
+
+async def search(client: httpx.AsyncClient, ctx: dict, rng: random.Random):
+    """Title/author search box."""
+    _ok(await client.get("/api/books/", params={"search": rng.choice(ctx["search_terms"]), "approved_only": "true"}))
+
+
+async def book_detail(client: httpx.AsyncClient, ctx: dict, rng: random.Random):
+    """Single book page (public, non-restricted book)."""
+    _ok(await client.get(f"/api/books/{rng.choice(ctx['public_book_ids'])}"))
+
+
+async def login_burst(client: httpx.AsyncClient, ctx: dict, rng: random.Random):
+    """Morning login spike: har operation ek password login hai (bcrypt verify included)."""
+    _ok(await client.post("/api/token", data={
+        "username": rng.choice(ctx["member_usernames"]),
+        "password": BENCH_PASSWORD,
+    }))
+
+
+async def issue_return_desk(client: httpx.AsyncClient, ctx: dict, rng: random.Random):
+    """Circulation desk: ek copy issue karo phir usi ko return karo."""
+    copy_id = await ctx["copy_queue"].get()
+    try:
+        issued = _ok(await client.post("/api/issues/issue", headers=ctx["admin_headers"], json={
+            "client_id": rng.choice(ctx["member_ids"]),
+            "copy_id": copy_id,
+            "due_date": (datetime.utcnow() + timedelta(days=14)).isoformat(),
+        })).json()
+        _ok(await client.post(f"/api/issues/return/{issued['id']}", headers=ctx["admin_headers"]))
+    finally:
+        ctx["copy_queue"].put_nowait(copy_id)
+
+
+async def audit_log_browse(client: httpx.AsyncClient, ctx: dict, rng: random.Random):
+    """Admin audit log paging, kabhi kabhi action_type filter ke saath."""
+    params = {"skip": rng.randint(0, 50) * 50, "limit": 50}
+    if rng.random() < 0.5:
+        params["action_type"] = rng.choice(ctx["action_types"])
+    _ok(await client.get("/api/logs/", params=params, headers=ctx["admin_headers"]))
+
+
+async def restricted_request_review(client: httpx.AsyncClient, ctx: dict, rng: random.Random):
+    """Admin review queue kholta hai aur ek request approve/reject karta hai."""
+    _ok(await client.get("/api/restricted-requests/list", headers=ctx["admin_headers"]))
+    _ok(await client.patch(
+        f"/api/restricted-requests/{rng.choice(ctx['request_ids'])}/status",
+        params={"status_update": rng.choice(["approved", "rejected"]), "rejection_reason": "benchmark"},
+        headers=ctx["admin_headers"],
+    ))
+
+
+SCENARIOS = {
+    "catalog_browse": catalog_browse,
+    "search": search,
+    "book_detail": book_detail,
+    "login_burst": login_burst,
+    "issue_return_desk": issue_return_desk,
+    "audit_log_browse": audit_log_browse,
+    "restricted_request_review": restricted_request_review,
+}
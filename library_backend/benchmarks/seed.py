@@ -0,0 +1,78 @@
+# file: benchmarks/seed.py
+"""
+Benchmark dataset seeding.
+
+Fresh database ko `scripts/synthetic_data.py` ke deterministic generator se
+bharta hai taake benchmarks aur manual load tests same data shape par chalein.
+`scale` badhane se saari tables proportionally badhti hain (scale=1 -> ~2k books).
+"""
+from sqlalchemy import select
+
+from models.user_model import User
+from models.book_model import Book
+from models.library_management_models import BookCopy
+from models.request_user_model import AccessRequest
+from scripts import synthetic_data
+
+BENCH_PASSWORD = "bench-password"
+ADMIN_USERNAME = "bench_admin"
+
+# scale=1 par row counts (laptop par kuch seconds mein seed ho jata hai)
+BASE_COUNTS = {
+    "users": 500,
+    "books": 2000,
+    "copies": 3000,
+    "issues": 5000,
+    "logs": 20000,
+    "access_requests": 1000,
+    "digital_access": 5000,
+}
+
+SEARCH_TERMS = synthetic_data.SEARCH_TERMS
+ACTION_TYPES = [action for action, _, _ in synthetic_data.LOG_ACTIONS]
+
+# Scenario context mein ids ki had (memory aur setup time bounded rahein)
+CTX_SAMPLE = 5000
+
+
+def seed_benchmark_data(db, password_hash: str, scale: float = 1.0, seed: int = 42) -> dict:
+    """
+    Synthetic generator chalata hai, phir scenarios ke liye ids (active members,
+    public books, available copies, requests) database se wapas padhta hai.
+    """
+    counts = {name: max(10, int(n * scale)) for name, n in BASE_COUNTS.items()}
+    written = synthetic_data.generate(
+        db.get_bind(), counts,
+        password_hash=password_hash,
+        seed=seed,
+        batch_size=synthetic_data.DEFAULT_BATCH_SIZE,
+        admin_username=ADMIN_USERNAME,
+    )
+
+    members = db.execute(
+        select(User.id, User.username)
+        .where(User.id != 1, User.status == "Active")
+        .order_by(User.id).limit(CTX_SAMPLE)
+    ).all()
+    public_book_ids = db.execute(
+        select(Book.id)
+        .where(Book.is_approved.is_(True), Book.is_restricted.is_(False), Book.deleted_at.is_(None))
+        .order_by(Book.id).limit(CTX_SAMPLE)
+    ).scalars().all()
+    copy_ids = db.execute(
+        select(BookCopy.id).where(BookCopy.status == "Available").order_by(BookCopy.id).limit(CTX_SAMPLE)
+    ).scalars().all()
+    request_ids = db.execute(
+        select(AccessRequest.id).order_by(AccessRequest.id).limit(CTX_SAMPLE)
+    ).scalars().all()
+
+    return {
+        "member_usernames": [m.username for m in members],
+        "member_ids": [m.id for m in members],
+        "public_book_ids": list(public_book_ids),
+        "copy_ids": list(copy_ids),
+        "request_ids": list(request_ids),
+        "search_terms": SEARCH_TERMS,
+        "action_types": ACTION_TYPES,
+        "counts": written,
+    }
@@ -0,0 +1,194 @@
+# file: config.py
+"""
+Central application settings.
+
+.env sirf ek baar (get_settings ki pehli call par) load hoti hai. Baaki
+modules `os.getenv` ki bajaye `get_settings()` use karte hain, aur tests /
+benchmarks apna `Settings(...)` bana kar `create_app(settings)` ko de sakte hain.
+"""
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+
+BASE_DIR = Path(__file__).resolve().parent
+
+DEFAULT_CORS_ORIGINS = (
+    "http://localhost:5173",
+    "http://127.0.0.1:5173",
+    "http://localhost:5174",
+    "http://127.0.0.1:5174",
+    "http://localhost:3000",
+    "http://127.0.0.1:3000",
+    # ✅ YOUR VERCEL APP URL
+    "https://pkil-two.vercel.app",
+    "https://pkil-two.vercel.app/",
+)
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def normalize_database_url(url: Optional[str]) -> Optional[str]:
+    """Heroku/Render kabhi-kabhi 'postgres://' dete hain, par SQLAlchemy ko 'postgresql://' chahiye."""
+    if url and url.startswith("postgres://"):
+        return url.replace("postgres://", "postgresql://", 1)
+    return url
+
+
+def _env_list(name: str) -> Tuple[str, ...]:
+    """Comma separated env value -> tuple (khali entries skip)."""
+    return tuple(part.strip() for part in os.getenv(name, "").split(",") if part.strip())
+
+
+@dataclass(frozen=True)
+class Settings:
+    database_url: Optional[str] = None
+    # Read replicas (optional): GET/catalog reads inhi par round-robin jati hain
+    database_replica_urls: Tuple[str, ...] = ()
+    # Write ke baad itne seconds tak us user ki reads primary par (read-your-writes)
+    replica_sticky_seconds: float = 5.0
+    # Unhealthy replica ko dobara try karne se pehle wait
+    replica_retry_seconds: float = 30.0
+    secret_key: str = "fallback-secret-key-for-dev-only"
+    algorithm: str = "HS256"
+    access_token_expire_minutes: int = 43200  # 30 days
+
+    frontend_url: Optional[str] = None
+    cors_origins: Tuple[str, ...] = DEFAULT_CORS_ORIGINS
+    static_dir: Path = BASE_DIR / "static"
+
+    supabase_url: Optional[str] = None
+    supabase_key: Optional[str] = None
+    cloudinary_cloud_name: Optional[str] = None
+    cloudinary_api_key: Optional[str] = None
+    cloudinary_api_secret: Optional[str] = None
+
+    # Cloudinary uploads ek request mein kitne parallel (utils/cloudinary_helper.upload_many)
+    upload_concurrency: int = 4
+
+    # Cover image derivatives ke liye process pool size
+    image_workers: int = 2
+
+    # PDF streaming proxy (/api/books/{id}/pdf): hot PDFs ka on-disk LRU cache
+    pdf_cache_dir: Path = BASE_DIR / "pdf_cache"
+    pdf_cache_max_mb: int = 2048
+    # Signed iframe link (?exp=&sig=) kitni der valid rahe
+    pdf_link_ttl_seconds: int = 900
+    # Upload par `qpdf --linearize` (agar qpdf installed ho) => pehla page jaldi
+    pdf_linearize: bool = True
+
+    # In-book full-text search: background extraction (utils/content_index)
+    content_index_enabled: bool = True
+    content_index_workers: int = 1
+    content_index_batch_pages: int = 20
+
+    # In-process snapshot caches ki cross-worker version files (utils/cache)
+    cache_state_dir: Path = BASE_DIR / "cache_state"
+
+    # Reading analytics: digital_access -> hourly/daily rollups (background aggregator)
+    analytics_enabled: bool = True
+    analytics_interval_seconds: float = 60.0
+    # Real-time request events (SSE); Postgres par LISTEN/NOTIFY se workers ke beech fan-out
+    events_enabled: bool = True
+    # Soft-deleted rows kitne din baad hard delete (scripts/purge_deleted.py)
+    soft_delete_retention_days: int = 30
+    # Public catalog snapshots (static/catalog, utils/catalog_snapshot)
+    catalog_snapshot_enabled: bool = True
+    catalog_snapshot_interval_seconds: float = 30.0
+    catalog_snapshot_page_size: int = 200
+    # Book holds (utils/holds): Ready hold kitne din pickup ka intezar kare + expiry sweep
+    hold_pickup_days: int = 3
+    hold_sweep_enabled: bool = True
+    hold_sweep_interval_seconds: float = 300.0
+
+    # Logging (utils/app_logging): JSON lines / text, per-module levels, DEBUG sampling
+    log_level: str = "INFO"
+    log_format: str = "json"
+    log_levels: str = ""
+    log_debug_sample_rate: float = 0.1
+
+    # Schema: production mein Alembic ("alembic upgrade head") hi source of truth hai.
+    # AUTO_CREATE_SCHEMA=true sirf local/dev ke liye create_all chalata hai.
+    auto_create_schema: bool = False
+    # STRICT_SCHEMA_CHECK=true => DB revision head par na ho to startup fail
+    strict_schema_check: bool = False
+
+    title: str = "BookNest Library API"
+    version: str = "6.5.0"
+
+    @property
+    def all_cors_origins(self) -> list:
+        origins = list(self.cors_origins)
+        if self.frontend_url:
+            origins.append(self.frontend_url)
+        return origins
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        try:
+            expire = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 43200))
+        except ValueError:
+            expire = 43200
+
+        return cls(
+            database_url=normalize_database_url(os.getenv("DATABASE_URL")),
+            database_replica_urls=tuple(normalize_database_url(u) for u in _env_list("DATABASE_REPLICA_URLS")),
+            replica_sticky_seconds=float(os.getenv("REPLICA_STICKY_SECONDS", 5.0)),
+            replica_retry_seconds=float(os.getenv("REPLICA_RETRY_SECONDS", 30.0)),
+            secret_key=os.getenv("SECRET_KEY", "fallback-secret-key-for-dev-only"),
+            algorithm=os.getenv("ALGORITHM", "HS256"),
+            access_token_expire_minutes=expire,
+            frontend_url=os.getenv("FRONTEND_URL"),
+            static_dir=Path(os.getenv("STATIC_DIR", str(BASE_DIR / "static"))),
+            supabase_url=os.getenv("SUPABASE_URL"),
+            supabase_key=os.getenv("SUPABASE_KEY"),
+            cloudinary_cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
+            cloudinary_api_key=os.getenv("CLOUDINARY_API_KEY"),
+            cloudinary_api_secret=os.getenv("CLOUDINARY_API_SECRET"),
+            upload_concurrency=int(os.getenv("UPLOAD_CONCURRENCY", 4)),
+            image_workers=int(os.getenv("IMAGE_WORKERS", 2)),
+            pdf_cache_dir=Path(os.getenv("PDF_CACHE_DIR", str(BASE_DIR / "pdf_cache"))),
+            pdf_cache_max_mb=int(os.getenv("PDF_CACHE_MAX_MB", 2048)),
+            pdf_link_ttl_seconds=int(os.getenv("PDF_LINK_TTL_SECONDS", 900)),
+            pdf_linearize=_env_bool("PDF_LINEARIZE", True),
+            content_index_enabled=_env_bool("CONTENT_INDEX_ENABLED", True),
+            content_index_workers=int(os.getenv("CONTENT_INDEX_WORKERS", 1)),
+            content_index_batch_pages=int(os.getenv("CONTENT_INDEX_BATCH_PAGES", 20)),
+            cache_state_dir=Path(os.getenv("CACHE_STATE_DIR", str(BASE_DIR / "cache_state"))),
+            analytics_enabled=_env_bool("ANALYTICS_ENABLED", True),
+            analytics_interval_seconds=float(os.getenv("ANALYTICS_INTERVAL_SECONDS", 60)),
+            events_enabled=_env_bool("EVENTS_ENABLED", True),
+            soft_delete_retention_days=int(os.getenv("SOFT_DELETE_RETENTION_DAYS", 30)),
+            catalog_snapshot_enabled=_env_bool("CATALOG_SNAPSHOT_ENABLED", True),
+            catalog_snapshot_interval_seconds=float(os.getenv("CATALOG_SNAPSHOT_INTERVAL_SECONDS", 30)),
+            catalog_snapshot_page_size=int(os.getenv("CATALOG_SNAPSHOT_PAGE_SIZE", 200)),
+            hold_pickup_days=int(os.getenv("HOLD_PICKUP_DAYS", 3)),
+            hold_sweep_enabled=_env_bool("HOLD_SWEEP_ENABLED", True),
+            hold_sweep_interval_seconds=float(os.getenv("HOLD_SWEEP_INTERVAL_SECONDS", 300)),
+            log_level=os.getenv("LOG_LEVEL", "INFO"),
+            log_format=os.getenv("LOG_FORMAT", "json").lower(),
+            log_levels=os.getenv("LOG_LEVELS", ""),
+            log_debug_sample_rate=float(os.getenv("LOG_DEBUG_SAMPLE_RATE", 0.1)),
+            auto_create_schema=_env_bool("AUTO_CREATE_SCHEMA"),
+            strict_schema_check=_env_bool("STRICT_SCHEMA_CHECK"),
+        )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Process-wide settings (cached).
+    🟢 LOCAL: repo root ya library_backend ki '.env' padhi jati hai.
+    🔴 PRODUCTION (Render): file nahi hoti, Environment Variables use hote hain.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv(BASE_DIR.parent / ".env")
+    load_dotenv(BASE_DIR / ".env")
+    return Settings.from_env()
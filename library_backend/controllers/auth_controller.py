@@ -1,5 +1,7 @@
 # file: controllers/auth_controller.py
 
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session, joinedload
@@ -15,6 +17,7 @@ from auth import (
 from utils import create_log
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
 
 @router.post("/token", tags=["Authentication"])
@@ -43,21 +46,21 @@ async def login_for_access_token(
     verification_passed = False
     
     if not user:
-        print(f"❌ Login Failed: User '{username}' not found in DB.")
+        logger.info("Login failed: user not found", extra={"username": username})
     else:
         try:
             # Check Password
             if verify_password(password, user.password_hash):
                 verification_passed = True
             else:
-                print(f"❌ Login Failed: Incorrect password for '{username}'")
+                logger.info("Login failed: incorrect password", extra={"username": username})
         except ValueError as e:
             # Ye tab aata hai jab password > 72 bytes ho ya format galat ho
-            print(f"⚠️ Bcrypt ValueError for '{username}': {e}")
+            logger.warning("Bcrypt ValueError during login: %s", e, extra={"username": username})
         except Exception as e:
             # Ye tab aata hai jab Library version galat ho (AttributeError)
-            print(f"⚠️ Critical Library Error during Verify: {e}")
-            print("👉 SOLUTION: Run 'pip install bcrypt==4.0.1' in terminal.")
+            logger.error("Password verify failed (bcrypt version? pip install bcrypt==4.0.1): %s", e,
+                         extra={"username": username})
 
     if not verification_passed:
         # Log Failed Attempt in DB
@@ -84,7 +87,7 @@ async def login_for_access_token(
     # ✅ 3) Account Status Check
     user_status = str(user.status).strip().lower() if user.status else "active"
     if user_status != "active":
-        print(f"⛔ Login Blocked: User '{username}' is {user_status}")
+        logger.info("Login blocked: account %s", user_status, extra={"username": username})
         try:
             create_log(
                 db=db,
@@ -138,7 +141,7 @@ async def login_for_access_token(
     except Exception:
         pass
 
-    print(f"✅ Login Success: {user.username}")
+    logger.info("Login success", extra={"user_id": user.id, "username": user.username})
 
     # ✅ 7) Return Response
     return {
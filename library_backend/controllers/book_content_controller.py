@@ -0,0 +1,96 @@
+# file: controllers/book_content_controller.py
+"""
+🔎 In-book full-text search
+
+- GET  /api/books/content-search?q=   -> saari readable books (best page + snippet)
+- GET  /api/books/{id}/search?q=      -> ek book ke matching pages
+- GET  /api/books/{id}/index-status   -> indexing progress (admin)
+- POST /api/books/{id}/reindex        -> dobara queue (admin)
+
+Indexing background mein hoti hai (utils/content_index); search ke waqt sirf
+DB ka full-text index query hota hai.
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from models import book_model, user_model
+from models.book_content_model import BookIndexJob
+from schemas import book_content_schema
+from auth import get_current_user_optional, require_permission
+from database import get_db, get_read_db
+from utils.book_access import ensure_book_access, is_admin, readable_restricted_ids
+from utils.content_index import enqueue_book, get_content_indexer, search_book, search_corpus
+
+router = APIRouter()
+
+
+def _load_book(db: Session, book_id: int):
+    return db.query(book_model.Book).filter(
+        book_model.Book.id == book_id,
+        book_model.Book.deleted_at.is_(None)
+    ).first()
+
+
+@router.get("/content-search", response_model=book_content_schema.ContentSearchResponse)
+def content_search(
+    q: str = Query(..., min_length=2, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_read_db),
+    current_user: Optional[user_model.User] = Depends(get_current_user_optional)
+):
+    # Restricted books sirf unhi users ko jin ke paas access hai (warna snippet se content leak)
+    results = search_corpus(
+        db, q,
+        restricted_ids=readable_restricted_ids(db, current_user),
+        include_unapproved=is_admin(current_user),
+        limit=limit, offset=offset,
+    )
+    return {"query": q, "results": results}
+
+
+@router.get("/{book_id}/search", response_model=book_content_schema.BookSearchResponse)
+def search_in_book(
+    book_id: int,
+    q: str = Query(..., min_length=2, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: Session = Depends(get_read_db),
+    current_user: Optional[user_model.User] = Depends(get_current_user_optional)
+):
+    ensure_book_access(db, _load_book(db, book_id), current_user)
+    job = db.get(BookIndexJob, book_id)
+    return {
+        "book_id": book_id,
+        "query": q,
+        "index_status": job.status if job else None,
+        "results": search_book(db, book_id, q, limit=limit, offset=offset),
+    }
+
+
+@router.get("/{book_id}/index-status", response_model=book_content_schema.IndexStatus,
+            dependencies=[Depends(require_permission("BOOK_MANAGE"))])
+def get_index_status(book_id: int, db: Session = Depends(get_db)):
+    job = db.get(BookIndexJob, book_id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book has no content index.")
+    return job
+
+
+@router.post("/{book_id}/reindex", response_model=book_content_schema.IndexStatus,
+             status_code=status.HTTP_202_ACCEPTED,
+             dependencies=[Depends(require_permission("BOOK_MANAGE"))])
+def reindex_book(book_id: int, db: Session = Depends(get_db)):
+    db_book = _load_book(db, book_id)
+    if not db_book:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
+
+    job = enqueue_book(db, db_book, force=True)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Book has no PDF or text file to index.")
+    db.commit()
+    db.refresh(job)
+    get_content_indexer().wake()
+    return job
@@ -1,16 +1,32 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session, joinedload
 
 # --- Imports ---
-from models import library_management_models as models, user_model
+from models import library_management_models as models, user_model, book_model
 from schemas import library_management_schemas as schemas
 from auth import require_permission
 from database import get_db
 from utils import create_log
+from utils.pagination import NEXT_CURSOR_HEADER, keyset_page
 
 router = APIRouter()
 
+
+def _copy_query(db: Session):
+    return db.query(models.BookCopy).options(
+        joinedload(models.BookCopy.book),
+        joinedload(models.BookCopy.location)
+    )
+
+
+def _find_by_barcode(db: Session, code: str):
+    # ix_book_copies_barcode_active (partial unique) se ek index lookup
+    return _copy_query(db).filter(
+        models.BookCopy.barcode == code,
+        models.BookCopy.deleted_at.is_(None)
+    ).first()
+
 # ==================================
 # COPY ENDPOINTS
 # ==================================
@@ -27,11 +43,15 @@ def create_book_copy(
     Create a new physical copy of a book.
     Requires BOOK_MANAGE permission.
     """
-    # 1. Create Model
+    # 1. Barcode unique hona chahiye (active copies mein)
+    if copy.barcode and _find_by_barcode(db, copy.barcode):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A copy with this barcode already exists")
+
+    # 2. Create Model
     db_copy = models.BookCopy(**copy.dict())
     db.add(db_copy)
     
-    # 2. Log Action
+    # 3. Log Action
     create_log(
         db=db, 
         user=current_user, 
@@ -48,19 +68,61 @@ def create_book_copy(
 # --- READ ALL COPIES ---
 @router.get("/", response_model=List[schemas.BookCopy])
 def get_all_book_copies(
-    skip: int = 0, 
-    limit: int = 100, 
+    response: Response,
+    skip: int = Query(0, ge=0, description="Legacy offset pagination (cursor behtar hai)"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="Pichhle response ka X-Next-Cursor"),
+    book_id: Optional[int] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    search: Optional[str] = Query(None, description="Book title (contains)"),
     db: Session = Depends(get_db),
     # ✅ FIX: 'BOOK_ISSUE' rakha hai taake Student/Issuer list dekh sake
     current_user: user_model.User = Depends(require_permission("BOOK_ISSUE")) 
 ):
     """
-    Get list of all book copies.
+    Get list of all book copies (newest first).
+    Agla page: `cursor` = pichhle response ka X-Next-Cursor.
     """
-    return db.query(models.BookCopy).options(
-        joinedload(models.BookCopy.book),
-        joinedload(models.BookCopy.location)
-    ).offset(skip).limit(limit).all()
+    query = _copy_query(db)
+    if book_id is not None:
+        query = query.filter(models.BookCopy.book_id == book_id)
+    if status_filter:
+        query = query.filter(models.BookCopy.status == status_filter)
+    if search:
+        query = query.filter(models.BookCopy.book.has(book_model.Book.title.ilike(f"%{search}%")))
+
+    if skip and not cursor:
+        return query.order_by(models.BookCopy.id.desc()).offset(skip).limit(limit).all()
+
+    copies, next_cursor = keyset_page(query, models.BookCopy.id, models.BookCopy.id, cursor, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return copies
+
+
+# --- SCANNER LOOKUP (Barcode ya Copy ID) ---
+# Note: "/{copy_id}" se pehle define hona zaroori hai
+@router.get("/lookup", response_model=schemas.BookCopy)
+def lookup_book_copy(
+    code: str = Query(..., min_length=1, max_length=64, description="Scan kiya barcode ya Copy ID"),
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(require_permission("BOOK_ISSUE"))
+):
+    """
+    Issue desk scanner: pehle barcode match, na mile aur code number ho to
+    Copy ID (primary key). Dono single indexed lookups hain.
+    """
+    code = code.strip()
+    db_copy = _find_by_barcode(db, code)
+    if db_copy is None and code.isdigit():
+        db_copy = _copy_query(db).filter(
+            models.BookCopy.id == int(code),
+            models.BookCopy.deleted_at.is_(None)
+        ).first()
+
+    if not db_copy:
+        raise HTTPException(status_code=404, detail="Book copy not found")
+    return db_copy
 
 
 # --- READ ONE COPY ---
@@ -74,10 +136,7 @@ def get_book_copy(
     """
     Get details of a specific copy.
     """
-    db_copy = db.query(models.BookCopy).options(
-        joinedload(models.BookCopy.book),
-        joinedload(models.BookCopy.location)
-    ).filter(models.BookCopy.id == copy_id).first()
+    db_copy = _copy_query(db).filter(models.BookCopy.id == copy_id).first()
     
     if not db_copy:
         raise HTTPException(status_code=404, detail="Book copy not found")
@@ -1,3 +1,4 @@
+import logging
 from typing import List, Optional
 from datetime import datetime, date
 
@@ -9,15 +10,19 @@ from sqlalchemy.orm import Session, joinedload
 from models import book_model, language_model, user_model, request_model, request_user_model
 from schemas import book_schema
 from auth import require_permission, get_current_user_optional 
-from database import get_db
+from database import get_db, get_read_db
 from utils import create_log
 
 # ✅ Hybrid Upload Imports
 from utils.cloudinary_helper import upload_to_cloudinary
 from utils.supabase_helper import upload_pdf_to_supabase
+from utils.image_pipeline import generate_cover_variants, variants_columns
+from utils.content_index import enqueue_book, get_content_indexer
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
 # ==================================
 # HELPER FUNCTIONS
 # ==================================
@@ -38,7 +43,7 @@ def get_book_by_id_internal(db: Session, book_id: int):
 
 @router.get("/", response_model=List[book_schema.Book]) 
 def get_books(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     # Guest user bhi allow hai (returns None if not logged in)
     current_user: Optional[user_model.User] = Depends(get_current_user_optional) 
 ):
@@ -67,8 +72,8 @@ def get_books(
             ).all()
             
             accessible_book_ids = {req.book_id for req in approved_reqs}
-        except Exception as e:
-            print(f"Error fetching access requests: {e}")
+        except Exception:
+            logger.exception("Error fetching access requests", extra={"user_id": current_user.id})
 
     # 3. Har book par Access Flag set karein
     results = []
@@ -149,8 +154,11 @@ async def create_book(
     # 4. Handle Files (Hybrid Upload)
     cover_image_url = None
     pdf_url = None
+    cover_columns = {}
 
     if cover_image:
+        # Responsive WebP/AVIF sizes + blurhash (process pool), phir original Cloudinary par
+        cover_columns = variants_columns(await generate_cover_variants(cover_image))
         cover_image_url = upload_to_cloudinary(cover_image, folder="booknest/covers")
     
     if pdf_file:
@@ -184,7 +192,8 @@ async def create_book(
         is_digital=is_digital,
         is_approved=False, 
         cover_image_url=cover_image_url,
-        pdf_url=pdf_url
+        pdf_url=pdf_url,
+        **cover_columns
     )
     
     new_book.subcategories = db_subcategories
@@ -199,7 +208,11 @@ async def create_book(
         target_type="Book", target_id=new_book.id
     )
 
+    # 8. In-book search: extraction background mein (same transaction mein queue)
+    enqueue_book(db, new_book)
+
     db.commit()
+    get_content_indexer().wake()
     db.refresh(new_book)
     return get_book_by_id_internal(db, new_book.id)
 
@@ -252,7 +265,11 @@ async def update_book(
 
     # Update Files
     if cover_image:
+        cover_columns = variants_columns(await generate_cover_variants(cover_image))
         db_book.cover_image_url = upload_to_cloudinary(cover_image, folder="booknest/covers")
+        # Nayi cover: purane derivatives ka reference bhi hata dein
+        db_book.cover_variants = cover_columns.get("cover_variants")
+        db_book.cover_blurhash = cover_columns.get("cover_blurhash")
 
     if pdf_file:
         db_book.pdf_url = upload_pdf_to_supabase(pdf_file, bucket_name="library_db")
@@ -287,8 +304,12 @@ async def update_book(
         description=f"Book '{db_book.title}' updated.",
         target_type="Book", target_id=book_id
     )
-    
+
+    # Naya PDF => purana content index hata kar dobara queue (warna no-op)
+    enqueue_book(db, db_book)
+
     db.commit()
+    get_content_indexer().wake()
     db.refresh(db_book)
     return get_book_by_id_internal(db, book_id)
 
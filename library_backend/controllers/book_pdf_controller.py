@@ -0,0 +1,194 @@
+# file: controllers/book_pdf_controller.py
+"""
+📄 Access-checked PDF streaming (/api/books/{id}/pdf)
+
+- Restricted rules wahi jo `read_book` ke (utils/book_access).
+- HTTP Range (206 Partial Content): browser ka PDF viewer / pdf.js sirf
+  zaroori bytes mangta hai, aur linearized PDF ka pehla page poori file
+  download hone se pehle dikh jata hai.
+- iframe Authorization header nahi bhej sakta, is liye frontend pehle
+  `/pdf-link` se chhoti umar ka signed URL leta hai (JWT URL/logs mein nahi jata).
+"""
+import hashlib
+import hmac
+import logging
+import time
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, joinedload
+
+from models import book_model, user_model
+from auth import get_current_user_optional
+from config import get_settings
+from database import get_read_db
+from utils.book_access import ensure_book_access
+from utils.pdf_storage import PdfNotFound, backend_for, get_pdf_cache, iter_file_range
+
+router = APIRouter()
+
+logger = logging.getLogger(__name__)
+
+
+# ==================================
+# HELPERS
+# ==================================
+
+def _load_book(db: Session, book_id: int):
+    return db.query(book_model.Book).filter(
+        book_model.Book.id == book_id,
+        book_model.Book.deleted_at.is_(None)
+    ).first()
+
+
+def _signature(book_id: int, user_id: int, expires: int) -> str:
+    message = f"pdf:{book_id}:{user_id}:{expires}".encode()
+    return hmac.new(get_settings().secret_key.encode(), message, hashlib.sha256).hexdigest()[:32]
+
+
+def _user_from_signature(db: Session, book_id: int, user_id: Optional[int], expires: Optional[int], sig: str):
+    """Valid signed link -> us user ka object (0 = guest link). Galat/expired => 403."""
+    if user_id is None or expires is None or expires < time.time() \
+            or not hmac.compare_digest(sig, _signature(book_id, user_id, expires)):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="PDF link is invalid or has expired.")
+    if user_id == 0:
+        return None
+    return db.query(user_model.User).options(
+        joinedload(user_model.User.role)
+    ).filter(user_model.User.id == user_id).first()
+
+
+def parse_range(header: Optional[str], size: int):
+    """
+    'bytes=0-1023' | 'bytes=500-' | 'bytes=-500' -> (start, end) inclusive.
+    None = poori file (header nahi, ya multi-range jo hum ignore karte hain).
+    ValueError = unsatisfiable (416).
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+
+    first, _, last = spec.strip().partition("-")
+    try:
+        if not first:
+            suffix = int(last)
+            if suffix <= 0:
+                raise ValueError(header)
+            start, end = max(size - suffix, 0), size - 1
+        else:
+            start = int(first)
+            end = int(last) if last else size - 1
+    except ValueError:
+        raise ValueError(header)
+
+    if start >= size or end < start:
+        raise ValueError(header)
+    return start, min(end, size - 1)
+
+
+# ==================================
+# ENDPOINTS
+# ==================================
+
+@router.get("/{book_id}/pdf-link")
+def get_pdf_link(
+    book_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: Optional[user_model.User] = Depends(get_current_user_optional)
+):
+    """iframe ke liye signed, chhoti umar ka URL (access yahin check hota hai)."""
+    db_book = _load_book(db, book_id)
+    ensure_book_access(db, db_book, current_user)
+    if not db_book.pdf_url:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="This book does not have a PDF file attached.")
+
+    expires = int(time.time()) + get_settings().pdf_link_ttl_seconds
+    user_id = current_user.id if current_user else 0
+    sig = _signature(book_id, user_id, expires)
+    return {
+        "url": f"/api/books/{book_id}/pdf?u={user_id}&exp={expires}&sig={sig}",
+        "expires_at": expires,
+    }
+
+
+# HEAD alag route (apna operation_id): ek api_route par dono methods same operationId banate hain
+@router.head("/{book_id}/pdf", operation_id="head_book_pdf")
+@router.get("/{book_id}/pdf")
+def stream_book_pdf(
+    book_id: int,
+    request: Request,
+    u: Optional[int] = None,
+    exp: Optional[int] = None,
+    sig: Optional[str] = None,
+    db: Session = Depends(get_read_db),
+    current_user: Optional[user_model.User] = Depends(get_current_user_optional)
+):
+    user = current_user
+    if user is None and sig:
+        user = _user_from_signature(db, book_id, u, exp, sig)
+
+    db_book = _load_book(db, book_id)
+    ensure_book_access(db, db_book, user)
+    key = db_book.pdf_url
+    if not key:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="This book does not have a PDF file attached.")
+
+    # 1. Source: disk cache (hit) ya storage backend
+    backend = backend_for(key)
+    cache = get_pdf_cache() if backend.cacheable else None
+    cached_path = cache.get(key) if cache else None
+    try:
+        size = cached_path.stat().st_size if cached_path else backend.size(key)
+    except PdfNotFound:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="PDF file not found in storage.")
+    except Exception:
+        logger.exception("PDF storage error", extra={"book_id": book_id})
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="PDF storage is unavailable.")
+
+    etag = f'"{hashlib.sha256(key.encode()).hexdigest()[:16]}-{size}"'
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        # Restricted content => shared caches (CDN) mein nahi
+        "Cache-Control": "private, max-age=3600",
+        "Content-Disposition": "inline",
+    }
+
+    # 2. Range
+    if_range = request.headers.get("if-range")
+    try:
+        byte_range = parse_range(request.headers.get("range"), size)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    if byte_range and if_range and if_range != etag:
+        byte_range = None  # File badal gayi => poori nayi file
+
+    if byte_range is None and request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    start, end = byte_range or (0, size - 1)
+    headers["Content-Length"] = str(end - start + 1)
+    status_code = status.HTTP_200_OK
+    if byte_range:
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    if request.method == "HEAD":
+        return Response(status_code=status_code, headers=headers, media_type="application/pdf")
+
+    # 3. Body: cache miss par ye range upstream se, aur poori file background mein cache mein
+    if cached_path:
+        body = iter_file_range(cached_path, start, end)
+    else:
+        if cache:
+            cache.fill_async(backend, key)
+        body = backend.iter_range(key, start, end)
+
+    return StreamingResponse(body, status_code=status_code, headers=headers, media_type="application/pdf")
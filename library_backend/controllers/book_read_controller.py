@@ -1,15 +1,27 @@
+import logging
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import or_, func # ✅ func add kiya case-insensitive check ke liye
 
 # --- Imports ---
 from models import book_model, user_model, book_permission_model, request_user_model
-from schemas import book_schema
+from models.library_management_models import AVAILABLE_COPY_STATUSES, BookCopy
+from models.location_model import Location
+from schemas import book_schema, library_management_schemas
 from auth import get_current_user_optional 
-from database import get_db
+from database import get_read_db
+from utils.book_access import ensure_book_access, is_admin, readable_restricted_ids
+from utils.change_feed import RESET_FEED, after_token, read_counter
+from utils.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor, keyset_page
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+CHANGES_DEFAULT_LIMIT = 500
+CHANGES_MAX_LIMIT = 2000
+BROWSE_DEFAULT_LIMIT = 25
+BROWSE_MAX_LIMIT = 200
 
 # --- Helper: Get Book Internal ---
 def get_book_by_id_internal(db: Session, book_id: int):
@@ -33,16 +45,10 @@ def read_books(
     category_id: Optional[int] = None,
     language_id: Optional[int] = None,
     approved_only: bool = False,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Optional[user_model.User] = Depends(get_current_user_optional)
 ):
-    print("\n" + "="*50)
-    print("🔍 DEBUG: Searching Books...")
-    
-    if current_user:
-        print(f"👤 User Logged In: {current_user.username} (ID: {current_user.id})")
-    else:
-        print("👤 Guest User (Not Logged In)")
+    logger.debug("Searching books", extra={"user_id": current_user.id if current_user else None, "search": search})
 
     # 1. Fetch Books
     query = db.query(book_model.Book).options(
@@ -87,15 +93,6 @@ def read_books(
 
         # B. Check Approved Requests (Case Insensitive Fix)
         try:
-            # 🔍 Debug: User ki saari requests print karo
-            all_reqs = db.query(request_user_model.AccessRequest).filter(
-                request_user_model.AccessRequest.user_id == current_user.id
-            ).all()
-            
-            print(f"📋 Total Requests found for user: {len(all_reqs)}")
-            for req in all_reqs:
-                print(f"   - Book ID: {req.book_id} | Status in DB: '{req.status}'")
-
             # ✅ FIX: Case Insensitive Check (Approved, approved, APPROVED sab chalega)
             approved_reqs = db.query(request_user_model.AccessRequest).filter(
                 request_user_model.AccessRequest.user_id == current_user.id,
@@ -104,10 +101,10 @@ def read_books(
             
             found_ids = [req.book_id for req in approved_reqs]
             accessible_book_ids.update(found_ids)
-            print(f"✅ Approved Book IDs found: {found_ids}")
+            logger.debug("Approved access requests", extra={"user_id": current_user.id, "book_ids": found_ids})
 
-        except Exception as e:
-            print(f"❌ Error fetching requests: {e}")
+        except Exception:
+            logger.exception("Error fetching access requests")
 
     # Step 2: Set Flag
     for book in books:
@@ -119,56 +116,172 @@ def read_books(
             has_access = True
         elif current_user and book.id in accessible_book_ids:
             has_access = True
-            print(f"🔓 Unlocking Restricted Book ID: {book.id} for User")
 
         setattr(book, "user_has_access", has_access)
 
-    print("="*50 + "\n")
     return books
 
 
+# ==================================
+# 🔄 DELTA SYNC (offline / cached clients)
+# ==================================
+
+@router.get("/changes", response_model=book_schema.BookChanges)
+def read_book_changes(
+    since: Optional[str] = None,
+    limit: int = Query(CHANGES_DEFAULT_LIMIT, ge=1, le=CHANGES_MAX_LIMIT),
+    db: Session = Depends(get_read_db),
+    current_user: Optional[user_model.User] = Depends(get_current_user_optional)
+):
+    """
+    `since` ke baad commit hui book changes (utils/change_feed). `since` na ho
+    => poora live catalog (pages mein). Client `token` save kare, `has_more`
+    par foran dobara call kare; `reset` par local copy clear kare.
+    """
+    # Token = (change_seq, id, epoch); epoch = token bante waqt ka "books.reset" counter
+    epoch = read_counter(db, RESET_FEED)
+    position = None
+    reset = False
+    if since:
+        seq, last_id, token_epoch = decode_cursor(since, 3)
+        if token_epoch < epoch:
+            reset = True  # Token ke baad hard delete hua (tombstones kho gaye): full resync
+        else:
+            position = (seq, last_id)
+
+    admin = is_admin(current_user)
+    query = db.query(book_model.Book).options(
+        selectinload(book_model.Book.subcategories).joinedload(book_model.Subcategory.category),
+        joinedload(book_model.Book.language)
+    )
+    if position is None:
+        # Initial sync: sirf live rows (tombstones ki zaroorat nahi)
+        query = query.filter(book_model.Book.deleted_at.is_(None))
+        if not admin:
+            query = query.filter(book_model.Book.is_approved == True)
+    else:
+        query = query.execution_options(include_deleted=True)
+
+    rows = after_token(query, position).limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    readable = readable_restricted_ids(db, current_user)
+    changed, deleted = [], []
+    for book in rows:
+        if book.deleted_at is not None or (not book.is_approved and not admin):
+            deleted.append(book.id)
+            continue
+        setattr(book, "user_has_access", not book.is_restricted or readable is None or book.id in readable)
+        changed.append(book)
+
+    last = (rows[-1].change_seq, rows[-1].id) if rows else (position or (0, 0))
+    token = encode_cursor(*last, epoch)
+
+    return {
+        "token": token,
+        "has_more": has_more,
+        "reset": reset,
+        "changed": changed,
+        "deleted": deleted,
+        "readable_ids": None if readable is None else sorted(readable),
+    }
+
+
+# ==================================
+# 📑 BROWSE (server-side filters + cursor pages)
+# ==================================
+
+@router.get("/browse", response_model=List[book_schema.Book])
+def browse_books(
+    response: Response,
+    search: Optional[str] = Query(None, description="Title / author / ISBN (contains)"),
+    approved: Optional[bool] = None,
+    restricted: Optional[bool] = None,
+    language_id: Optional[int] = None,
+    subcategory_id: Optional[int] = None,
+    limit: int = Query(BROWSE_DEFAULT_LIMIT, ge=1, le=BROWSE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="Pichhle response ka X-Next-Cursor"),
+    db: Session = Depends(get_read_db),
+    current_user: Optional[user_model.User] = Depends(get_current_user_optional)
+):
+    """
+    Admin tables (Streamlit) ke liye: filters DB mein, newest first, ek page
+    (keyset on id) - poori list kabhi memory mein nahi aati. Non-admins ko
+    sirf approved books.
+    """
+    Book = book_model.Book
+    query = db.query(Book).options(
+        selectinload(Book.subcategories).joinedload(book_model.Subcategory.category),
+        joinedload(Book.language)
+    )
+    if not is_admin(current_user):
+        approved = True
+    if approved is not None:
+        query = query.filter(Book.is_approved == approved)
+    if restricted is not None:
+        query = query.filter(Book.is_restricted == restricted)
+    if language_id is not None:
+        query = query.filter(Book.language_id == language_id)
+    if subcategory_id is not None:
+        query = query.filter(Book.subcategories.any(id=subcategory_id))
+    if search:
+        term = f"%{search}%"
+        query = query.filter(or_(Book.title.ilike(term), Book.author.ilike(term), Book.isbn.ilike(term)))
+
+    books, next_cursor = keyset_page(query, Book.id, Book.id, cursor, limit)
+    readable = readable_restricted_ids(db, current_user)
+    for book in books:
+        setattr(book, "user_has_access", not book.is_restricted or readable is None or book.id in readable)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return books
+
+
+@router.get("/{book_id}/availability", response_model=library_management_schemas.BookAvailability)
+def read_book_availability(
+    book_id: int,
+    db: Session = Depends(get_read_db),
+    current_user: Optional[user_model.User] = Depends(get_current_user_optional)
+):
+    """
+    Book ki issue ho sakne wali copies, Location ke hisaab se group.
+    Sirf (CopyID, LocationID) + location columns - ix_book_copies_book_id_status
+    (BookID, Status) se index range scan, poori copy rows / book load nahi hoti.
+    """
+    db_book = get_book_by_id_internal(db, book_id)
+    ensure_book_access(db, db_book, current_user)
+
+    rows = db.query(
+        BookCopy.id, Location.id, Location.name, Location.rack, Location.shelf
+    ).join(Location, BookCopy.location_id == Location.id).filter(
+        BookCopy.book_id == book_id,
+        BookCopy.status.in_(AVAILABLE_COPY_STATUSES),
+        BookCopy.deleted_at.is_(None)
+    ).order_by(Location.name, BookCopy.id).all()
+
+    locations = {}
+    for copy_id, location_id, name, rack, shelf in rows:
+        entry = locations.setdefault(location_id, {
+            "location_id": location_id, "name": name, "rack": rack, "shelf": shelf,
+            "count": 0, "copy_ids": []
+        })
+        entry["count"] += 1
+        entry["copy_ids"].append(copy_id)
+
+    return {"book_id": book_id, "available_count": len(rows), "locations": list(locations.values())}
+
+
 @router.get("/{book_id}", response_model=book_schema.Book)
 def read_book(
     book_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: Optional[user_model.User] = Depends(get_current_user_optional)
 ):
     db_book = get_book_by_id_internal(db, book_id)
-    
-    if not db_book:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
-
-    # 1. Approval Check
-    if not db_book.is_approved:
-        if not current_user or (current_user.role.name.lower() not in ['admin', 'superadmin']):
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found.")
-            
-    # 2. Restricted Access Check Logic
-    has_access = False
-
-    if not db_book.is_restricted:
-        has_access = True
-    elif current_user and hasattr(current_user, 'role') and current_user.role.name.lower() in ['admin', 'superadmin']:
-        has_access = True
-    elif current_user:
-        # Check Permission Table
-        perm = db.query(book_permission_model.BookPermission).filter(
-            book_permission_model.BookPermission.book_id == book_id,
-            book_permission_model.BookPermission.user_id == current_user.id
-        ).first()
-        
-        # Check Request Table (Case Insensitive)
-        req = db.query(request_user_model.AccessRequest).filter(
-            request_user_model.AccessRequest.book_id == book_id,
-            request_user_model.AccessRequest.user_id == current_user.id,
-            func.lower(request_user_model.AccessRequest.status) == "approved"
-        ).first()
-
-        if perm or req:
-            has_access = True
 
-    if db_book.is_restricted and not has_access:
-         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You do not have permission to view this restricted book.")
+    # Approval + Restricted Access rules (utils/book_access - PDF stream bhi yahi use karta hai)
+    has_access = ensure_book_access(db, db_book, current_user)
 
     setattr(db_book, "user_has_access", has_access)
-    return db_book
\ No newline at end of file
+    return db_book
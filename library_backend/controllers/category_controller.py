@@ -1,17 +1,30 @@
+import hashlib
+import json
 from datetime import datetime
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func 
+from sqlalchemy import Integer, distinct, func, literal, select, true, union_all
 
 # --- Imports ---
 from models import book_model, user_model
 from schemas import category_schema
 from auth import require_permission, get_db
+from database import get_read_db
 from utils import create_log
+from utils.cache import VersionedCache, invalidate_on_commit, on_primary
 
 router = APIRouter()
 
+# ✅ Category tree snapshot: book / category / subcategory write commit hote hi purana
+TREE_CACHE_CONTROL = "private, max-age=60"
+tree_cache = VersionedCache("category_tree", max_age=600)
+invalidate_on_commit(tree_cache, {
+    book_model.Book: ("is_approved", "deleted_at", "subcategories"),
+    book_model.Category: None,
+    book_model.Subcategory: None,
+})
+
 # ==================================
 # CATEGORY ENDPOINTS
 # ==================================
@@ -50,7 +63,7 @@ def create_category(
 def read_categories(
     skip: int = 0, 
     limit: int = 100, 
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     # ✅ FIX: 'BOOK_VIEW' allow kiya hai taake Student dropdown dekh sake
     current_user: user_model.User = Depends(require_permission("BOOK_VIEW"))
 ):
@@ -60,11 +73,81 @@ def read_categories(
     ).order_by(book_model.Category.id).offset(skip).limit(limit).all()
 
 
+# --- CATEGORY TREE (navigation) ---
+def _tree_counts(db: Session) -> dict:
+    """
+    Ek aggregate query (UNION ALL) mein teeno levels ke counts:
+    (category_id, subcategory_id) -> books, (category_id, None) -> distinct books,
+    (None, None) -> total distinct books. Link table ka reverse index
+    (subcategory_id, book_id) join + count cover karta hai.
+    """
+    link = book_model.book_subcategory_link
+    Sub, Book = book_model.Subcategory, book_model.Book
+    no_id = literal(None, Integer)
+
+    def _active(stmt):
+        return stmt.select_from(link).join(Sub, Sub.id == link.c.subcategory_id).join(
+            Book, Book.id == link.c.book_id
+        ).where(Sub.deleted_at.is_(None), Book.deleted_at.is_(None), Book.is_approved.is_(true()))
+
+    per_sub = _active(select(Sub.category_id, link.c.subcategory_id, func.count(link.c.book_id))) \
+        .group_by(Sub.category_id, link.c.subcategory_id)
+    per_category = _active(select(Sub.category_id, no_id, func.count(distinct(link.c.book_id)))) \
+        .group_by(Sub.category_id)
+    overall = _active(select(no_id, no_id, func.count(distinct(link.c.book_id))))
+
+    return {(cat_id, sub_id): count for cat_id, sub_id, count in db.execute(union_all(per_sub, per_category, overall))}
+
+
+def _build_tree(db: Session) -> tuple:
+    """(body bytes, etag) - poori hierarchy + counts, ek baar render."""
+    counts = _tree_counts(db)
+    subcategories = {}
+    for sub in db.query(book_model.Subcategory).filter(
+        book_model.Subcategory.deleted_at.is_(None)
+    ).order_by(book_model.Subcategory.name, book_model.Subcategory.id):
+        subcategories.setdefault(sub.category_id, []).append(category_schema.SubcategoryTreeNode(
+            id=sub.id, name=sub.name, description=sub.description,
+            book_count=counts.get((sub.category_id, sub.id), 0),
+        ))
+
+    tree = category_schema.CategoryTree(
+        total_books=counts.get((None, None), 0),
+        categories=[
+            category_schema.CategoryTreeNode(
+                id=cat.id, name=cat.name, description=cat.description,
+                book_count=counts.get((cat.id, None), 0),
+                subcategories=subcategories.get(cat.id, []),
+            )
+            for cat in db.query(book_model.Category).filter(
+                book_model.Category.deleted_at.is_(None)
+            ).order_by(book_model.Category.name, book_model.Category.id)
+        ],
+    )
+    body = json.dumps(tree.model_dump(mode="json"), separators=(",", ":"), ensure_ascii=False).encode()
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+# ⚠️ Static path: /{category_id} se pehle define hona zaroori
+@router.get("/tree", response_model=category_schema.CategoryTree)
+def read_category_tree(
+    request: Request,
+    current_user: user_model.User = Depends(require_permission("BOOK_VIEW"))
+):
+    """Categories -> subcategories, har node par active (approved) book count ke saath."""
+    # Snapshot primary se: bump primary commit par, replica abhi purani ho sakti hai
+    body, etag = tree_cache.get("tree", on_primary(_build_tree))
+    headers = {"ETag": etag, "Cache-Control": TREE_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # --- READ ONE (Accessible to Students/Staff) ---
 @router.get("/{category_id}", response_model=category_schema.Category)
 def read_category(
     category_id: int, 
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     # ✅ FIX: 'BOOK_VIEW' allow kiya hai
     current_user: user_model.User = Depends(require_permission("BOOK_VIEW"))
 ):
@@ -1,22 +1,26 @@
 # file: controllers/digital_access_controller.py
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-from models import library_management_models as models, user_model
-from schemas import library_management_schemas as schemas
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import List, Literal, Optional
+from models import library_management_models as models, user_model, book_model
+from schemas import library_management_schemas as schemas, analytics_schema
 from auth import require_permission, get_db, get_current_user
+from database import get_read_db
 from utils import create_log
+from utils import reading_analytics
+from utils.pagination import NEXT_CURSOR_HEADER, keyset_page
 
 router = APIRouter()
 
 @router.post("/", response_model=schemas.DigitalAccess, status_code=status.HTTP_201_CREATED)
 def log_digital_access(
-    access_data: schemas.DigitalAccessCreate, 
+    access_data: schemas.DigitalAccessCreate,
     db: Session = Depends(get_db),
     current_user: user_model.User = Depends(get_current_user) # Any logged-in user can access
 ):
     """
     Log karein jab koi user ek digital book access karta hai.
+    (Analytics rollups background aggregator banata hai - yahan sirf raw event.)
     """
     # Verify that the current user is the one logging the access
     if current_user.id != access_data.client_id:
@@ -24,20 +28,112 @@ def log_digital_access(
 
     db_access = models.DigitalAccess(**access_data.dict())
     db.add(db_access)
-    
+    db.flush()  # ✅ Log ko sahi target_id mile
+
     log_desc = f"User '{current_user.username}' accessed digital book ID {access_data.book_id}."
     create_log(db, current_user, "DIGITAL_ACCESS_LOGGED", log_desc, "DigitalAccess", db_access.id)
-    
+
     db.commit()
     db.refresh(db_access)
     return db_access
 
 @router.get("/user/{client_id}", response_model=List[schemas.DigitalAccess], dependencies=[Depends(require_permission("DIGITAL_ACCESS_VIEW"))])
-def get_user_digital_access_history(client_id: int, db: Session = Depends(get_db)):
+def get_user_digital_access_history(
+    client_id: int,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="Pichhle response ka X-Next-Cursor"),
+    db: Session = Depends(get_db)
+):
     """
-    Ek specific user ki digital access history dekhein.
+    Ek specific user ki digital access history dekhein (naye pehle).
+    Keyset pagination: (ClientID, DigitalAccessID) index par, OFFSET nahi.
+    Agla page: `cursor` = pichhle response ka X-Next-Cursor.
     """
-    history = db.query(models.DigitalAccess).filter(models.DigitalAccess.client_id == client_id).all()
-    if not history:
+    query = db.query(models.DigitalAccess).options(
+        joinedload(models.DigitalAccess.client).joinedload(user_model.User.role).selectinload(user_model.Role.permissions),
+        selectinload(models.DigitalAccess.book).joinedload(book_model.Book.language),
+        selectinload(models.DigitalAccess.book).selectinload(book_model.Book.subcategories).joinedload(book_model.Subcategory.category),
+    ).filter(models.DigitalAccess.client_id == client_id)
+
+    history, next_cursor = keyset_page(query, models.DigitalAccess.id, models.DigitalAccess.id, cursor, limit)
+    if not history and not cursor:
         raise HTTPException(status_code=404, detail="No access history found for this user")
-    return history
\ No newline at end of file
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return history
+
+
+# ==================================
+# 📊 READING ANALYTICS (rollup tables, raw events scan nahi)
+# ==================================
+
+@router.get("/analytics/top-books", response_model=analytics_schema.TopBooksResponse,
+            dependencies=[Depends(require_permission("DIGITAL_ACCESS_VIEW"))])
+def get_top_books(
+    days: int = Query(30, ge=1, le=366),
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_read_db)
+):
+    data = reading_analytics.top_books(db, days, limit)
+    books = {b.id: b for b in db.query(book_model.Book).filter(
+        book_model.Book.id.in_([row.book_id for row in data["rows"]])
+    )}
+    return {
+        "granularity": data["granularity"],
+        "since": data["since"],
+        "as_of": reading_analytics.as_of(db),
+        "results": [{
+            "book_id": row.book_id,
+            "title": books[row.book_id].title if row.book_id in books else None,
+            "author": books[row.book_id].author if row.book_id in books else None,
+            "accesses": row.accesses or 0,
+            "denied": row.denied or 0,
+        } for row in data["rows"]],
+    }
+
+
+@router.get("/analytics/active-readers", response_model=analytics_schema.ActiveReadersResponse,
+            dependencies=[Depends(require_permission("DIGITAL_ACCESS_VIEW"))])
+def get_active_readers(
+    days: int = Query(30, ge=1, le=366),
+    limit: int = Query(10, ge=1, le=100),
+    db: Session = Depends(get_read_db)
+):
+    data = reading_analytics.active_readers(db, days, limit)
+    users = {u.id: u for u in db.query(user_model.User).filter(
+        user_model.User.id.in_([row.user_id for row in data["rows"]])
+    )}
+    return {
+        "granularity": data["granularity"],
+        "since": data["since"],
+        "as_of": reading_analytics.as_of(db),
+        "active_readers": data["active_readers"],
+        "top_readers": [{
+            "user_id": row.user_id,
+            "username": users[row.user_id].username if row.user_id in users else None,
+            "full_name": users[row.user_id].full_name if row.user_id in users else None,
+            "accesses": row.accesses or 0,
+        } for row in data["rows"]],
+    }
+
+
+@router.get("/analytics/trends", response_model=analytics_schema.TrendResponse,
+            dependencies=[Depends(require_permission("DIGITAL_ACCESS_VIEW"))])
+def get_access_trends(
+    days: int = Query(30, ge=1, le=366),
+    granularity: Optional[Literal["hour", "day"]] = None,
+    book_id: Optional[int] = None,
+    db: Session = Depends(get_read_db)
+):
+    if granularity == "hour" and days > 31:
+        raise HTTPException(status_code=400, detail="Hourly trends are limited to 31 days.")
+    data = reading_analytics.trends(db, days, granularity=granularity, book_id=book_id)
+    return {
+        "granularity": data["granularity"],
+        "since": data["since"],
+        "book_id": book_id,
+        "as_of": reading_analytics.as_of(db),
+        "points": [{"bucket_start": row.bucket_start, "accesses": row.accesses or 0, "denied": row.denied or 0}
+                   for row in data["rows"]],
+    }
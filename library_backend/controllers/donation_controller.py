@@ -1,29 +1,43 @@
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Form
+import hashlib
+import json
+
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from database import get_db
 # Ensure these imports work based on your folder structure
-from models.donation_model import DonationInfo 
-from schemas.donation_schema import DonationInfoResponse
-from utils.cloudinary_helper import upload_to_cloudinary
+from models.donation_models import DonationInfo
+from schemas.donation_schemas import DonationInfoResponse
+from utils.cloudinary_helper import upload_many
+from utils.cache import VersionedCache, on_primary
 
 # ✅ Router Initialize (Prefix hataya kyunki main.py me already hai)
 router = APIRouter()
 
+# ✅ Singleton snapshot: har public page view par DB query nahi.
+# Update ke baad bump => sab workers agli request par dobara load karte hain.
+DONATION_CACHE_CONTROL = "public, max-age=60"
+DONATION_FOLDER = "library_donation"
+donation_cache = VersionedCache("donation_info", max_age=300)
+
+
+def _build_snapshot(db: Session) -> tuple:
+    """(body bytes, etag) - row na ho to khali config (GET se insert nahi)."""
+    info = db.query(DonationInfo).order_by(DonationInfo.id).first()
+    data = DonationInfoResponse.model_validate(info) if info else DonationInfoResponse()
+    body = json.dumps(data.model_dump(mode="json"), separators=(",", ":")).encode()
+    return body, f'"{hashlib.sha1(body).hexdigest()}"'
+
 # ============================================================
 # 1. GET Donation Info (Public)
 # ============================================================
 @router.get("/", response_model=DonationInfoResponse)
-def get_donation_details(db: Session = Depends(get_db)):
-    info = db.query(DonationInfo).first()
-    
-    # Agar record nahi hai, to naya bana dein (Empty)
-    if not info:
-        info = DonationInfo()
-        db.add(info)
-        db.commit()
-        db.refresh(info)
-        
-    return info
+def get_donation_details(request: Request):
+    # Snapshot primary se (update ke bump ke baad replica lag mein ho sakti hai)
+    body, etag = donation_cache.get("info", on_primary(_build_snapshot))
+    headers = {"ETag": etag, "Cache-Control": DONATION_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 # ============================================================
 # 2. UPDATE Donation Info (Admin Panel - Cloudinary Support)
@@ -34,60 +48,38 @@ async def update_donation_details(
     qr_code_desktop: UploadFile = File(None),
     appeal_desktop: UploadFile = File(None),
     bank_desktop: UploadFile = File(None),
-    
+
     # --- Mobile Files ---
     qr_code_mobile: UploadFile = File(None),
     appeal_mobile: UploadFile = File(None),
     bank_mobile: UploadFile = File(None),
-    
+
     db: Session = Depends(get_db)
 ):
-    # 1. Database se record nikalein
-    info = db.query(DonationInfo).first()
+    submitted = {
+        "qr_code_desktop": qr_code_desktop, "qr_code_mobile": qr_code_mobile,
+        "appeal_desktop": appeal_desktop, "appeal_mobile": appeal_mobile,
+        "bank_desktop": bank_desktop, "bank_mobile": bank_mobile,
+    }
+    files = {field: f for field, f in submitted.items() if f and f.filename}
+
+    # 1. Saari images ek saath upload (bounded thread pool, event loop free)
+    urls = await upload_many(files, folder=DONATION_FOLDER)
+    failed = [field for field, url in urls.items() if not url]
+    if failed:
+        # Adhoora update save nahi karte: ya sab images, ya koi nahi
+        raise HTTPException(status_code=502, detail=f"Image upload failed for: {', '.join(failed)}")
+
+    # 2. Sab uploads ke baad ek hi transaction mein row update
+    info = db.query(DonationInfo).order_by(DonationInfo.id).with_for_update().first()
     if not info:
         info = DonationInfo()
         db.add(info)
+    for field, url in urls.items():
+        setattr(info, field, url)
 
-    # 2. Helper Function to Upload & Update
-    async def process_upload(file_obj, folder_name="library_donation"):
-        if file_obj and file_obj.filename:
-            print(f"Uploading {file_obj.filename} to Cloudinary...")
-            # Ensure read/seek is handled if using async
-            url = upload_to_cloudinary(file_obj.file, folder=folder_name)
-            return url
-        return None
-
-    # --- 3. Uploading Images (One by one check) ---
-    
-    # QR Codes
-    if qr_code_desktop:
-        url = await process_upload(qr_code_desktop)
-        if url: info.qr_code_desktop = url
-        
-    if qr_code_mobile:
-        url = await process_upload(qr_code_mobile)
-        if url: info.qr_code_mobile = url
-
-    # Appeal Images
-    if appeal_desktop:
-        url = await process_upload(appeal_desktop)
-        if url: info.appeal_desktop = url
-        
-    if appeal_mobile:
-        url = await process_upload(appeal_mobile)
-        if url: info.appeal_mobile = url
-
-    # Bank Details
-    if bank_desktop:
-        url = await process_upload(bank_desktop)
-        if url: info.bank_desktop = url
-        
-    if bank_mobile:
-        url = await process_upload(bank_mobile)
-        if url: info.bank_mobile = url
-
-    # 4. Save to Database
     db.commit()
     db.refresh(info)
-    
-    return {"message": "Donation details updated successfully!", "data": info}
+    donation_cache.bump()  # Public snapshot purana ho gaya
+
+    return {"message": "Donation details updated successfully!", "data": DonationInfoResponse.model_validate(info)}
@@ -0,0 +1,119 @@
+# file: controllers/events_controller.py
+import asyncio
+import hashlib
+import hmac
+import time
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import joinedload
+
+from auth import oauth2_scheme, get_current_user, get_user_from_token
+from config import get_settings
+from database import SessionLocal
+from models import user_model
+from utils.book_access import is_admin
+from utils.events import get_event_bus, format_sse, public_payload
+
+router = APIRouter()
+
+HEARTBEAT_SECONDS = 15
+STREAM_MAX_SECONDS = 600   # Phir client (EventSource) khud reconnect karta hai
+REVIEWER_PERMISSIONS = {"REQUEST_VIEW", "REQUEST_APPROVE", "REQUEST_MANAGE"}
+# EventSource headers nahi bhej sakta => URL mein chhota ticket (login JWT nahi:
+# URL access logs mein jata hai). Sirf stream kholne ke liye, jaldi expire.
+TICKET_TTL_SECONDS = 60
+
+
+def _is_reviewer(user) -> bool:
+    if is_admin(user) or (user.role and user.role.name.lower() == "administrator"):
+        return True
+    perms = {p.name for p in (user.role.permissions if user.role else [])}
+    return bool(perms & REVIEWER_PERMISSIONS)
+
+
+def _ticket_signature(user_id: int, expires: int) -> str:
+    message = f"events:{user_id}:{expires}".encode()
+    return hmac.new(get_settings().secret_key.encode(), message, hashlib.sha256).hexdigest()[:32]
+
+
+def _user_from_ticket(db, ticket: str):
+    """'<user_id>.<expires>.<sig>' -> user; galat / expired => None."""
+    try:
+        user_id, expires, sig = ticket.split(".")
+        user_id, expires = int(user_id), int(expires)
+    except ValueError:
+        return None
+    if expires < time.time() or not hmac.compare_digest(sig, _ticket_signature(user_id, expires)):
+        return None
+    return db.query(user_model.User).options(
+        joinedload(user_model.User.role).joinedload(user_model.Role.permissions)
+    ).filter(user_model.User.id == user_id).first()
+
+
+async def _stream(request: Request, sub):
+    bus = get_event_bus()
+    deadline = time.monotonic() + STREAM_MAX_SECONDS
+    event_id = 0
+    try:
+        yield "retry: 5000\n\n"
+        yield format_sse("ready", {"reviewer": sub.is_reviewer})
+        while time.monotonic() < deadline:
+            try:
+                event = await asyncio.wait_for(sub.queue.get(), timeout=HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keep-alive\n\n"
+                continue
+            if event is None:  # Server shutdown
+                break
+            event_id += 1
+            yield format_sse(event["type"], public_payload(event), event_id)
+    finally:
+        bus.unsubscribe(sub)
+
+
+@router.post("/ticket")
+def create_stream_ticket(current_user: user_model.User = Depends(get_current_user)):
+    """
+    /stream ke liye short-lived ticket (Authorization header wali request se).
+    EventSource ise `?ticket=` mein bhejta hai; expire ho to client naya leta hai.
+    """
+    expires = int(time.time()) + TICKET_TTL_SECONDS
+    return {
+        "ticket": f"{current_user.id}.{expires}.{_ticket_signature(current_user.id, expires)}",
+        "expires_at": expires,
+    }
+
+
+@router.get("/stream")
+async def stream_events(
+    request: Request,
+    ticket: Optional[str] = Query(None, description="POST /api/events/ticket se (JWT nahi)"),
+    bearer: Optional[str] = Depends(oauth2_scheme),
+):
+    """
+    Server-Sent Events: user ko apni requests ke status changes, reviewers ko
+    nayi / reviewed requests. Polling ki zaroorat nahi.
+    Auth: `?ticket=` (browser EventSource) ya Authorization header.
+    """
+    # Session sirf auth ke liye; stream ke dauran DB connection hold nahi hota
+    db = SessionLocal()
+    try:
+        if ticket:
+            user = _user_from_ticket(db, ticket)
+        else:
+            user = await get_user_from_token(bearer or "", db)
+        if user is None or (user.status and str(user.status).lower() != "active"):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Could not validate credentials")
+        sub = get_event_bus().subscribe(user.id, _is_reviewer(user))
+    finally:
+        db.close()
+
+    return StreamingResponse(
+        _stream(request, sub),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
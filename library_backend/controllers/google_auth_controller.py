@@ -1,8 +1,8 @@
 from fastapi import APIRouter, HTTPException, Depends, status
 from pydantic import BaseModel
-from google.oauth2 import id_token
-from google.auth.transport import requests
 from sqlalchemy.orm import Session
+from functools import lru_cache
+import logging
 import secrets # Random username ke liye
 
 # --- Imports (Apne project ke hisaab se check karein) ---
@@ -12,18 +12,34 @@ from auth import create_access_token
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
 GOOGLE_CLIENT_ID = "158248986174-cv22ngbp9ctjlf0dmditmsre151lpqm9.apps.googleusercontent.com"
 
 class GoogleLoginRequest(BaseModel):
     token: str
 
+
+@lru_cache(maxsize=1)
+def _google_transport():
+    """
+    google-auth (+ requests/urllib3) pehle Google login par import hota hai,
+    `import main` par nahi. Ek hi transport (session) - Google certs ke liye
+    connection reuse.
+    """
+    from google.oauth2 import id_token
+    from google.auth.transport import requests
+
+    return id_token, requests.Request()
+
 @router.post("/auth/google")
 def google_login(payload: GoogleLoginRequest, db: Session = Depends(get_db)):
     try:
         # 1. Google Token Verify karein
+        id_token, transport = _google_transport()
         info = id_token.verify_oauth2_token(
             payload.token,
-            requests.Request(),
+            transport,
             GOOGLE_CLIENT_ID
         )
 
@@ -98,6 +114,5 @@ def google_login(payload: GoogleLoginRequest, db: Session = Depends(get_db)):
     except ValueError:
         raise HTTPException(status_code=401, detail="Invalid Google token")
     except Exception as e:
-        # Debugging ke liye error print karein
-        print(f"Error: {str(e)}") 
+        logger.exception("Google login failed")
         raise HTTPException(status_code=500, detail=f"Google login failed: {str(e)}")
\ No newline at end of file
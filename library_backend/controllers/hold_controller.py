@@ -0,0 +1,146 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+# --- Imports ---
+from models import book_model, user_model
+from models.hold_model import BookHold, ACTIVE_HOLD_STATUSES
+from models.library_management_models import BookCopy
+from schemas import library_management_schemas as schemas
+from auth import get_current_user, require_permission, user_has_permission
+from database import get_db
+from utils import create_log, holds
+from utils.pagination import NEXT_CURSOR_HEADER, keyset_page
+
+router = APIRouter()
+
+MY_HOLDS_LIMIT = 50
+
+
+def _with_positions(db: Session, rows: List[BookHold]) -> List[dict]:
+    positions = holds.queue_positions(db, rows)
+    return [
+        dict(schemas.BookHold.model_validate(hold).model_dump(), queue_position=positions.get(hold.id))
+        for hold in rows
+    ]
+
+
+# ==================================
+# HOLD ENDPOINTS (Reservation Queue)
+# ==================================
+
+# --- PLACE HOLD ---
+@router.post("/", response_model=schemas.BookHold, status_code=status.HTTP_201_CREATED)
+def place_hold(
+    hold_in: schemas.BookHoldCreate,
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user)
+):
+    """
+    Book ki queue mein lagna. Member apna hold lagata hai; staff (BOOK_ISSUE)
+    `user_id` de kar kisi member ke liye. Copy shelf par free ho to foran Ready.
+    """
+    user_id = hold_in.user_id or current_user.id
+    if user_id != current_user.id and not user_has_permission(current_user, "BOOK_ISSUE"):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You do not have permission: BOOK_ISSUE")
+
+    book = db.query(book_model.Book.id).filter(
+        book_model.Book.id == hold_in.book_id,
+        book_model.Book.deleted_at.is_(None)
+    ).first()
+    if not book:
+        raise HTTPException(status_code=404, detail="Book not found")
+    has_copies = db.query(BookCopy.id).filter(
+        BookCopy.book_id == hold_in.book_id,
+        BookCopy.deleted_at.is_(None)
+    ).first()
+    if not has_copies:
+        raise HTTPException(status_code=400, detail="This book has no physical copies to reserve")
+    if user_id != current_user.id and not db.get(user_model.User, user_id):
+        raise HTTPException(status_code=404, detail="Client (User) not found")
+
+    existing = db.query(BookHold.id).filter(
+        BookHold.user_id == user_id,
+        BookHold.book_id == hold_in.book_id,
+        BookHold.status.in_(ACTIVE_HOLD_STATUSES)
+    ).first()
+    if existing:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="An active hold for this book already exists")
+
+    try:
+        hold = holds.place_hold(db, hold_in.book_id, user_id)
+        create_log(db, current_user, "HOLD_PLACED", f"Hold placed on Book ID {hold_in.book_id} for User ID {user_id}.",
+                   "BookHold", hold.id)
+        db.commit()
+    except IntegrityError:
+        # Do requests ek saath: partial unique index (ix_book_holds_active_user_book)
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="An active hold for this book already exists")
+    db.refresh(hold)
+    return _with_positions(db, [hold])[0]
+
+
+# --- MY HOLDS ---
+@router.get("/me", response_model=List[schemas.BookHold])
+def read_my_holds(
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user)
+):
+    """Member ke holds (newest first), Waiting holds ke saath queue number."""
+    rows = db.query(BookHold).filter(BookHold.user_id == current_user.id).order_by(
+        BookHold.id.desc()
+    ).limit(MY_HOLDS_LIMIT).all()
+    return _with_positions(db, rows)
+
+
+# --- ALL HOLDS (Staff) ---
+@router.get("/", response_model=List[schemas.BookHold])
+def read_holds(
+    response: Response,
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="Pichhle response ka X-Next-Cursor"),
+    book_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(require_permission("BOOK_ISSUE"))
+):
+    """
+    Issue desk ki waiting list (newest first); Waiting holds ke saath queue_position.
+    Agla page: `cursor` = pichhle response ka X-Next-Cursor.
+    """
+    query = db.query(BookHold)
+    if book_id is not None:
+        query = query.filter(BookHold.book_id == book_id)
+    if user_id is not None:
+        query = query.filter(BookHold.user_id == user_id)
+    if status_filter:
+        query = query.filter(BookHold.status == status_filter)
+
+    rows, next_cursor = keyset_page(query, BookHold.id, BookHold.id, cursor, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return _with_positions(db, rows)
+
+
+# --- CANCEL HOLD ---
+@router.post("/{hold_id}/cancel", response_model=schemas.BookHold)
+def cancel_hold(
+    hold_id: int,
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user)
+):
+    """Member apna hold, staff (BOOK_ISSUE) koi bhi. Ready hold ki copy agle hold ko jati hai."""
+    hold = db.query(BookHold).filter(BookHold.id == hold_id).with_for_update().first()
+    if not hold or (hold.user_id != current_user.id and not user_has_permission(current_user, "BOOK_ISSUE")):
+        raise HTTPException(status_code=404, detail="Hold not found")
+    if hold.status not in ACTIVE_HOLD_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Hold is already closed. Current status: {hold.status}")
+
+    holds.cancel_hold(db, hold)
+    create_log(db, current_user, "HOLD_CANCELLED", f"Hold {hold.id} on Book ID {hold.book_id} cancelled.",
+               "BookHold", hold.id)
+    db.commit()
+    db.refresh(hold)
+    return hold
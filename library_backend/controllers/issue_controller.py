@@ -1,5 +1,5 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session, joinedload
 from datetime import datetime
 
@@ -7,7 +7,8 @@ from datetime import datetime
 from models import library_management_models as models, user_model
 from schemas import library_management_schemas as schemas
 from auth import require_permission, get_db
-from utils import create_log
+from utils import create_log, holds
+from utils.pagination import NEXT_CURSOR_HEADER, keyset_page
 
 router = APIRouter()
 
@@ -18,20 +19,37 @@ router = APIRouter()
 # --- READ ALL ISSUES (History/Returns) ---
 @router.get("/", response_model=List[schemas.IssuedBook])
 def get_all_issues(
-    skip: int = 0, 
-    limit: int = 100, 
+    response: Response,
+    skip: int = Query(0, ge=0, description="Legacy offset pagination (cursor behtar hai)"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="Pichhle response ka X-Next-Cursor"),
+    status_filter: Optional[str] = Query(None, alias="status"),
+    client_id: Optional[int] = None,
     db: Session = Depends(get_db),
     # ✅ FIX: 'BOOK_ISSUE' allow kiya taake 'Returns' tab load ho sake
     current_user: user_model.User = Depends(require_permission("BOOK_ISSUE"))
 ):
     """
-    Get list of all issued books (Active & Returned).
+    Get list of all issued books (Active & Returned), newest first.
+    Agla page: `cursor` = pichhle response ka X-Next-Cursor.
     """
-    return db.query(models.IssuedBook).options(
+    query = db.query(models.IssuedBook).options(
         joinedload(models.IssuedBook.book_copy).joinedload(models.BookCopy.book),
         # Agar user relationship defined hai model me to use load karein
         # joinedload(models.IssuedBook.user) 
-    ).order_by(models.IssuedBook.id.desc()).offset(skip).limit(limit).all()
+    )
+    if status_filter:
+        query = query.filter(models.IssuedBook.status == status_filter)
+    if client_id is not None:
+        query = query.filter(models.IssuedBook.client_id == client_id)
+
+    if skip and not cursor:
+        return query.order_by(models.IssuedBook.id.desc()).offset(skip).limit(limit).all()
+
+    issues, next_cursor = keyset_page(query, models.IssuedBook.id, models.IssuedBook.id, cursor, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return issues
 
 
 # --- ISSUE A BOOK ---
@@ -51,7 +69,11 @@ def issue_book_to_client(
         raise HTTPException(status_code=404, detail="Book copy not found")
     
     # Check availability (Allow 'Available' or 'Reference' if policy permits, strictly block 'Issued'/'Lost')
-    if db_copy.status not in ["Available", "New"]:
+    # "On Hold" copy sirf us member ko jis ka Ready hold hai (hold => Fulfilled)
+    if db_copy.status == models.ON_HOLD_COPY_STATUS:
+        if holds.claim_hold(db, db_copy, issue_data.client_id) is None:
+            raise HTTPException(status_code=400, detail="Book copy is reserved for another member's hold")
+    elif db_copy.status not in models.AVAILABLE_COPY_STATUSES:
         raise HTTPException(status_code=400, detail=f"Book copy is not available. Current status: {db_copy.status}")
     
     # 2. Validate Client (User exists?)
@@ -85,7 +107,8 @@ def return_book(
     current_user: user_model.User = Depends(require_permission("BOOK_ISSUE"))
 ):
     """
-    Returns a book and marks copy as Available.
+    Returns a book. Copy agle hold ko allocate hoti hai (member ko notification),
+    warna Available.
     """
     db_issue = db.query(models.IssuedBook).filter(models.IssuedBook.id == issue_id).first()
     if not db_issue:
@@ -98,10 +121,10 @@ def return_book(
     db_issue.status = "Returned"
     db_issue.actual_return_date = datetime.utcnow()
     
-    # 2. Update Copy Status -> Available
+    # 2. Copy free: queue ke agle hold ko (SKIP LOCKED, isi transaction mein), warna Available
     db_copy = db.query(models.BookCopy).filter(models.BookCopy.id == db_issue.copy_id).first()
     if db_copy:
-        db_copy.status = "Available"
+        holds.allocate_copy(db, db_copy)
     
     # 3. Log Action
     log_desc = f"Copy ID {db_issue.copy_id} returned."
@@ -6,6 +6,7 @@ from typing import List
 from models import language_model, user_model, book_model # Import book_model
 from schemas import language_schema
 from auth import require_permission, get_db
+from database import get_read_db
 from utils import create_log
 
 router = APIRouter()
@@ -30,13 +31,13 @@ def create_language(
 
 # --- READ ALL (Public) ---
 @router.get("/", response_model=List[language_schema.Language])
-def read_languages(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def read_languages(skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db)):
     """Fetches a list of all languages."""
     return db.query(language_model.Language).offset(skip).limit(limit).all()
 
 # --- READ ONE (Public) ---
 @router.get("/{language_id}", response_model=language_schema.Language)
-def read_language(language_id: int, db: Session = Depends(get_db)):
+def read_language(language_id: int, db: Session = Depends(get_read_db)):
     """Fetches details of a specific language by ID."""
     db_language = db.query(language_model.Language).filter(language_model.Language.id == language_id).first()
     if db_language is None:
@@ -1,12 +1,13 @@
 # file: controllers/log_controller.py
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 
-from models import log_model
+from models import log_model, user_model
 from schemas import log_schema
 from auth import require_permission, get_db
+from utils.pagination import NEXT_CURSOR_HEADER, keyset_page
 
 router = APIRouter()
 
@@ -17,27 +18,32 @@ router = APIRouter()
     dependencies=[Depends(require_permission("LOG_VIEW"))]
 )
 def get_logs(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0, description="Legacy offset pagination (cursor behtar hai)"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="Pichhle response ka X-Next-Cursor"),
     user_id: Optional[int] = None,
     action_type: Optional[str] = None,
     target_type: Optional[str] = None,
+    username: Optional[str] = None,
+    action: Optional[str] = None,
     db: Session = Depends(get_db),
 ):
     """
-    ✅ System logs list
+    ✅ System logs list (newest first)
     Filters:
     - user_id (action_by_id)
-    - action_type
+    - action_type (exact) / action (contains, case-insensitive)
     - target_type
+    - username (action_by ka username, contains)
     Pagination:
-    - skip, limit
+    - cursor (keyset on timestamp, id) - agla page X-Next-Cursor header mein
+    - skip (legacy OFFSET)
     """
 
     query = (
         db.query(log_model.Log)
         .options(joinedload(log_model.Log.action_by))  # ✅ FIX: action_by user load
-        .order_by(log_model.Log.timestamp.desc())
     )
 
     # ✅ Filter: user_id (action_by_id)
@@ -52,5 +58,17 @@ def get_logs(
     if target_type:
         query = query.filter(log_model.Log.target_type == target_type)
 
-    logs = query.offset(skip).limit(limit).all()
+    if action:
+        query = query.filter(log_model.Log.action_type.ilike(f"%{action}%"))
+
+    if username:
+        query = query.filter(log_model.Log.action_by.has(user_model.User.username.ilike(f"%{username}%")))
+
+    if skip and not cursor:
+        # Purane clients: OFFSET path
+        return query.order_by(log_model.Log.timestamp.desc(), log_model.Log.id.desc()).offset(skip).limit(limit).all()
+
+    logs, next_cursor = keyset_page(query, log_model.Log.timestamp, log_model.Log.id, cursor, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return logs
@@ -1,21 +1,37 @@
+import hashlib
+import json
+import logging
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Query, Request, Response
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
-from database import get_db
+from database import get_db, get_read_db
 from models import post_model, user_model
 from schemas.post_schema import PostResponse
 from auth import require_permission
 
 # ✅ Cloudinary Helper Import
 from utils.cloudinary_helper import upload_to_cloudinary
+from utils.cache import VersionedCache, on_primary
+from utils.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
 # ✅ Settings
 ALLOWED_IMAGE_TYPES = {"image/jpeg", "image/png", "image/webp", "image/jpg"}
 ALLOWED_PDF_TYPES = {"application/pdf"}
 
+# ✅ Public feed cache: sabse naye FEED_SNAPSHOT_SIZE posts rendered memory mein.
+# create/delete par bump => sab workers agli request par snapshot dobara banate hain.
+FEED_SNAPSHOT_SIZE = 200
+FEED_MAX_LIMIT = 100
+FEED_MAX_RENDERED_PAGES = 1000
+FEED_CACHE_CONTROL = "public, max-age=30"
+feed_cache = VersionedCache("posts_feed", max_age=300)
+
 # =========================================
 # 🔥 HELPERS
 # =========================================
@@ -81,7 +97,7 @@ def create_post(
             )
 
         # 2. Upload to Cloudinary
-        print(f"Uploading {file.filename} to Cloudinary...") # Debugging
+        logger.debug("Uploading post file to Cloudinary", extra={"upload_file": file.filename})
         file_url = upload_to_cloudinary(file, folder="library_posts")
 
         if not file_url:
@@ -100,25 +116,101 @@ def create_post(
     db.add(new_post)
     db.commit()
     db.refresh(new_post)
+    feed_cache.bump()  # Public feed snapshot purana ho gaya
 
     return _to_post_response(new_post)
 
 
+def _feed_order():
+    return (post_model.MarkazPost.created_at.desc(), post_model.MarkazPost.id.desc())
+
+
+def _build_feed_snapshot(db: Session) -> dict:
+    """Newest posts ek query mein (author joined), ek hi baar JSON-ready dicts mein."""
+    posts = db.query(post_model.MarkazPost).order_by(*_feed_order()).limit(FEED_SNAPSHOT_SIZE + 1).all()
+    complete = len(posts) <= FEED_SNAPSHOT_SIZE
+    posts = posts[:FEED_SNAPSHOT_SIZE]
+    return {
+        "items": [_to_post_response(p).model_dump(mode="json") for p in posts],
+        "keys": [(p.created_at, p.id) for p in posts],
+        "complete": complete,  # True => snapshot mein saare posts hain
+        "pages": {},           # (cursor, limit) -> rendered page (body, etag, next_cursor)
+    }
+
+
+def _render_page(items: list, next_key) -> tuple:
+    body = json.dumps(items, separators=(",", ":"), ensure_ascii=False).encode()
+    etag = f'"{hashlib.sha1(body).hexdigest()}"'
+    return body, etag, encode_cursor(*next_key) if next_key else None
+
+
+def _page_from_snapshot(snapshot: dict, after, limit: int, cache_key) -> Optional[tuple]:
+    """Page snapshot ke andar ho to rendered page, warna None (DB se)."""
+    page = snapshot["pages"].get(cache_key)
+    if page:
+        return page
+
+    keys = snapshot["keys"]
+    start = 0
+    if after is not None:
+        start = next((i for i, key in enumerate(keys) if key < after), len(keys))
+    end = start + limit
+    if end > len(keys) and not snapshot["complete"]:
+        return None
+
+    # Snapshot adhoora ho to uske aakhri post ke baad bhi DB mein posts hain
+    has_more = end < len(keys) or not snapshot["complete"]
+    page = _render_page(snapshot["items"][start:end], keys[end - 1] if has_more else None)
+    if len(snapshot["pages"]) < FEED_MAX_RENDERED_PAGES:
+        snapshot["pages"][cache_key] = page
+    return page
+
+
+def _page_from_db(db: Session, after, limit: int) -> tuple:
+    query = db.query(post_model.MarkazPost)
+    if after is not None:
+        created_at, post_id = after
+        query = query.filter(or_(
+            post_model.MarkazPost.created_at < created_at,
+            and_(post_model.MarkazPost.created_at == created_at, post_model.MarkazPost.id < post_id),
+        ))
+    posts = query.order_by(*_feed_order()).limit(limit + 1).all()
+    has_more = len(posts) > limit
+    posts = posts[:limit]
+    items = [_to_post_response(p).model_dump(mode="json") for p in posts]
+    return _render_page(items, (posts[-1].created_at, posts[-1].id) if has_more else None)
+
+
 @router.get("/public", response_model=List[PostResponse])
 def get_public_posts(
-    skip: int = 0,
-    limit: int = 20,
-    db: Session = Depends(get_db)
+    request: Request,
+    skip: int = Query(0, ge=0, description="Legacy offset pagination (cursor behtar hai)"),
+    limit: int = Query(20, ge=1, le=FEED_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="Pichhle response ka X-Next-Cursor"),
+    db: Session = Depends(get_read_db)
 ):
-    posts = (
-        db.query(post_model.MarkazPost)
-        .order_by(post_model.MarkazPost.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    """
+    Public home page feed (newest first).
+    Keyset pagination on (created_at, id); pehle pages memory snapshot se
+    (DB query nahi), ETag + 304 ke saath.
+    """
+    if skip and not cursor:
+        # Purane clients: OFFSET path, cache ke bina
+        posts = db.query(post_model.MarkazPost).order_by(*_feed_order()).offset(skip).limit(limit).all()
+        return [_to_post_response(p) for p in posts]
+
+    after = tuple(decode_cursor(cursor, 2)) if cursor else None
+    # Snapshot primary se (bump primary commit par); snapshot ke baad wale pages replica se theek
+    snapshot = feed_cache.get("snapshot", on_primary(_build_feed_snapshot))
+    page = _page_from_snapshot(snapshot, after, limit, (cursor, limit)) or _page_from_db(db, after, limit)
+    body, etag, next_cursor = page
 
-    return [_to_post_response(p) for p in posts]
+    headers = {"ETag": etag, "Cache-Control": FEED_CACHE_CONTROL}
+    if next_cursor:
+        headers[NEXT_CURSOR_HEADER] = next_cursor
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.delete("/{post_id}")
@@ -137,5 +229,6 @@ def delete_post(
     
     db.delete(post)
     db.commit()
+    feed_cache.bump()
 
     return {"message": "Post deleted successfully ✅"}
\ No newline at end of file
@@ -1,3 +1,4 @@
+import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session, joinedload
 from typing import List
@@ -19,6 +20,8 @@ from utils import create_log
 
 router = APIRouter()
 
+logger = logging.getLogger(__name__)
+
 # ==================================
 # LOGGED-IN USER PROFILE ENDPOINTS
 # ==================================
@@ -64,8 +67,8 @@ def get_my_profile(
                         permissions_list.append(perm.code)
                     elif hasattr(perm, 'name') and perm.name: 
                         permissions_list.append(perm.name)
-        except Exception as e:
-            print(f"⚠️ Error loading permissions: {e}")
+        except Exception:
+            logger.exception("Error loading permissions", extra={"user_id": current_user.id})
 
     # 2. Permissions ko response object mein daalein
     # Ye temporary attribute hai jo Schema me jaayega (DB me save nahi hoga)
@@ -98,8 +101,8 @@ def update_my_profile(
                 description=f"User updated their name from '{old_name}' to '{current_user.full_name}'.",
                 target_type="User", target_id=current_user.id
             )
-        except Exception as log_error:
-            print(f"Log Error (Ignored): {log_error}")
+        except Exception:
+            logger.warning("Profile update log failed (ignored)", exc_info=True)
 
     if has_changes:
         db.commit()
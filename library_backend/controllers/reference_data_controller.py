@@ -0,0 +1,24 @@
+# file: controllers/reference_data_controller.py
+from fastapi import APIRouter, Request, Response
+from schemas.reference_data_schema import ReferenceDataBundle
+from utils.reference_data import get_bundle
+
+router = APIRouter()
+
+# Client version/ETag se revalidate kare; body tabhi aati hai jab data badla ho
+REFERENCE_CACHE_CONTROL = "public, max-age=60"
+
+
+@router.get("/", response_model=ReferenceDataBundle)
+def get_reference_data(request: Request):
+    """
+    Languages, categories, subcategories aur locations ek hi round trip mein.
+    In-process snapshot se serve hota hai (in tables mein commit par rebuild,
+    primary se - request replica connection nahi leti).
+    """
+    body, version = get_bundle()
+    etag = f'"{version}"'
+    headers = {"ETag": etag, "Cache-Control": REFERENCE_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import case, false, true, update
 from typing import List, Optional
 from datetime import datetime
 
@@ -13,7 +14,14 @@ except ImportError:
 
 from schemas import request_schema
 from auth import require_permission, get_db, get_current_user
-from utils import create_log
+from database import get_read_db
+from utils import create_log, create_logs_bulk
+from utils.events import notify, notify_many, request_event
+from utils.pagination import NEXT_CURSOR_HEADER, keyset_page
+from utils.request_queue import (
+    QUEUE_DEFAULT_LIMIT, QUEUE_MAX_LIMIT, status_summary,
+    latest_per_id, batch_result, apply_grouped_updates, batch_summary,
+)
 
 # Tagging for Swagger UI
 router = APIRouter(tags=["Requests Management"])
@@ -22,12 +30,30 @@ router = APIRouter(tags=["Requests Management"])
 # 🛠️ HELPER FUNCTIONS
 # ==============================================================================
 
+def upload_request_options():
+    """
+    Book + users ek JOIN mein; lazyload("*") se User ke selectin relationships
+    (logs, issues, requests...) har row par load nahi hote - schema ko sirf
+    id/username/full_name chahiye.
+    """
+    return (
+        joinedload(request_model.UploadRequest.book).lazyload("*"),
+        joinedload(request_model.UploadRequest.submitted_by).lazyload("*"),
+        joinedload(request_model.UploadRequest.reviewed_by).lazyload("*"),
+    )
+
+
+def book_request_options():
+    return (
+        joinedload(request_model.BookRequest.book).lazyload("*"),
+        joinedload(request_model.BookRequest.user).lazyload("*"),
+    )
+
+
 def get_upload_request_details(db: Session, request_id: int):
     """ Helper to fetch request with all relations loaded """
     return db.query(request_model.UploadRequest).options(
-        joinedload(request_model.UploadRequest.book),
-        joinedload(request_model.UploadRequest.submitted_by),
-        joinedload(request_model.UploadRequest.reviewed_by)
+        *upload_request_options()
     ).filter(request_model.UploadRequest.id == request_id).first()
 
 # ==============================================================================
@@ -64,6 +90,9 @@ def create_upload_request(
         status='Pending' # Default pending
     )
     db.add(new_request)
+    db.flush()
+    notify(db, request_event("upload_request", "created", new_request.id, "Pending",
+                             book_id=request.book_id, owner_id=current_user.id))
     db.commit()
     db.refresh(new_request)
     
@@ -77,12 +106,8 @@ def get_all_upload_requests(
     status_filter: Optional[str] = None, 
     db: Session = Depends(get_db)
 ):
-    """ Admin View: List all book approval requests. """
-    query = db.query(request_model.UploadRequest).options(
-        joinedload(request_model.UploadRequest.book),
-        joinedload(request_model.UploadRequest.submitted_by),
-        joinedload(request_model.UploadRequest.reviewed_by)
-    )
+    """ Admin View: List all book approval requests. (Bade backlog ke liye /upload/queue) """
+    query = db.query(request_model.UploadRequest).options(*upload_request_options())
     
     if status_filter:
         query = query.filter(request_model.UploadRequest.status == status_filter)
@@ -90,6 +115,45 @@ def get_all_upload_requests(
     return query.order_by(request_model.UploadRequest.submitted_at.desc()).all()
 
 
+@router.get("/upload/queue", response_model=List[request_schema.UploadRequest])
+def get_upload_request_queue(
+    response: Response,
+    status_filter: Optional[request_schema.RequestStatus] = Query(None, alias="status"),
+    book_id: Optional[int] = None,
+    submitted_from: Optional[datetime] = None,
+    submitted_to: Optional[datetime] = None,
+    limit: int = Query(QUEUE_DEFAULT_LIMIT, ge=1, le=QUEUE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="Pichhle response ka X-Next-Cursor"),
+    db: Session = Depends(get_read_db),
+    current_user: user_model.User = Depends(require_permission("REQUEST_APPROVE"))
+):
+    """ Admin Queue: newest first, keyset pagination (next page cursor X-Next-Cursor header mein). """
+    UploadRequest = request_model.UploadRequest
+    query = db.query(UploadRequest).options(*upload_request_options())
+    if status_filter:
+        query = query.filter(UploadRequest.status == status_filter.value)
+    if book_id is not None:
+        query = query.filter(UploadRequest.book_id == book_id)
+    if submitted_from:
+        query = query.filter(UploadRequest.submitted_at >= submitted_from)
+    if submitted_to:
+        query = query.filter(UploadRequest.submitted_at < submitted_to)
+
+    rows, next_cursor = keyset_page(query, UploadRequest.submitted_at, UploadRequest.id, cursor, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rows
+
+
+@router.get("/upload/summary", response_model=request_schema.StatusSummary)
+def get_upload_request_summary(
+    db: Session = Depends(get_read_db),
+    current_user: user_model.User = Depends(require_permission("REQUEST_APPROVE"))
+):
+    """ Approval page badges: status-wise counts. """
+    return status_summary(db, request_model.UploadRequest.status)
+
+
 @router.put("/upload/{request_id}/review", response_model=request_schema.UploadRequest)
 def review_upload_request(
     request_id: int,
@@ -128,6 +192,8 @@ def review_upload_request(
         # Agar book delete ho gayi ho database se
         db_request.remarks += " (Warning: Linked Book ID not found)"
 
+    notify(db, request_event("upload_request", "updated", request_id, review_data.status.value,
+                             book_id=db_request.book_id, owner_id=db_request.submitted_by_id))
     db.commit()
     
     create_log(db, current_user, "REQUEST_REVIEW", f"Upload Request {request_id} {review_data.status}", "UploadRequest", request_id)
@@ -135,6 +201,64 @@ def review_upload_request(
     return get_upload_request_details(db, request_id)
 
 
+UPLOAD_REVIEW_STATUSES = {"Pending", "Approved", "Rejected"}
+
+
+@router.post("/upload/review-batch", response_model=request_schema.BatchReviewResponse)
+def review_upload_requests_batch(
+    batch: request_schema.BatchReviewRequest,
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(require_permission("REQUEST_APPROVE"))
+):
+    """
+    Admin Action: ek call mein bahut saari books approve/reject.
+    Ek SELECT, har decision group par ek UPDATE, books ka is_approved ek
+    UPDATE (CASE) mein, logs ek bulk INSERT mein, aur ek hi commit.
+    """
+    UploadRequest = request_model.UploadRequest
+    items = latest_per_id(batch.items)
+    found = {row.id: row for row in db.query(UploadRequest.id, UploadRequest.book_id, UploadRequest.submitted_by_id)
+             .filter(UploadRequest.id.in_(list(items)))}
+    book_ids = {request_id: row.book_id for request_id, row in found.items()}
+
+    results, groups = [], {}
+    for request_id, item in items.items():
+        if request_id not in book_ids:
+            results.append(batch_result(request_id, detail="Request not found"))
+        elif item.status.value not in UPLOAD_REVIEW_STATUSES:
+            results.append(batch_result(request_id, detail=f"Invalid status for upload request: {item.status.value}"))
+        else:
+            groups.setdefault((item.status.value, item.remarks), []).append(request_id)
+            results.append(batch_result(request_id, status=item.status.value))
+
+    apply_grouped_updates(
+        db, UploadRequest, groups, ("status", "remarks"),
+        reviewed_by_id=current_user.id, reviewed_at=datetime.utcnow(),
+    )
+
+    # 🔥 Books ka visibility flag: Approved => True, Rejected => False (Pending => unchanged)
+    approved = [book_ids[i] for (state, _), ids in groups.items() if state == "Approved" for i in ids]
+    rejected = [book_ids[i] for (state, _), ids in groups.items() if state == "Rejected" for i in ids]
+    if approved or rejected:
+        db.execute(
+            update(book_model.Book).where(book_model.Book.id.in_(approved + rejected))
+            .values(is_approved=case((book_model.Book.id.in_(approved), true()), else_=false()))
+            .execution_options(synchronize_session=False)
+        )
+
+    create_logs_bulk(db, current_user, [
+        ("REQUEST_REVIEW", f"Upload Request {request_id} {state} (batch)", "UploadRequest", request_id)
+        for (state, _), ids in groups.items() for request_id in ids
+    ])
+    notify_many(db, [
+        request_event("upload_request", "updated", request_id, state,
+                      book_id=book_ids[request_id], owner_id=found[request_id].submitted_by_id)
+        for (state, _), ids in groups.items() for request_id in ids
+    ])
+    db.commit()
+    return batch_summary(results)
+
+
 # ==============================================================================
 # 📖 SECTION 2: USER ACCESS REQUESTS (User -> Borrow Restricted Book)
 # ==============================================================================
@@ -173,12 +297,14 @@ def request_book_access(
     )
     
     db.add(new_req)
+    db.flush()
+    notify(db, request_event("book_request", "created", new_req.id, "Pending",
+                             book_id=new_req.book_id, owner_id=current_user.id))
     db.commit()
     db.refresh(new_req)
     
     return db.query(request_model.BookRequest).options(
-        joinedload(request_model.BookRequest.book),
-        joinedload(request_model.BookRequest.user)
+        *book_request_options()
     ).filter(request_model.BookRequest.id == new_req.id).first()
 
 
@@ -189,8 +315,7 @@ def get_my_access_requests(
 ):
     """ Get logged-in user's requests history """
     return db.query(request_model.BookRequest).options(
-        joinedload(request_model.BookRequest.book),
-        joinedload(request_model.BookRequest.user)
+        *book_request_options()
     ).filter(
         request_model.BookRequest.user_id == current_user.id
     ).order_by(request_model.BookRequest.created_at.desc()).all()
@@ -202,11 +327,8 @@ def get_all_access_requests(
     db: Session = Depends(get_db),
     current_user: user_model.User = Depends(require_permission("REQUEST_APPROVE"))
 ):
-    """ Admin View: See all borrow requests from users """
-    query = db.query(request_model.BookRequest).options(
-        joinedload(request_model.BookRequest.book),
-        joinedload(request_model.BookRequest.user)
-    )
+    """ Admin View: See all borrow requests from users (bade backlog ke liye /access/queue) """
+    query = db.query(request_model.BookRequest).options(*book_request_options())
     
     if status:
         query = query.filter(request_model.BookRequest.status == status)
@@ -214,6 +336,45 @@ def get_all_access_requests(
     return query.order_by(request_model.BookRequest.created_at.desc()).all()
 
 
+@router.get("/access/queue", response_model=List[request_schema.BookRequestResponse])
+def get_access_request_queue(
+    response: Response,
+    status_filter: Optional[request_schema.RequestStatus] = Query(None, alias="status"),
+    book_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = Query(QUEUE_DEFAULT_LIMIT, ge=1, le=QUEUE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="Pichhle response ka X-Next-Cursor"),
+    db: Session = Depends(get_read_db),
+    current_user: user_model.User = Depends(require_permission("REQUEST_APPROVE"))
+):
+    """ Admin Queue: borrow requests, newest first, keyset pagination. """
+    BookRequest = request_model.BookRequest
+    query = db.query(BookRequest).options(*book_request_options())
+    if status_filter:
+        query = query.filter(BookRequest.status == status_filter.value)
+    if book_id is not None:
+        query = query.filter(BookRequest.book_id == book_id)
+    if created_from:
+        query = query.filter(BookRequest.created_at >= created_from)
+    if created_to:
+        query = query.filter(BookRequest.created_at < created_to)
+
+    rows, next_cursor = keyset_page(query, BookRequest.created_at, BookRequest.id, cursor, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rows
+
+
+@router.get("/access/summary", response_model=request_schema.StatusSummary)
+def get_access_request_summary(
+    db: Session = Depends(get_read_db),
+    current_user: user_model.User = Depends(require_permission("REQUEST_APPROVE"))
+):
+    """ Borrow requests: status-wise counts (badges). """
+    return status_summary(db, request_model.BookRequest.status)
+
+
 @router.put("/access/{request_id}/review", response_model=request_schema.BookRequestResponse)
 def review_access_request(
     request_id: int,
@@ -233,11 +394,56 @@ def review_access_request(
     req.updated_at = datetime.utcnow()
     
     create_log(db, current_user, "ACCESS_REVIEW", f"Access Request {request_id} set to {update_data.status}", "BookRequest", request_id)
+    notify(db, request_event("book_request", "updated", request_id, update_data.status.value,
+                             book_id=req.book_id, owner_id=req.user_id))
     
     db.commit()
     db.refresh(req)
     
     return db.query(request_model.BookRequest).options(
-        joinedload(request_model.BookRequest.book),
-        joinedload(request_model.BookRequest.user)
-    ).filter(request_model.BookRequest.id == request_id).first()
\ No newline at end of file
+        *book_request_options()
+    ).filter(request_model.BookRequest.id == request_id).first()
+
+
+@router.post("/access/review-batch", response_model=request_schema.BatchReviewResponse)
+def review_access_requests_batch(
+    batch: request_schema.BatchReviewRequest,
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(require_permission("REQUEST_APPROVE"))
+):
+    """ Admin: bahut saari borrow requests ek call mein (set-based UPDATEs, bulk logs). """
+    BookRequest = request_model.BookRequest
+    items = latest_per_id(batch.items)
+    found = {row.id: row for row in db.query(BookRequest.id, BookRequest.user_id, BookRequest.book_id)
+             .filter(BookRequest.id.in_(list(items)))}
+
+    results, groups = [], {}
+    for request_id, item in items.items():
+        if request_id not in found:
+            results.append(batch_result(request_id, detail="Request not found"))
+            continue
+        groups.setdefault((item.status.value, item.remarks), []).append(request_id)
+        results.append(batch_result(request_id, status=item.status.value))
+
+    # rejection_reason na diya ho to purani value rehti hai (single review jaisa)
+    with_reason, without_reason = {}, {}
+    for (state, reason), ids in groups.items():
+        if reason:
+            with_reason[(state, reason)] = ids
+        else:
+            without_reason.setdefault((state,), []).extend(ids)
+    now = datetime.utcnow()
+    apply_grouped_updates(db, BookRequest, with_reason, ("status", "rejection_reason"), updated_at=now)
+    apply_grouped_updates(db, BookRequest, without_reason, ("status",), updated_at=now)
+
+    create_logs_bulk(db, current_user, [
+        ("ACCESS_REVIEW", f"Access Request {request_id} set to {state} (batch)", "BookRequest", request_id)
+        for (state, _), ids in groups.items() for request_id in ids
+    ])
+    notify_many(db, [
+        request_event("book_request", "updated", request_id, state,
+                      book_id=found[request_id].book_id, owner_id=found[request_id].user_id)
+        for (state, _), ids in groups.items() for request_id in ids
+    ])
+    db.commit()
+    return batch_summary(results)
@@ -1,13 +1,22 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import desc, func
-from typing import List, Optional
-from database import get_db
+from typing import List, Literal, Optional
+from database import get_db, get_read_db
 from models.request_user_model import AccessRequest
 from models.book_model import Book
 from models.user_model import User
 from schemas import request_user_schema as schemas
+from schemas.request_schema import StatusSummary, BatchReviewResponse
 from auth import get_current_user
+from utils import create_logs_bulk
+from utils.events import notify, notify_many, request_event
+from utils.pagination import NEXT_CURSOR_HEADER, keyset_page
+from utils.request_queue import (
+    QUEUE_DEFAULT_LIMIT, QUEUE_MAX_LIMIT, status_summary,
+    latest_per_id, batch_result, apply_grouped_updates, batch_summary,
+)
 
 router = APIRouter()
 
@@ -79,6 +88,8 @@ def submit_restricted_access_request(
             existing_request.status = "pending"
             existing_request.rejection_reason = None 
             existing_request.updated_at = func.now() 
+            notify(db, request_event("access_request", "created", existing_request.id, "pending",
+                                     book_id=existing_request.book_id, owner_id=current_user.id))
             
             try:
                 db.commit()
@@ -101,6 +112,9 @@ def submit_restricted_access_request(
     
     try:
         db.add(new_request)
+        db.flush()  # id chahiye (event ke liye)
+        notify(db, request_event("access_request", "created", new_request.id, "pending",
+                                 book_id=new_request.book_id, owner_id=current_user.id))
         db.commit()
         db.refresh(new_request)
         return new_request
@@ -190,6 +204,97 @@ def get_all_access_requests(
         formatted_requests.append(obj)
     return formatted_requests
 
+# ---------------------------------------------------------
+# 4b. GET: Admin Queue (Keyset paginated) + Badge Counts
+# ---------------------------------------------------------
+@router.get("/queue", response_model=List[schemas.AccessRequestResponse])
+def get_access_request_queue(
+    response: Response,
+    status_filter: Optional[Literal["pending", "approved", "rejected"]] = Query(None, alias="status"),
+    book_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = Query(QUEUE_DEFAULT_LIMIT, ge=1, le=QUEUE_MAX_LIMIT),
+    cursor: Optional[str] = Query(None, description="Pichhle response ka X-Next-Cursor"),
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Admin Only: newest first, ek page (next page ka cursor X-Next-Cursor header mein)."""
+    ensure_admin(current_user) # 🔐 Security Check
+
+    # Book ek JOIN mein; lazyload("*") => Book/User ke relationships per-row load nahi
+    query = db.query(AccessRequest).options(joinedload(AccessRequest.book).lazyload("*"))
+    if status_filter:
+        query = query.filter(AccessRequest.status == status_filter)
+    if book_id is not None:
+        query = query.filter(AccessRequest.book_id == book_id)
+    if created_from:
+        query = query.filter(AccessRequest.created_at >= created_from)
+    if created_to:
+        query = query.filter(AccessRequest.created_at < created_to)
+
+    rows, next_cursor = keyset_page(query, AccessRequest.created_at, AccessRequest.id, cursor, limit)
+    for req in rows:
+        setattr(req, "book_title", req.book.title if req.book else "Unknown Book (Deleted)")
+        setattr(req, "book_cover", req.book.cover_image_url if req.book else None)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return rows
+
+
+@router.get("/summary", response_model=StatusSummary)
+def get_access_request_summary(
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Admin Only: status-wise counts (badge numbers)."""
+    ensure_admin(current_user) # 🔐 Security Check
+    return status_summary(db, AccessRequest.status)
+
+# ---------------------------------------------------------
+# 4c. POST: Batch Review (Admin - bahut saari requests ek saath)
+# ---------------------------------------------------------
+@router.post("/review-batch", response_model=BatchReviewResponse)
+def review_access_requests_batch(
+    batch: schemas.AccessBatchReviewRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Admin Only: ek SELECT, har decision group par ek UPDATE, bulk logs, ek commit."""
+    ensure_admin(current_user) # 🔐 Security Check
+
+    items = latest_per_id(batch.items)
+    found = {row.id: row for row in db.query(AccessRequest.id, AccessRequest.user_id, AccessRequest.book_id)
+             .filter(AccessRequest.id.in_(list(items)))}
+
+    results, groups = [], {}
+    for request_id, item in items.items():
+        if request_id not in found:
+            results.append(batch_result(request_id, detail="Request nahi mili."))
+            continue
+        # Single PATCH jaisa: rejected => reason (default), approved => reason clear
+        if item.status == "rejected":
+            reason = item.rejection_reason or "No reason provided."
+        elif item.status == "approved":
+            reason = None
+        else:
+            reason = item.rejection_reason
+        groups.setdefault((item.status, reason), []).append(request_id)
+        results.append(batch_result(request_id, status=item.status))
+
+    apply_grouped_updates(db, AccessRequest, groups, ("status", "rejection_reason"), updated_at=func.now())
+    create_logs_bulk(db, current_user, [
+        ("RESTRICTED_ACCESS_REVIEW", f"Restricted access request {request_id} set to {state} (batch)", "AccessRequest", request_id)
+        for (state, _), ids in groups.items() for request_id in ids
+    ])
+    notify_many(db, [
+        request_event("access_request", "updated", request_id, state,
+                      book_id=found[request_id].book_id, owner_id=found[request_id].user_id)
+        for (state, _), ids in groups.items() for request_id in ids
+    ])
+    db.commit()
+    return batch_summary(results)
+
 # ---------------------------------------------------------
 # 5. PATCH: Update Status (Secured)
 # ---------------------------------------------------------
@@ -222,6 +327,10 @@ def update_request_status(
     elif normalized_status == "approved":
         db_request.rejection_reason = None # Clear reason if approved
 
+    # 🔔 User (aur baaki admins) ko real-time update (commit ke baad hi jata hai)
+    notify(db, request_event("access_request", "updated", db_request.id, normalized_status,
+                             book_id=db_request.book_id, owner_id=db_request.user_id))
+
     try:
         db.commit()
         db.refresh(db_request)
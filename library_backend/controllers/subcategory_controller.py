@@ -10,6 +10,7 @@ from models import book_model, user_model
 from schemas import subcategory_schema
 # Import auth and utils
 from auth import require_permission, get_db
+from database import get_read_db
 from utils import create_log
 
 router = APIRouter()
@@ -60,7 +61,7 @@ def create_subcategory(
 
 # --- READ ALL Subcategories (Public) ---
 @router.get("/", response_model=List[subcategory_schema.SubcategoryWithCategory])
-def read_subcategories(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def read_subcategories(skip: int = 0, limit: int = 100, db: Session = Depends(get_read_db)):
     """Fetches a list of all non-deleted subcategories, including their parent category."""
     return db.query(book_model.Subcategory).options(
         joinedload(book_model.Subcategory.category)
@@ -70,7 +71,7 @@ def read_subcategories(skip: int = 0, limit: int = 100, db: Session = Depends(ge
 
 # --- READ ONE Subcategory (Public) ---
 @router.get("/{subcategory_id}", response_model=subcategory_schema.SubcategoryWithCategory)
-def read_subcategory(subcategory_id: int, db: Session = Depends(get_db)):
+def read_subcategory(subcategory_id: int, db: Session = Depends(get_read_db)):
     """Fetches details of a specific non-deleted subcategory by ID."""
     db_subcategory = get_subcategory_with_category(db, subcategory_id)
     if db_subcategory is None:
@@ -1,6 +1,9 @@
 from fastapi import APIRouter, File, UploadFile, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from auth import require_permission
 from utils.cloudinary_helper import upload_to_cloudinary  # ✅ New Import
+from utils.image_pipeline import generate_cover_variants
+from utils.pdf_storage import linearize_upload
 
 router = APIRouter()
 
@@ -8,21 +11,27 @@ router = APIRouter()
 @router.post("/image", dependencies=[Depends(require_permission("FILE_UPLOAD"))])
 async def upload_image(file: UploadFile = File(...)):
     """
-    Book cover image upload karta hai aur Cloudinary URL return karta hai.
+    Book cover image upload karta hai aur Cloudinary URL return karta hai,
+    saath responsive derivatives (thumb/card/detail WebP/AVIF) aur blurhash.
     """
     # 1. Validation check (Security)
     if file.content_type not in ["image/jpeg", "image/png", "image/webp"]:
         raise HTTPException(status_code=400, detail="Invalid file type. Only JPEG, PNG, WEBP are allowed.")
     
-    # 2. Upload to Cloudinary (Folder: covers)
+    # 2. Derivatives (process pool) + Upload to Cloudinary (Folder: covers)
+    manifest = await generate_cover_variants(file)
     url = upload_to_cloudinary(file, folder="booknest/covers")
     
     # 3. Error Handling
     if not url:
         raise HTTPException(status_code=500, detail="Image upload failed on server.")
         
-    # 4. Return URL (Frontend compatible)
-    return {"url": url}
+    # 4. Return URL (Frontend compatible) + optional variants
+    return {
+        "url": url,
+        "variants": manifest["variants"] if manifest else None,
+        "blurhash": manifest["blurhash"] if manifest else None,
+    }
 
 
 # --- 2. PDF UPLOAD ---
@@ -35,7 +44,8 @@ async def upload_pdf(file: UploadFile = File(...)):
     if file.content_type != "application/pdf":
         raise HTTPException(status_code=400, detail="Invalid file type. Only PDF is allowed.")
         
-    # 2. Upload to Cloudinary (Folder: pdfs)
+    # 2. Linearize (qpdf, agar installed) + Upload to Cloudinary (Folder: pdfs)
+    await run_in_threadpool(linearize_upload, file)
     url = upload_to_cloudinary(file, folder="booknest/pdfs")
     
     # 3. Error Handling
@@ -1,16 +1,24 @@
 from datetime import datetime
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import case, func, literal, literal_column, or_
 from sqlalchemy.orm import Session, joinedload
 
 # --- Imports ---
 from models import user_model
 from schemas import user_schema
 from auth import get_db, require_permission, get_password_hash, get_current_user
+from database import get_read_db
 from utils import create_log
+from utils.pagination import NEXT_CURSOR_HEADER, keyset_page
 
 router = APIRouter()
 
+SEARCH_DEFAULT_LIMIT = 10
+SEARCH_MAX_LIMIT = 50
+# Is se chhoti query par trigrams nahi bante: sirf username / email prefix
+TRIGRAM_MIN_LENGTH = 3
+
 # ==================================
 # USER MANAGEMENT ENDPOINTS
 # ==================================
@@ -96,21 +104,92 @@ def create_user(
 # --- READ ALL USERS (Dropdowns & Lists) ---
 @router.get("/", response_model=List[user_schema.User])
 def read_users(
-    skip: int = 0,
-    limit: int = 100,
+    response: Response,
+    skip: int = Query(0, ge=0, description="Legacy offset pagination (cursor behtar hai)"),
+    limit: int = Query(100, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="Pichhle response ka X-Next-Cursor"),
+    search: Optional[str] = Query(None, description="Name / username / email (contains)"),
+    role_id: Optional[int] = None,
+    status_filter: Optional[str] = Query(None, alias="status"),
     db: Session = Depends(get_db),
     # ✅ FIX: 'BOOK_ISSUE' allow kiya taake Issuer User select kar sake
     current_user: user_model.User = Depends(require_permission("BOOK_ISSUE"))
 ):
     """
-    Fetches a list of all active users.
+    Fetches a list of all active users (newest first).
     Allowed for Book Issuers (to select client) and Admins.
+    Agla page: `cursor` = pichhle response ka X-Next-Cursor.
     """
-    return db.query(user_model.User).options(
-        joinedload(user_model.User.role)
-    ).filter(
-        user_model.User.deleted_at.is_(None)
-    ).order_by(user_model.User.id.desc()).offset(skip).limit(limit).all()
+    User = user_model.User
+    query = db.query(User).options(joinedload(User.role)).filter(User.deleted_at.is_(None))
+    if search:
+        term = f"%{search}%"
+        query = query.filter(or_(User.full_name.ilike(term), User.username.ilike(term), User.email.ilike(term)))
+    if role_id is not None:
+        query = query.filter(User.role_id == role_id)
+    if status_filter:
+        query = query.filter(User.status == status_filter)
+
+    if skip and not cursor:
+        return query.order_by(User.id.desc()).offset(skip).limit(limit).all()
+
+    users, next_cursor = keyset_page(query, User.id, User.id, cursor, limit)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return users
+
+
+# --- TYPEAHEAD SEARCH (Issue desk) ---
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _search_expression():
+    # models/user_model.USER_SEARCH_EXPRESSION jaisa hi (warna ix_users_search_trgm use nahi hota)
+    User = user_model.User
+    space = literal_column("' '")
+    return func.lower(User.username.op("||")(space).op("||")(func.coalesce(User.full_name, literal_column("''")))
+                      .op("||")(space).op("||")(User.email))
+
+
+@router.get("/search", response_model=List[user_schema.UserSearchResult])
+def search_users(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=SEARCH_MAX_LIMIT),
+    db: Session = Depends(get_read_db),
+    current_user: user_model.User = Depends(require_permission("BOOK_ISSUE"))
+):
+    """
+    Username / full name / email typeahead. Sirf columns select hote hain (User
+    ki selectin relationships / role load nahi), partial indexes se:
+    - 1-2 letters: username ya email prefix (btree text_pattern_ops)
+    - 3+ letters: contains + word similarity (pg_trgm GIN); prefix matches pehle
+    """
+    User = user_model.User
+    term = q.strip().lower()
+    if not term:
+        return []
+    prefix = f"{_like_escape(term)}%"
+    prefix_match = or_(func.lower(User.username).like(prefix, escape="\\"),
+                       func.lower(User.email).like(prefix, escape="\\"))
+
+    query = db.query(User.id, User.username, User.full_name, User.email, User.status).filter(
+        User.deleted_at.is_(None)
+    )
+    if len(term) < TRIGRAM_MIN_LENGTH:
+        query = query.filter(prefix_match).order_by(User.username)
+    else:
+        expression = _search_expression()
+        contains = expression.like(f"%{_like_escape(term)}%", escape="\\")
+        order = [case((prefix_match, 0), else_=1)]
+        if db.get_bind().dialect.name == "postgresql":
+            query = query.filter(or_(contains, literal(term).op("<%")(expression)))
+            order.append(func.word_similarity(term, expression).desc())
+        else:
+            query = query.filter(contains)
+        query = query.order_by(*order, User.username)
+
+    return query.limit(limit).all()
 
 
 # --- UPDATE USER (Admin Only) ---
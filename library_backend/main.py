@@ -1,12 +1,9 @@
 import os
-import sys
 import logging
 import bcrypt  # ✅ Essential for the patch
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-import uvicorn
-from dotenv import load_dotenv
 from fastapi import FastAPI, APIRouter, Request, status, Depends
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
@@ -29,24 +26,27 @@ if not hasattr(bcrypt, '__about__'):
         pass
 
 # =====================================================
-# 1. SETUP PATHS & ENV
+# 1. SETUP PATHS & LOGGING
 # =====================================================
 BASE_DIR = Path(__file__).resolve().parent
-ENV_PATH = BASE_DIR.parent / ".env"
-load_dotenv(ENV_PATH)
-
-# Setup Logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)]
-)
+
+# Logging: QueueHandler + background writer, JSON lines + request ids
+# (utils/app_logging) - create_app() mein setup hota hai
 logger = logging.getLogger(__name__)
 
 # =====================================================
-# 2. DATABASE IMPORTS
+# 2. CONFIG & DATABASE IMPORTS
 # =====================================================
-from database import engine, Base, get_db
+# Note: inme se koi bhi import DB connection ya network client nahi banata
+# (.env bhi sirf ek baar get_settings() mein padhi jati hai). Engine, static
+# folders aur schema check create_app() / lifespan / pehli zaroorat par hote hain.
+from config import Settings, get_settings
+import database
+from database import Base, get_db
+from utils.app_logging import REQUEST_ID_HEADER, RequestIdMiddleware, setup_logging
+from utils.replica_routing import ReadYourWritesMiddleware
+from utils.static_files import PrecompressedStaticFiles
+from utils import image_pipeline, content_index, reading_analytics, cloudinary_helper, events, soft_delete, change_feed, catalog_snapshot, holds  # noqa: F401
 from models import user_model, permission_model, library_management_models
 
 # =====================================================
@@ -73,96 +73,112 @@ from controllers import (
     public_user_controller,
     request_controller,
     book_read_controller,
+    book_pdf_controller,
+    book_content_controller,
     book_management_controller,
     password_controller,
     post_controller,
-    donation_controller
+    donation_controller,
+    reference_data_controller,
+    events_controller,
+    hold_controller
 )
 
 # =====================================================
 # 4. LIFESPAN MANAGER
 # =====================================================
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """
-    Application Startup & Shutdown Logic.
-    Ensures Database Tables exist before server starts.
-    """
-    logger.info("🔄 Starting BookNest API...")
-    
-    # Database Check & Table Creation
-    try:
-        Base.metadata.create_all(bind=engine)
-        
-        # Verify Connection
-        with engine.connect() as connection:
-            connection.execute(text("SELECT 1"))
-        logger.info("✅ Database Tables Verified & Connected.")
-    except Exception as e:
-        logger.critical(f"❌ DATABASE ERROR: {str(e)}")
-    
-    yield  # Server runs here
-    
-    logger.info("🛑 Shutting down BookNest API...")
+def _prepare_static_dirs(static_dir: Path):
+    """Upload folders (import par nahi) startup par ek baar bante hain."""
+    uploads_dir = static_dir / "uploads"
+    posts_dir = uploads_dir / "posts"
+    images_dir = static_dir / "images"  # ✅ Added images folder for Logo
+    catalog_dir = static_dir / "catalog"  # Public catalog snapshots (utils/catalog_snapshot)
 
-# =====================================================
-# 5. INITIALIZE FASTAPI
-# =====================================================
-app = FastAPI(
-    title="BookNest Library API",
-    version="6.5.0",
-    description="Full-featured Library API (Optimized Router Order)",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    lifespan=lifespan
-)
-
-# =====================================================
-# 6. STATIC FILES SETUP
-# =====================================================
-static_dir = BASE_DIR / "static"
-uploads_dir = static_dir / "uploads"
-posts_dir = uploads_dir / "posts"
-images_dir = static_dir / "images" # ✅ Added images folder for Logo
+    for folder in [static_dir, uploads_dir, posts_dir, images_dir, catalog_dir]:
+        folder.mkdir(parents=True, exist_ok=True)
 
-# Create directories if they don't exist
-for folder in [static_dir, uploads_dir, posts_dir, images_dir]:
-    folder.mkdir(parents=True, exist_ok=True)
 
-app.mount("/static", StaticFiles(directory=static_dir), name="static")
+def _verify_schema(settings: Settings):
+    """
+    Production: Alembic revision check (ek chhoti SELECT), har worker par
+    create_all nahi. AUTO_CREATE_SCHEMA=true sirf local/dev ke liye.
+    """
+    engine = database.init_engine(settings.database_url)
 
-# =====================================================
-# 7. CORS MIDDLEWARE
-# =====================================================
-origins = [
-    "http://localhost:5173",
-    "http://127.0.0.1:5173",
-    "http://localhost:5174",
-    "http://127.0.0.1:5174",
-    "http://localhost:3000",
-    "http://127.0.0.1:3000",
-    # ✅ YOUR VERCEL APP URL
-    "https://pkil-two.vercel.app",
-    "https://pkil-two.vercel.app/"
-]
-
-# Add Production URL from Environment Variable
-env_frontend_url = os.getenv("FRONTEND_URL")
-if env_frontend_url:
-    origins.append(env_frontend_url)
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    if settings.auto_create_schema:
+        Base.metadata.create_all(bind=engine)
+        logger.info("🧱 AUTO_CREATE_SCHEMA: tables created (dev mode).")
+    else:
+        state = database.check_schema_revision(engine)
+        if not state["up_to_date"]:
+            message = (
+                f"Database schema revision {state['current'] or 'none'} != migrations head "
+                f"{state['expected']}. Run 'alembic upgrade head'."
+            )
+            if settings.strict_schema_check:
+                raise RuntimeError(message)
+            logger.critical(f"❌ {message}")
+
+    # Verify Connection
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+def _build_lifespan(settings: Settings):
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        """
+        Application Startup & Shutdown Logic.
+        Static folders + schema revision verify karta hai.
+        """
+        logger.info("🔄 Starting BookNest API...")
+        _prepare_static_dirs(settings.static_dir)
+
+        try:
+            _verify_schema(settings)
+            logger.info("✅ Database Schema Verified & Connected.")
+        except RuntimeError:
+            raise
+        except Exception as e:
+            logger.critical(f"❌ DATABASE ERROR: {str(e)}")
+
+        # In-book search indexing (background thread + process pool)
+        if settings.content_index_enabled:
+            content_index.get_content_indexer().start()
+        # Reading analytics rollups (digital_access -> hourly/daily)
+        if settings.analytics_enabled:
+            reading_analytics.get_aggregator().start()
+        # Request status events: Postgres LISTEN thread (SSE fan-out)
+        if settings.events_enabled:
+            events.get_event_bus().start()
+        # Public catalog snapshots (change feed se incremental rebuild)
+        if settings.catalog_snapshot_enabled:
+            catalog_snapshot.get_snapshot_builder().start()
+        # Book holds: uncollected Ready holds expire, copy agle hold ko
+        if settings.hold_sweep_enabled:
+            holds.get_hold_sweeper().start()
+
+        yield  # Server runs here
+
+        if settings.content_index_enabled:
+            content_index.get_content_indexer().stop()
+        if settings.analytics_enabled:
+            reading_analytics.get_aggregator().stop()
+        if settings.events_enabled:
+            events.get_event_bus().stop()
+        if settings.catalog_snapshot_enabled:
+            catalog_snapshot.get_snapshot_builder().stop()
+        if settings.hold_sweep_enabled:
+            holds.get_hold_sweeper().stop()
+        image_pipeline.shutdown_pool()
+        cloudinary_helper.shutdown_upload_pool()
+        logger.info("🛑 Shutting down BookNest API...")
+
+    return lifespan
 
 # =====================================================
-# 8. EXCEPTION HANDLERS
+# 5. EXCEPTION HANDLERS
 # =====================================================
-@app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     error_details = []
     try:
@@ -192,67 +208,80 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         )
 
 # =====================================================
-# 9. ROUTER REGISTRATION
+# 6. ROUTER REGISTRATION
 # =====================================================
-api_router = APIRouter(prefix="/api")
-
-# --- Authentication ---
-api_router.include_router(auth_controller.router, tags=["Authentication"])
-api_router.include_router(google_auth_controller.router, tags=["Google Auth"])
-api_router.include_router(password_controller.router, prefix="/auth", tags=["Password Reset"])
-
-# --- Users & Roles ---
-api_router.include_router(profile_controller.router, prefix="/profile", tags=["Profile"])
-api_router.include_router(user_controller.router, prefix="/users", tags=["Users"])
-api_router.include_router(role_controller.router, prefix="/roles", tags=["Roles"])
-api_router.include_router(permission_controller.router, prefix="/permissions", tags=["Permissions"])
-
-# --- Library Content ---
-api_router.include_router(category_controller.router, prefix="/categories", tags=["Categories"])
-api_router.include_router(subcategory_controller.router, prefix="/subcategories", tags=["Subcategories"])
-api_router.include_router(language_controller.router, prefix="/languages", tags=["Languages"])
-api_router.include_router(location_controller.router, prefix="/locations", tags=["Locations"])
-api_router.include_router(book_copy_controller.router, prefix="/copies", tags=["Copies"])
-api_router.include_router(upload_controller.router, prefix="/upload", tags=["Uploads"])
-
-# --- Operations ---
-api_router.include_router(issue_controller.router, prefix="/issues", tags=["Issues"])
-api_router.include_router(request_controller.router, prefix="/requests", tags=["Requests (Admin)"])
-api_router.include_router(request_user_controller.router, prefix="/restricted-requests", tags=["Requests (User)"])
-
-# --- Security & Logs ---
-api_router.include_router(book_permission_controller.router, prefix="/book-permissions", tags=["Book Permissions"])
-api_router.include_router(digital_access_controller.router, prefix="/digital-access", tags=["Digital Access"])
-api_router.include_router(log_controller.router, prefix="/logs", tags=["Logs"])
-
-# --- Public & Extra ---
-api_router.include_router(public_user_controller.router, prefix="/public", tags=["Public Actions"])
-
-# ✅ FIX: Static routes (Manage) MUST come before Dynamic routes (Read by ID)
-api_router.include_router(book_management_controller.router, prefix="/books", tags=["Books (Manage)"])
-api_router.include_router(book_read_controller.router, prefix="/books", tags=["Books (Read)"])
-
-api_router.include_router(post_controller.router, prefix="/posts", tags=["Markaz News"])
-
-# ✅ FIX: Added prefix so route becomes /api/donation
-api_router.include_router(donation_controller.router, prefix="/donation", tags=["Donation"])
-
-# Add Main Router to App
-app.include_router(api_router)
+def build_api_router() -> APIRouter:
+    api_router = APIRouter(prefix="/api")
+
+    # --- Authentication ---
+    api_router.include_router(auth_controller.router, tags=["Authentication"])
+    api_router.include_router(google_auth_controller.router, tags=["Google Auth"])
+    api_router.include_router(password_controller.router, prefix="/auth", tags=["Password Reset"])
+
+    # --- Users & Roles ---
+    api_router.include_router(profile_controller.router, prefix="/profile", tags=["Profile"])
+    api_router.include_router(user_controller.router, prefix="/users", tags=["Users"])
+    api_router.include_router(role_controller.router, prefix="/roles", tags=["Roles"])
+    api_router.include_router(permission_controller.router, prefix="/permissions", tags=["Permissions"])
+
+    # --- Library Content ---
+    api_router.include_router(category_controller.router, prefix="/categories", tags=["Categories"])
+    api_router.include_router(subcategory_controller.router, prefix="/subcategories", tags=["Subcategories"])
+    api_router.include_router(language_controller.router, prefix="/languages", tags=["Languages"])
+    api_router.include_router(location_controller.router, prefix="/locations", tags=["Locations"])
+    api_router.include_router(book_copy_controller.router, prefix="/copies", tags=["Copies"])
+    # Saari lookup tables ek cached bundle mein (forms / admin pages ke liye)
+    api_router.include_router(reference_data_controller.router, prefix="/reference-data", tags=["Reference Data"])
+    api_router.include_router(upload_controller.router, prefix="/upload", tags=["Uploads"])
+
+    # --- Operations ---
+    api_router.include_router(issue_controller.router, prefix="/issues", tags=["Issues"])
+    api_router.include_router(hold_controller.router, prefix="/holds", tags=["Holds"])
+    api_router.include_router(request_controller.router, prefix="/requests", tags=["Requests (Admin)"])
+    api_router.include_router(request_user_controller.router, prefix="/restricted-requests", tags=["Requests (User)"])
+
+    # --- Security & Logs ---
+    api_router.include_router(book_permission_controller.router, prefix="/book-permissions", tags=["Book Permissions"])
+    api_router.include_router(digital_access_controller.router, prefix="/digital-access", tags=["Digital Access"])
+    api_router.include_router(log_controller.router, prefix="/logs", tags=["Logs"])
+
+    # --- Real-time (SSE) ---
+    api_router.include_router(events_controller.router, prefix="/events", tags=["Events"])
+
+    # --- Public & Extra ---
+    api_router.include_router(public_user_controller.router, prefix="/public", tags=["Public Actions"])
+
+    # ✅ FIX: Static routes (Manage) MUST come before Dynamic routes (Read by ID)
+    api_router.include_router(book_management_controller.router, prefix="/books", tags=["Books (Manage)"])
+    api_router.include_router(book_pdf_controller.router, prefix="/books", tags=["Books (PDF)"])
+    # /books/content-search static path hai: /{book_id} se pehle register hona zaroori
+    api_router.include_router(book_content_controller.router, prefix="/books", tags=["Books (Content Search)"])
+    api_router.include_router(book_read_controller.router, prefix="/books", tags=["Books (Read)"])
+
+    api_router.include_router(post_controller.router, prefix="/posts", tags=["Markaz News"])
+
+    # ✅ FIX: Added prefix so route becomes /api/donation
+    api_router.include_router(donation_controller.router, prefix="/donation", tags=["Donation"])
+
+    return api_router
 
 # =====================================================
-# 10. UTILITY ENDPOINTS
+# 7. UTILITY ENDPOINTS
 # =====================================================
+system_router = APIRouter()
+
 
-@app.get("/", tags=["System"])
+@system_router.get("/", tags=["System"])
 def root():
     return {"message": "Welcome to BookNest Library API", "status": "running"}
 
-@app.get("/api/health", tags=["System"])
-def health_check():
-    return {"status": "ok", "version": app.version}
 
-@app.get("/api/nuke-issues", tags=["Debug"])
+@system_router.get("/api/health", tags=["System"])
+def health_check(request: Request):
+    return {"status": "ok", "version": request.app.version, "replicas": database.replica_status()}
+
+
+@system_router.get("/api/nuke-issues", tags=["Debug"])
 def nuke_issues(db: Session = Depends(get_db)):
     """Deletes all issued books (Emergency cleanup)"""
     try:
@@ -264,7 +293,8 @@ def nuke_issues(db: Session = Depends(get_db)):
         db.rollback()
         return {"message": f"Error deleting issues: {str(e)}"}
 
-@app.get("/api/setup-permissions", tags=["Setup"])
+
+@system_router.get("/api/setup-permissions", tags=["Setup"])
 def setup_default_permissions(db: Session = Depends(get_db)):
     """Creates default permissions."""
     permission_groups = {
@@ -305,6 +335,75 @@ def setup_default_permissions(db: Session = Depends(get_db)):
         db.rollback()
         return {"error": str(e)}
 
+
+# =====================================================
+# 8. APP FACTORY
+# =====================================================
+def create_app(settings: Settings = None) -> FastAPI:
+    """
+    Naya FastAPI app banata hai. Import par koi side effect nahi: DB, static
+    folders aur schema check sab lifespan (startup) mein hote hain.
+
+    Isolated NAHI hai: engine, SessionLocal aur replica pool process-wide
+    (database module) hain. `settings` dene par unhe isi DB par rebind kiya
+    jata hai - doosra create_app(settings) pehle app ka engine bhi badal deta
+    hai. Ek process = ek DB (tests / benchmarks ek app ek waqt par).
+    """
+    if settings is not None:
+        # Explicit settings (tests / benchmarks): process-wide engine (aur replicas) isi DB par
+        if settings.database_url:
+            database.init_engine(settings.database_url)
+        database.init_replicas(settings.database_replica_urls, settings.replica_retry_seconds)
+    settings = settings or get_settings()
+    setup_logging(settings)
+
+    app = FastAPI(
+        title=settings.title,
+        version=settings.version,
+        description="Full-featured Library API (Optimized Router Order)",
+        docs_url="/docs",
+        redoc_url="/redoc",
+        lifespan=_build_lifespan(settings)
+    )
+    app.state.settings = settings
+
+    # --- Static Files (folder startup par banta hai, is liye check_dir=False) ---
+    # Precompressed catalog snapshots (.br / .gz disk se, request par compression nahi)
+    app.mount("/static/catalog", PrecompressedStaticFiles(directory=settings.static_dir / "catalog", check_dir=False), name="catalog")
+    app.mount("/static", StaticFiles(directory=settings.static_dir, check_dir=False), name="static")
+
+    # --- CORS ---
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.all_cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        # Cursor pagination + conditional requests ke headers browser JS ko dikhne chahiye
+        expose_headers=["X-Next-Cursor", "ETag", REQUEST_ID_HEADER],
+    )
+
+    # --- Read replicas: write ke baad user ki reads kuch seconds primary par ---
+    if settings.database_replica_urls:
+        app.add_middleware(
+            ReadYourWritesMiddleware,
+            state_dir=settings.cache_state_dir / "db_pins",  # sab workers ke shared token pins
+            sticky_seconds=settings.replica_sticky_seconds,
+        )
+
+    # --- Request ids (sab se bahar: har log line + X-Request-ID response header) ---
+    app.add_middleware(RequestIdMiddleware)
+
+    app.add_exception_handler(RequestValidationError, validation_exception_handler)
+
+    app.include_router(build_api_router())
+    app.include_router(system_router)
+    return app
+
+
+# gunicorn / uvicorn "main:app" ke liye
+app = create_app()
+
 # =====================================================
 # 11. MAIN ENTRY POINT
 # =====================================================
@@ -312,4 +411,5 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     host = "0.0.0.0"
     logger.info(f"🚀 Server starting on http://{host}:{port}")
+    import uvicorn
     uvicorn.run("main:app", host=host, port=port, reload=True)
@@ -8,4 +8,8 @@ from .language_model import Language
 from .location_model import Location  # <--- Ye file ab mil jayegi
 from .request_model import BookRequest, UploadRequest
 from .issue_model import Issue # Agar Issue model ban chuka hai to
-from .donation_models import DonationInfo
\ No newline at end of file
+from .donation_models import DonationInfo
+from .book_content_model import BookPage, BookIndexJob
+from .reading_analytics_model import BookAccessRollup, UserAccessRollup, AnalyticsWatermark
+from .change_feed_model import ChangeCounter
+from .hold_model import BookHold
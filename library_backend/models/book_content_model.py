@@ -0,0 +1,78 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint, DDL, event
+from datetime import datetime
+
+from database import Base
+
+# ==========================================
+# 📖 DIGITAL BOOK CONTENT (In-book full-text search)
+# ==========================================
+# Har page ek row. Inverted index DB ka apna hai:
+#   - PostgreSQL: generated `search_vector` tsvector column + GIN index
+#   - SQLite:     FTS5 external-content table `book_pages_fts` (triggers se sync)
+# 'simple' / unicode61 config: koi stemming nahi, taake Urdu/Arabic/Hindi/English
+# sab ek jaise tokenize hon.
+
+class BookPage(Base):
+    __tablename__ = "book_pages"
+
+    id = Column(Integer, primary_key=True)
+    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), nullable=False, index=True)
+    page_number = Column(Integer, nullable=False)  # 1-based
+    content = Column(Text, nullable=False, default="")
+
+    __table_args__ = (UniqueConstraint("book_id", "page_number", name="uq_book_pages_book_page"),)
+
+
+class BookIndexJob(Base):
+    """
+    Ek book ka extraction progress. `pages_done` har batch ke baad commit hota
+    hai, is liye crash/restart ke baad indexing wahin se resume hoti hai.
+    """
+    __tablename__ = "book_index_jobs"
+
+    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), primary_key=True)
+    source_url = Column(Text, nullable=False)
+    source_kind = Column(String(10), nullable=False, default="pdf")  # pdf | txt
+
+    # queued | running | done | failed
+    status = Column(String(20), nullable=False, default="queued", index=True)
+    total_pages = Column(Integer, nullable=True)
+    pages_done = Column(Integer, nullable=False, default=0)
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+    # Running job ka lease: worker mar jaye to expire hone par koi aur utha le
+    lease_until = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+
+# ==========================================
+# FULL-TEXT INDEX DDL (create_all ke liye; Alembic migration bhi yahi SQL chalati hai)
+# ==========================================
+POSTGRES_FTS_DDL = [
+    "ALTER TABLE book_pages ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS (to_tsvector('simple', coalesce(content, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS ix_book_pages_search_vector ON book_pages USING gin (search_vector)",
+]
+
+SQLITE_FTS_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS book_pages_fts USING fts5("
+    "content, content='book_pages', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS book_pages_fts_ai AFTER INSERT ON book_pages BEGIN "
+    "INSERT INTO book_pages_fts(rowid, content) VALUES (new.id, new.content); END",
+    "CREATE TRIGGER IF NOT EXISTS book_pages_fts_ad AFTER DELETE ON book_pages BEGIN "
+    "INSERT INTO book_pages_fts(book_pages_fts, rowid, content) VALUES ('delete', old.id, old.content); END",
+    "CREATE TRIGGER IF NOT EXISTS book_pages_fts_au AFTER UPDATE ON book_pages BEGIN "
+    "INSERT INTO book_pages_fts(book_pages_fts, rowid, content) VALUES ('delete', old.id, old.content); "
+    "INSERT INTO book_pages_fts(rowid, content) VALUES (new.id, new.content); END",
+]
+
+for _statement in POSTGRES_FTS_DDL:
+    event.listen(BookPage.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+for _statement in SQLITE_FTS_DDL:
+    event.listen(BookPage.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    BookPage.__table__, "after_drop",
+    DDL("DROP TABLE IF EXISTS book_pages_fts").execute_if(dialect="sqlite")
+)
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, Table, TIMESTAMP, DateTime, func, Float, Date
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, Text, ForeignKey, Table, TIMESTAMP, DateTime, func, Float, Date, Index
 from sqlalchemy.orm import relationship
-from database import Base
+from database import Base, active_rows_index
 from datetime import datetime
 
 # --- Association Table (Many-to-Many for Subcategories) ---
@@ -9,6 +9,8 @@ book_subcategory_link = Table(
     Base.metadata,
     Column('book_id', Integer, ForeignKey('books.id', ondelete="CASCADE"), primary_key=True),
     Column('subcategory_id', Integer, ForeignKey('subcategories.id', ondelete="CASCADE"), primary_key=True),
+    # Reverse index: PK (book_id, subcategory_id) "subcategory -> books" lookups / counts mein kaam nahi aata
+    Index('ix_book_subcategory_link_subcategory_book', 'subcategory_id', 'book_id'),
     mysql_engine='InnoDB'
 )
 
@@ -16,7 +18,7 @@ book_subcategory_link = Table(
 class Category(Base):
     __tablename__ = "categories"
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(100), unique=True, nullable=False, index=True)
+    name = Column(String(100), nullable=False)
     description = Column(Text, nullable=True)
     
     # Relationships
@@ -27,7 +29,11 @@ class Category(Base):
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at = Column(DateTime, nullable=True)
     
-    __table_args__ = {'mysql_engine': 'InnoDB'}
+    __table_args__ = (
+        # Naam sirf active categories mein unique (deleted category ka naam dobara ban sakta hai)
+        active_rows_index("ix_categories_name_active", "name", unique=True),
+        {'mysql_engine': 'InnoDB'},
+    )
 
 # --- Subcategory Model ---
 class Subcategory(Base):
@@ -37,7 +43,7 @@ class Subcategory(Base):
     description = Column(Text, nullable=True)
     
     # Foreign Key
-    category_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"), nullable=False)
+    category_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Relationships
     category = relationship("Category", back_populates="subcategories")
@@ -60,15 +66,18 @@ class Book(Base):
     author = Column(String(255), nullable=True, index=True) 
     publisher = Column(String(255), nullable=True) 
     published_date = Column(Date, nullable=True) 
-    isbn = Column(String(20), unique=True, index=True, nullable=True)
+    isbn = Column(String(20), nullable=True)
     edition = Column(String(100), nullable=True)
     
     # 2. Categorization & Language
-    language_id = Column(Integer, ForeignKey("languages.LanguageID", ondelete="SET NULL"), nullable=True)
+    language_id = Column(Integer, ForeignKey("languages.LanguageID", ondelete="SET NULL"), nullable=True, index=True)
     
     # 3. Digital & Media
     is_digital = Column(Boolean, default=False)
     cover_image_url = Column(Text, nullable=True)
+    # Responsive derivatives (utils/image_pipeline): {"thumb": {"webp": url, ...}, ...} JSON text
+    cover_variants = Column(Text, nullable=True)
+    cover_blurhash = Column(String(64), nullable=True)
     pdf_url = Column(Text, nullable=True)      
     txt_file_url = Column(Text, nullable=True) 
     description = Column(Text, nullable=True)
@@ -82,7 +91,7 @@ class Book(Base):
     available_copies = Column(Integer, default=1, nullable=False)
     
     # 6. Location
-    location_id = Column(Integer, ForeignKey("locations.id", ondelete="SET NULL"), nullable=True)
+    location_id = Column(Integer, ForeignKey("locations.id", ondelete="SET NULL"), nullable=True, index=True)
 
     # 7. Library Specific Fields
     serial_number = Column(String(100), nullable=True, index=True)
@@ -100,6 +109,9 @@ class Book(Base):
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at = Column(DateTime, nullable=True) 
 
+    # 9. Delta sync (utils/change_feed): har insert / update / soft delete par commit-order sequence
+    change_seq = Column(BigInteger, nullable=False, default=0, server_default="0")
+
     # --- Relationships ---
     
     language = relationship("Language") 
@@ -109,7 +121,14 @@ class Book(Base):
     upload_request = relationship("UploadRequest", back_populates="book", cascade="all, delete-orphan", uselist=False)
     requests = relationship("BookRequest", cascade="all, delete-orphan")
     
-    __table_args__ = {'mysql_engine': 'InnoDB'}
+    __table_args__ = (
+        active_rows_index("ix_books_isbn_active", "isbn", unique=True),
+        # Catalog listing: active + is_approved, id order
+        active_rows_index("ix_books_active_approved_id", "is_approved", "id"),
+        # /api/books/changes: (change_seq, id) > token range scan
+        Index("ix_books_change_seq_id", "change_seq", "id"),
+        {'mysql_engine': 'InnoDB'},
+    )
 
     # 🔥🔥🔥 MAGIC FIX STARTS HERE 🔥🔥🔥
     # Ye property backend ko "Smart" banati hai.
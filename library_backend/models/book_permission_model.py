@@ -1,5 +1,5 @@
 # file: models/book_permission_model.py
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, func
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Index, func
 from database import Base
 from datetime import datetime
 
@@ -11,9 +11,13 @@ class BookPermission(Base):
     
     # --- YAHAN BADLAV KIYA GAYA HAI ---
     # 'users.ClientID' ko 'users.id' kar diya gaya hai
-    user_id = Column(Integer, ForeignKey('users.id', ondelete="CASCADE"), nullable=True)
+    user_id = Column(Integer, ForeignKey('users.id', ondelete="CASCADE"), nullable=True, index=True)
     
-    role_id = Column(Integer, ForeignKey('roles.id', ondelete="CASCADE"), nullable=True)
+    role_id = Column(Integer, ForeignKey('roles.id', ondelete="CASCADE"), nullable=True, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     
-    __table_args__ = {'mysql_engine': 'InnoDB'}
\ No newline at end of file
+    __table_args__ = (
+        # can_access_book(): book_id + user_id dono equality
+        Index("ix_book_permissions_book_id_user_id", "book_id", "user_id"),
+        {'mysql_engine': 'InnoDB'},
+    )
\ No newline at end of file
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, BigInteger, String
+
+from database import Base
+
+# ==========================================
+# 🔄 CHANGE FEED COUNTERS
+# ==========================================
+# Delta sync (/api/books/changes) ke monotonic sequence numbers
+# (utils/change_feed). Har row ek feed hai:
+#   "books"       -> last assigned books.change_seq
+#   "books.reset" -> aakhri hard delete ka seq (is se purane tokens => full resync)
+
+class ChangeCounter(Base):
+    __tablename__ = "change_counters"
+
+    name = Column(String(50), primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0)
@@ -0,0 +1,57 @@
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index, text
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from database import Base
+
+# ==========================================
+# 📌 BOOK HOLDS (Reservation Queue)
+# ==========================================
+# Saari copies issue hon to member queue mein lagta hai (utils/holds).
+# Waiting -> Ready (copy allocate, pickup window) -> Fulfilled (issue hui)
+#                                                 -> Expired (pickup nahi hua)
+# Waiting / Ready -> Cancelled
+
+HOLD_WAITING = "Waiting"
+HOLD_READY = "Ready"
+HOLD_FULFILLED = "Fulfilled"
+HOLD_EXPIRED = "Expired"
+HOLD_CANCELLED = "Cancelled"
+ACTIVE_HOLD_STATUSES = (HOLD_WAITING, HOLD_READY)
+
+_ACTIVE = text("status IN ('Waiting', 'Ready')")
+
+
+class BookHold(Base):
+    __tablename__ = "book_holds"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    status = Column(String(20), nullable=False, default=HOLD_WAITING)
+    # Ready hone par allocate hui copy (copy ka Status = "On Hold")
+    copy_id = Column(Integer, ForeignKey("book_copies.CopyID"), nullable=True)
+
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    ready_at = Column(DateTime, nullable=True)
+    expires_at = Column(DateTime, nullable=True)   # Pickup deadline (Ready holds)
+    closed_at = Column(DateTime, nullable=True)    # Fulfilled / Expired / Cancelled
+
+    book = relationship("Book")
+    user = relationship("User")
+    book_copy = relationship("BookCopy")
+
+    __table_args__ = (
+        # Queue: "is book ka agla Waiting hold" - (book_id, status) equality + created_at order
+        Index("ix_book_holds_queue", "book_id", "status", "created_at", "id"),
+        # Member ke holds
+        Index("ix_book_holds_user_id_status", "user_id", "status"),
+        # Issue desk: "On Hold" copy ka Ready hold (+ FK index)
+        Index("ix_book_holds_copy_id", "copy_id"),
+        # Expiry sweep: Ready holds jin ki deadline guzar gayi
+        Index("ix_book_holds_status_expires_at", "status", "expires_at"),
+        # Ek member ka ek book par ek hi active hold
+        Index("ix_book_holds_active_user_book", "user_id", "book_id", unique=True,
+              postgresql_where=_ACTIVE, sqlite_where=_ACTIVE),
+    )
@@ -13,10 +13,10 @@ class Issue(Base):
     id = Column(Integer, primary_key=True, index=True)
     
     # --- Foreign Keys ---
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     
     # Note: Aapke BookCopy table mein primary key "CopyID" hai
-    book_copy_id = Column(Integer, ForeignKey("book_copies.CopyID"), nullable=False)
+    book_copy_id = Column(Integer, ForeignKey("book_copies.CopyID"), nullable=False, index=True)
 
     # --- Dates & Status ---
     issue_date = Column(DateTime, default=datetime.utcnow)
@@ -1,11 +1,16 @@
 # models/library_management_models.py
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, TIMESTAMP, DateTime, func
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, TIMESTAMP, DateTime, Index, func
 from sqlalchemy.orm import relationship
-from database import Base
+from database import Base, active_rows_index
 from datetime import datetime
 
 # Note: 'Book' aur 'User' hum circular imports se bachne ke liye string references ("Book", "User") use karenge.
 
+# Issue ho sakne wali copies (issue desk, /api/books/{id}/availability)
+AVAILABLE_COPY_STATUSES = ("Available", "New")
+# Kisi member ke Ready hold ke liye rakhi copy (utils/holds) - sirf wahi issue kara sakta hai
+ON_HOLD_COPY_STATUS = "On Hold"
+
 # --- DELETE LOCATION CLASS ---
 # (Yahan se Location class hata di gayi hai kyunki wo ab models/location_model.py mein hai)
 
@@ -19,9 +24,12 @@ class BookCopy(Base):
     id = Column("CopyID", Integer, primary_key=True, autoincrement=True)
     
     book_id = Column("BookID", Integer, ForeignKey("books.id"), nullable=False)
-    location_id = Column("LocationID", Integer, ForeignKey("locations.id"), nullable=False)
+    location_id = Column("LocationID", Integer, ForeignKey("locations.id"), nullable=False, index=True)
     
     status = Column("Status", String(50), nullable=False, default="Available")
+
+    # Scanner label (optional - purani copies sirf CopyID se pehchani jati hain)
+    barcode = Column("Barcode", String(64), nullable=True)
     
     # Relationships
     book = relationship("Book")
@@ -37,14 +45,20 @@ class BookCopy(Base):
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at = Column(DateTime, nullable=True)
     
-    __table_args__ = {'mysql_engine': 'InnoDB'}
+    __table_args__ = (
+        # "Is book ki available copies" - BookID equality + Status filter ek hi index se
+        Index("ix_book_copies_book_id_status", "BookID", "Status"),
+        # Barcode scan => ek unique index lookup (deleted copy ka label dobara chal sakta hai)
+        active_rows_index("ix_book_copies_barcode_active", "Barcode", unique=True),
+        {'mysql_engine': 'InnoDB'},
+    )
 
 class IssuedBook(Base):
     __tablename__ = "issued_books"
     id = Column("IssuedBookID", Integer, primary_key=True, autoincrement=True)
     
     client_id = Column("ClientID", Integer, ForeignKey("users.id"), nullable=False)
-    copy_id = Column("CopyID", Integer, ForeignKey("book_copies.CopyID"), nullable=False)
+    copy_id = Column("CopyID", Integer, ForeignKey("book_copies.CopyID"), nullable=False, index=True)
     
     issue_date = Column("IssueDate", DateTime, default=datetime.utcnow, nullable=False)
     due_date = Column("ReturnDate", DateTime, nullable=False)
@@ -58,7 +72,11 @@ class IssuedBook(Base):
     
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
     
-    __table_args__ = {'mysql_engine': 'InnoDB'}
+    __table_args__ = (
+        # Member ki issued / overdue books: ClientID + Status
+        Index("ix_issued_books_client_id_status", "ClientID", "Status"),
+        {'mysql_engine': 'InnoDB'},
+    )
 
 class DigitalAccess(Base):
     __tablename__ = "digital_access"
@@ -73,4 +91,10 @@ class DigitalAccess(Base):
     client = relationship("User")
     book = relationship("Book")
     
-    __table_args__ = {'mysql_engine': 'InnoDB'}
\ No newline at end of file
+    __table_args__ = {'mysql_engine': 'InnoDB'}
+
+
+# Raw reading events ke indexes: user history (keyset on id) aur per-book time range.
+# Dashboards in par nahi, rollup tables (models/reading_analytics_model) par chalte hain.
+Index("ix_digital_access_client_id_id", DigitalAccess.client_id, DigitalAccess.id)
+Index("ix_digital_access_book_id_timestamp", DigitalAccess.book_id, DigitalAccess.access_timestamp)
\ No newline at end of file
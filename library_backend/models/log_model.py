@@ -1,6 +1,6 @@
 # file: models/log_model.py
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime, timezone
 
@@ -13,7 +13,7 @@ class Log(Base):
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
 
     # user related to record (optional)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
 
     # user who performed the action
     action_by_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -21,7 +21,8 @@ class Log(Base):
     timestamp = Column(
         DateTime,
         default=lambda: datetime.now(timezone.utc),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     action_type = Column(String(100), nullable=False)
@@ -44,6 +45,12 @@ class Log(Base):
         lazy="selectin"
     )
 
+    # Logs page: filter (action_by / action_type) + ORDER BY timestamp DESC
+    __table_args__ = (
+        Index("ix_logs_action_by_id_timestamp", "action_by_id", "timestamp"),
+        Index("ix_logs_action_type_timestamp", "action_type", "timestamp"),
+    )
+
     def __repr__(self):
         return (
             f"<Log id={self.id} action_type={self.action_type} "
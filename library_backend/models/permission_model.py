@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, Table, TIMESTAMP, DateTime, func
+from sqlalchemy import Column, Integer, String, ForeignKey, Table, TIMESTAMP, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from database import Base
 from datetime import datetime
@@ -9,6 +9,8 @@ role_permission_link = Table(
     Base.metadata,
     Column('role_id', Integer, ForeignKey('roles.id', ondelete="CASCADE"), primary_key=True),
     Column('permission_id', Integer, ForeignKey('permissions.id', ondelete="CASCADE"), primary_key=True),
+    # PK (role_id, permission_id) permission -> roles lookup / permission delete mein kaam nahi aata
+    Index('ix_role_permissions_permission_id', 'permission_id'),
     mysql_engine='InnoDB'
 )
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -26,12 +26,16 @@ class MarkazPost(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     # Author Link (Admin who posted)
-    author_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    author_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     
     # ✅ lazy="joined" is kept (Best for performance)
     author = relationship("User", lazy="joined")
 
-    __table_args__ = {"mysql_engine": "InnoDB"}
+    __table_args__ = (
+        # Public feed keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_markaz_posts_created_at_id", "created_at", "id"),
+        {"mysql_engine": "InnoDB"},
+    )
 
     def __repr__(self):
         return f"<MarkazPost id={self.id} title='{self.title}'>" 
\ No newline at end of file
@@ -0,0 +1,52 @@
+from sqlalchemy import Column, Integer, String, DateTime, Index
+from datetime import datetime
+
+from database import Base
+
+# ==========================================
+# 📊 READING ANALYTICS ROLLUPS
+# ==========================================
+# digital_access (raw events) se background aggregator (utils/reading_analytics)
+# incrementally ye tables bharta hai. Dashboards sirf yahi padhte hain, raw
+# events scan nahi hote.
+#
+# granularity: "hour" | "day"; bucket_start us hour/day ka UTC start.
+# FK jaan-boojh kar nahi: rollups historical hain, book/user delete hone par bhi rehte hain.
+
+class BookAccessRollup(Base):
+    __tablename__ = "book_access_rollups"
+
+    granularity = Column(String(8), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    book_id = Column(Integer, primary_key=True)
+
+    access_count = Column(Integer, nullable=False, default=0)
+    denied_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        # Top books / trends: granularity + time range, phir book
+        Index("ix_book_access_rollups_book", "book_id", "granularity", "bucket_start"),
+    )
+
+
+class UserAccessRollup(Base):
+    __tablename__ = "user_access_rollups"
+
+    granularity = Column(String(8), primary_key=True)
+    bucket_start = Column(DateTime, primary_key=True)
+    user_id = Column(Integer, primary_key=True)
+
+    access_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_user_access_rollups_user", "user_id", "granularity", "bucket_start"),
+    )
+
+
+class AnalyticsWatermark(Base):
+    """Aggregator ne kis event id tak process kar liya (exactly-once: rollup + watermark ek transaction)."""
+    __tablename__ = "analytics_watermarks"
+
+    name = Column(String(50), primary_key=True)
+    last_event_id = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
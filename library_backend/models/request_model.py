@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLAlchemyEnum, Text
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum as SQLAlchemyEnum, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -13,8 +13,8 @@ class UploadRequest(Base):
 
     id = Column(Integer, primary_key=True, index=True)
 
-    submitted_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
-    reviewed_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    submitted_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    reviewed_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
 
     book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), nullable=False, unique=True)
 
@@ -46,7 +46,11 @@ class UploadRequest(Base):
         uselist=False
     )
 
-    __table_args__ = {"mysql_engine": "InnoDB"}
+    __table_args__ = (
+        # Admin queue: status filter + newest first (keyset) aur status counts
+        Index("ix_upload_requests_status_submitted_at", "status", "submitted_at"),
+        {"mysql_engine": "InnoDB"},
+    )
 
 
 # ==========================================================
@@ -57,8 +61,8 @@ class BookRequest(Base):
 
     id = Column(Integer, primary_key=True, index=True)
 
-    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    book_id = Column(Integer, ForeignKey("books.id", ondelete="CASCADE"), nullable=False, index=True)
 
     request_reason = Column(Text, nullable=False)
     delivery_address = Column(Text, nullable=False)
@@ -84,4 +88,7 @@ class BookRequest(Base):
         back_populates="requests"
     )
 
-    __table_args__ = {"mysql_engine": "InnoDB"}
+    __table_args__ = (
+        Index("ix_book_requests_status_created_at", "status", "created_at"),
+        {"mysql_engine": "InnoDB"},
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -52,4 +52,8 @@ class AccessRequest(Base):
     book = relationship("Book")
     user = relationship("User") # Isse hum User ka Email/Role access kar sakenge
 
-    __table_args__ = {'mysql_engine': 'InnoDB'}
\ No newline at end of file
+    __table_args__ = (
+        # Admin queue: status filter + newest first (keyset) aur status counts
+        Index('ix_access_requests_user_status_created_at', 'status', 'created_at'),
+        {'mysql_engine': 'InnoDB'},
+    )
\ No newline at end of file
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, func, TIMESTAMP, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, func, TIMESTAMP, DateTime, DDL, event
 from sqlalchemy.orm import relationship
-from database import Base
+from database import Base, active_rows_index
 from datetime import datetime
 
 from .permission_model import role_permission_link
@@ -13,7 +13,7 @@ class Role(Base):
     __tablename__ = "roles"
 
     id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(50), unique=True, nullable=False, index=True)
+    name = Column(String(50), nullable=False)
     description = Column(String(255), nullable=True)
 
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -28,7 +28,10 @@ class Role(Base):
         back_populates="roles"
     )
 
-    __table_args__ = {"mysql_engine": "InnoDB"}
+    __table_args__ = (
+        active_rows_index("ix_roles_name_active", "name", unique=True),
+        {"mysql_engine": "InnoDB"},
+    )
 
 
 # ==========================================
@@ -40,14 +43,14 @@ class User(Base):
     id = Column(Integer, primary_key=True, index=True)
 
     full_name = Column("FullName", String(255), nullable=True)
-    email = Column("Email", String(255), unique=True, nullable=False, index=True)
-    username = Column("Username", String(100), unique=True, nullable=False, index=True)
+    email = Column("Email", String(255), nullable=False)
+    username = Column("Username", String(100), nullable=False)
     password_hash = Column("PasswordHash", String(255), nullable=False)
 
     date_joined = Column("DateJoined", DateTime, default=datetime.utcnow, nullable=False)
     status = Column("Status", String(50), default="Active")
 
-    role_id = Column("RoleID", Integer, ForeignKey("roles.id"), nullable=False)
+    role_id = Column("RoleID", Integer, ForeignKey("roles.id"), nullable=False, index=True)
     role = relationship("Role", back_populates="users")
 
     otp_code = Column(String(6), nullable=True)
@@ -92,4 +95,32 @@ class User(Base):
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now(), nullable=False)
     deleted_at = Column(DateTime, nullable=True)
 
-    __table_args__ = {"mysql_engine": "InnoDB"}
+    __table_args__ = (
+        # Email / Username sirf active users mein unique: soft-deleted user global filter
+        # se chhup jata hai, is liye uska email / username dobara register ho sakta hai
+        active_rows_index("ix_users_email_active", "Email", unique=True),
+        active_rows_index("ix_users_username_active", "Username", unique=True),
+        {"mysql_engine": "InnoDB"},
+    )
+
+
+# ==========================================
+# TYPEAHEAD SEARCH INDEXES (Postgres; create_all + Alembic migration dono yahi SQL)
+# ==========================================
+# Ek hi expression (username + full name + email) par trigram GIN: contains (LIKE
+# '%q%') aur word similarity (`q <% expr`) dono isi index se. 1-2 letter queries
+# par trigram kaam nahi karte => username / email ke prefix btree indexes.
+USER_SEARCH_EXPRESSION = """lower("Username" || ' ' || coalesce("FullName", '') || ' ' || "Email")"""
+
+POSTGRES_USER_SEARCH_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX IF NOT EXISTS ix_users_search_trgm ON users "
+    f"USING gin (({USER_SEARCH_EXPRESSION}) gin_trgm_ops) WHERE deleted_at IS NULL",
+    'CREATE INDEX IF NOT EXISTS ix_users_username_prefix ON users '
+    '(lower("Username") text_pattern_ops) WHERE deleted_at IS NULL',
+    'CREATE INDEX IF NOT EXISTS ix_users_email_prefix ON users '
+    '(lower("Email") text_pattern_ops) WHERE deleted_at IS NULL',
+]
+
+for _statement in POSTGRES_USER_SEARCH_DDL:
+    event.listen(User.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
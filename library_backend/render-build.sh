@@ -6,4 +6,6 @@ pip install -r requirements.txt
 
 # --- YAHAN BADLAV KAREIN ---
 # Run alembic before the app starts
+# (purana create_all DB ho to pehle stamp - data ko haath nahi lagta)
+python scripts/stamp_existing_schema.py
 alembic upgrade head
\ No newline at end of file
@@ -0,0 +1,49 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+
+# --- Reading analytics (rollup tables se) ---
+# as_of: aggregator ne aakhri baar kab roll up kiya (data itna taza hai)
+
+class TopBook(BaseModel):
+    book_id: int
+    title: Optional[str] = None
+    author: Optional[str] = None
+    accesses: int
+    denied: int = 0
+
+
+class TopBooksResponse(BaseModel):
+    granularity: str
+    since: datetime
+    as_of: Optional[datetime] = None
+    results: List[TopBook]
+
+
+class ReaderCount(BaseModel):
+    user_id: int
+    username: Optional[str] = None
+    full_name: Optional[str] = None
+    accesses: int
+
+
+class ActiveReadersResponse(BaseModel):
+    granularity: str
+    since: datetime
+    as_of: Optional[datetime] = None
+    active_readers: int
+    top_readers: List[ReaderCount]
+
+
+class TrendPoint(BaseModel):
+    bucket_start: datetime
+    accesses: int
+    denied: int = 0
+
+
+class TrendResponse(BaseModel):
+    granularity: str
+    since: datetime
+    book_id: Optional[int] = None
+    as_of: Optional[datetime] = None
+    points: List[TrendPoint]
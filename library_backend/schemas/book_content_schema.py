@@ -0,0 +1,49 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List, Optional
+
+# --- In-book search (/api/books/{id}/search) ---
+class PageHit(BaseModel):
+    page_number: int
+    # HTML-escaped text; matched terms <mark>...</mark> mein
+    snippet: str
+    rank: float
+
+
+class BookSearchResponse(BaseModel):
+    book_id: int
+    query: str
+    index_status: Optional[str] = None  # queued | running | done | failed | None (index nahi)
+    results: List[PageHit]
+
+
+# --- Corpus-wide content search (/api/books/content-search) ---
+class ContentSearchHit(BaseModel):
+    book_id: int
+    title: str
+    author: Optional[str] = None
+    cover_image_url: Optional[str] = None
+    best_page: int
+    matching_pages: int
+    snippet: str
+    rank: float
+
+
+class ContentSearchResponse(BaseModel):
+    query: str
+    results: List[ContentSearchHit]
+
+
+# --- Admin: indexing progress ---
+class IndexStatus(BaseModel):
+    book_id: int
+    source_kind: str
+    status: str
+    pages_done: int
+    total_pages: Optional[int] = None
+    attempts: int
+    error: Optional[str] = None
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
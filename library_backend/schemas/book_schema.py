@@ -1,5 +1,7 @@
-from pydantic import BaseModel, Field, model_validator
-from typing import Optional, List
+import json
+
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Optional, List, Dict
 from datetime import date, datetime
 
 # --- Import Dependent Schemas ---
@@ -97,6 +99,21 @@ class Book(BookBase):
     language: Optional[LanguageSchema] = None
     subcategories: List[SubcategorySchema] = []
 
+    # ✅ Responsive covers: {"thumb": {"webp": "https://res.cloudinary.com/.../booknest/covers/variants/<hash>/thumb_webp.webp", "avif": ..., "width": 160, ...}, "card": ..., "detail": ...}
+    cover_variants: Optional[Dict[str, Dict]] = None
+    cover_blurhash: Optional[str] = None
+
+    @field_validator("cover_variants", mode="before")
+    @classmethod
+    def parse_cover_variants(cls, value):
+        # DB mein JSON text ki shakal mein store hota hai
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except ValueError:
+                return None
+        return value
+
     # ✅ SMART VALIDATOR
     @model_validator(mode='after')
     def sync_file_urls(self):
@@ -111,8 +128,31 @@ class Book(BookBase):
             self.pdf_url = self.pdf_file
         elif self.pdf_url and not self.pdf_file:
             self.pdf_file = self.pdf_url
-            
+
+        # 🔒 Endpoint ne access check kiya aur user ke paas access nahi => raw storage URL
+        # nahi bhejte (PDF sirf /pdf-link + /pdf proxy se). Jahan flag set hi nahi hota
+        # (staff ke nested responses) wahan URL waise hi rehta hai.
+        if "user_has_access" in self.model_fields_set and not self.user_has_access:
+            self.pdf_url = None
+            self.pdf_file = None
+
         return self
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# ==============================================================================
+# 🔄 DELTA SYNC (/api/books/changes)
+# ==============================================================================
+class BookChanges(BaseModel):
+    # Agli call mein `since` ke taur par wapas bhejein (opaque)
+    token: str
+    # True => abhi aur changes baaki hain, foran dobara call karein
+    has_more: bool = False
+    # True => local copy clear karke `changed` se dobara bharein (token bahut purana)
+    reset: bool = False
+    changed: List[Book] = []
+    # Deleted / unapproved / ab visible nahi => local copy se hata dein
+    deleted: List[int] = []
+    # Restricted books jin ka is user ke paas access hai (None = admin, sab)
+    readable_ids: Optional[List[int]] = None
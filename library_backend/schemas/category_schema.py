@@ -1,6 +1,6 @@
 # file: schemas/category_schema.py
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 class CategoryBase(BaseModel):
     name: str = Field(..., max_length=100, example="Science Fiction")
@@ -12,4 +12,24 @@ class CategoryCreate(CategoryBase):
 class Category(CategoryBase):
     id: int
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# --- Category Tree (navigation) ---
+# book_count: approved, non-deleted books (category level par distinct books)
+
+class SubcategoryTreeNode(BaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    book_count: int = 0
+
+
+class CategoryTreeNode(CategoryBase):
+    id: int
+    book_count: int = 0
+    subcategories: List[SubcategoryTreeNode] = []
+
+
+class CategoryTree(BaseModel):
+    total_books: int = 0
+    categories: List[CategoryTreeNode]
@@ -4,7 +4,7 @@ from datetime import datetime
 
 # Response Model (Frontend will receive these 6 images + ID + timestamp)
 class DonationInfoResponse(BaseModel):
-    id: int
+    id: Optional[int] = None  # Row abhi bani na ho to None
     
     # --- 1. QR Code ---
     qr_code_desktop: Optional[str] = None
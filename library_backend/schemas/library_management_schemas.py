@@ -1,7 +1,7 @@
  # File: schemas/library_management_schemas.py
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Optional
 from datetime import datetime
 
 # Sahi schemas ko import karein
@@ -29,6 +29,17 @@ class BookCopyBase(BaseModel):
     book_id: int
     location_id: int
     status: str = "Available"
+    # book_copies.Barcode String(64); khali / sirf spaces => None (barcode hi nahi)
+    barcode: Optional[str] = Field(None, min_length=1, max_length=64)
+
+    @field_validator("barcode", mode="before")
+    @classmethod
+    def normalize_barcode(cls, value):
+        # Scanner aksar aage / peeche space ya newline bhejta hai (lookup bhi strip karta hai)
+        if isinstance(value, str):
+            value = value.strip()
+            return value or None
+        return value
 
 class BookCopyCreate(BookCopyBase):
     pass
@@ -40,6 +51,20 @@ class BookCopy(BookCopyBase):
     class Config:
         from_attributes = True
 
+# --- Availability Schemas (/api/books/{id}/availability) ---
+class LocationAvailability(BaseModel):
+    location_id: int
+    name: str
+    rack: Optional[str] = None
+    shelf: Optional[str] = None
+    count: int
+    copy_ids: List[int]
+
+class BookAvailability(BaseModel):
+    book_id: int
+    available_count: int
+    locations: List[LocationAvailability]
+
 # --- IssuedBook Schemas ---
 class IssuedBookBase(BaseModel):
     client_id: int
@@ -74,4 +99,25 @@ class DigitalAccess(DigitalAccessBase):
     client: user_schema.User
     book: book_schema.Book
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# --- BookHold Schemas (Reservation Queue) ---
+class BookHoldCreate(BaseModel):
+    book_id: int
+    # Staff (BOOK_ISSUE) kisi member ke liye hold laga sakta hai; warna khud ka
+    user_id: Optional[int] = None
+
+class BookHold(BaseModel):
+    id: int
+    book_id: int
+    user_id: int
+    status: str
+    copy_id: Optional[int] = None
+    created_at: datetime
+    ready_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    closed_at: Optional[datetime] = None
+    # Waiting holds: queue mein kaunsa number (1 = agla)
+    queue_position: Optional[int] = None
+    class Config:
+        from_attributes = True
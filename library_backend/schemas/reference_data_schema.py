@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+# --- /api/reference-data bundle (sirf docs / OpenAPI ke liye; response pre-rendered hai) ---
+
+class RefLanguage(BaseModel):
+    id: int
+    name: str
+    code: Optional[str] = None
+    description: Optional[str] = None
+
+
+class RefCategory(BaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+
+
+class RefSubcategory(BaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    category_id: int
+
+
+class RefLocation(BaseModel):
+    id: int
+    name: str
+    rack: Optional[str] = None
+    shelf: Optional[str] = None
+
+
+class ReferenceDataBundle(BaseModel):
+    version: str  # Content hash - data badle to hi badalta hai
+    languages: List[RefLanguage]
+    categories: List[RefCategory]
+    subcategories: List[RefSubcategory]
+    locations: List[RefLocation]
@@ -1,6 +1,6 @@
 # schemas/request_schema.py
 from pydantic import BaseModel, Field, validator
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -133,4 +133,35 @@ class BookRequestResponse(BaseModel):
     user: Optional[UserSummary] = None 
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# ==========================================
+# 3. ADMIN QUEUE SUMMARY (badge counts)
+# ==========================================
+class StatusSummary(BaseModel):
+    total: int
+    counts: Dict[str, int]  # e.g. {"Pending": 12, "Approved": 340}
+
+
+# ==========================================
+# 4. BATCH REVIEW (bahut saare requests ek call mein)
+# ==========================================
+class BatchReviewItem(BaseModel):
+    id: int
+    status: RequestStatus
+    # Upload requests: remarks | Borrow requests: rejection_reason
+    remarks: Optional[str] = Field(None, max_length=500)
+
+class BatchReviewRequest(BaseModel):
+    items: List[BatchReviewItem] = Field(..., min_length=1, max_length=500)
+
+class BatchReviewResult(BaseModel):
+    id: int
+    ok: bool
+    status: Optional[str] = None
+    detail: Optional[str] = None  # Fail hone ki wajah (e.g. "Request not found")
+
+class BatchReviewResponse(BaseModel):
+    updated: int
+    failed: int
+    results: List[BatchReviewResult]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, validator, Field
-from typing import Optional, List, Union
+from typing import Literal, Optional, List, Union
 from datetime import datetime
 
 # ---------------------------------------------------------
@@ -60,4 +60,14 @@ class AccessRequestResponse(AccessRequestBase):
         return v
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+# ---------------------------------------------------------
+# 4. Batch Review (Admin: bahut saari requests ek saath)
+# ---------------------------------------------------------
+class AccessBatchReviewItem(BaseModel):
+    id: int
+    status: Literal["approved", "rejected", "pending"]
+    rejection_reason: Optional[str] = None
+
+class AccessBatchReviewRequest(BaseModel):
+    items: List[AccessBatchReviewItem] = Field(..., min_length=1, max_length=500)
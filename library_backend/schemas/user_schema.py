@@ -104,4 +104,16 @@ class UserProfile(BaseModel):
     email: EmailStr
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class UserSearchResult(BaseModel):
+    """Issue desk typeahead: sirf chand columns (role / relationships load nahi hote)."""
+    id: int
+    username: str
+    full_name: Optional[str] = None
+    email: str
+    status: Optional[str] = None
+
+    class Config:
+        from_attributes = True
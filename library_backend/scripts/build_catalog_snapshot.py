@@ -0,0 +1,39 @@
+# library_backend/scripts/build_catalog_snapshot.py
+"""
+Public catalog snapshots (static/catalog) ko foran build / rebuild karta hai.
+
+Server ka background builder (CATALOG_SNAPSHOT_ENABLED) ye kaam khud har
+CATALOG_SNAPSHOT_INTERVAL_SECONDS par karta hai; ye script deploy ke baad ya
+static files kisi CDN / bucket par sync karne se pehle ke liye hai.
+
+Usage (library_backend folder se):
+
+    python scripts/build_catalog_snapshot.py          # incremental (change feed se)
+    python scripts/build_catalog_snapshot.py --full   # saare shards dobara
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import main as _app  # noqa: F401 - saare models register; import side-effect free hai
+from utils.catalog_snapshot import catalog_dir, get_snapshot_builder
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build precompressed public catalog snapshots")
+    parser.add_argument("--full", action="store_true", help="saare shards dobara render karein")
+    args = parser.parse_args()
+
+    catalog_dir().mkdir(parents=True, exist_ok=True)
+    result = get_snapshot_builder().run_once(full=args.full)
+    if result is None:
+        print("⏳ Another worker is building the snapshot right now, try again shortly.")
+        sys.exit(1)
+    print(f"📦 Catalog snapshot ({result['mode']}): pages={result['pages']} "
+          f"categories={result['categories']} seq={result['seq']} -> {catalog_dir()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# library_backend/scripts/check_import_time.py
+"""
+Cold-start budget check for `import main`.
+
+Har run ek fresh Python process mein `python -X importtime -c "import main"`
+chalata hai (warm page cache ke baad) aur verify karta hai ke import side-effect
+free hai: engine nahi bana, static folders nahi bane, Supabase/Cloudinary/Google
+SDK load nahi hue.
+
+Budget app ke APNE hisse par hai: `import main` minus framework floor (fastapi,
+sqlalchemy.orm, pydantic - usi machine par alag process mein naapa). Absolute
+time machine par depend karta hai (dev laptop ~1s, chhota CI / Render instance
+~2s); framework floor ko hum kam nahi kar sakte, app ka overhead (models,
+schemas, routers, create_app) hi is check ka vishay hai.
+
+Default 1.25s overhead. Aaj 0.85-1.1s (chhoti shared machine par) ka hisaab:
+models + schemas + routers ki declarations ~0.55s, create_app() ~0.2s
+(include_router har APIRoute dobara banata hai), models ke kheenche hue
+SQLAlchemy ORM / dialect modules ~0.3s - inhe app ka structure badle bina
+taala nahi ja sakta. ~20% headroom: module level par ek naya SDK import
+(Supabase ~0.5s, google-auth ~0.17s) check ko fail kar deta hai, jo isi
+liye hai. `--budget` se absolute limit bhi lag sakti hai.
+
+Usage (library_backend folder se):
+
+    python scripts/check_import_time.py --overhead-budget 1.25 --runs 5
+
+Exit code 1 agar budget cross ho ya koi side effect mile (CI gate ke liye).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+PROBE = r"""
+import json, sys, time
+started = time.perf_counter()
+import main
+elapsed = time.perf_counter() - started
+
+import database
+from utils import supabase_helper, cloudinary_helper
+print(json.dumps({
+    "seconds": elapsed,
+    "engine_created": database._engine is not None,
+    "supabase_loaded": "supabase" in sys.modules,
+    "cloudinary_loaded": "cloudinary" in sys.modules,
+    "supabase_client_created": supabase_helper.get_supabase.cache_info().currsize > 0,
+    "cloudinary_configured": cloudinary_helper.get_uploader.cache_info().currsize > 0,
+    "google_auth_loaded": "google.auth.transport.requests" in sys.modules,
+}))
+"""
+
+# Framework floor: main in ke bina import nahi ho sakta
+FLOOR_PROBE = r"""
+import json, time
+started = time.perf_counter()
+import fastapi, fastapi.security, sqlalchemy.orm, pydantic, email_validator, starlette.staticfiles
+print(json.dumps({"seconds": time.perf_counter() - started}))
+"""
+
+
+def _parse_importtime(stderr: str, top: int):
+    """`-X importtime` output se sabse mehnge (cumulative) modules."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        rows.append((int(parts[1]), parts[2].strip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def run_probe(env: dict, probe: str = PROBE) -> tuple:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"❌ `import main` failed:\n{proc.stderr[-4000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    return result, proc.stderr
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import-time budget for main.py")
+    parser.add_argument("--overhead-budget", type=float, default=1.25,
+                        help="Max seconds `import main` may add on top of the framework floor (best of runs)")
+    parser.add_argument("--budget", type=float, default=None, help="Optional absolute max seconds for `import main`")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to print")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        static_dir = Path(tmp) / "static"
+        env = dict(os.environ)
+        env.update({
+            "DATABASE_URL": env.get("DATABASE_URL", f"sqlite:///{Path(tmp) / 'import_check.db'}"),
+            "STATIC_DIR": str(static_dir),
+        })
+
+        results, floors, last_stderr = [], [], ""
+        for _ in range(args.runs):
+            floors.append(run_probe(env, FLOOR_PROBE)[0]["seconds"])
+            result, last_stderr = run_probe(env)
+            results.append(result)
+        static_created = static_dir.exists()
+
+    best = min(r["seconds"] for r in results)
+    floor = min(floors)
+    overhead = best - floor
+    print(f"⏱️  import main: best {best:.3f}s over {args.runs} runs; framework floor {floor:.3f}s; "
+          f"app overhead {overhead:.3f}s (budget {args.overhead_budget:.2f}s)")
+    print("   Slowest imports (cumulative):")
+    for cumulative_us, name in _parse_importtime(last_stderr, args.top):
+        print(f"   {cumulative_us / 1000:8.1f} ms  {name}")
+
+    failures = []
+    if overhead > args.overhead_budget:
+        failures.append(f"app import overhead {overhead:.3f}s > budget {args.overhead_budget:.2f}s")
+    if args.budget is not None and best > args.budget:
+        failures.append(f"import took {best:.3f}s > budget {args.budget:.2f}s")
+    side_effects = {k: v for k, v in results[-1].items() if k != "seconds" and v}
+    if static_created:
+        side_effects["static_dir_created"] = True
+    for name in side_effects:
+        failures.append(f"side effect at import time: {name}")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("✅ Import is within budget and side-effect free.")
+
+
+if __name__ == "__main__":
+    main()
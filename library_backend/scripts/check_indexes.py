@@ -0,0 +1,120 @@
+# library_backend/scripts/check_indexes.py
+"""
+Index coverage check (CI gate).
+
+`Base.metadata` ki har table dekhta hai aur fail karta hai agar:
+- kisi foreign key column ke liye aisa index / PK / unique constraint nahi
+  jo usi column se shuru hota ho (Postgres FK par khud index nahi banata:
+  joins aur parent delete / ON DELETE checks full scan ban jate hain), ya
+- `FILTER_INDEXES` mein declared hot filter ke columns kisi index ka
+  leading prefix (usi order mein) nahi hain.
+
+Naya hot filter / sort likhein to yahan declare karein, taake coverage
+regress na ho.
+
+Usage (library_backend folder se):
+
+    python scripts/check_indexes.py            # models (Base.metadata)
+    python scripts/check_indexes.py --live     # DATABASE_URL wala asli schema (migrations chali ya nahi)
+
+Exit code 1 agar koi gap mile.
+"""
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# (table, leading index columns) - equality filters pehle, phir sort column
+FILTER_INDEXES: List[Tuple[str, Tuple[str, ...]]] = [
+    ("book_copies", ("BookID", "Status")),
+    ("issued_books", ("ClientID", "Status")),
+    ("digital_access", ("ClientID",)),
+    ("digital_access", ("BookID", "AccessTimestamp")),
+    ("book_permissions", ("book_id", "user_id")),
+    ("logs", ("timestamp",)),
+    ("logs", ("action_by_id", "timestamp")),
+    ("logs", ("action_type", "timestamp")),
+    ("upload_requests", ("status", "submitted_at")),
+    ("book_requests", ("status", "created_at")),
+    ("access_requests_user", ("status", "created_at")),
+    ("markaz_posts", ("created_at",)),
+    ("book_subcategory_link", ("subcategory_id", "book_id")),
+    ("books", ("change_seq", "id")),
+    ("book_holds", ("book_id", "status", "created_at")),
+    ("book_holds", ("status", "expires_at")),
+]
+
+
+def _column_lists(table) -> Iterable[Sequence[str]]:
+    """Table ke saare indexed column lists: indexes + PK + unique constraints."""
+    for index in table.indexes:
+        yield [c.name for c in index.columns]
+    if table.primary_key is not None:
+        yield [c.name for c in table.primary_key.columns]
+    for constraint in table.constraints:
+        if constraint.__class__.__name__ == "UniqueConstraint":
+            yield [c.name for c in constraint.columns]
+    for column in table.columns:
+        if column.unique:
+            yield [column.name]
+
+
+def _covered(table, columns: Sequence[str]) -> bool:
+    size = len(columns)
+    return any(list(cols[:size]) == list(columns) for cols in _column_lists(table))
+
+
+def find_gaps(metadata) -> List[str]:
+    gaps = []
+    for table in metadata.sorted_tables:
+        for fk in table.foreign_key_constraints:
+            columns = [c.name for c in fk.columns]
+            if not _covered(table, columns):
+                gaps.append(f"{table.name}({', '.join(columns)}): foreign key -> {fk.referred_table.name} has no index")
+
+    tables = metadata.tables
+    for table_name, columns in FILTER_INDEXES:
+        table = tables.get(table_name)
+        if table is None:
+            gaps.append(f"{table_name}: declared in FILTER_INDEXES but table not found")
+        elif not _covered(table, columns):
+            gaps.append(f"{table_name}({', '.join(columns)}): declared filter has no matching index")
+    return gaps
+
+
+def load_metadata(live: bool):
+    sys.path.insert(0, str(BACKEND_DIR))
+    import main  # noqa: F401 - saare models register ho jate hain (import side-effect free hai)
+    from database import Base, get_engine
+
+    if not live:
+        return Base.metadata
+
+    from sqlalchemy import MetaData
+
+    reflected = MetaData()
+    reflected.reflect(bind=get_engine(), only=lambda name, _: name in Base.metadata.tables)
+    return reflected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Foreign key / hot filter index coverage check")
+    parser.add_argument("--live", action="store_true", help="models ki jagah DATABASE_URL ka reflected schema check karein")
+    args = parser.parse_args()
+
+    metadata = load_metadata(args.live)
+    gaps = find_gaps(metadata)
+    source = "database" if args.live else "models"
+
+    if gaps:
+        print(f"❌ {len(gaps)} index gap(s) in {source}:")
+        for gap in gaps:
+            print(f"   - {gap}")
+        sys.exit(1)
+    print(f"✅ Index coverage OK ({len(metadata.tables)} tables, {source})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+# library_backend/scripts/check_pdf_streaming.py
+"""
+PDF streaming proxy check (/api/books/{id}/pdf) - local SQLite + temp folders.
+
+1. Public book (local backend): full 200, HEAD, Range 206, suffix range, 416
+2. Restricted book: guest 403, bina access user 403, admin 206; book list
+   delta feed (/changes) aur /browse mein bina access raw pdf_url nahi
+3. Signed /pdf-link: valid link chalta hai, tampered link 403
+4. HTTP backend (Range support ke bina local http.server): sahi bytes,
+   background cache fill, phir server band hone par bhi disk cache se serve
+5. LRU eviction size cap ke andar rakhta hai
+6. Time-to-first-range vs poori file (first page latency ka andaza)
+
+Usage (library_backend folder se):
+
+    python scripts/check_pdf_streaming.py
+"""
+import functools
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+PASSWORD = "pdf-check"
+PDF_SIZE = 8 * 1024 * 1024
+FIRST_RANGE = 64 * 1024
+
+
+def _fake_pdf(size: int) -> bytes:
+    body = bytes((i * 31 + 7) % 251 for i in range(4096))
+    data = b"%PDF-1.7\n" + body * (size // len(body) + 1)
+    return data[:size - 6] + b"%%EOF\n"
+
+
+def _seed(url: str, password_hash: str, http_pdf_url: str):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from database import Base
+    from models.user_model import User, Role
+    from models.book_model import Book
+    from models.language_model import Language
+
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        admin_role, user_role = Role(name="Admin", description="pdf check"), Role(name="User", description="pdf check")
+        language = Language(name="English", code="en")
+        db.add_all([admin_role, user_role, language])
+        db.flush()
+        db.add_all([
+            User(username="pdf_admin", email="pdf_admin@example.com", full_name="PDF Admin",
+                 password_hash=password_hash, role_id=admin_role.id, status="Active"),
+            User(username="pdf_reader", email="pdf_reader@example.com", full_name="PDF Reader",
+                 password_hash=password_hash, role_id=user_role.id, status="Active"),
+            Book(id=1, title="Public", language_id=language.id, pdf_url="uploads/public.pdf", is_approved=True, is_restricted=False),
+            Book(id=2, title="Restricted", language_id=language.id, pdf_url="static/uploads/public.pdf", is_approved=True, is_restricted=True),
+            Book(id=3, title="Remote", language_id=language.id, pdf_url=http_pdf_url, is_approved=True, is_restricted=False),
+        ])
+        db.commit()
+    engine.dispose()
+
+
+def _restricted_pdf_url(rows):
+    """Restricted book (id 2) ka pdf_url jaisa response mein aaya (None = blank)."""
+    book = next(row for row in rows if row["id"] == 2)
+    return book["pdf_url"] or book["pdf_file"]
+
+
+def _serve(directory: Path):
+    handler = functools.partial(SimpleHTTPRequestHandler, directory=str(directory))
+    handler.log_message = lambda *args: None
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    results = []
+
+    def check(label, ok, extra=""):
+        results.append(bool(ok))
+        print(f"{'✅' if ok else '❌'} {label}{f' ({extra})' if extra else ''}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        static_dir, cache_dir, remote_dir = tmp / "static", tmp / "pdf_cache", tmp / "remote"
+        (static_dir / "uploads").mkdir(parents=True)
+        remote_dir.mkdir()
+        pdf = _fake_pdf(PDF_SIZE)
+        (static_dir / "uploads" / "public.pdf").write_bytes(pdf)
+        (remote_dir / "remote.pdf").write_bytes(pdf)
+        server = _serve(remote_dir)
+        remote_url = f"http://127.0.0.1:{server.server_port}/remote.pdf"
+
+        db_url = f"sqlite:///{tmp / 'pdf.db'}"
+        os.environ.update({
+            "DATABASE_URL": db_url, "STATIC_DIR": str(static_dir), "PDF_CACHE_DIR": str(cache_dir),
+            "AUTO_CREATE_SCHEMA": "true", "PDF_LINK_TTL_SECONDS": "60",
+        })
+
+        import models  # noqa: F401
+        from models import log_model, post_model, book_permission_model, request_user_model  # noqa: F401
+        from auth import get_password_hash
+        from config import get_settings
+        from fastapi.testclient import TestClient
+        import database
+        from main import create_app
+        from utils.pdf_storage import PdfDiskCache, get_pdf_cache
+
+        _seed(db_url, get_password_hash(PASSWORD), remote_url)
+        app = create_app(get_settings())
+
+        with TestClient(app) as client:
+            def login(username):
+                r = client.post("/api/token", data={"username": username, "password": PASSWORD})
+                r.raise_for_status()
+                client.cookies.clear()
+                return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+            # 1. Local backend + ranges
+            full = client.get("/api/books/1/pdf")
+            check("full download", full.status_code == 200 and full.content == pdf, f"HTTP {full.status_code}")
+            check("Accept-Ranges advertised", full.headers.get("accept-ranges") == "bytes")
+            head = client.head("/api/books/1/pdf")
+            check("HEAD: size without body", head.status_code == 200 and head.content == b""
+                  and head.headers.get("content-length") == str(PDF_SIZE), f"HTTP {head.status_code}")
+            part = client.get("/api/books/1/pdf", headers={"Range": "bytes=100-199"})
+            check("range 206", part.status_code == 206 and part.content == pdf[100:200]
+                  and part.headers.get("content-range") == f"bytes 100-199/{PDF_SIZE}", part.headers.get("content-range"))
+            suffix = client.get("/api/books/1/pdf", headers={"Range": "bytes=-6"})
+            check("suffix range", suffix.status_code == 206 and suffix.content == b"%%EOF\n")
+            bad = client.get("/api/books/1/pdf", headers={"Range": f"bytes={PDF_SIZE}-"})
+            check("unsatisfiable 416", bad.status_code == 416 and bad.headers.get("content-range") == f"bytes */{PDF_SIZE}")
+
+            # 2. Restricted rules
+            check("restricted: guest 403", client.get("/api/books/2/pdf").status_code == 403)
+            check("restricted: guest list hides pdf_url", _restricted_pdf_url(client.get("/api/books/").json()) is None)
+            check("restricted: guest changes feed hides pdf_url",
+                  _restricted_pdf_url(client.get("/api/books/changes").json()["changed"]) is None)
+            check("restricted: guest browse hides pdf_url",
+                  _restricted_pdf_url(client.get("/api/books/browse").json()) is None)
+            reader = login("pdf_reader")
+            check("restricted: no-access user 403", client.get("/api/books/2/pdf", headers=reader).status_code == 403)
+            check("restricted: no-access user list hides pdf_url",
+                  _restricted_pdf_url(client.get("/api/books/", headers=reader).json()) is None)
+            check("restricted: no-access user changes feed hides pdf_url",
+                  _restricted_pdf_url(client.get("/api/books/changes", headers=reader).json()["changed"]) is None)
+            check("restricted: no-access user browse hides pdf_url",
+                  _restricted_pdf_url(client.get("/api/books/browse", headers=reader).json()) is None)
+            check("restricted: no-access user cannot get link",
+                  client.get("/api/books/2/pdf-link", headers=reader).status_code == 403)
+            admin = login("pdf_admin")
+            r = client.get("/api/books/2/pdf", headers={**admin, "Range": "bytes=0-9"})
+            check("restricted: admin 206", r.status_code == 206 and r.content == pdf[:10])
+            check("restricted: admin list keeps pdf_url",
+                  _restricted_pdf_url(client.get("/api/books/", headers=admin).json()) is not None)
+            check("restricted: admin changes feed keeps pdf_url",
+                  _restricted_pdf_url(client.get("/api/books/changes", headers=admin).json()["changed"]) is not None)
+            check("restricted: admin browse keeps pdf_url",
+                  _restricted_pdf_url(client.get("/api/books/browse", headers=admin).json()) is not None)
+
+            # 3. Signed link (iframe, no header)
+            link = client.get("/api/books/2/pdf-link", headers=admin).json()["url"]
+            r = client.get(link, headers={"Range": "bytes=0-9"})
+            check("signed link works without header", r.status_code == 206 and r.content == pdf[:10])
+            tampered = link.replace("u=", "u=9")
+            check("tampered link 403", client.get(tampered).status_code == 403)
+
+            # 4. HTTP backend + disk cache
+            r = client.get("/api/books/3/pdf", headers={"Range": "bytes=5000-5099"})
+            check("remote range (upstream ignores Range)", r.status_code == 206 and r.content == pdf[5000:5100])
+            cache = get_pdf_cache()
+            deadline = time.time() + 10
+            while cache.get(remote_url) is None and time.time() < deadline:
+                time.sleep(0.05)
+            check("background cache fill", cache.get(remote_url) is not None)
+            server.shutdown()
+            server.server_close()
+            r = client.get("/api/books/3/pdf", headers={"Range": f"bytes={PDF_SIZE - 100}-"})
+            check("served from disk cache with upstream down", r.status_code == 206 and r.content == pdf[-100:])
+
+            # 6. First range vs full file
+            started = time.perf_counter()
+            client.get("/api/books/1/pdf", headers={"Range": f"bytes=0-{FIRST_RANGE - 1}"})
+            first = time.perf_counter() - started
+            started = time.perf_counter()
+            client.get("/api/books/1/pdf")
+            whole = time.perf_counter() - started
+            print(f"   first {FIRST_RANGE // 1024} KiB: {first * 1000:.1f} ms, full {PDF_SIZE // (1024 * 1024)} MiB: {whole * 1000:.1f} ms")
+
+        # 5. LRU eviction
+        lru = PdfDiskCache(tmp / "lru", max_bytes=2500)
+        lru.root.mkdir()
+        for i, key in enumerate(["a", "b", "c"]):
+            path = lru.path_for(key)
+            path.write_bytes(b"x" * 1000)
+            os.utime(path, (time.time() - 1000 + i * 100,) * 2)
+        os.utime(lru.path_for("a"))  # "a" abhi use hui => sabse nayi
+        lru.evict()
+        kept = sorted(k for k in "abc" if lru.path_for(k).exists())
+        check("LRU evicts least recently used", kept == ["a", "c"], f"kept {kept}")
+
+        database.get_engine().dispose()
+
+    if not all(results):
+        sys.exit(1)
+    print("✅ PDF streaming proxy behaves as expected.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# library_backend/scripts/check_replica_routing.py
+"""
+Replica routing check with two local SQLite databases.
+
+Primary aur "replica" mein jaan-boojh kar alag language rows hoti hain, taake
+response se pata chale ke read kis DB se aayi:
+
+1. Guest GET /api/languages/          -> replica
+2. Login (POST = write) ke baad GET   -> primary (db_pin cookie)
+3. Bearer-token write, cookie ke bina -> primary (token-hash window),
+   aur naya row foran nazar aata hai (read-your-writes) - doosre worker
+   (alag app instance, same cache_state_dir) par bhi
+4. Sticky window khatam hone par      -> replica
+5. Replica down                       -> pehli read hi primary par (koi 5xx nahi)
+6. Guest GET /api/reference-data/     -> cached snapshot primary se bana (replica
+   lag wala data max_age tak cache nahi hota)
+
+Usage (library_backend folder se):
+
+    python scripts/check_replica_routing.py
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+STICKY_SECONDS = 1.0
+PASSWORD = "replica-check"
+
+
+def _seed(url: str, marker: str, password_hash: str):
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+    from database import Base
+    from models.user_model import User, Role
+    from models.language_model import Language
+
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        role = Role(name="Admin", description="replica check")
+        db.add(role)
+        db.flush()
+        db.add(User(username="replica_admin", email="replica_admin@example.com", full_name="Replica Admin",
+                    password_hash=password_hash, role_id=role.id, status="Active"))
+        db.add(Language(name=marker, code=marker[:2].lower()))
+        db.commit()
+    engine.dispose()
+
+
+def _served_by(response) -> str:
+    response.raise_for_status()
+    return _served_by_names(response.json())
+
+
+def _served_by_names(rows) -> str:
+    names = {row["name"] for row in rows}
+    return "primary" if "Primary-Only" in names else "replica" if "Replica-Only" in names else f"unknown {names}"
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        primary_url = f"sqlite:///{Path(tmp) / 'primary.db'}"
+        replica_url = f"sqlite:///{Path(tmp) / 'replica.db'}"
+        os.environ.setdefault("DATABASE_URL", primary_url)
+
+        import models  # noqa: F401
+        from models import log_model, post_model, book_permission_model, request_user_model  # noqa: F401
+        from auth import get_password_hash
+        from config import Settings
+        from fastapi.testclient import TestClient
+        import database
+        from main import create_app
+
+        password_hash = get_password_hash(PASSWORD)
+        _seed(primary_url, "Primary-Only", password_hash)
+        _seed(replica_url, "Replica-Only", password_hash)
+
+        settings = Settings(
+            database_url=primary_url,
+            database_replica_urls=(replica_url,),
+            replica_sticky_seconds=STICKY_SECONDS,
+            replica_retry_seconds=60,
+            auto_create_schema=True,
+            static_dir=Path(tmp) / "static",
+            cache_state_dir=Path(tmp) / "cache_state",
+            catalog_snapshot_enabled=False,  # background builder bundle pehle hi primary se bana deta
+        )
+        app = create_app(settings)
+        results = []
+
+        def check(label, got, expected):
+            results.append(got == expected)
+            print(f"{'✅' if got == expected else '❌'} {label}: served by {got} (expected {expected})")
+
+        with TestClient(app) as client:
+            check("guest read", _served_by(client.get("/api/languages/")), "replica")
+            bundle = client.get("/api/reference-data/")
+            check("reference snapshot", _served_by_names(bundle.json()["languages"]), "primary")
+
+            login = client.post("/api/token", data={"username": "replica_admin", "password": PASSWORD})
+            login.raise_for_status()
+            token = login.json()["access_token"]
+            check("read after write (cookie)", _served_by(client.get("/api/languages/")), "primary")
+
+            headers = {"Authorization": f"Bearer {token}"}
+            client.post("/api/languages/", json={"name": "Just-Written"}, headers=headers).raise_for_status()
+            client.cookies.clear()
+            fresh = client.get("/api/languages/", headers=headers)
+            check("read after write (token)", _served_by(fresh), "primary")
+            check("own write visible", "Just-Written" in {row["name"] for row in fresh.json()}, True)
+            with TestClient(create_app(settings)) as other_worker:
+                check("read after write (token, other worker)",
+                      _served_by(other_worker.get("/api/languages/", headers=headers)), "primary")
+
+            time.sleep(STICKY_SECONDS + 0.5)
+            check("after sticky window", _served_by(client.get("/api/languages/", headers=headers)), "replica")
+
+        # Replica "down": aisi file jis ka folder hi maujood nahi
+        database.init_replicas([f"sqlite:///{Path(tmp) / 'missing' / 'replica.db'}"], retry_seconds=60)
+        with TestClient(app, raise_server_exceptions=False) as client:
+            first = client.get("/api/languages/")
+            check("replica down, first read", first.status_code, 200)
+            check("replica down, first read", _served_by(first), "primary")
+            check("replica marked down", database.replica_status()[0]["healthy"], False)
+            check("failover after replica failure", _served_by(client.get("/api/languages/")), "primary")
+
+        database.init_replicas([])
+        database.get_engine().dispose()
+
+    if not all(results):
+        sys.exit(1)
+    print("✅ Replica routing behaves as expected.")
+
+
+if __name__ == "__main__":
+    main()
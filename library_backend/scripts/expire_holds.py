@@ -0,0 +1,33 @@
+# library_backend/scripts/expire_holds.py
+"""
+Book holds ka expiry sweep (utils/holds) manually chalayein.
+
+API server ka background sweeper ye kaam khud karta hai; ye script cron /
+HOLD_SWEEP_ENABLED=false deployments ke liye hai. Pickup deadline guzar chuki
+Ready holds Expire hoti hain aur copy queue ke agle member ko milti hai.
+
+Usage (library_backend folder se):
+
+    python scripts/expire_holds.py
+"""
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import models  # noqa: F401
+from database import SessionLocal
+from utils import holds
+
+
+def main():
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        result = holds.sweep(db)
+    print(f"✅ Expired {result['expired']} holds, allocated {result['allocated']} copies "
+          f"in {time.perf_counter() - started:.1f}s.")
+
+
+if __name__ == "__main__":
+    main()
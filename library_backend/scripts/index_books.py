@@ -0,0 +1,90 @@
+# library_backend/scripts/index_books.py
+"""
+In-book search index: backfill / status (utils/content_index).
+
+API server khud background mein queue process karta hai; ye script purani
+books ko queue karne ya server ke bina (cron / one-off) queue drain karne ke liye hai.
+Beech mein rok dein to dobara chalane par wahin se resume hota hai.
+
+Usage (library_backend folder se):
+
+    python scripts/index_books.py --enqueue-all          # sab digital books queue
+    python scripts/index_books.py --book-id 42 --force   # ek book dobara
+    python scripts/index_books.py --run                  # queue khali hone tak index
+    python scripts/index_books.py --status
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import func, or_
+
+import models  # noqa: F401
+from database import SessionLocal
+from models.book_model import Book
+from models.book_content_model import BookIndexJob
+from utils.content_index import enqueue_book, get_content_indexer
+
+
+def enqueue(book_ids=None, force=False) -> int:
+    db = SessionLocal()
+    try:
+        query = db.query(Book).filter(
+            Book.deleted_at.is_(None),
+            or_(Book.pdf_url.isnot(None), Book.txt_file_url.isnot(None))
+        )
+        if book_ids:
+            query = query.filter(Book.id.in_(book_ids))
+        count = 0
+        for book in query.yield_per(500):
+            if enqueue_book(db, book, force=force):
+                count += 1
+        db.commit()
+        return count
+    finally:
+        db.close()
+
+
+def print_status():
+    db = SessionLocal()
+    try:
+        rows = db.query(BookIndexJob.status, func.count(), func.sum(BookIndexJob.pages_done)) \
+            .group_by(BookIndexJob.status).all()
+        for job_status, jobs, pages in rows:
+            print(f"   {job_status:<8} {jobs:>6} books  {pages or 0:>9} pages")
+        for job in db.query(BookIndexJob).filter(BookIndexJob.status == "failed").limit(20):
+            print(f"   ❌ book {job.book_id}: {job.error}")
+    finally:
+        db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Book content index backfill")
+    parser.add_argument("--enqueue-all", action="store_true", help="Queue every book with a PDF/txt file")
+    parser.add_argument("--book-id", type=int, action="append", help="Queue specific book(s)")
+    parser.add_argument("--force", action="store_true", help="Re-index even if already indexed")
+    parser.add_argument("--run", action="store_true", help="Process the queue until it is empty")
+    parser.add_argument("--status", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.enqueue_all or args.book_id:
+        print(f"📥 Queued {enqueue(args.book_id, force=args.force)} books.")
+
+    if args.run:
+        indexer = get_content_indexer()
+        started = time.perf_counter()
+        try:
+            processed = indexer.run_until_idle()
+        finally:
+            indexer.stop()
+        print(f"✅ Indexed {processed} books in {time.perf_counter() - started:.1f}s.")
+
+    if args.status or not (args.enqueue_all or args.book_id or args.run):
+        print_status()
+
+
+if __name__ == "__main__":
+    main()
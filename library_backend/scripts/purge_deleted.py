@@ -0,0 +1,48 @@
+# library_backend/scripts/purge_deleted.py
+"""
+Soft-deleted rows ka hard delete (retention ke baad).
+
+`deleted_at` N din se purana ho to row batches mein delete hoti hai (har batch
+alag transaction). Jo rows abhi bhi kisi aur table se referenced hain (e.g.
+book ki copies / issue records) unhe skip kiya jata hai - report mein
+"found" vs "deleted" ka farq yahi hai.
+
+Usage (library_backend folder se, cron / scheduler se):
+
+    python scripts/purge_deleted.py                  # SOFT_DELETE_RETENTION_DAYS (default 30)
+    python scripts/purge_deleted.py --days 90 --batch-size 1000
+    python scripts/purge_deleted.py --dry-run
+"""
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import main as _app  # noqa: F401 - saare models (BookCopy, logs, ...) register; import side-effect free hai
+from config import get_settings
+from database import SessionLocal
+from utils.soft_delete import PURGE_BATCH_SIZE, purge_deleted
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hard delete rows soft-deleted more than N days ago")
+    parser.add_argument("--days", type=int, default=get_settings().soft_delete_retention_days)
+    parser.add_argument("--batch-size", type=int, default=PURGE_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="sirf count, delete nahi")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        report = purge_deleted(db, args.days, batch_size=args.batch_size, dry_run=args.dry_run)
+    finally:
+        db.close()
+
+    mode = "dry run" if args.dry_run else "purged"
+    print(f"🧹 Soft-deleted rows older than {args.days} days ({mode}):")
+    for table, counts in report.items():
+        print(f"   {table:<16} found={counts['found']:<6} deleted={counts['deleted']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# library_backend/scripts/rollup_analytics.py
+"""
+Reading analytics rollups (utils/reading_analytics) manually chalayein.
+
+API server ka background aggregator ye kaam khud karta hai; ye script bade
+backfill (purane digital_access events) ya rollup logic badalne ke baad
+`--rebuild` ke liye hai.
+
+Usage (library_backend folder se):
+
+    python scripts/rollup_analytics.py            # backlog catch-up
+    python scripts/rollup_analytics.py --rebuild  # rollups shuru se dobara
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import models  # noqa: F401
+from database import SessionLocal
+from utils import reading_analytics
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Digital access rollups")
+    parser.add_argument("--rebuild", action="store_true", help="Truncate rollups and re-aggregate all events")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        if args.rebuild:
+            processed = reading_analytics.rebuild(db)
+        else:
+            processed = reading_analytics.catch_up(db)
+        as_of = reading_analytics.as_of(db)
+    print(f"✅ Rolled up {processed} events in {time.perf_counter() - started:.1f}s (as of {as_of}).")
+
+
+if __name__ == "__main__":
+    main()
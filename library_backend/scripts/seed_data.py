@@ -57,5 +57,53 @@ def seed_everything():
     finally:
         db.close()
 
+def seed_synthetic(argv=None):
+    """
+    Bara, deterministic synthetic dataset (scripts/synthetic_data.py).
+    Example: python scripts/seed_data.py --synthetic --profile small --reset
+    """
+    import argparse
+    from auth import get_password_hash
+    from database import Base
+    from scripts import synthetic_data
+
+    parser = argparse.ArgumentParser(description="Synthetic dataset generator")
+    parser.add_argument("--synthetic", action="store_true")
+    parser.add_argument("--profile", choices=list(synthetic_data.PROFILES), default="small",
+                        help="production = 1M books / 200k users / 50M logs; baaki 1/10, 1/100, 1/1000")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=synthetic_data.DEFAULT_BATCH_SIZE)
+    parser.add_argument("--password", default="password", help="Sab synthetic users ka password")
+    parser.add_argument("--admin-username", default="admin")
+    parser.add_argument("--reset", action="store_true", help="Pehle saari tables drop + create karein")
+    parser.add_argument("--only", default=None, help="Comma separated table names")
+    for name in synthetic_data.PRODUCTION_COUNTS:
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, default=None, dest=name,
+                            help=f"Override row count for {name}")
+    args = parser.parse_args(argv)
+
+    counts = synthetic_data.counts_for(args.profile, {n: getattr(args, n) for n in synthetic_data.PRODUCTION_COUNTS})
+    print(f"🌱 Synthetic seed ({args.profile}, seed={args.seed}): {counts}")
+
+    if args.reset:
+        import models  # noqa: F401
+        from models import log_model, request_user_model, library_management_models  # noqa: F401
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+
+    written = synthetic_data.generate(
+        engine, counts,
+        password_hash=get_password_hash(args.password),
+        seed=args.seed,
+        batch_size=args.batch_size,
+        admin_username=args.admin_username,
+        only=args.only.split(",") if args.only else None,
+    )
+    print(f"✅ Synthetic data ready: {sum(written.values()):,} rows")
+
+
 if __name__ == "__main__":
-    seed_everything()
\ No newline at end of file
+    if "--synthetic" in sys.argv:
+        seed_synthetic()
+    else:
+        seed_everything()
@@ -0,0 +1,75 @@
+# library_backend/scripts/stamp_existing_schema.py
+"""
+Purane create_all wale DB ko Alembic ke hawale karna (deploy par `alembic
+upgrade head` se PEHLE chalta hai - render.yaml / render-build.sh).
+
+Pehle app har startup par `Base.metadata.create_all` chalati thi. Aisa DB jis
+mein `alembic_version` row nahi hai, `upgrade head` par initial_setup se
+shuru hota - tables pehle se hain, is liye ye script use LEGACY_REVISION par
+stamp karti hai. Us ke baad ki migrations (5a7c9e1b3d20 se) idempotent /
+additive hain aur baaki schema bana deti hain. Koi data nahi chhuaa jata.
+
+- `alembic_version` mein revision hai      -> kuch nahi (already tracked)
+- App tables hi nahi (fresh DB)            -> kuch nahi (upgrade sab banayega)
+- Tables hain, revision nahi (create_all)  -> stamp LEGACY_REVISION
+
+Usage (library_backend folder se):
+
+    python scripts/stamp_existing_schema.py            # detect + stamp
+    python scripts/stamp_existing_schema.py --dry-run  # sirf batao
+"""
+import argparse
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+# Purana render.yaml har deploy par `alembic stamp head` karta tha; tab head ye tha
+LEGACY_REVISION = "02df56eb99b9"
+# Ye tables create_all wale har DB mein hoti hain
+LEGACY_MARKER_TABLES = ("books", "users", "categories")
+
+
+def detect(engine) -> str:
+    """'tracked' | 'fresh' | 'legacy'"""
+    from alembic.runtime.migration import MigrationContext
+    from sqlalchemy import inspect
+
+    with engine.connect() as connection:
+        if MigrationContext.configure(connection).get_current_heads():
+            return "tracked"
+        tables = set(inspect(connection).get_table_names())
+    if not tables.intersection(LEGACY_MARKER_TABLES):
+        return "fresh"
+    return "legacy"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stamp a create_all-built database before alembic upgrade")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    from alembic import command
+    from alembic.config import Config
+    import database
+
+    state = detect(database.get_engine())
+    if state == "tracked":
+        print("✅ Database already tracked by Alembic - nothing to stamp.")
+        return
+    if state == "fresh":
+        print("✅ Empty database - `alembic upgrade head` will create the schema.")
+        return
+
+    print(f"⚠️ Tables exist but no alembic_version row (create_all database) -> stamp {LEGACY_REVISION}")
+    if args.dry_run:
+        return
+    config = Config(str(database.ALEMBIC_INI))
+    config.set_main_option("script_location", str(database.ALEMBIC_INI.parent / "alembic"))
+    command.stamp(config, LEGACY_REVISION)
+    print(f"✅ Stamped {LEGACY_REVISION}. Now run `alembic upgrade head`.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,536 @@
+# library_backend/scripts/synthetic_data.py
+"""
+Scalable, deterministic synthetic data generator.
+
+Production jaisa bara dataset (1M books, 200k users, 2M copies, 10M issues,
+50M logs...) laptop par generate karta hai taake har performance feature ko
+asal scale par test kiya ja sake.
+
+- Postgres: psycopg2 COPY ... FROM STDIN (sabse tez raasta)
+- Baaki DBs (SQLite etc.): Core insert() executemany batches
+- Same --seed + same counts => bilkul same data (har table ka apna seeded RNG)
+
+Usage (library_backend folder se):
+
+    python scripts/seed_data.py --synthetic --profile small
+    python scripts/seed_data.py --synthetic --profile production --reset
+    python scripts/seed_data.py --synthetic --profile tiny --books 50000 --logs 0
+"""
+import csv
+import io
+import random
+import time
+from array import array
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import text
+
+# ==============================================================================
+# 1. SCALE PROFILES
+# ==============================================================================
+
+PRODUCTION_COUNTS = {
+    "users": 200_000,
+    "books": 1_000_000,
+    "copies": 2_000_000,
+    "issues": 10_000_000,
+    "logs": 50_000_000,
+    "access_requests": 500_000,
+    "digital_access": 5_000_000,
+}
+
+PROFILES = {
+    "production": 1.0,
+    "large": 0.1,
+    "small": 0.01,
+    "tiny": 0.001,
+}
+
+DEFAULT_BATCH_SIZE = 10_000
+
+
+def counts_for(profile: str = "small", overrides: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Profile ke hisaab se row counts (minimum 1 har table ke liye) + manual overrides."""
+    factor = PROFILES[profile]
+    counts = {name: max(1, int(n * factor)) for name, n in PRODUCTION_COUNTS.items()}
+    for name, value in (overrides or {}).items():
+        if value is not None:
+            counts[name] = value
+    return counts
+
+
+# ==============================================================================
+# 2. REFERENCE VOCABULARY (multilingual)
+# ==============================================================================
+
+# (name, code, weight) - library ka asal mix Urdu/Arabic heavy hai
+LANGUAGES = [
+    ("Urdu", "ur", 40), ("English", "en", 25), ("Arabic", "ar", 20),
+    ("Hindi", "hi", 8), ("Persian", "fa", 7),
+]
+
+TITLE_WORDS = {
+    "ur": ["تاریخ", "اسلام", "سیرت", "تفسیر", "مجموعہ", "رسائل", "فقہ", "حدیث", "ادب", "شاعری", "مقالات", "خطبات"],
+    "en": ["History", "Principles", "Introduction", "Guide", "Commentary", "Collection", "Studies",
+           "Letters", "Essays", "Foundations", "Lectures", "Notes", "Treasury", "Garden", "Light", "Path"],
+    "ar": ["تاريخ", "شرح", "كتاب", "رسالة", "مختصر", "تفسير", "الفقه", "الحديث", "السيرة", "الأدب", "ديوان", "مجموع"],
+    "hi": ["इतिहास", "परिचय", "संग्रह", "कहानियाँ", "कविता", "निबंध", "विज्ञान", "दर्शन", "जीवनी", "साहित्य"],
+    "fa": ["تاریخ", "دیوان", "گلستان", "بوستان", "رساله", "شرح", "مثنوی", "مقالات", "سفرنامه", "تذکره"],
+}
+
+FIRST_NAMES = ["Muhammad", "Ahmed", "Ali", "Fatima", "Aisha", "Zainab", "Omar", "Hassan", "Maryam",
+               "Bilal", "Khadija", "Yusuf", "Sara", "Ibrahim", "Hamza", "Ayesha", "Abdullah", "Noor"]
+LAST_NAMES = ["Khan", "Siddiqui", "Qureshi", "Ansari", "Sheikh", "Malik", "Hashmi", "Rizvi",
+              "Farooqui", "Butt", "Chaudhry", "Mirza", "Naqvi", "Usmani", "Salafi", "Nadvi"]
+
+CATEGORIES = {
+    "Islamic Studies": ["Quran", "Hadith", "Fiqh", "Seerat-un-Nabi", "Aqeedah", "History of Islam"],
+    "Literature": ["Fiction", "Poetry", "Essays", "Drama", "Classical Literature"],
+    "Science & Tech": ["Computer Science", "Physics", "Mathematics", "Biology", "Engineering"],
+    "Social Sciences": ["Political Science", "Sociology", "Psychology", "Economics"],
+    "Children's Books": ["Stories", "Educational", "Picture Books", "Moral Stories"],
+    "Reference": ["Dictionaries", "Encyclopedias", "Yearbooks", "Reports"],
+}
+
+ROLES = ["Admin", "Manager", "Editor", "Student", "Member"]
+
+# (action_type, target_type, weight)
+LOG_ACTIONS = [
+    ("LOGIN_SUCCESS", "User", 40), ("LOGIN_FAILED", "User", 5), ("BOOK_ISSUED", "IssuedBook", 15),
+    ("BOOK_RETURNED", "IssuedBook", 14), ("DIGITAL_ACCESS_LOGGED", "DigitalAccess", 15),
+    ("BOOK_CREATED", "Book", 4), ("BOOK_UPDATED", "Book", 4), ("REQUEST_REVIEW", "UploadRequest", 2),
+    ("USER_CREATED", "User", 1),
+]
+
+ACCESS_REQUEST_STATUS_MIX = [("pending", 15), ("approved", 65), ("rejected", 20)]
+COPY_STATUS_MIX = [("Available", 80), ("Issued", 15), ("Damaged", 3), ("Lost", 2)]
+
+HISTORY_START = datetime(2020, 1, 1)
+HISTORY_END = datetime(2026, 1, 1)
+
+
+def _rng(seed: int, table: str) -> random.Random:
+    """Har table ka alag RNG: ek table ka count badlne se doosri table ka data nahi badalta."""
+    return random.Random(f"{seed}:{table}")
+
+
+def _weighted(rng: random.Random, choices):
+    """Pre-split (values, weights) se weighted choice."""
+    values, weights = choices
+    return rng.choices(values, weights=weights)[0]
+
+
+def _split(mix):
+    return [m[0] for m in mix], [m[-1] for m in mix]
+
+
+def _spread(i: int, n: int, jitter: float, rng: random.Random) -> datetime:
+    """id ke saath barhta hua timestamp (history ordered rehti hai) + thoda random jitter."""
+    span = (HISTORY_END - HISTORY_START).total_seconds()
+    offset = span * (i / max(n, 1)) + rng.uniform(-jitter, jitter)
+    return HISTORY_START + timedelta(seconds=min(max(offset, 0), span))
+
+
+def _skewed_id(rng: random.Random, n: int) -> int:
+    """Popular items zyada baar aate hain (quadratic skew towards low ids)."""
+    return int(n * (rng.random() ** 2)) + 1
+
+
+# ==============================================================================
+# 3. ROW GENERATORS (DB column names; har ek lazy iterator hai)
+# ==============================================================================
+
+def gen_roles(counts, seed):
+    for role_id, name in enumerate(ROLES, 1):
+        yield {"id": role_id, "name": name, "description": f"{name} role", "created_at": HISTORY_START}
+
+
+def gen_languages(counts, seed):
+    for lang_id, (name, code, _) in enumerate(LANGUAGES, 1):
+        yield {"LanguageID": lang_id, "LanguageName": name, "LanguageCode": code, "created_at": HISTORY_START}
+
+
+def gen_categories(counts, seed):
+    for cat_id, name in enumerate(CATEGORIES, 1):
+        yield {"id": cat_id, "name": name, "description": f"Books related to {name}", "created_at": HISTORY_START}
+
+
+def _subcategory_rows():
+    rows = []
+    for cat_id, subs in enumerate(CATEGORIES.values(), 1):
+        for name in subs:
+            rows.append({"id": len(rows) + 1, "name": name, "category_id": cat_id, "created_at": HISTORY_START})
+    return rows
+
+
+def gen_subcategories(counts, seed):
+    yield from _subcategory_rows()
+
+
+N_LOCATIONS = 50
+
+
+def gen_locations(counts, seed):
+    for loc_id in range(1, N_LOCATIONS + 1):
+        yield {"id": loc_id, "name": f"Hall {(loc_id - 1) // 10 + 1} - Rack {loc_id}",
+               "rack": str(loc_id), "shelf": "ABCDE"[loc_id % 5], "section_name": f"Section {loc_id % 7 + 1}"}
+
+
+def gen_users(counts, seed, password_hash: str, admin_username: str = "admin"):
+    rng = _rng(seed, "users")
+    n = counts["users"]
+    # Staff roles ~0.5%, baaki readers
+    role_mix = _split([(2, 1), (3, 2), (4, 300), (5, 697)])
+    for user_id in range(1, n + 1):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        is_admin = user_id == 1
+        username = admin_username if is_admin else f"user{user_id}"
+        yield {
+            "id": user_id,
+            "FullName": "Super Administrator" if is_admin else f"{first} {last}",
+            "Email": f"{username}@example.com",
+            "Username": username,
+            "PasswordHash": password_hash,
+            "DateJoined": _spread(user_id, n, 86400, rng),
+            "Status": "Active" if is_admin or rng.random() < 0.97 else "Inactive",
+            "RoleID": 1 if is_admin else _weighted(rng, role_mix),
+        }
+
+
+def gen_books(counts, seed):
+    """total / available copies `book_copies` ke generated rows se (`_copy_tallies`)."""
+    rng = _rng(seed, "books")
+    n = counts["books"]
+    total_copies, available_copies = _copy_tallies(counts, seed)
+    lang_mix = _split([(i, w) for i, (_, _, w) in enumerate(LANGUAGES, 1)])
+    codes = [code for _, code, _ in LANGUAGES]
+    for book_id in range(1, n + 1):
+        lang_id = _weighted(rng, lang_mix)
+        words = TITLE_WORDS[codes[lang_id - 1]]
+        created = _spread(book_id, n, 3600, rng)
+        is_digital = rng.random() < 0.35
+        yield {
+            "id": book_id,
+            "title": f"{' '.join(rng.sample(words, rng.randint(2, 4)))} {book_id}",
+            "author": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "publisher": f"{rng.choice(LAST_NAMES)} Publications",
+            "isbn": f"978{book_id:010d}",
+            "language_id": lang_id,
+            "is_digital": is_digital,
+            "pdf_url": f"https://storage.example.com/books/{book_id}.pdf" if is_digital else None,
+            "cover_image_url": f"https://images.example.com/covers/{book_id}.jpg",
+            "is_approved": rng.random() < 0.92,
+            "is_restricted": rng.random() < 0.08,
+            "total_copies": total_copies[book_id],
+            "available_copies": available_copies[book_id],
+            "location_id": rng.randint(1, N_LOCATIONS),
+            "page_count": rng.randint(40, 1200),
+            "created_at": created,
+            "deleted_at": created + timedelta(days=rng.randint(1, 365)) if rng.random() < 0.01 else None,
+        }
+
+
+def gen_book_subcategory_links(counts, seed):
+    rng = _rng(seed, "book_subcategory_link")
+    n_subs = len(_subcategory_rows())
+    for book_id in range(1, counts["books"] + 1):
+        for sub_id in sorted(rng.sample(range(1, n_subs + 1), rng.randint(1, 3))):
+            yield {"book_id": book_id, "subcategory_id": sub_id}
+
+
+def _hashed_copy_status(copy_id: int, seed: int) -> str:
+    values, weights = _split(COPY_STATUS_MIX)
+    return random.Random(f"{seed}:copy-status:{copy_id}").choices(values, weights=weights)[0]
+
+
+@lru_cache(maxsize=4)
+def _issued_copies(n_copies: int, n_issues: int, seed: int) -> tuple:
+    """
+    'Issued' copies (id order). Har ek ka exactly ek open issue banta hai, is
+    liye ye `n_issues` se zyada nahi ho saktin - baaki 'Available' ho jati hain.
+    """
+    issued = []
+    for copy_id in range(1, n_copies + 1):
+        if len(issued) == n_issues:
+            break
+        if _hashed_copy_status(copy_id, seed) == "Issued":
+            issued.append(copy_id)
+    return tuple(issued)
+
+
+@lru_cache(maxsize=4)
+def _issued_copy_set(n_copies: int, n_issues: int, seed: int) -> frozenset:
+    return frozenset(_issued_copies(n_copies, n_issues, seed))
+
+
+def _copy_status(copy_id: int, counts, seed: int) -> str:
+    """Copy status deterministic hash se; 'Issued' sirf wahi jinka open loan gen_issues banata hai."""
+    status = _hashed_copy_status(copy_id, seed)
+    if status == "Issued" and copy_id not in _issued_copy_set(counts["copies"], counts["issues"], seed):
+        return "Available"
+    return status
+
+
+def gen_copies(counts, seed):
+    rng = _rng(seed, "book_copies")
+    n = counts["copies"]
+    for copy_id in range(1, n + 1):
+        yield {
+            "CopyID": copy_id,
+            "BookID": _skewed_id(rng, counts["books"]),
+            "LocationID": rng.randint(1, N_LOCATIONS),
+            "Status": _copy_status(copy_id, counts, seed),
+            "created_at": _spread(copy_id, n, 3600, rng),
+        }
+
+
+def _copy_tallies(counts, seed):
+    """
+    (total, available) per book id - gen_copies ko dobara chala kar (same seed
+    => same rows). Arrays: production scale par bhi sirf do int per book.
+    """
+    from models.library_management_models import AVAILABLE_COPY_STATUSES
+
+    total = array("l", [0]) * (counts["books"] + 1)
+    available = array("l", [0]) * (counts["books"] + 1)
+    for copy in gen_copies(counts, seed):
+        total[copy["BookID"]] += 1
+        if copy["Status"] in AVAILABLE_COPY_STATUSES:
+            available[copy["BookID"]] += 1
+    return total, available
+
+
+def gen_issues(counts, seed):
+    """
+    History mostly 'Returned' hai. Har 'Issued' copy ka exactly ek open issue:
+    wo sab se aakhri (recent tail) mein hain, is liye us copy ka koi baad wala
+    issue record nahi hota.
+    """
+    rng = _rng(seed, "issued_books")
+    n, n_copies, n_users = counts["issues"], counts["copies"], counts["users"]
+    open_loans = list(_issued_copies(n_copies, n, seed))
+    _rng(seed, "open_loans").shuffle(open_loans)
+    tail_start = n - len(open_loans)
+    for issue_id in range(1, n + 1):
+        still_out = issue_id > tail_start
+        copy_id = open_loans[issue_id - tail_start - 1] if still_out else rng.randint(1, n_copies)
+        issued_at = _spread(issue_id, n, 600, rng)
+        due = issued_at + timedelta(days=14)
+        yield {
+            "IssuedBookID": issue_id,
+            "ClientID": _skewed_id(rng, n_users),
+            "CopyID": copy_id,
+            "IssueDate": issued_at,
+            "ReturnDate": due,
+            "ActualReturnDate": None if still_out else issued_at + timedelta(days=rng.randint(1, 30)),
+            "Status": "Issued" if still_out else "Returned",
+        }
+
+
+def gen_logs(counts, seed):
+    rng = _rng(seed, "logs")
+    n, n_users = counts["logs"], counts["users"]
+    actions = _split([(a, t, w) for a, t, w in LOG_ACTIONS])
+    targets = dict((a, t) for a, t, _ in LOG_ACTIONS)
+    for log_id in range(1, n + 1):
+        action = _weighted(rng, actions)
+        actor = _skewed_id(rng, n_users)
+        yield {
+            "id": log_id,
+            "user_id": actor if targets[action] == "User" else None,
+            "action_by_id": actor,
+            "timestamp": _spread(log_id, n, 30, rng),
+            "action_type": action,
+            "target_type": targets[action],
+            "target_id": rng.randint(1, counts["books"]),
+            "description": f"{action.replace('_', ' ').title()} (synthetic #{log_id})",
+        }
+
+
+def gen_access_requests(counts, seed):
+    """Restricted-book requests; (user, book) pair unique rehta hai jaisa app assume karti hai."""
+    rng = _rng(seed, "access_requests_user")
+    n = min(counts["access_requests"], counts["users"] * counts["books"])
+    status_mix = _split(ACCESS_REQUEST_STATUS_MIX)
+    seen = set()
+    req_id = 0
+    while req_id < n:
+        pair = (_skewed_id(rng, counts["users"]), rng.randint(1, counts["books"]))
+        if pair in seen:
+            continue
+        seen.add(pair)
+        req_id += 1
+        status = _weighted(rng, status_mix)
+        created = _spread(req_id, n, 3600, rng)
+        yield {
+            "id": req_id,
+            "user_id": pair[0],
+            "book_id": pair[1],
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "age": str(rng.randint(18, 70)),
+            "whatsapp": f"0300{rng.randint(1_000_000, 9_999_999)}",
+            "qualification": rng.choice(["Alim", "MA", "BS", "PhD", "Hafiz"]),
+            "is_salafi": rng.random() < 0.5,
+            "purpose": rng.choice(["Research", "Teaching", "Personal Study", "Research, Teaching"]),
+            "status": status,
+            "rejection_reason": "Incomplete details" if status == "rejected" else None,
+            "created_at": created,
+            "updated_at": created + timedelta(days=rng.randint(0, 10)) if status != "pending" else created,
+        }
+
+
+def gen_upload_requests(counts, seed):
+    """Har ~5th book ki upload approval history (book_id unique constraint respect hota hai)."""
+    rng = _rng(seed, "upload_requests")
+    n_books = counts["books"]
+    req_id = 0
+    for book_id in range(1, n_books + 1, 5):
+        req_id += 1
+        submitted = _spread(book_id, n_books, 3600, rng)
+        status = rng.choices(["Approved", "Pending", "Rejected"], weights=[85, 10, 5])[0]
+        yield {
+            "id": req_id,
+            "submitted_by_id": rng.randint(1, min(counts["users"], 1000)),
+            "reviewed_by_id": 1 if status != "Pending" else None,
+            "book_id": book_id,
+            "status": status,
+            "submitted_at": submitted,
+            "reviewed_at": submitted + timedelta(hours=rng.randint(1, 96)) if status != "Pending" else None,
+        }
+
+
+def gen_digital_access(counts, seed):
+    rng = _rng(seed, "digital_access")
+    n = counts["digital_access"]
+    for access_id in range(1, n + 1):
+        yield {
+            "DigitalAccessID": access_id,
+            "ClientID": _skewed_id(rng, counts["users"]),
+            "BookID": _skewed_id(rng, counts["books"]),
+            "AccessGranted": True,
+            "AccessTimestamp": _spread(access_id, n, 60, rng),
+        }
+
+
+# ==============================================================================
+# 4. WRITERS (COPY for Postgres, insert() batches otherwise)
+# ==============================================================================
+
+def _batches(rows: Iterator[dict], size: int) -> Iterator[List[dict]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _copy_batch(raw_conn, table, columns: List[str], batch: List[dict]):
+    """psycopg2 COPY FROM STDIN (CSV). Empty unquoted field = NULL."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in batch:
+        writer.writerow([row.get(col) for col in columns])
+    buf.seek(0)
+    cols = ", ".join(f'"{c}"' for c in columns)
+    with raw_conn.cursor() as cur:
+        cur.copy_expert(f'COPY "{table.name}" ({cols}) FROM STDIN WITH (FORMAT csv)', buf)
+
+
+def load_table(engine, table, rows: Iterator[dict], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Ek table ko streaming batches mein load karta hai; memory batch size tak hi rehti hai."""
+    total = 0
+    started = time.perf_counter()
+    use_copy = engine.dialect.name == "postgresql"
+
+    if use_copy:
+        raw_conn = engine.raw_connection()
+        try:
+            for batch in _batches(rows, batch_size):
+                _copy_batch(raw_conn, table, list(batch[0].keys()), batch)
+                raw_conn.commit()
+                total += len(batch)
+        finally:
+            raw_conn.close()
+    else:
+        for batch in _batches(rows, batch_size):
+            with engine.begin() as conn:
+                conn.execute(table.insert(), batch)
+            total += len(batch)
+
+    elapsed = time.perf_counter() - started
+    rate = int(total / elapsed) if elapsed > 0 else total
+    print(f"   ✅ {table.name}: {total:,} rows in {elapsed:.1f}s ({rate:,} rows/s)")
+    return total
+
+
+def reset_sequences(engine, tables):
+    """Explicit ids ke baad Postgres SERIAL sequences ko MAX(id) par set karta hai."""
+    if engine.dialect.name != "postgresql":
+        return
+    with engine.begin() as conn:
+        for table in tables:
+            pk = list(table.primary_key.columns)
+            if len(pk) != 1:
+                continue
+            conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('\"{table.name}\"', '{pk[0].name}'), "
+                f"COALESCE((SELECT MAX(\"{pk[0].name}\") FROM \"{table.name}\"), 1))"
+            ))
+
+
+# ==============================================================================
+# 5. ORCHESTRATION
+# ==============================================================================
+
+def generate(
+    engine,
+    counts: Dict[str, int],
+    password_hash: str,
+    seed: int = 42,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    admin_username: str = "admin",
+    only: Optional[List[str]] = None,
+) -> Dict[str, int]:
+    """
+    Saari tables FK order mein generate karta hai. Tables khali honi chahiye
+    (CLI ka --reset use karein). Returns {table_name: rows_written}.
+    """
+    from database import Base
+    import models  # noqa: F401
+    from models import log_model, request_user_model, library_management_models  # noqa: F401
+
+    tables = Base.metadata.tables
+    plan: List[tuple] = [
+        ("roles", gen_roles),
+        ("languages", gen_languages),
+        ("categories", gen_categories),
+        ("subcategories", gen_subcategories),
+        ("locations", gen_locations),
+        ("users", lambda c, s: gen_users(c, s, password_hash, admin_username)),
+        ("books", gen_books),
+        ("book_subcategory_link", gen_book_subcategory_links),
+        ("book_copies", gen_copies),
+        ("issued_books", gen_issues),
+        ("logs", gen_logs),
+        ("access_requests_user", gen_access_requests),
+        ("upload_requests", gen_upload_requests),
+        ("digital_access", gen_digital_access),
+    ]
+
+    written = {}
+    for table_name, factory in plan:
+        if only and table_name not in only:
+            continue
+        written[table_name] = load_table(engine, tables[table_name], factory(counts, seed), batch_size)
+
+    reset_sequences(engine, [tables[name] for name in written])
+    return written
+
+
+# Benchmarks ke search scenario ke liye (English titles mein aksar milte hain)
+SEARCH_TERMS = TITLE_WORDS["en"][:6]
@@ -2,7 +2,7 @@
 from .email_service import send_otp_email
 
 # 2. Logger
-from .logger import create_log
+from .logger import create_log, create_logs_bulk
 
 # 3. File Utils (Ye wali line add karein 👇)
 from .file_utils import delete_static_file
\ No newline at end of file
@@ -0,0 +1,216 @@
+# file: utils/app_logging.py
+"""
+Application logging: non-blocking, structured, request-aware.
+
+- Request thread sirf record ko `SimpleQueue` mein daalta hai (QueueHandler);
+  stdout par likhna ek background `QueueListener` thread karta hai. Slow
+  stdout / log collector request latency mein nahi aata.
+- JSON lines (LOG_FORMAT=json, default) ya purana text format (LOG_FORMAT=text).
+- Har record mein `request_id` (RequestIdMiddleware, X-Request-ID header).
+  Sync endpoints threadpool mein chalte hain; anyio context copy karta hai,
+  is liye contextvar wahan bhi milta hai.
+- Per-module levels: LOG_LEVELS="sqlalchemy.engine=WARNING,controllers=DEBUG".
+- DEBUG records sampled (LOG_DEBUG_SAMPLE_RATE, e.g. 0.01 = 1%) - hot path
+  par debug on karne se log volume nahi phatta.
+
+Modules sirf `logging.getLogger(__name__)` use karte hain; `setup_logging()`
+create_app() mein ek baar chalta hai.
+"""
+import atexit
+import json
+import logging
+import queue
+import random
+import re
+import sys
+import uuid
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+REQUEST_ID_HEADER = "X-Request-ID"
+TEXT_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Client ka diya request id sirf tab manein jab chhota aur safe ho (log injection nahi)
+_VALID_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+# LogRecord ke apne attributes - baaki sab `extra=` fields hain (JSON mein jate hain)
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime", "request_id"}
+
+_listener: Optional[QueueListener] = None
+
+
+# ==================================
+# 🏷️ FILTERS
+# ==================================
+
+class RequestIdFilter(logging.Filter):
+    """Caller thread mein chalta hai (QueueHandler par) - contextvar yahin padhna zaroori hai."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """DEBUG (aur neeche) records ka sirf `rate` hissa queue tak jata hai. INFO+ hamesha."""
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.rate >= 1.0:
+            return True
+        if random.random() >= self.rate:
+            return False
+        record.sample_rate = self.rate
+        return True
+
+
+# ==================================
+# 🧾 FORMATTERS
+# ==================================
+
+class JsonFormatter(logging.Formatter):
+    """Ek line = ek JSON object (log collectors seedha parse karte hain)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        if getattr(record, "request_id", None):
+            entry["request_id"] = record.request_id
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    def __init__(self):
+        super().__init__(TEXT_FORMAT)
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        request_id = getattr(record, "request_id", None)
+        return f"{line} [req={request_id}]" if request_id else line
+
+
+class _PreformattedQueueHandler(QueueHandler):
+    """
+    Stdlib QueueHandler.prepare() message ko pehle hi format kar deta hai (aur
+    JSON formatter ke extra fields kho jate hain). Yahan sirf args merge: record
+    listener thread mein asli formatter se format hota hai.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Traceback object thread ke beech safe nahi - text bana kar bhejo
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+# ==================================
+# ⚙️ SETUP
+# ==================================
+
+def parse_levels(spec: str) -> dict:
+    """"sqlalchemy.engine=WARNING, controllers=DEBUG" -> {"sqlalchemy.engine": "WARNING", ...}"""
+    levels = {}
+    for part in (spec or "").split(","):
+        name, _, level = part.partition("=")
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def setup_logging(settings) -> None:
+    """
+    Root logger par QueueHandler + background listener. Dobara call (tests /
+    kai create_app) par sirf levels update hote hain, naya thread nahi.
+    """
+    global _listener
+
+    root = logging.getLogger()
+    root.setLevel(settings.log_level.upper())
+    for name, level in parse_levels(settings.log_levels).items():
+        logging.getLogger(name).setLevel(level)
+    if _listener is not None:
+        return
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(JsonFormatter() if settings.log_format == "json" else TextFormatter())
+
+    log_queue = queue.SimpleQueue()
+    handler = _PreformattedQueueHandler(log_queue)
+    handler.addFilter(RequestIdFilter())
+    handler.addFilter(DebugSamplingFilter(settings.log_debug_sample_rate))
+
+    # basicConfig / uvicorn ke direct stdout handlers hata kar sab queue se
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uv_logger = logging.getLogger(name)
+        uv_logger.handlers.clear()
+        uv_logger.propagate = True
+
+    _listener = QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+def shutdown_logging() -> None:
+    """Queue mein bache records likh kar listener band (process exit par)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+# ==================================
+# 🆔 REQUEST ID MIDDLEWARE
+# ==================================
+
+class RequestIdMiddleware:
+    """
+    Pure ASGI: har request ko id (client ka X-Request-ID ya naya uuid) aur
+    response mein wahi header - support ticket se log lines dhoondh sakte hain.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        incoming = Headers(scope=scope).get(REQUEST_ID_HEADER)
+        request_id = incoming if incoming and _VALID_REQUEST_ID.match(incoming) else uuid.uuid4().hex
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_id_var.reset(token)
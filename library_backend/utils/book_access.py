@@ -0,0 +1,82 @@
+# file: utils/book_access.py
+"""
+Book visibility + restricted-access rules (ek hi jagah).
+
+`read_book` (metadata) aur `/books/{id}/pdf` (file stream) dono yahi use
+karte hain, taake PDF ka rasta metadata se zyada khula na ho.
+"""
+from typing import Optional
+
+from fastapi import HTTPException, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from models import book_model, user_model, book_permission_model, request_user_model
+
+ADMIN_ROLES = ("admin", "superadmin")
+
+
+def is_admin(user: Optional[user_model.User]) -> bool:
+    return bool(user and getattr(user, "role", None) and user.role.name.lower() in ADMIN_ROLES)
+
+
+def user_can_read(db: Session, book: book_model.Book, user: Optional[user_model.User]) -> bool:
+    """Restricted book: admin, direct BookPermission, ya approved AccessRequest."""
+    if not book.is_restricted or is_admin(user):
+        return True
+    if not user:
+        return False
+
+    perm = db.query(book_permission_model.BookPermission.id).filter(
+        book_permission_model.BookPermission.book_id == book.id,
+        book_permission_model.BookPermission.user_id == user.id
+    ).first()
+    if perm:
+        return True
+
+    # Case Insensitive (Approved, approved, APPROVED sab chalega)
+    req = db.query(request_user_model.AccessRequest.id).filter(
+        request_user_model.AccessRequest.book_id == book.id,
+        request_user_model.AccessRequest.user_id == user.id,
+        func.lower(request_user_model.AccessRequest.status) == "approved"
+    ).first()
+    return req is not None
+
+
+def ensure_book_access(db: Session, book: Optional[book_model.Book], user: Optional[user_model.User]) -> bool:
+    """
+    404: book nahi mili, ya unapproved hai aur user admin nahi.
+    403: restricted hai aur user ke paas access nahi.
+    Warna `has_access` (hamesha True) return karta hai.
+    """
+    if not book:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found")
+
+    # 1. Approval Check
+    if not book.is_approved and not is_admin(user):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Book not found.")
+
+    # 2. Restricted Access Check
+    if not user_can_read(db, book, user):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="You do not have permission to view this restricted book.")
+    return True
+
+
+def readable_restricted_ids(db: Session, user: Optional[user_model.User]) -> Optional[set]:
+    """
+    List/search queries ke liye: restricted books jin ka user ke paas access hai.
+    None = koi pabandi nahi (admin).
+    """
+    if is_admin(user):
+        return None
+    if not user:
+        return set()
+
+    ids = {row.book_id for row in db.query(book_permission_model.BookPermission.book_id).filter(
+        book_permission_model.BookPermission.user_id == user.id
+    )}
+    ids.update(row.book_id for row in db.query(request_user_model.AccessRequest.book_id).filter(
+        request_user_model.AccessRequest.user_id == user.id,
+        func.lower(request_user_model.AccessRequest.status) == "approved"
+    ))
+    return ids
@@ -0,0 +1,127 @@
+# file: utils/cache.py
+"""
+In-process snapshot cache with cross-worker invalidation.
+
+Har worker apna rendered snapshot memory mein rakhta hai. Invalidation ek
+chhoti "version file" (settings.cache_state_dir/<name>.version) se hoti hai:
+write karne wala worker `bump()` karta hai, aur baaki workers har read par
+sirf ek `stat()` (DB query nahi) se dekh lete hain ke snapshot purana hai.
+
+Alag machines (shared disk nahi) ke liye `max_age` safety net hai.
+
+`invalidate_on_commit()` ORM session events se cache ko models ke writes se
+jod deta hai: commit hote hi bump, rollback par kuch nahi.
+
+Snapshot loaders `on_primary()` se chalte hain: bump primary ke commit par
+hota hai, replica (lag) se bana snapshot purana data `max_age` tak cache kar deta.
+"""
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from config import get_settings
+from database import SessionLocal
+
+
+class VersionedCache:
+    def __init__(self, name: str, max_age: float = 300.0):
+        self.name = name
+        self.max_age = max_age
+        self._entries: Dict[Any, Tuple[Any, float, Any]] = {}  # key -> (version, built_at, value)
+        self._lock = threading.Lock()
+
+    @property
+    def version_file(self) -> Path:
+        return get_settings().cache_state_dir / f"{self.name}.version"
+
+    def version(self) -> Any:
+        """Current version token: file ka (mtime_ns, size, inode) - sirf ek stat syscall."""
+        try:
+            stat = self.version_file.stat()
+            return stat.st_mtime_ns, stat.st_size, stat.st_ino
+        except FileNotFoundError:
+            return None
+
+    def bump(self):
+        """Sab workers ke snapshots invalidate (write ke commit ke baad call karein)."""
+        path = self.version_file
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        tmp.write_text(uuid.uuid4().hex)
+        os.replace(tmp, path)  # naya inode => version zaroor badlega
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key: Any, loader: Callable[[], Any]) -> Any:
+        """Fresh snapshot ho to wahi, warna `loader()` se bana kar store."""
+        version = self.version()
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry and entry[0] == version and now - entry[1] < self.max_age:
+            return entry[2]
+
+        value = loader()
+        with self._lock:
+            self._entries[key] = (version, now, value)
+        return value
+
+    def peek(self, key: Any) -> Optional[Any]:
+        entry = self._entries.get(key)
+        return entry[2] if entry and entry[0] == self.version() else None
+
+
+def on_primary(build: Callable[[Session], Any]) -> Callable[[], Any]:
+    """
+    `build(db)` ko loader banata hai jo apne PRIMARY session par chalta hai -
+    request ka `get_read_db` session (replica) nahi.
+    """
+    def _load():
+        with SessionLocal() as db:
+            return build(db)
+    return _load
+
+
+def invalidate_on_commit(cache: VersionedCache, watch: Dict[type, Optional[Sequence[str]]]):
+    """
+    `watch`: model -> attribute names jin ke badalne par cache purana ho
+    (None = koi bhi change / insert / delete). Insert aur delete hamesha count
+    hote hain; bulk query.update()/delete() par attributes check nahi hote.
+    """
+    dirty_key = f"{cache.name}_dirty"
+    models = tuple(watch)
+
+    def _changed(obj) -> bool:
+        attrs = watch[next(m for m in models if isinstance(obj, m))]
+        if attrs is None:
+            return True
+        state = inspect(obj)
+        return any(state.attrs[name].history.has_changes() for name in attrs)
+
+    @event.listens_for(Session, "after_flush")
+    def _track_writes(session, flush_context):
+        # after_flush mein new/dirty/deleted + attribute history abhi flush se pehle wali hai
+        if any(isinstance(obj, models) for obj in (*session.new, *session.deleted)) or \
+                any(isinstance(obj, models) and _changed(obj) for obj in session.dirty):
+            session.info[dirty_key] = True
+
+    @event.listens_for(Session, "do_orm_execute")
+    def _track_bulk_writes(orm_execute_state):
+        mapper = orm_execute_state.bind_mapper
+        if (orm_execute_state.is_update or orm_execute_state.is_delete) and mapper is not None \
+                and issubclass(mapper.class_, models):
+            orm_execute_state.session.info[dirty_key] = True
+
+    @event.listens_for(Session, "after_commit")
+    def _bump_on_commit(session):
+        if session.info.pop(dirty_key, False):
+            cache.bump()
+
+    @event.listens_for(Session, "after_rollback")
+    def _discard_on_rollback(session):
+        session.info.pop(dirty_key, None)
@@ -0,0 +1,351 @@
+# file: utils/catalog_snapshot.py
+"""
+Public catalog snapshots: precompressed, content-hashed JSON files.
+
+Guest visitors ko approved + non-restricted catalog sab ke liye ek jaisa milta
+hai, phir bhi har request joinedload query + Pydantic serialization chalati
+thi. Ye module wahi response pehle se files mein render kar deta hai:
+
+    static/catalog/manifest.json                    (short cache, har build par naya)
+    static/catalog/page-<k>.<hash>.json[.gz|.br]    (ids [k*size, (k+1)*size), newest first)
+    static/catalog/category-<id>.<hash>.json[...]   (top-level category ki saari books)
+
+Shard ka naam uske content ka hash hai => file kabhi nahi badalti (immutable
+cache headers, utils/static_files.PrecompressedStaticFiles). Brotli (`.br`)
+sirf tab banta hai jab `brotli` package installed ho; gzip hamesha.
+
+Incremental rebuild change feed (utils/change_feed) se hota hai: pichhle build
+ke baad jin books ka `change_seq` badha (approve / edit / soft delete / restrict),
+sirf unke id-page aur unki (purani + nayi) categories dobara render hoti hain.
+Hard delete (reset counter), reference data (category / language naam) ya page
+size badle to full rebuild.
+
+Builder background thread mein chalta hai; kai workers hon to lock file
+(`flock`) ki wajah se ek waqt mein sirf ek build karta hai.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, selectinload
+
+import database
+from config import get_settings
+from models.book_model import Book, Subcategory
+from schemas.book_schema import Book as BookSchema
+from utils.change_feed import FEED, RESET_FEED, read_counter
+from utils.reference_data import get_bundle
+
+try:
+    import brotli  # optional: `pip install brotli`
+except ImportError:
+    brotli = None
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines: lock ke bina (single worker)
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+STATE_NAME = "catalog_snapshot.json"
+LOCK_NAME = "catalog_snapshot.lock"
+# Purane manifest wale clients ke liye unreferenced shards itni der tak rehte hain
+GC_GRACE_SECONDS = 3600
+FORMAT_VERSION = 1
+
+
+def catalog_dir() -> Path:
+    return get_settings().static_dir / "catalog"
+
+
+def _state_path() -> Path:
+    return get_settings().cache_state_dir / STATE_NAME
+
+
+# ==================================
+# 📚 QUERY + RENDER
+# ==================================
+
+def _public_books(db: Session):
+    return db.query(Book).options(
+        selectinload(Book.subcategories).selectinload(Subcategory.category),
+        selectinload(Book.language),
+    ).filter(
+        Book.deleted_at.is_(None),
+        Book.is_approved == True,  # noqa: E712
+        Book.is_restricted == False,  # noqa: E712
+    )
+
+
+def _category_ids(book: Book) -> List[int]:
+    return sorted({sub.category_id for sub in book.subcategories if sub.category_id is not None})
+
+
+def _serialize(book: Book) -> dict:
+    # Guest /api/books/ jaisa hi shape (non-restricted => user_has_access true)
+    data = BookSchema.model_validate(book).model_dump(mode="json")
+    data["user_has_access"] = True
+    return data
+
+
+def _compress(body: bytes) -> Dict[str, bytes]:
+    encoded = {".gz": gzip.compress(body, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        encoded[".br"] = brotli.compress(body, quality=11)
+    return encoded
+
+
+def _atomic_write(path: Path, data: bytes):
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _write_shard(key: str, books: List[dict]) -> dict:
+    """`<key>.<hash>.json` (+ .gz / .br). Same content => same file, dobara nahi likhi jati."""
+    body = json.dumps(books, separators=(",", ":"), ensure_ascii=False).encode()
+    digest = hashlib.sha256(body).hexdigest()[:16]
+    name = f"{key}.{digest}.json"
+    path = catalog_dir() / name
+    if not path.exists() or (brotli is not None and not path.with_name(name + ".br").exists()):
+        for suffix, data in _compress(body).items():
+            _atomic_write(path.with_name(name + suffix), data)
+        _atomic_write(path, body)  # plain file aakhri: iska hona = shard mukammal
+    return {"file": name, "count": len(books), "first_id": books[0]["id"], "last_id": books[-1]["id"]}
+
+
+# ==================================
+# 🏗️ BUILD
+# ==================================
+
+def _render(db: Session, page_size: int, pages: Optional[Set[int]], categories: Optional[Set[int]],
+            shards: Dict[str, dict], book_categories: Dict[str, List[int]]):
+    """
+    `pages` / `categories` = None => sab. Diye gaye shards dobara render karke
+    `shards` / `book_categories` (state) update karta hai; khali shard hat jata hai.
+    """
+    query = _public_books(db)
+    if pages is not None or categories is not None:
+        # Sirf affected shards ki books (id range ya category)
+        conditions = [Book.id.between(k * page_size, (k + 1) * page_size - 1) for k in pages or ()]
+        if categories:
+            conditions.append(Book.subcategories.any(Subcategory.category_id.in_(categories)))
+        if not conditions:
+            return
+        query = query.filter(or_(*conditions))
+
+    page_books: Dict[int, List[dict]] = {k: [] for k in pages or ()}
+    category_books: Dict[int, List[dict]] = {c: [] for c in categories or ()}
+    for book in query.order_by(Book.id.desc()):
+        data = _serialize(book)
+        cats = _category_ids(book)
+        book_categories[str(book.id)] = cats
+
+        page = book.id // page_size
+        if pages is None or page in pages:
+            page_books.setdefault(page, []).append(data)
+        for cat in cats:
+            if categories is None or cat in categories:
+                category_books.setdefault(cat, []).append(data)
+
+    if pages is None:
+        shards.clear()
+    for page, books in page_books.items():
+        _put(shards, f"page-{page}", books)
+    for cat, books in category_books.items():
+        _put(shards, f"category-{cat}", books)
+
+
+def _put(shards: Dict[str, dict], key: str, books: List[dict]):
+    if books:
+        shards[key] = _write_shard(key, books)
+    else:
+        shards.pop(key, None)
+
+
+def _write_manifest(shards: Dict[str, dict], seq: int, ref_version: str):
+    def entries(prefix: str, newest_first: bool):
+        items = [(int(key[len(prefix):]), info) for key, info in shards.items() if key.startswith(prefix)]
+        return sorted(items, key=lambda item: item[0], reverse=newest_first)
+
+    manifest = {
+        "version": FORMAT_VERSION,
+        "seq": seq,
+        "reference_version": ref_version,
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "book_count": sum(info["count"] for key, info in shards.items() if key.startswith("page-")),
+        "pages": [
+            {"page": page, "url": f"/static/catalog/{info['file']}", "count": info["count"],
+             "first_id": info["first_id"], "last_id": info["last_id"]}
+            for page, info in entries("page-", newest_first=True)
+        ],
+        "categories": [
+            {"category_id": cat, "url": f"/static/catalog/{info['file']}", "count": info["count"]}
+            for cat, info in entries("category-", newest_first=False)
+        ],
+    }
+    body = json.dumps(manifest, separators=(",", ":"), ensure_ascii=False).encode()
+    path = catalog_dir() / MANIFEST_NAME
+    for suffix, data in _compress(body).items():
+        _atomic_write(path.with_name(MANIFEST_NAME + suffix), data)
+    _atomic_write(path, body)
+
+
+def _load_state() -> Optional[dict]:
+    try:
+        state = json.loads(_state_path().read_text())
+    except (FileNotFoundError, ValueError):
+        return None
+    return state if state.get("format") == FORMAT_VERSION else None
+
+
+def _save_state(state: dict):
+    path = _state_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write(path, json.dumps(state, separators=(",", ":")).encode())
+
+
+def _changed_book_ids(db: Session, since_seq: int) -> List[int]:
+    rows = (
+        db.query(Book.id)
+        .filter(Book.change_seq > since_seq)
+        .execution_options(include_deleted=True)
+    )
+    return [row[0] for row in rows]
+
+
+def build_snapshot(db: Session, full: bool = False) -> dict:
+    """
+    Snapshot ko DB ke barabar lata hai. Returns {"mode": "full"|"incremental"|"noop",
+    "pages", "categories", "seq"}. Lock caller ki zimmedari (`SnapshotBuilder`).
+    """
+    settings = get_settings()
+    page_size = settings.catalog_snapshot_page_size
+    catalog_dir().mkdir(parents=True, exist_ok=True)
+
+    # Counter pehle padho: is seq tak ke saare changes committed hain
+    seq = read_counter(db, FEED)
+    epoch = read_counter(db, RESET_FEED)
+    _, ref_version = get_bundle()
+
+    state = _load_state()
+    if (
+        full or state is None or state["epoch"] != epoch or state["reference_version"] != ref_version
+        or state["page_size"] != page_size or not (catalog_dir() / MANIFEST_NAME).exists()
+    ):
+        state = {"format": FORMAT_VERSION, "page_size": page_size, "shards": {}, "book_categories": {}}
+        _render(db, page_size, None, None, state["shards"], state["book_categories"])
+        mode, pages, categories = "full", None, None
+    elif state["seq"] == seq:
+        return {"mode": "noop", "pages": 0, "categories": 0, "seq": seq}
+    else:
+        changed = _changed_book_ids(db, state["seq"])
+        pages = {book_id // page_size for book_id in changed}
+        categories: Set[int] = set()
+        for book_id in changed:
+            # Purani categories (book wahan se hati ho to bhi shard update ho)
+            categories.update(state["book_categories"].pop(str(book_id), ()))
+        if changed:
+            for book in _public_books(db).filter(Book.id.in_(changed)):
+                categories.update(_category_ids(book))
+        _render(db, page_size, pages, categories, state["shards"], state["book_categories"])
+        mode = "incremental"
+
+    state.update(seq=seq, epoch=epoch, reference_version=ref_version)
+    _write_manifest(state["shards"], seq, ref_version)
+    _save_state(state)
+    return {
+        "mode": mode,
+        "pages": len(pages) if pages is not None else sum(k.startswith("page-") for k in state["shards"]),
+        "categories": len(categories) if categories is not None else sum(k.startswith("category-") for k in state["shards"]),
+        "seq": seq,
+    }
+
+
+def collect_garbage(grace_seconds: float = GC_GRACE_SECONDS) -> int:
+    """Manifest mein na rehne wali shard files (grace period ke baad) delete."""
+    state = _load_state()
+    if state is None:
+        return 0
+    live = {info["file"] for info in state["shards"].values()}
+    cutoff = time.time() - grace_seconds
+    removed = 0
+    for path in catalog_dir().glob("*.json*"):
+        base = path.name.split(".json", 1)[0] + ".json"
+        if path.name.startswith(MANIFEST_NAME) or base in live:
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    return removed
+
+
+# ==================================
+# 🔁 BACKGROUND BUILDER
+# ==================================
+
+class SnapshotBuilder:
+    """Background thread: har `interval` seconds change feed check karke snapshot update."""
+
+    def __init__(self, interval: float = 30.0):
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="catalog-snapshot", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+
+    def run_once(self, full: bool = False) -> Optional[dict]:
+        """Lock mil jaye to build + GC; koi aur worker bana raha ho to None."""
+        lock_path = get_settings().cache_state_dir / LOCK_NAME
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(lock_path, "a") as lock_file:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    return None
+            with database.SessionLocal() as db:
+                result = build_snapshot(db, full=full)
+            collect_garbage()
+            return result
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Catalog snapshot error")
+            self._stop.wait(self.interval)
+
+
+_builder: Optional[SnapshotBuilder] = None
+
+
+def get_snapshot_builder() -> SnapshotBuilder:
+    global _builder
+    if _builder is None:
+        _builder = SnapshotBuilder(get_settings().catalog_snapshot_interval_seconds)
+    return _builder
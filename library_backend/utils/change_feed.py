@@ -0,0 +1,126 @@
+# file: utils/change_feed.py
+"""
+Books delta sync (/api/books/changes?since=<token>).
+
+`updated_at` token ke liye kaafi nahi: do transactions commit order se ulat
+timestamps le sakti hain, aur client ka "since" aage nikal kar ek change miss
+kar deta. Is liye har commit jis mein koi book insert / update / (soft) delete
+hui, `change_counters` se ek naya sequence leta hai:
+
+1. Flush / bulk UPDATE par badli books ka `change_seq = PENDING` (-1).
+2. `before_commit` par (transaction ka aakhri kaam): counter +1 aur
+   `UPDATE books SET change_seq = :seq WHERE change_seq = -1`.
+
+Counter row ka lock commit tak rehta hai, is liye sequence commit order mein
+hi milte hain: client ne (seq, id) tak padh liya to us se chhota seq baad mein
+kabhi commit nahi hoga. Lock sirf commit ke aakhri pal mein liya jata hai.
+
+Hard delete (purge / db.delete) par tombstone nahi bachta => "books.reset"
+counter badhta hai. Token mein us waqt ka reset counter (epoch) hota hai;
+purane epoch wale token ko full resync (`reset: true`) milta hai.
+"""
+from typing import Optional, Tuple
+
+from sqlalchemy import and_, event, insert, or_, update
+from sqlalchemy.orm import Session
+
+from models.book_model import Book
+from models.change_feed_model import ChangeCounter
+
+FEED = "books"
+RESET_FEED = "books.reset"
+PENDING = -1
+_CHANGED_KEY = "books_changed"
+_RESET_KEY = "books_hard_deleted"
+
+_books = Book.__table__
+_counters = ChangeCounter.__table__
+
+
+# ==================================
+# 🔢 COUNTERS
+# ==================================
+
+def _next_value(conn, name: str) -> int:
+    """Counter +1 (row lock commit tak). Row na ho to 1 se shuru."""
+    row = conn.execute(
+        update(_counters).where(_counters.c.name == name)
+        .values(value=_counters.c.value + 1).returning(_counters.c.value)
+    ).first()
+    if row is not None:
+        return row[0]
+    conn.execute(insert(_counters).values(name=name, value=1))
+    return 1
+
+
+def _set_value(conn, name: str, value: int):
+    result = conn.execute(update(_counters).where(_counters.c.name == name).values(value=value))
+    if result.rowcount == 0:
+        conn.execute(insert(_counters).values(name=name, value=value))
+
+
+def read_counter(db: Session, name: str) -> int:
+    value = db.query(ChangeCounter.value).filter(ChangeCounter.name == name).scalar()
+    return value or 0
+
+
+# ==================================
+# 🧷 SESSION HOOKS
+# ==================================
+
+@event.listens_for(Session, "before_flush")
+def _mark_changed_books(session, flush_context, instances):
+    for obj in session.new:
+        if isinstance(obj, Book):
+            obj.change_seq = PENDING
+            session.info[_CHANGED_KEY] = True
+    for obj in session.dirty:
+        if isinstance(obj, Book) and session.is_modified(obj):
+            obj.change_seq = PENDING
+            session.info[_CHANGED_KEY] = True
+    if any(isinstance(obj, Book) for obj in session.deleted):
+        session.info[_RESET_KEY] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_bulk_writes(orm_execute_state):
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or not issubclass(mapper.class_, Book):
+        return
+    if orm_execute_state.is_update:
+        orm_execute_state.statement = orm_execute_state.statement.values(change_seq=PENDING)
+        orm_execute_state.session.info[_CHANGED_KEY] = True
+    elif orm_execute_state.is_delete:
+        orm_execute_state.session.info[_RESET_KEY] = True
+
+
+@event.listens_for(Session, "before_commit")
+def _assign_sequence(session):
+    # commit() apna flush is hook ke baad karta hai - pending books pehle flush karo
+    session.flush()
+    if not (session.info.get(_CHANGED_KEY) or session.info.get(_RESET_KEY)):
+        return
+    conn = session.connection()
+    seq = _next_value(conn, FEED)
+    if session.info.pop(_CHANGED_KEY, False):
+        conn.execute(update(_books).where(_books.c.change_seq == PENDING).values(change_seq=seq))
+    if session.info.pop(_RESET_KEY, False):
+        _set_value(conn, RESET_FEED, seq)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop(_CHANGED_KEY, None)
+    session.info.pop(_RESET_KEY, None)
+
+
+# ==================================
+# 📥 READ SIDE
+# ==================================
+
+def after_token(query, position: Optional[Tuple[int, int]]):
+    """(change_seq, id) > position, us hi order mein (ix_books_change_seq_id range scan)."""
+    if position is not None:
+        seq, last_id = position
+        query = query.filter(or_(Book.change_seq > seq, and_(Book.change_seq == seq, Book.id > last_id)))
+    return query.filter(Book.change_seq >= 0).order_by(Book.change_seq, Book.id)
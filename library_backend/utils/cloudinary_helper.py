@@ -1,18 +1,35 @@
-import cloudinary
-import cloudinary.uploader
+import asyncio
+import logging
 import os
 import shutil
-from dotenv import load_dotenv
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Optional
+
 from fastapi import UploadFile
 
-load_dotenv()
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_uploader():
+    """
+    Cloudinary SDK pehli upload par import + configure hota hai (import time par nahi).
+    """
+    import cloudinary
+    import cloudinary.uploader
 
-cloudinary.config( 
-  cloud_name = os.getenv("CLOUDINARY_CLOUD_NAME"), 
-  api_key = os.getenv("CLOUDINARY_API_KEY"), 
-  api_secret = os.getenv("CLOUDINARY_API_SECRET"),
-  secure = True
-)
+    settings = get_settings()
+    cloudinary.config(
+        cloud_name=settings.cloudinary_cloud_name,
+        api_key=settings.cloudinary_api_key,
+        api_secret=settings.cloudinary_api_secret,
+        secure=True
+    )
+    return cloudinary.uploader
 
 def upload_to_cloudinary(file: UploadFile, folder="library_uploads"):
     """
@@ -22,11 +39,11 @@ def upload_to_cloudinary(file: UploadFile, folder="library_uploads"):
     if not file:
         return None
     
-    # 1. Temporary filename
-    temp_filename = f"temp_{file.filename}"
-    
+    # 1. Temporary file (unique naam: parallel uploads same filename par takrayen nahi)
+    fd, temp_filename = tempfile.mkstemp(prefix="upload_", suffix=os.path.splitext(file.filename or "")[1])
+    os.close(fd)
+
     try:
-        print(f"🚀 PROCESSING: {file.filename}")
 
         # 2. Save to Disk (Safe buffering)
         with open(temp_filename, "wb") as buffer:
@@ -35,7 +52,6 @@ def upload_to_cloudinary(file: UploadFile, folder="library_uploads"):
         
         # 3. Check File Size
         file_size = os.path.getsize(temp_filename)
-        print(f"📊 Size: {file_size / (1024*1024):.2f} MB")
 
         # 4. Determine Resource Type (CRITICAL FIX)
         # Default is 'auto', BUT 'auto' treats PDFs as Images.
@@ -43,33 +59,99 @@ def upload_to_cloudinary(file: UploadFile, folder="library_uploads"):
         # So we MUST force 'raw' for any PDF or large file.
         res_type = "auto"
         
-        if file.filename.lower().endswith(".pdf"):
+        if (file.filename or "").lower().endswith(".pdf"):
              res_type = "raw"
-             print("📄 PDF Detected -> Forcing 'raw' mode.")
         
         elif file_size > 10000000: # If > 10MB
              res_type = "raw"
-             print("⚠️ Large File (>10MB) -> Forcing 'raw' mode to enable chunking.")
 
-        print(f"📤 UPLOADING CHUNKS (Mode: {res_type})...")
+        logger.info("Cloudinary upload started", extra={"upload_file": file.filename, "size_bytes": file_size,
+                                                        "resource_type": res_type})
 
         # 5. Upload Large (Chunked)
-        response = cloudinary.uploader.upload_large(
+        response = get_uploader().upload_large(
             temp_filename, 
             folder=folder,
             resource_type=res_type, # This must be 'raw' for chunking to work!
             chunk_size=5242880      # 5MB Chunks (Safe size)
         )
         
-        print("✅ UPLOAD SUCCESS")
+        logger.info("Cloudinary upload done", extra={"upload_file": file.filename})
         return response.get("secure_url")
 
-    except Exception as e:
-        print(f"❌ Cloudinary Upload Error: {e}")
+    except Exception:
+        logger.exception("Cloudinary upload error", extra={"upload_file": file.filename})
         return None
         
     finally:
         # Cleanup
         if os.path.exists(temp_filename):
             os.remove(temp_filename)
-            print("🧹 Temp file cleaned")
\ No newline at end of file
+
+
+# ==========================================================
+# ⚡ PARALLEL UPLOADS (bounded thread pool)
+# ==========================================================
+_upload_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_upload_pool() -> ThreadPoolExecutor:
+    global _upload_pool
+    if _upload_pool is None:
+        _upload_pool = ThreadPoolExecutor(
+            max_workers=get_settings().upload_concurrency, thread_name_prefix="cloudinary-upload"
+        )
+    return _upload_pool
+
+
+async def upload_many(files: Dict[str, UploadFile], folder="library_uploads") -> Dict[str, Optional[str]]:
+    """
+    Kai files ek saath upload (event loop block nahi hota, pool size se zyada
+    parallel nahi). {key: UploadFile} -> {key: secure_url ya None}.
+    """
+    loop = asyncio.get_running_loop()
+    keys = list(files)
+    urls = await asyncio.gather(*[
+        loop.run_in_executor(_get_upload_pool(), upload_to_cloudinary, files[key], folder)
+        for key in keys
+    ])
+    return dict(zip(keys, urls))
+
+
+def upload_derivative(path: str, public_id: str) -> Optional[str]:
+    """
+    Content-addressed derivative (e.g. cover WebP) ek fixed `public_id` par.
+    Wahi id pehle se ho to dobara upload nahi hoti (overwrite=False) - same
+    image ka URL hamesha same. Fail par None.
+    """
+    try:
+        response = get_uploader().upload(
+            path,
+            public_id=public_id,
+            resource_type="image",
+            overwrite=False,
+            unique_filename=False,
+        )
+        return response.get("secure_url")
+    except Exception:
+        logger.exception("Cloudinary derivative upload error", extra={"public_id": public_id})
+        return None
+
+
+async def upload_derivatives(paths: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """{public_id: local path} -> {public_id: secure_url ya None}, upload pool mein parallel."""
+    loop = asyncio.get_running_loop()
+    ids = list(paths)
+    urls = await asyncio.gather(*[
+        loop.run_in_executor(_get_upload_pool(), upload_derivative, paths[public_id], public_id)
+        for public_id in ids
+    ])
+    return dict(zip(ids, urls))
+
+
+def shutdown_upload_pool():
+    """Lifespan shutdown par threads band."""
+    global _upload_pool
+    if _upload_pool is not None:
+        _upload_pool.shutdown(wait=False)
+        _upload_pool = None
@@ -0,0 +1,372 @@
+# file: utils/content_index.py
+"""
+Digital book content indexing + search.
+
+Pipeline:
+    create/update book -> enqueue_book() (book_index_jobs row, same transaction)
+    ContentIndexer thread -> job claim (conditional UPDATE, multi-worker safe)
+        -> file disk par (utils/pdf_storage.fetch_local)
+        -> process pool mein `batch_pages` pages extract (utils/text_extraction)
+        -> book_pages insert + pages_done commit (har batch)
+
+Har batch alag commit hai, is liye 1000 page ki book kisi request ko block
+nahi karti, aur process restart ke baad `pages_done` se resume hoti hai.
+Search PostgreSQL par tsvector/GIN, SQLite par FTS5, baaki DBs par ILIKE.
+"""
+import html
+import logging
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import bindparam, insert, text, update, or_, and_
+from sqlalchemy.orm import Session
+
+import database
+from config import get_settings
+from models import book_model
+from models.book_content_model import BookPage, BookIndexJob
+from utils.pdf_storage import fetch_local
+from utils.text_extraction import EXTRACTORS
+
+logger = logging.getLogger(__name__)
+MAX_ATTEMPTS = 3
+LEASE_SECONDS = 300
+POLL_SECONDS = 30
+MARK_START, MARK_END = "[[[", "]]]"
+
+
+# ==============================================================================
+# ENQUEUE
+# ==============================================================================
+
+def content_source(book) -> tuple:
+    """txt (saaf text) ho to wahi, warna PDF."""
+    if book.txt_file_url:
+        return book.txt_file_url, "txt"
+    if book.pdf_url:
+        return book.pdf_url, "pdf"
+    return None, None
+
+
+def enqueue_book(db: Session, book, force: bool = False) -> Optional[BookIndexJob]:
+    """
+    Book ka indexing job queue karta hai (commit caller karta hai). Source same ho
+    aur `force` na ho to kuch nahi badalta, is liye har update par call karna safe hai.
+    """
+    source, kind = content_source(book)
+    job = db.get(BookIndexJob, book.id)
+
+    if job and not force and job.source_url == source and job.status != "failed":
+        return job
+
+    db.query(BookPage).filter(BookPage.book_id == book.id).delete(synchronize_session=False)
+    if not source:
+        if job:
+            db.delete(job)
+        return None
+
+    if job is None:
+        job = BookIndexJob(book_id=book.id)
+        db.add(job)
+    job.source_url, job.source_kind = source, kind
+    job.status, job.pages_done, job.total_pages = "queued", 0, None
+    job.attempts, job.error, job.lease_until = 0, None, None
+    job.updated_at = datetime.utcnow()
+    return job
+
+
+# ==============================================================================
+# BACKGROUND INDEXER
+# ==============================================================================
+
+class ContentIndexer:
+    def __init__(self, workers: int = 1, batch_pages: int = 20):
+        self.workers = workers
+        self.batch_pages = batch_pages
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+
+    # --- lifecycle ---
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="content-indexer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+        if self._pool:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def wake(self):
+        """Naya job aaya - poll interval ka intezar na karein."""
+        self._wake.set()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                worked = self.run_once()
+            except Exception:
+                logger.exception("Content indexer error")
+                worked = False
+            if not worked:
+                self._wake.wait(POLL_SECONDS)
+                self._wake.clear()
+
+    def run_until_idle(self) -> int:
+        """Queue khali hone tak jobs (scripts/index_books.py). Processed count return."""
+        count = 0
+        while self.run_once():
+            count += 1
+        return count
+
+    # --- one job ---
+    def run_once(self) -> bool:
+        book_id = self._claim()
+        if book_id is None:
+            return False
+        self._process(book_id)
+        return True
+
+    def _claim(self) -> Optional[int]:
+        now = datetime.utcnow()
+        claimable = or_(
+            BookIndexJob.status == "queued",
+            and_(BookIndexJob.status == "running", BookIndexJob.lease_until < now),
+        )
+        with database.SessionLocal() as db:
+            candidates = [row.book_id for row in db.query(BookIndexJob.book_id).filter(claimable)
+                          .order_by(BookIndexJob.updated_at).limit(10)]
+            for book_id in candidates:
+                # Conditional UPDATE: do workers ek hi job utha na sakein
+                claimed = db.execute(
+                    update(BookIndexJob)
+                    .where(BookIndexJob.book_id == book_id, claimable)
+                    .values(status="running", attempts=BookIndexJob.attempts + 1,
+                            lease_until=now + timedelta(seconds=LEASE_SECONDS), updated_at=now)
+                ).rowcount
+                db.commit()
+                if claimed:
+                    return book_id
+        return None
+
+    def _process(self, book_id: int):
+        with database.SessionLocal() as db:
+            job = db.get(BookIndexJob, book_id)
+            if job is None or job.status != "running":
+                return
+            source, kind, start = job.source_url, job.source_kind, job.pages_done
+            # Resume: pichhli adhoori batch ke pages (agar commit se pehle crash hua)
+            db.query(BookPage).filter(BookPage.book_id == book_id, BookPage.page_number > start) \
+                .delete(synchronize_session=False)
+            db.commit()
+
+        try:
+            while not self._stop.is_set():
+                path = fetch_local(source)
+                total, pages = self._get_pool().submit(
+                    EXTRACTORS[kind], str(path), start, start + self.batch_pages
+                ).result()
+                done = min(start + self.batch_pages, total)
+                if not self._save_batch(book_id, source, start, done, total, pages):
+                    return  # Job reset/changed (naya PDF) - ye run chhod do
+                start = done
+                if done >= total:
+                    return
+        except Exception as e:
+            logger.exception("Indexing failed", extra={"book_id": book_id})
+            with database.SessionLocal() as db:
+                job = db.get(BookIndexJob, book_id)
+                if job and job.source_url == source:
+                    job.status = "failed" if job.attempts >= MAX_ATTEMPTS else "queued"
+                    job.error = str(e)[:1000]
+                    job.lease_until = None
+                    job.updated_at = datetime.utcnow()
+                    db.commit()
+
+    def _save_batch(self, book_id, source, start, done, total, pages) -> bool:
+        now = datetime.utcnow()
+        with database.SessionLocal() as db:
+            # pages_done == start guard: beech mein job reset ho gaya to kuch save nahi
+            updated = db.execute(
+                update(BookIndexJob)
+                .where(BookIndexJob.book_id == book_id, BookIndexJob.status == "running",
+                       BookIndexJob.source_url == source, BookIndexJob.pages_done == start)
+                .values(pages_done=done, total_pages=total, updated_at=now,
+                        status="done" if done >= total else "running",
+                        lease_until=None if done >= total else now + timedelta(seconds=LEASE_SECONDS),
+                        error=None)
+            ).rowcount
+            if not updated:
+                db.rollback()
+                return False
+            if pages:
+                db.execute(insert(BookPage), [
+                    {"book_id": book_id, "page_number": number, "content": content}
+                    for number, content in pages
+                ])
+            db.commit()
+            return True
+
+
+_indexer: Optional[ContentIndexer] = None
+
+
+def get_content_indexer() -> ContentIndexer:
+    global _indexer
+    if _indexer is None:
+        settings = get_settings()
+        _indexer = ContentIndexer(settings.content_index_workers, settings.content_index_batch_pages)
+    return _indexer
+
+
+# ==============================================================================
+# SEARCH
+# ==============================================================================
+
+def _highlight(snippet: Optional[str]) -> str:
+    """DB snippet -> HTML-safe text, matches <mark> mein."""
+    escaped = html.escape(snippet or "")
+    return escaped.replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+def _fts5_query(q: str) -> str:
+    # User input ko FTS5 syntax (NEAR, *, ") se bachane ke liye har token quoted (AND)
+    return " ".join(f'"{token}"' for token in re.findall(r"\w+", q, re.UNICODE))
+
+
+def _plain_snippet(content: str, q: str, width: int = 80) -> str:
+    lowered, needle = content.lower(), q.lower()
+    at = lowered.find(needle)
+    if at < 0:
+        return content[:width * 2]
+    begin, end = max(at - width, 0), at + len(q) + width
+    return f"{content[begin:at]}{MARK_START}{content[at:at + len(q)]}{MARK_END}{content[at + len(q):end]}"
+
+
+def _access_clause(restricted_ids: Optional[set], include_unapproved: bool) -> tuple:
+    clauses, params = ["b.deleted_at IS NULL"], {}
+    if not include_unapproved:
+        clauses.append("b.is_approved = :approved")
+        params["approved"] = True
+    if restricted_ids is not None:
+        clauses.append("(b.is_restricted = :unrestricted OR b.id IN :allowed_ids)")
+        params["unrestricted"] = False
+        params["allowed_ids"] = sorted(restricted_ids)
+    return " AND ".join(clauses), params
+
+
+def _page_hits_sql(dialect: str, where: str) -> str:
+    """Matching pages: book_id, page_id, page_number, rank (+ snippet SQLite par)."""
+    if dialect == "postgresql":
+        return f"""
+            SELECT p.book_id, p.id AS page_id, p.page_number,
+                   ts_rank_cd(p.search_vector, query) AS rank
+            FROM book_pages p JOIN books b ON b.id = p.book_id,
+                 websearch_to_tsquery('simple', :q) AS query
+            WHERE p.search_vector @@ query AND {where}
+        """
+    # SQLite FTS5: snippet() sirf MATCH wali query mein chal sakta hai; bm25 chhota = behtar
+    return f"""
+        SELECT p.book_id, p.id AS page_id, p.page_number, -bm25(book_pages_fts) AS rank,
+               snippet(book_pages_fts, 0, '{MARK_START}', '{MARK_END}', '…', 24) AS snippet
+        FROM book_pages_fts JOIN book_pages p ON p.id = book_pages_fts.rowid
+             JOIN books b ON b.id = p.book_id
+        WHERE book_pages_fts MATCH :q AND {where}
+    """
+
+
+def _headline_sql(select_sql: str) -> str:
+    # ts_headline mehnga hai: sirf LIMIT ke baad wali rows par
+    return f"""
+        SELECT hits.*, ts_headline('simple', p.content, websearch_to_tsquery('simple', :q),
+               'StartSel="{MARK_START}", StopSel="{MARK_END}", MaxWords=35, MinWords=15, MaxFragments=2') AS snippet
+        FROM ({select_sql}) hits JOIN book_pages p ON p.id = hits.page_id
+        ORDER BY hits.rank DESC, hits.book_id, hits.page_number
+    """
+
+
+def _execute(db: Session, sql: str, params: dict):
+    statement = text(sql)
+    if "allowed_ids" in params:
+        statement = statement.bindparams(bindparam("allowed_ids", expanding=True))
+    return db.execute(statement, params).mappings().all()
+
+
+def search_book(db: Session, book_id: int, q: str, limit: int = 20, offset: int = 0) -> List[dict]:
+    """Ek book ke andar: matching pages, rank order mein, snippet ke saath."""
+    dialect = db.get_bind().dialect.name
+    params = {"q": q, "book_id": book_id, "limit": limit, "offset": offset}
+    where = "p.book_id = :book_id AND b.deleted_at IS NULL"
+
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "sqlite":
+            params["q"] = _fts5_query(q)
+            if not params["q"]:
+                return []
+        sql = _page_hits_sql(dialect, where) + " ORDER BY rank DESC, p.page_number LIMIT :limit OFFSET :offset"
+        rows = _execute(db, _headline_sql(sql) if dialect == "postgresql" else sql, params)
+    else:
+        pages = db.query(BookPage).filter(BookPage.book_id == book_id, BookPage.content.ilike(f"%{q}%")) \
+            .order_by(BookPage.page_number).offset(offset).limit(limit).all()
+        rows = [{"page_number": p.page_number, "rank": 1.0, "snippet": _plain_snippet(p.content, q)} for p in pages]
+
+    return [{"page_number": r["page_number"], "rank": float(r["rank"] or 0), "snippet": _highlight(r["snippet"])}
+            for r in rows]
+
+
+def search_corpus(db: Session, q: str, restricted_ids: Optional[set], include_unapproved: bool = False,
+                  limit: int = 20, offset: int = 0) -> List[dict]:
+    """
+    Saari (user ke liye readable) books: har book ka best page + matching pages count.
+    """
+    dialect = db.get_bind().dialect.name
+    where, params = _access_clause(restricted_ids, include_unapproved)
+    params.update({"q": q, "limit": limit, "offset": offset})
+
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "sqlite":
+            params["q"] = _fts5_query(q)
+            if not params["q"]:
+                return []
+        best = f"""
+            SELECT * FROM (
+                SELECT hits.*,
+                       row_number() OVER (PARTITION BY hits.book_id ORDER BY hits.rank DESC, hits.page_number) AS rn,
+                       count(*) OVER (PARTITION BY hits.book_id) AS matching_pages
+                FROM ({_page_hits_sql(dialect, where)}) hits
+            ) ranked WHERE rn = 1
+            ORDER BY rank DESC, book_id LIMIT :limit OFFSET :offset
+        """
+        rows = _execute(db, _headline_sql(best) if dialect == "postgresql" else best, params)
+    else:
+        rows = []
+
+    if not rows:
+        return []
+    books = {b.id: b for b in db.query(book_model.Book).filter(book_model.Book.id.in_([r["book_id"] for r in rows]))}
+    return [{
+        "book_id": r["book_id"],
+        "title": books[r["book_id"]].title,
+        "author": books[r["book_id"]].author,
+        "cover_image_url": books[r["book_id"]].cover_image_url,
+        "best_page": r["page_number"],
+        "matching_pages": r["matching_pages"],
+        "snippet": _highlight(r["snippet"]),
+        "rank": float(r["rank"] or 0),
+    } for r in rows if r["book_id"] in books]
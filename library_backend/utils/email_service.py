@@ -1,8 +1,11 @@
+import logging
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import os
 
+logger = logging.getLogger(__name__)
+
 # Aapki Env Settings (Hardcoded for now based on your message)
 SMTP_SERVER = "smtp.gmail.com"
 SMTP_PORT = 587
@@ -45,6 +48,6 @@ def send_otp_email(to_email: str, otp: str):
         server.quit()
         
         return True
-    except Exception as e:
-        print(f"Failed to send email: {str(e)}")
+    except Exception:
+        logger.exception("Failed to send email")
         return False
\ No newline at end of file
@@ -0,0 +1,215 @@
+# file: utils/events.py
+"""
+Real-time request status events (SSE: /api/events/stream).
+
+Flow:
+- Controller `notify(db, event)` apni transaction ke andar call karta hai.
+- Postgres: `pg_notify` usi transaction mein => commit par hi deliver hota
+  hai (rollback par kabhi nahi). Har worker ka listener thread `LISTEN`
+  karta hai aur event apne local subscribers tak pahunchata hai - is tarah
+  kisi bhi worker par hua approval har worker ke SSE clients ko milta hai.
+- SQLite / dev: event session.info mein rukta hai aur after_commit par
+  seedha local bus par dispatch hota hai (single worker).
+
+Event routing: `user_ids` (request ka owner) + `reviewers` (admins /
+REQUEST_* permission wale). Ye routing keys client ko nahi bheje jate.
+"""
+import asyncio
+import json
+import logging
+import select
+import threading
+from typing import List, Optional
+
+from sqlalchemy import event as sa_event, text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+CHANNEL = "kil_events"
+MAX_PAYLOAD_BYTES = 7900      # Postgres NOTIFY payload limit ~8000 bytes
+SUBSCRIBER_QUEUE_SIZE = 100   # Slow client: purane events drop, connection nahi
+_PENDING_KEY = "pending_events"
+ROUTING_KEYS = ("user_ids", "reviewers")
+
+
+def request_event(kind: str, action: str, request_id: int, status: Optional[str],
+                  book_id: Optional[int] = None, owner_id: Optional[int] = None) -> dict:
+    """e.g. request_event("access_request", "updated", 7, "approved", book_id=3, owner_id=12)"""
+    return {
+        "type": f"{kind}.{action}",
+        "request_id": request_id,
+        "book_id": book_id,
+        "status": status,
+        "user_ids": [owner_id] if owner_id else [],
+        "reviewers": True,
+    }
+
+
+def public_payload(event: dict) -> dict:
+    return {k: v for k, v in event.items() if k not in ROUTING_KEYS}
+
+
+# ==================================
+# 📡 LOCAL PUB/SUB (per worker)
+# ==================================
+
+class Subscription:
+    def __init__(self, user_id: int, is_reviewer: bool, loop: asyncio.AbstractEventLoop):
+        self.user_id = user_id
+        self.is_reviewer = is_reviewer
+        self.loop = loop
+        self.queue: asyncio.Queue = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+
+    def wants(self, event: dict) -> bool:
+        return self.user_id in event.get("user_ids", ()) or (self.is_reviewer and bool(event.get("reviewers")))
+
+    def offer(self, event: Optional[dict]):
+        """Event loop thread par chalta hai. None = stream band karo."""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+
+class EventBus:
+    def __init__(self):
+        self._subs = set()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    # --- subscribers (SSE connections) ---
+    def subscribe(self, user_id: int, is_reviewer: bool) -> Subscription:
+        sub = Subscription(user_id, is_reviewer, asyncio.get_running_loop())
+        with self._lock:
+            self._subs.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription):
+        with self._lock:
+            self._subs.discard(sub)
+
+    def subscriber_count(self) -> int:
+        return len(self._subs)
+
+    def dispatch(self, event: dict):
+        """Kisi bhi thread se safe: har matching subscriber ke loop par offer."""
+        with self._lock:
+            targets = [sub for sub in self._subs if sub.wants(event)]
+        for sub in targets:
+            try:
+                sub.loop.call_soon_threadsafe(sub.offer, event)
+            except RuntimeError:
+                self.unsubscribe(sub)  # Loop band ho chuka
+
+    # --- cross-worker fan-out (Postgres LISTEN) ---
+    def start(self):
+        import database
+
+        if self._thread and self._thread.is_alive():
+            return
+        if database.get_engine().dialect.name != "postgresql":
+            return  # SQLite: after_commit se local dispatch kaafi hai
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen, name="event-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+            self._thread = None
+        with self._lock:
+            subs = list(self._subs)
+        for sub in subs:
+            try:
+                sub.loop.call_soon_threadsafe(sub.offer, None)
+            except RuntimeError:
+                pass
+
+    def _listen(self):
+        import database
+
+        while not self._stop.is_set():
+            conn = None
+            try:
+                # Dedicated connection (pool se detach): LISTEN hamesha khula rehta hai.
+                # DBAPI connection detach se PEHLE lein - detach ke baad fairy ka
+                # driver_connection None ho jata hai.
+                raw = database.get_engine().raw_connection()
+                conn = raw.dbapi_connection
+                raw.detach()
+                conn.autocommit = True
+                conn.cursor().execute(f"LISTEN {CHANNEL}")
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], 5.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        note = conn.notifies.pop(0)
+                        try:
+                            self.dispatch(json.loads(note.payload))
+                        except ValueError:
+                            continue
+            except Exception:
+                logger.exception("Event listener error (retrying)")
+                self._stop.wait(5.0)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+_bus: Optional[EventBus] = None
+
+
+def get_event_bus() -> EventBus:
+    global _bus
+    if _bus is None:
+        _bus = EventBus()
+    return _bus
+
+
+# ==================================
+# 📤 PUBLISH (transaction ke saath)
+# ==================================
+
+def notify(db: Session, event: dict):
+    """Commit par deliver, rollback par discard. db.commit() se pehle call karein."""
+    notify_many(db, [event])
+
+
+def notify_many(db: Session, events: List[dict]):
+    """Batch actions: Postgres par saare events ek statement (unnest) mein."""
+    if not events:
+        return
+    if db.get_bind().dialect.name == "postgresql":
+        payloads = [json.dumps(e, separators=(",", ":"), default=str) for e in events]
+        payloads = [p for p in payloads if len(p.encode()) <= MAX_PAYLOAD_BYTES]
+        db.execute(
+            text("SELECT pg_notify(:channel, payload) FROM unnest(CAST(:payloads AS text[])) AS payload"),
+            {"channel": CHANNEL, "payloads": payloads},
+        )
+        return
+    db.info.setdefault(_PENDING_KEY, []).extend(events)
+
+
+@sa_event.listens_for(Session, "after_commit")
+def _dispatch_on_commit(session):
+    for event in session.info.pop(_PENDING_KEY, ()):
+        get_event_bus().dispatch(event)
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+
+
+def format_sse(event_type: str, data: dict, event_id: Optional[int] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    lines.append(f"data: {json.dumps(data, separators=(',', ':'), default=str)}")
+    return "\n".join(lines) + "\n\n"
@@ -1,5 +1,8 @@
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 def delete_static_file(file_path: str):
     """
     Deletes a file from the filesystem if it exists.
@@ -12,16 +15,16 @@ def delete_static_file(file_path: str):
         # (Depend karta hai aap DB me path kaise save kar rahe hain)
         if os.path.exists(file_path):
             os.remove(file_path)
-            print(f"File deleted successfully: {file_path}")
+            logger.info("File deleted", extra={"path": file_path})
         else:
             # Agar relative path hai (e.g., 'static/uploads/...')
             # to current directory se check karein
             full_path = os.path.abspath(file_path)
             if os.path.exists(full_path):
                 os.remove(full_path)
-                print(f"File deleted successfully: {full_path}")
+                logger.info("File deleted", extra={"path": full_path})
             else:
-                print(f"File not found for deletion: {file_path}")
+                logger.warning("File not found for deletion", extra={"path": file_path})
                 
-    except Exception as e:
-        print(f"Error deleting file {file_path}: {str(e)}")
\ No newline at end of file
+    except Exception:
+        logger.exception("Error deleting file", extra={"path": file_path})
\ No newline at end of file
@@ -0,0 +1,270 @@
+# file: utils/holds.py
+"""
+Book holds (reservation queue) - allocation aur expiry.
+
+Queue `book_holds` mein (book_id, created_at, id) order se hai. Copy free
+hote hi (return, cancel, expired pickup) usi transaction mein agle Waiting
+hold ko milti hai:
+
+    SELECT ... FROM book_holds WHERE book_id = :b AND status = 'Waiting'
+    ORDER BY created_at, id LIMIT 1 FOR UPDATE SKIP LOCKED
+
+SKIP LOCKED: do copies ek saath return hon to dono transactions alag holds
+lock karti hain - ek doosre ka intezar nahi, aur ek hold ko do copies nahi
+milti. Copy ka Status "On Hold" ho jata hai (issue desk sirf us member ko de
+sakta hai) aur member ko `hold.ready` event (utils/events) commit par jata hai.
+
+Har status change conditional UPDATE hai (`WHERE status = <purana>`): SQLite
+par FOR UPDATE nahi hota (aur session autoflush=False hai, yaani queue write
+lock se pehle padhi jati hai) - do returns ek hi hold na le sakein, haarne
+wala agla hold try karta hai. Postgres par ye SKIP LOCKED ke upar safety net.
+Expiry sweep (background thread / scripts/expire_holds.py) pickup deadline
+guzarne par hold Expire karke copy agle hold ko deta hai.
+"""
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import exists, func, select, update
+from sqlalchemy.orm import Session
+
+import database
+from config import get_settings
+from models.hold_model import (
+    BookHold, HOLD_CANCELLED, HOLD_EXPIRED, HOLD_FULFILLED, HOLD_READY, HOLD_WAITING,
+)
+from models.library_management_models import AVAILABLE_COPY_STATUSES, ON_HOLD_COPY_STATUS, BookCopy
+from utils.events import notify
+
+logger = logging.getLogger(__name__)
+SWEEP_BATCH_SIZE = 200
+
+
+def hold_event(action: str, hold: BookHold) -> dict:
+    """Sirf hold ke member ko (reviewers ko nahi)."""
+    return {
+        "type": f"hold.{action}",
+        "hold_id": hold.id,
+        "book_id": hold.book_id,
+        "copy_id": hold.copy_id,
+        "status": hold.status,
+        "expires_at": hold.expires_at,
+        "user_ids": [hold.user_id],
+        "reviewers": False,
+    }
+
+
+# ==================================
+# 📥 ALLOCATION
+# ==================================
+
+def _next_waiting_hold(db: Session, book_id: int) -> Optional[BookHold]:
+    return db.query(BookHold).filter(
+        BookHold.book_id == book_id,
+        BookHold.status == HOLD_WAITING,
+    ).order_by(BookHold.created_at, BookHold.id).with_for_update(skip_locked=True).first()
+
+
+def _lock_available_copy(db: Session, book_id: int) -> Optional[BookCopy]:
+    return db.query(BookCopy).filter(
+        BookCopy.book_id == book_id,
+        BookCopy.status.in_(AVAILABLE_COPY_STATUSES),
+        BookCopy.deleted_at.is_(None),
+    ).order_by(BookCopy.id).with_for_update(skip_locked=True).first()
+
+
+def _transition(db: Session, hold: BookHold, from_status: str, **values) -> bool:
+    """
+    `from_status` -> values, sirf agar hold abhi bhi `from_status` mein ho
+    (compare-and-set). False = kisi aur transaction ne pehle badal diya.
+    """
+    result = db.execute(
+        update(BookHold).where(BookHold.id == hold.id, BookHold.status == from_status)
+        .values(**values).execution_options(synchronize_session="evaluate")
+    )
+    if result.rowcount == 1:
+        return True
+    db.expire(hold)
+    return False
+
+
+def allocate_copy(db: Session, copy: BookCopy) -> Optional[BookHold]:
+    """
+    Free hui copy: agla Waiting hold ho to use Ready karo (copy "On Hold"),
+    warna copy Available. Caller ki transaction mein; commit caller karta hai.
+    """
+    while True:
+        hold = _next_waiting_hold(db, copy.book_id)
+        if hold is None:
+            if copy.status not in AVAILABLE_COPY_STATUSES:
+                copy.status = "Available"
+            return None
+
+        now = datetime.utcnow()
+        if _transition(db, hold, HOLD_WAITING, status=HOLD_READY, copy_id=copy.id, ready_at=now,
+                       expires_at=now + timedelta(days=get_settings().hold_pickup_days)):
+            break
+
+    copy.status = ON_HOLD_COPY_STATUS
+    notify(db, hold_event("ready", hold))
+    return hold
+
+
+def place_hold(db: Session, book_id: int, user_id: int) -> BookHold:
+    """
+    Naya Waiting hold. Shelf par copy pehle se free ho to queue ke head ko
+    (FIFO - zaroori nahi ke yahi hold) foran allocate.
+    """
+    hold = BookHold(book_id=book_id, user_id=user_id, status=HOLD_WAITING, created_at=datetime.utcnow())
+    db.add(hold)
+    db.flush()
+    copy = _lock_available_copy(db, book_id)
+    if copy is not None:
+        allocate_copy(db, copy)
+    return hold
+
+
+def claim_hold(db: Session, copy: BookCopy, client_id: int) -> Optional[BookHold]:
+    """Issue desk: "On Hold" copy sirf usi member ko - us ka Ready hold Fulfilled."""
+    hold = db.query(BookHold).filter(
+        BookHold.copy_id == copy.id,
+        BookHold.status == HOLD_READY,
+    ).with_for_update().first()
+    if hold is None or hold.user_id != client_id:
+        return None
+    if not _transition(db, hold, HOLD_READY, status=HOLD_FULFILLED, closed_at=datetime.utcnow()):
+        return None
+    return hold
+
+
+def close_hold(db: Session, hold: BookHold, status: str) -> Optional[BookHold]:
+    """
+    Cancel / expire. Ready hold ki copy agle hold ko (ya shelf par) jati hai.
+    Returns: copy jis naye hold ko mili (agar koi).
+    """
+    was_ready = hold.status == HOLD_READY
+    if not _transition(db, hold, hold.status, status=status, closed_at=datetime.utcnow()):
+        return None  # Isi dauran issue / cancel / expire ho chuka
+    notify(db, hold_event(status.lower(), hold))
+    if not was_ready or hold.copy_id is None:
+        return None
+    copy = db.query(BookCopy).filter(BookCopy.id == hold.copy_id).with_for_update().first()
+    if copy is None or copy.status != ON_HOLD_COPY_STATUS:
+        return None
+    return allocate_copy(db, copy)
+
+
+def cancel_hold(db: Session, hold: BookHold) -> Optional[BookHold]:
+    return close_hold(db, hold, HOLD_CANCELLED)
+
+
+def queue_positions(db: Session, holds: List[BookHold]) -> dict:
+    """
+    Waiting holds ka queue number (1 = agla), poore page ke liye ek query:
+    in books ki Waiting holds par row_number() (ix_book_holds_queue range scan).
+    """
+    waiting = [hold for hold in holds if hold.status == HOLD_WAITING]
+    if not waiting:
+        return {}
+    position = func.row_number().over(
+        partition_by=BookHold.book_id, order_by=(BookHold.created_at, BookHold.id)
+    ).label("position")
+    ranked = select(BookHold.id, position).where(
+        BookHold.book_id.in_({hold.book_id for hold in waiting}),
+        BookHold.status == HOLD_WAITING,
+    ).subquery()
+    rows = db.execute(
+        select(ranked.c.id, ranked.c.position).where(ranked.c.id.in_([hold.id for hold in waiting]))
+    )
+    return dict(rows.all())
+
+
+# ==================================
+# 🧹 EXPIRY SWEEP
+# ==================================
+
+def expire_ready_holds(db: Session, now: Optional[datetime] = None) -> int:
+    """Pickup deadline guzar chuki Ready holds => Expired, copy agle hold ko. Batch-wise commit."""
+    now = now or datetime.utcnow()
+    expired = 0
+    while True:
+        holds = db.query(BookHold).filter(
+            BookHold.status == HOLD_READY,
+            BookHold.expires_at < now,
+        ).order_by(BookHold.expires_at).limit(SWEEP_BATCH_SIZE).with_for_update(skip_locked=True).all()
+        if not holds:
+            return expired
+        for hold in holds:
+            close_hold(db, hold, HOLD_EXPIRED)
+        db.commit()
+        expired += len(holds)
+
+
+def reconcile_waiting(db: Session) -> int:
+    """
+    Waiting holds + shelf par free copy (e.g. hold aur return ek hi pal mein
+    commit hue, dono ne doosre ko nahi dekha): copies queue ko de do.
+    """
+    book_ids = [book_id for (book_id,) in db.query(BookHold.book_id).filter(
+        BookHold.status == HOLD_WAITING,
+        exists().where(
+            BookCopy.book_id == BookHold.book_id,
+            BookCopy.status.in_(AVAILABLE_COPY_STATUSES),
+            BookCopy.deleted_at.is_(None),
+        ),
+    ).distinct().limit(SWEEP_BATCH_SIZE)]
+
+    allocated = 0
+    for book_id in book_ids:
+        while True:
+            copy = _lock_available_copy(db, book_id)
+            if copy is None or allocate_copy(db, copy) is None:
+                break
+            allocated += 1
+        db.commit()
+    return allocated
+
+
+def sweep(db: Session) -> dict:
+    return {"expired": expire_ready_holds(db), "allocated": reconcile_waiting(db)}
+
+
+class HoldSweeper:
+    """Background thread: har `interval` seconds mein expiry sweep. Kai workers safe (SKIP LOCKED)."""
+
+    def __init__(self, interval: float = 300.0):
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="hold-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                with database.SessionLocal() as db:
+                    sweep(db)
+            except Exception:
+                logger.exception("Hold sweeper error")
+            self._stop.wait(self.interval)
+
+
+_sweeper: Optional[HoldSweeper] = None
+
+
+def get_hold_sweeper() -> HoldSweeper:
+    global _sweeper
+    if _sweeper is None:
+        _sweeper = HoldSweeper(get_settings().hold_sweep_interval_seconds)
+    return _sweeper
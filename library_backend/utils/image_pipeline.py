@@ -0,0 +1,248 @@
+# file: utils/image_pipeline.py
+"""
+Cover image derivative pipeline.
+
+Upload par original cover se responsive sizes (thumb / card / detail) WebP
+(aur AVIF agar Pillow build support kare) mein banti hain, saath ek blurhash
+placeholder. CPU-heavy kaam ProcessPoolExecutor mein hota hai taake event loop
+block na ho.
+
+Derivatives usi durable backend (Cloudinary) par jate hain jahan original:
+public_id `booknest/covers/variants/<sha256[:16]>/<size>_<fmt>`. Deploy par
+persistent disk nahi hai aur kai workers hain - local file ka URL DB mein
+rakha to redeploy ke baad 404. Local <cache_state_dir>/covers/<hash>/ sirf
+processing cache hai (same image dobara encode nahi hoti) - /static ke bahar,
+is liye HTTP par serve nahi hota. Same image = same public_id =
+same URL, aur koi variant upload na ho sake to kuch persist nahi hota
+(frontend original cover use karta hai).
+"""
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from fastapi import UploadFile
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+
+# name -> max width (px). Catalog grid card, list thumbnail, detail page.
+SIZES = {"thumb": 160, "card": 360, "detail": 900}
+WEBP_QUALITY = 80
+AVIF_QUALITY = 55
+BLURHASH_COMPONENTS = (4, 3)
+MANIFEST = "manifest.json"
+VARIANTS_FOLDER = "booknest/covers/variants"
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def covers_dir() -> Path:
+    # Sirf pipeline ka cache (public URL Cloudinary ka); process_cover folder khud banata hai
+    return get_settings().cache_state_dir / "covers"
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=get_settings().image_workers)
+    return _pool
+
+
+def shutdown_pool():
+    """Lifespan shutdown par workers band karein."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+# ==============================================================================
+# BLURHASH (https://blurha.sh algorithm, chhoti image par pure-Python)
+# ==============================================================================
+_BASE83 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~"
+
+
+def _encode83(value: int, length: int) -> str:
+    result = ""
+    for i in range(1, length + 1):
+        digit = (value // (83 ** (length - i))) % 83
+        result += _BASE83[digit]
+    return result
+
+
+def _srgb_to_linear(value: int) -> float:
+    v = value / 255.0
+    return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value: float) -> int:
+    v = max(0.0, min(1.0, value))
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * (v ** (1 / 2.4)) - 0.055) * 255 + 0.5)
+
+
+def _sign_pow(value: float, exp: float) -> float:
+    return math.copysign(abs(value) ** exp, value)
+
+
+def blurhash_encode(pixels, width: int, height: int, x_components: int = 4, y_components: int = 3) -> str:
+    """`pixels`: row-major list of (r, g, b) tuples."""
+    linear = [tuple(_srgb_to_linear(c) for c in px) for px in pixels]
+    factors = []
+    for j in range(y_components):
+        for i in range(x_components):
+            normalisation = 1 if i == 0 and j == 0 else 2
+            r = g = b = 0.0
+            for y in range(height):
+                basis_y = math.cos(math.pi * j * y / height)
+                row = y * width
+                for x in range(width):
+                    basis = normalisation * math.cos(math.pi * i * x / width) * basis_y
+                    pr, pg, pb = linear[row + x]
+                    r += basis * pr
+                    g += basis * pg
+                    b += basis * pb
+            scale = 1.0 / (width * height)
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    result = _encode83((x_components - 1) + (y_components - 1) * 9, 1)
+
+    if ac:
+        actual_max = max(abs(c) for factor in ac for c in factor)
+        quantised_max = max(0, min(82, int(actual_max * 166 - 0.5)))
+        maximum = (quantised_max + 1) / 166
+        result += _encode83(quantised_max, 1)
+    else:
+        maximum = 1.0
+        result += _encode83(0, 1)
+
+    result += _encode83(
+        (_linear_to_srgb(dc[0]) << 16) + (_linear_to_srgb(dc[1]) << 8) + _linear_to_srgb(dc[2]), 4
+    )
+    for factor in ac:
+        quant = [max(0, min(18, int(math.floor(_sign_pow(c / maximum, 0.5) * 9 + 9.5)))) for c in factor]
+        result += _encode83(quant[0] * 19 * 19 + quant[1] * 19 + quant[2], 2)
+    return result
+
+
+# ==============================================================================
+# WORKER (process pool ke andar chalta hai)
+# ==============================================================================
+
+def _atomic_write(path: Path, data: bytes):
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def process_cover(data: bytes, target_root: str) -> dict:
+    """
+    Original bytes -> derivatives on disk (local cache). Manifest mein variant
+    ki file ka naam hota hai, URL nahi (pehle se bana ho to disk se hi).
+    """
+    from PIL import Image, ImageOps, features
+
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    target = Path(target_root) / digest
+    manifest_path = target / MANIFEST
+    if manifest_path.exists():
+        return json.loads(manifest_path.read_text())
+
+    target.mkdir(parents=True, exist_ok=True)
+    image = ImageOps.exif_transpose(Image.open(io.BytesIO(data)))
+    image = image.convert("RGB")
+    formats = ["webp"] + (["avif"] if features.check("avif") else [])
+
+    variants = {}
+    for name, max_width in SIZES.items():
+        resized = image.copy()
+        # Chhoti image ko upscale nahi karte
+        resized.thumbnail((max_width, max_width * 3), Image.LANCZOS)
+        variants[name] = {"width": resized.width, "height": resized.height}
+        for fmt in formats:
+            buf = io.BytesIO()
+            if fmt == "webp":
+                resized.save(buf, "WEBP", quality=WEBP_QUALITY, method=6)
+            else:
+                resized.save(buf, "AVIF", quality=AVIF_QUALITY)
+            _atomic_write(target / f"{name}.{fmt}", buf.getvalue())
+            variants[name][fmt] = f"{name}.{fmt}"
+
+    tiny = image.copy()
+    tiny.thumbnail((32, 32))
+    blurhash = blurhash_encode(list(tiny.getdata()), tiny.width, tiny.height, *BLURHASH_COMPONENTS)
+
+    manifest = {
+        "hash": digest,
+        "width": image.width,
+        "height": image.height,
+        "blurhash": blurhash,
+        "variants": variants,
+    }
+    _atomic_write(manifest_path, json.dumps(manifest).encode())
+    return manifest
+
+
+# ==============================================================================
+# ASYNC API (controllers yahi call karte hain)
+# ==============================================================================
+
+async def _store_variants(manifest: dict) -> Optional[dict]:
+    """Local derivatives -> Cloudinary; manifest ki file names durable URLs se badal jate hain."""
+    from utils.cloudinary_helper import upload_derivatives
+
+    digest = manifest["hash"]
+    paths, slots = {}, []
+    for name, variant in manifest["variants"].items():
+        for fmt in ("webp", "avif"):
+            if fmt in variant:
+                # Purane cache manifests mein "/static/covers/<hash>/<file>" tha - naam wahi
+                public_id = f"{VARIANTS_FOLDER}/{digest}/{name}_{fmt}"
+                paths[public_id] = str(covers_dir() / digest / Path(variant[fmt]).name)
+                slots.append((name, fmt, public_id))
+
+    urls = await upload_derivatives(paths)
+    if not all(urls.values()):
+        logger.warning("Cover variants not stored, using original only", extra={"hash": digest})
+        return None
+    variants = {name: dict(variant) for name, variant in manifest["variants"].items()}
+    for name, fmt, public_id in slots:
+        variants[name][fmt] = urls[public_id]
+    return dict(manifest, variants=variants)
+
+
+async def generate_cover_variants(file: UploadFile) -> Optional[dict]:
+    """
+    UploadFile se derivatives banata hai aur Cloudinary par rakhta hai. Pipeline
+    ya upload fail ho (Pillow missing, corrupt image, Cloudinary down) to None -
+    upload khud fail nahi hota, bas original use hota hai.
+    """
+    if not file:
+        return None
+    try:
+        file.file.seek(0)
+        data = file.file.read()
+        file.file.seek(0)  # Cloudinary upload ke liye wapas shuru par
+        loop = asyncio.get_running_loop()
+        manifest = await loop.run_in_executor(_get_pool(), process_cover, data, str(covers_dir()))
+        return await _store_variants(manifest)
+    except Exception:
+        logger.exception("Cover pipeline error")
+        return None
+
+
+def variants_columns(manifest: Optional[dict]) -> dict:
+    """Manifest -> Book model columns (cover_variants JSON text, cover_blurhash)."""
+    if not manifest:
+        return {}
+    return {"cover_variants": json.dumps(manifest["variants"]), "cover_blurhash": manifest["blurhash"]}
@@ -1,3 +1,6 @@
+import logging
+
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from datetime import datetime
 
@@ -6,6 +9,9 @@ from datetime import datetime
 # Warna: from models.log_model import Log
 from models import log_model 
 
+# Audit log (DB) se alag: application log (utils/app_logging)
+_logger = logging.getLogger(__name__)
+
 def create_log(db: Session, user, action_type: str, description: str, target_type: str = None, target_id: int = None):
     """
     Database mein audit log entry create karta hai.
@@ -22,5 +28,25 @@ def create_log(db: Session, user, action_type: str, description: str, target_typ
         db.add(new_log)
         db.flush() # ID generate karne ke liye, lekin commit main controller karega
         # Note: Hum yahan db.commit() nahi kar rahe taake main transaction ke sath hi save ho
-    except Exception as e:
-        print(f"Failed to create log: {str(e)}")
\ No newline at end of file
+    except Exception:
+        _logger.exception("Failed to create audit log", extra={"action_type": action_type})
+
+def create_logs_bulk(db: Session, user, entries):
+    """
+    Batch actions ke liye: entries = [(action_type, description, target_type, target_id), ...]
+    Ek executemany INSERT (har row par flush nahi). Commit caller karega.
+    """
+    if not entries:
+        return
+    now = datetime.utcnow()
+    db.execute(insert(log_model.Log), [
+        {
+            "user_id": user.id if user else None,
+            "action_type": action_type,
+            "description": description,
+            "target_type": target_type,
+            "target_id": target_id,
+            "timestamp": now,
+        }
+        for action_type, description, target_type, target_id in entries
+    ])
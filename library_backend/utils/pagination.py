@@ -0,0 +1,60 @@
+# file: utils/pagination.py
+"""
+Opaque cursor helpers for keyset pagination.
+
+Cursor = base64url(JSON list of sort-key values), e.g. (created_at, id).
+Client ke liye ye sirf ek string hai jo `X-Next-Cursor` header mein aati hai.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    raise TypeError(f"Unsupported cursor value: {value!r}")
+
+
+def _object_hook(obj):
+    if set(obj) == {"dt"}:
+        return datetime.fromisoformat(obj["dt"])
+    return obj
+
+
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps(list(values), default=_default, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Galat / tampered cursor => 400 (500 nahi)."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()), object_hook=_object_hook)
+        if not isinstance(values, list) or len(values) != size:
+            raise ValueError(cursor)
+        return values
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor.")
+
+
+def keyset_page(query, sort_col, id_col, cursor: Optional[str], limit: int) -> Tuple[list, Optional[str]]:
+    """
+    Newest-first (sort_col desc, id desc) keyset page: OFFSET nahi, is liye
+    page 1 aur page 1000 ki cost barabar. Returns (rows, next_cursor).
+    """
+    if cursor:
+        value, last_id = decode_cursor(cursor, 2)
+        query = query.filter(or_(sort_col < value, and_(sort_col == value, id_col < last_id)))
+    rows = query.order_by(sort_col.desc(), id_col.desc()).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    last = rows[limit - 1]
+    return rows[:limit], encode_cursor(getattr(last, sort_col.key), getattr(last, id_col.key))
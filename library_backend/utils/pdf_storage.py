@@ -0,0 +1,311 @@
+# file: utils/pdf_storage.py
+"""
+PDF storage backends + on-disk LRU cache for the streaming proxy.
+
+- `HttpPdfStorage`: Supabase/Cloudinary public URLs. Range request upstream
+  ko forward hoti hai, is liye pehla page poori file aane ka intezar nahi karta.
+- `LocalPdfStorage`: static_dir ke andar relative paths (local uploads, tests).
+- `PdfDiskCache`: hot (remote) PDFs background mein disk par aa jati hain;
+  uske baad ranges seedha disk se. Size cap cross ho to sabse purani
+  (least recently used, mtime se) files delete.
+
+Naya backend: `register_backend(scheme, factory)`.
+"""
+import hashlib
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from config import get_settings
+
+logger = logging.getLogger(__name__)
+CHUNK_SIZE = 64 * 1024
+HTTP_TIMEOUT = (5, 30)  # (connect, read) seconds
+SIZE_TTL_SECONDS = 300
+TOUCH_INTERVAL_SECONDS = 60
+
+
+class PdfNotFound(Exception):
+    pass
+
+
+# ==============================================================================
+# BACKENDS
+# ==============================================================================
+
+class LocalPdfStorage:
+    """static_dir ke andar ki files. Cache ki zaroorat nahi (pehle se disk par)."""
+
+    cacheable = False
+
+    def __init__(self, root: Path):
+        self.root = Path(root).resolve()
+
+    def local_path(self, key: str) -> Path:
+        clean = key.replace("\\", "/").lstrip("/")
+        if clean.startswith("static/"):
+            clean = clean[len("static/"):]
+        path = (self.root / clean).resolve()
+        # Path traversal (../../etc/passwd) block
+        if self.root not in path.parents or not path.is_file():
+            raise PdfNotFound(key)
+        return path
+
+    def size(self, key: str) -> int:
+        return self.local_path(key).stat().st_size
+
+    def iter_range(self, key: str, start: int, end: int) -> Iterator[bytes]:
+        return iter_file_range(self.local_path(key), start, end)
+
+    def download(self, key: str, dest: Path):
+        shutil.copyfile(self.local_path(key), dest)
+
+
+class HttpPdfStorage:
+    """Public HTTP(S) object storage (Supabase / Cloudinary)."""
+
+    cacheable = True
+
+    def __init__(self):
+        self._session = None
+        self._sizes: Dict[str, Tuple[int, float]] = {}
+
+    @property
+    def session(self):
+        if self._session is None:
+            import requests  # pehli PDF request par (import time nahi)
+            self._session = requests.Session()
+        return self._session
+
+    def size(self, key: str) -> int:
+        cached = self._sizes.get(key)
+        if cached and cached[1] > time.time():
+            return cached[0]
+
+        # bytes=0-0 ka Content-Range ("bytes 0-0/12345") HEAD se zyada reliable hai
+        response = self.session.get(key, headers={"Range": "bytes=0-0"}, timeout=HTTP_TIMEOUT, stream=True)
+        try:
+            if response.status_code == 404:
+                raise PdfNotFound(key)
+            response.raise_for_status()
+            content_range = response.headers.get("Content-Range", "")
+            if response.status_code == 206 and "/" in content_range:
+                size = int(content_range.rsplit("/", 1)[1])
+            else:
+                size = int(response.headers["Content-Length"])
+        finally:
+            response.close()
+
+        self._sizes[key] = (size, time.time() + SIZE_TTL_SECONDS)
+        return size
+
+    def iter_range(self, key: str, start: int, end: int) -> Iterator[bytes]:
+        response = self.session.get(
+            key, headers={"Range": f"bytes={start}-{end}"}, timeout=HTTP_TIMEOUT, stream=True
+        )
+        try:
+            response.raise_for_status()
+            # Upstream ne Range ignore kar ke 200 diya => shuru ke bytes skip
+            skip = start if response.status_code == 200 else 0
+            remaining = end - start + 1
+            for chunk in response.iter_content(CHUNK_SIZE):
+                if skip:
+                    if len(chunk) <= skip:
+                        skip -= len(chunk)
+                        continue
+                    chunk, skip = chunk[skip:], 0
+                if len(chunk) >= remaining:
+                    yield chunk[:remaining]
+                    return
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            response.close()
+
+    def download(self, key: str, dest: Path):
+        with self.session.get(key, timeout=HTTP_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            with open(dest, "wb") as f:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    f.write(chunk)
+
+
+_BACKEND_FACTORIES: Dict[str, Callable[[], object]] = {}
+
+
+def register_backend(scheme: str, factory: Callable[[], object]):
+    """e.g. register_backend("s3", lambda: S3PdfStorage(...)) - "s3://..." URLs ke liye."""
+    _BACKEND_FACTORIES[scheme] = factory
+    _backend.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def _backend(scheme: str):
+    if scheme in _BACKEND_FACTORIES:
+        return _BACKEND_FACTORIES[scheme]()
+    if scheme in ("http", "https"):
+        return HttpPdfStorage()
+    return LocalPdfStorage(get_settings().static_dir)
+
+
+def backend_for(location: str):
+    """pdf_url -> backend. 'https://...' remote, baaki static_dir relative path."""
+    scheme = location.split("://", 1)[0].lower() if "://" in location else ""
+    return _backend(scheme)
+
+
+# ==============================================================================
+# DISK LRU CACHE
+# ==============================================================================
+
+def iter_file_range(path: Path, start: int, end: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+class PdfDiskCache:
+    """
+    Size-capped LRU. Recency = file mtime (hit par touch, max har 60s mein ek
+    baar), is liye restart ke baad bhi order yaad rehta hai aur sab workers
+    ek hi folder share kar sakte hain (writes atomic rename se).
+    """
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._filling = set()
+        self._lock = threading.Lock()
+
+    def path_for(self, key: str) -> Path:
+        return self.root / f"{hashlib.sha256(key.encode()).hexdigest()[:32]}.pdf"
+
+    def get(self, key: str) -> Optional[Path]:
+        path = self.path_for(key)
+        try:
+            mtime = path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if time.time() - mtime > TOUCH_INTERVAL_SECONDS:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+        return path
+
+    def fill_async(self, backend, key: str):
+        """Background thread mein poori file download (ek key ek hi baar)."""
+        with self._lock:
+            if key in self._filling:
+                return
+            self._filling.add(key)
+        threading.Thread(target=self._fill, args=(backend, key), daemon=True).start()
+
+    def _fill(self, backend, key: str):
+        try:
+            self.fill(backend, key)
+        except Exception:
+            logger.exception("PDF cache fill failed", extra={"key": key})
+        finally:
+            with self._lock:
+                self._filling.discard(key)
+
+    def fill(self, backend, key: str) -> Path:
+        """Poori file download (atomic rename), phir size cap enforce."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".part")
+        os.close(fd)
+        try:
+            backend.download(key, Path(tmp))
+            os.replace(tmp, self.path_for(key))
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        self.evict()
+        return self.path_for(key)
+
+    def evict(self):
+        entries = []
+        for path in self.root.glob("*.pdf"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except FileNotFoundError:
+                pass
+
+
+@lru_cache(maxsize=1)
+def get_pdf_cache() -> PdfDiskCache:
+    settings = get_settings()
+    return PdfDiskCache(settings.pdf_cache_dir, settings.pdf_cache_max_mb * 1024 * 1024)
+
+
+def fetch_local(location: str) -> Path:
+    """
+    Kisi bhi backend ki file ka local disk path (remote ho to cache mein la kar).
+    Background jobs (text extraction) isi se file padhte hain.
+    """
+    backend = backend_for(location)
+    if not backend.cacheable:
+        return backend.local_path(location)
+    cache = get_pdf_cache()
+    return cache.get(location) or cache.fill(backend, location)
+
+
+# ==============================================================================
+# LINEARIZATION (upload time)
+# ==============================================================================
+
+def linearize_pdf(data: bytes) -> bytes:
+    """
+    `qpdf --linearize` ("fast web view"): pehle page ke objects file ke shuru
+    mein, taake viewer chand range requests mein page 1 dikha de.
+    qpdf na ho, setting off ho ya fail ho to original bytes.
+    """
+    qpdf = shutil.which("qpdf")
+    if not qpdf or not get_settings().pdf_linearize or not data:
+        return data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src, dst = Path(tmp) / "in.pdf", Path(tmp) / "out.pdf"
+        src.write_bytes(data)
+        proc = subprocess.run([qpdf, "--linearize", str(src), str(dst)], capture_output=True, timeout=120)
+        # qpdf exit code 3 = warnings ke saath kamyab
+        if proc.returncode not in (0, 3) or not dst.exists():
+            logger.warning("qpdf linearize failed", extra={"stderr": proc.stderr[-300:].decode(errors="replace")})
+            return data
+        return dst.read_bytes()
+
+
+def linearize_upload(file) -> None:
+    """UploadFile ki content ko in-place linearized version se badalta hai."""
+    file.file.seek(0)
+    original = file.file.read()
+    linearized = linearize_pdf(original)
+    file.file.seek(0)
+    if linearized is not original:
+        file.file.truncate(0)
+        file.file.write(linearized)
+        file.file.seek(0)
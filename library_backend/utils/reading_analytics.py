@@ -0,0 +1,250 @@
+# file: utils/reading_analytics.py
+"""
+Reading analytics: digital_access events -> hourly/daily rollups.
+
+Aggregator `analytics_watermarks.last_event_id` ke baad wale events id order
+mein batches mein padhta hai, unhe (hour/day, book) aur (hour/day, user)
+buckets mein gin kar rollup tables mein UPSERT (count + naya count) karta hai,
+aur watermark usi transaction mein aage badhata hai - crash par na koi event
+do baar gina jata hai na chhoot'ta hai.
+
+Sirf `SETTLE_SECONDS` se purane events liye jate hain, taake abhi commit ho
+rahi (chhoti id wali) transactions watermark ke peeche na reh jayen.
+"""
+import logging
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+import database
+from config import get_settings
+from models.library_management_models import DigitalAccess
+from models.reading_analytics_model import BookAccessRollup, UserAccessRollup, AnalyticsWatermark
+
+logger = logging.getLogger(__name__)
+WATERMARK = "digital_access"
+BATCH_SIZE = 5000
+SETTLE_SECONDS = 5
+UPSERT_CHUNK = 200  # SQLite bind-parameter limit ke andar
+GRANULARITIES = ("hour", "day")
+
+
+def bucket_start(ts: datetime, granularity: str) -> datetime:
+    ts = ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0) if granularity == "day" else ts
+
+
+# ==============================================================================
+# AGGREGATION
+# ==============================================================================
+
+def _upsert(db: Session, model, keys: tuple, rows: list):
+    """INSERT ... ON CONFLICT DO UPDATE SET count = count + excluded.count"""
+    if not rows:
+        return
+    counters = [c for c in rows[0] if c not in keys]
+    dialect = db.get_bind().dialect.name
+
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+        table = model.__table__
+        for i in range(0, len(rows), UPSERT_CHUNK):
+            stmt = insert(table).values(rows[i:i + UPSERT_CHUNK])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(keys),
+                set_={c: table.c[c] + stmt.excluded[c] for c in counters},
+            )
+            db.execute(stmt)
+        return
+
+    # Generic fallback (dusre DBs): row-by-row merge
+    for row in rows:
+        existing = db.get(model, tuple(row[k] for k in keys))
+        if existing:
+            for c in counters:
+                setattr(existing, c, getattr(existing, c) + row[c])
+        else:
+            db.add(model(**row))
+
+
+def aggregate_once(db: Session) -> int:
+    """Ek batch process karta hai. Kitne events roll up hue, wo return."""
+    watermark = db.query(AnalyticsWatermark).filter(
+        AnalyticsWatermark.name == WATERMARK
+    ).with_for_update().first()  # Postgres: dusre workers yahin wait karte hain
+    if watermark is None:
+        watermark = AnalyticsWatermark(name=WATERMARK, last_event_id=0)
+        db.add(watermark)
+        try:
+            db.flush()
+        except IntegrityError:
+            db.rollback()  # Kisi aur worker ne abhi banaya
+            return 0
+
+    cutoff = datetime.utcnow() - timedelta(seconds=SETTLE_SECONDS)
+    events = db.query(
+        DigitalAccess.id, DigitalAccess.client_id, DigitalAccess.book_id,
+        DigitalAccess.access_granted, DigitalAccess.access_timestamp
+    ).filter(DigitalAccess.id > watermark.last_event_id).order_by(DigitalAccess.id).limit(BATCH_SIZE).all()
+
+    # Id order mein pehla "abhi-abhi" wala event aate hi ruk jao (prefix contiguous rahe)
+    batch = []
+    for event in events:
+        if event.access_timestamp > cutoff:
+            break
+        batch.append(event)
+    if not batch:
+        db.rollback()
+        return 0
+
+    book_counts, book_denied, user_counts = Counter(), Counter(), Counter()
+    for event in batch:
+        for granularity in GRANULARITIES:
+            start = bucket_start(event.access_timestamp, granularity)
+            book_counts[(granularity, start, event.book_id)] += 1
+            if event.access_granted is False:
+                book_denied[(granularity, start, event.book_id)] += 1
+            user_counts[(granularity, start, event.client_id)] += 1
+
+    _upsert(db, BookAccessRollup, ("granularity", "bucket_start", "book_id"), [
+        {"granularity": g, "bucket_start": s, "book_id": b, "access_count": n, "denied_count": book_denied[(g, s, b)]}
+        for (g, s, b), n in book_counts.items()
+    ])
+    _upsert(db, UserAccessRollup, ("granularity", "bucket_start", "user_id"), [
+        {"granularity": g, "bucket_start": s, "user_id": u, "access_count": n}
+        for (g, s, u), n in user_counts.items()
+    ])
+
+    watermark.last_event_id = batch[-1].id
+    watermark.updated_at = datetime.utcnow()
+    db.commit()
+    return len(batch)
+
+
+def catch_up(db: Session) -> int:
+    """Backlog khatam hone tak batches (rebuild / scripts)."""
+    total = 0
+    while True:
+        processed = aggregate_once(db)
+        total += processed
+        if processed < BATCH_SIZE:
+            return total
+
+
+def rebuild(db: Session) -> int:
+    """Rollups shuru se dobara (rollup logic badalne par)."""
+    db.query(BookAccessRollup).delete(synchronize_session=False)
+    db.query(UserAccessRollup).delete(synchronize_session=False)
+    db.query(AnalyticsWatermark).filter(AnalyticsWatermark.name == WATERMARK).delete(synchronize_session=False)
+    db.commit()
+    return catch_up(db)
+
+
+class AnalyticsAggregator:
+    """Background thread: har `interval` seconds mein backlog roll up karta hai."""
+
+    def __init__(self, interval: float = 60.0):
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="analytics-aggregator", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                with database.SessionLocal() as db:
+                    catch_up(db)
+            except Exception:
+                logger.exception("Analytics aggregator error")
+            self._stop.wait(self.interval)
+
+
+_aggregator: Optional[AnalyticsAggregator] = None
+
+
+def get_aggregator() -> AnalyticsAggregator:
+    global _aggregator
+    if _aggregator is None:
+        _aggregator = AnalyticsAggregator(get_settings().analytics_interval_seconds)
+    return _aggregator
+
+
+# ==============================================================================
+# QUERIES (sirf rollups)
+# ==============================================================================
+
+def window(days: int) -> tuple:
+    """<= 2 din: hourly rollups (exact window), warna daily."""
+    now = datetime.utcnow()
+    if days <= 2:
+        return "hour", bucket_start(now - timedelta(days=days), "hour")
+    return "day", bucket_start(now - timedelta(days=days), "day")
+
+
+def as_of(db: Session) -> Optional[datetime]:
+    watermark = db.get(AnalyticsWatermark, WATERMARK)
+    return watermark.updated_at if watermark else None
+
+
+def top_books(db: Session, days: int, limit: int) -> dict:
+    granularity, since = window(days)
+    rows = db.query(
+        BookAccessRollup.book_id,
+        func.sum(BookAccessRollup.access_count).label("accesses"),
+        func.sum(BookAccessRollup.denied_count).label("denied"),
+    ).filter(
+        BookAccessRollup.granularity == granularity,
+        BookAccessRollup.bucket_start >= since,
+    ).group_by(BookAccessRollup.book_id).order_by(func.sum(BookAccessRollup.access_count).desc()).limit(limit).all()
+    return {"granularity": granularity, "since": since, "rows": rows}
+
+
+def active_readers(db: Session, days: int, limit: int) -> dict:
+    granularity, since = window(days)
+    base = db.query(UserAccessRollup).filter(
+        UserAccessRollup.granularity == granularity,
+        UserAccessRollup.bucket_start >= since,
+    )
+    count = base.with_entities(func.count(func.distinct(UserAccessRollup.user_id))).scalar() or 0
+    rows = base.with_entities(
+        UserAccessRollup.user_id,
+        func.sum(UserAccessRollup.access_count).label("accesses"),
+    ).group_by(UserAccessRollup.user_id).order_by(func.sum(UserAccessRollup.access_count).desc()).limit(limit).all()
+    return {"granularity": granularity, "since": since, "active_readers": count, "rows": rows}
+
+
+def trends(db: Session, days: int, granularity: Optional[str] = None, book_id: Optional[int] = None) -> dict:
+    default_granularity, since = window(days)
+    granularity = granularity or default_granularity
+    since = bucket_start(since, granularity)
+    query = db.query(
+        BookAccessRollup.bucket_start,
+        func.sum(BookAccessRollup.access_count).label("accesses"),
+        func.sum(BookAccessRollup.denied_count).label("denied"),
+    ).filter(
+        BookAccessRollup.granularity == granularity,
+        BookAccessRollup.bucket_start >= since,
+    )
+    if book_id is not None:
+        query = query.filter(BookAccessRollup.book_id == book_id)
+    rows = query.group_by(BookAccessRollup.bucket_start).order_by(BookAccessRollup.bucket_start).all()
+    return {"granularity": granularity, "since": since, "rows": rows}
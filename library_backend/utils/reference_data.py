@@ -0,0 +1,59 @@
+# file: utils/reference_data.py
+"""
+Reference-data bundle: languages, categories, subcategories, locations.
+
+Ye chhoti lookup tables har form / admin page par chahiye hoti hain aur bahut
+kam badalti hain. Poora bundle ek baar render hota hai (JSON bytes + content
+hash), aur in mein se kisi bhi table mein ORM write commit hote hi
+`reference_cache.bump()` ho jata hai (`invalidate_on_commit`) - is liye koi
+controller bump karna bhool nahi sakta.
+"""
+import hashlib
+import json
+from typing import Tuple
+
+from sqlalchemy.orm import Session
+
+from models.book_model import Category, Subcategory
+from models.language_model import Language
+from models.location_model import Location
+from utils.cache import VersionedCache, invalidate_on_commit, on_primary
+
+reference_cache = VersionedCache("reference_data", max_age=600)
+invalidate_on_commit(reference_cache, {Language: None, Category: None, Subcategory: None, Location: None})
+
+
+def build_bundle(db: Session) -> dict:
+    """Charon tables, id order mein (stable hash ke liye). Soft-deleted categories skip."""
+    return {
+        "languages": [
+            {"id": l.id, "name": l.name, "code": l.code, "description": l.description}
+            for l in db.query(Language).order_by(Language.id)
+        ],
+        "categories": [
+            {"id": c.id, "name": c.name, "description": c.description}
+            for c in db.query(Category).filter(Category.deleted_at.is_(None)).order_by(Category.id)
+        ],
+        "subcategories": [
+            {"id": s.id, "name": s.name, "description": s.description, "category_id": s.category_id}
+            for s in db.query(Subcategory).filter(Subcategory.deleted_at.is_(None)).order_by(Subcategory.id)
+        ],
+        "locations": [
+            {"id": l.id, "name": l.name, "rack": l.rack, "shelf": l.shelf}
+            for l in db.query(Location).order_by(Location.id)
+        ],
+    }
+
+
+def render_bundle(bundle: dict) -> Tuple[bytes, str]:
+    """(body bytes, version) - version = data ka content hash (ETag bhi yahi)."""
+    canonical = json.dumps(bundle, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+    version = hashlib.sha256(canonical).hexdigest()[:16]
+    body = json.dumps({"version": version, **bundle}, separators=(",", ":"), ensure_ascii=False).encode()
+    return body, version
+
+
+def get_bundle() -> Tuple[bytes, str]:
+    """Cached (body, version); rebuild primary par (bump ke turant baad replica lag mein ho sakti hai)."""
+    return reference_cache.get("bundle", on_primary(lambda db: render_bundle(build_bundle(db))))
+
@@ -0,0 +1,124 @@
+# file: utils/replica_routing.py
+"""
+Read-your-writes middleware for replica routing.
+
+- Write request (POST/PUT/PATCH/DELETE): poori request primary par.
+- Kamyab write ke baad `sticky_seconds` tak usi user ki reads bhi primary par:
+  browser ke liye `db_pin` cookie, aur bearer-token clients ke liye token-hash
+  pin (cookie cross-site requests mein nahi aati).
+- Token pins `<state_dir>/<token hash>` files hain (mtime = expiry), is liye
+  `gunicorn -w N` ke sab workers dekhte hain - write ek worker par, agli read
+  doosre par ho tab bhi primary. Read par sirf ek `stat()`.
+  Limit: shared disk na ho (alag machines) to pin sirf cookie se; bina cookie
+  wala client doosri machine par `sticky_seconds` tak replica lag dekh sakta hai.
+"""
+import hashlib
+import math
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+import database
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+PIN_COOKIE = "db_pin"
+_PRUNE_EVERY = 500
+
+
+class _RecentWriters:
+    """Token hash -> pin expiry, sab workers ke liye: file ka mtime = expiry."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._writes = 0
+
+    def add(self, key: Optional[str], expires_at: float):
+        if not key:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / key
+        path.touch()
+        os.utime(path, (expires_at, expires_at))
+        self._writes += 1
+        if self._writes % _PRUNE_EVERY == 0:
+            self._prune()
+
+    def active(self, key: Optional[str]) -> bool:
+        if not key:
+            return False
+        try:
+            return (self.directory / key).stat().st_mtime > time.time()
+        except FileNotFoundError:
+            return False
+
+    def _prune(self):
+        """Expired pins hatao (directory tokens ki tadaad se na barhe)."""
+        now = time.time()
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.stat().st_mtime <= now:
+                        os.remove(entry.path)
+                except FileNotFoundError:
+                    pass  # Doosre worker ne pehle hi hata di
+
+
+def _token_key(authorization: Optional[str]) -> Optional[str]:
+    if not authorization:
+        return None
+    return hashlib.sha256(authorization.encode()).hexdigest()[:24]
+
+
+def _cookie_pinned(cookie_header: Optional[str]) -> bool:
+    if not cookie_header:
+        return False
+    for part in cookie_header.split(";"):
+        name, _, value = part.strip().partition("=")
+        if name == PIN_COOKIE:
+            try:
+                return float(value) > time.time()
+            except ValueError:
+                return False
+    return False
+
+
+class ReadYourWritesMiddleware:
+    """Pure ASGI middleware (BaseHTTPMiddleware se halka, streaming bhi safe)."""
+
+    def __init__(self, app, state_dir: Path, sticky_seconds: float = 5.0):
+        self.app = app
+        self.sticky_seconds = sticky_seconds
+        self.recent = _RecentWriters(state_dir)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        is_write = scope["method"] not in SAFE_METHODS
+        token_key = _token_key(headers.get("authorization"))
+        pinned = is_write or _cookie_pinned(headers.get("cookie")) or self.recent.active(token_key)
+
+        async def send_wrapper(message):
+            if is_write and message["type"] == "http.response.start" and message["status"] < 400:
+                expires_at = time.time() + self.sticky_seconds
+                self.recent.add(token_key, expires_at)
+                secure = scope.get("scheme") == "https"
+                cookie = (
+                    f"{PIN_COOKIE}={expires_at:.0f}; Max-Age={math.ceil(self.sticky_seconds)}; Path=/; HttpOnly; "
+                    + ("SameSite=None; Secure" if secure else "SameSite=Lax")
+                )
+                MutableHeaders(scope=message).append("set-cookie", cookie)
+            await send(message)
+
+        # Sync endpoints threadpool mein chalte hain; anyio context copy karta hai,
+        # is liye ye value get_read_db tak pohanchti hai.
+        context_token = database.read_from_primary.set(pinned)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            database.read_from_primary.reset(context_token)
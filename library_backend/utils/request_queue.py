@@ -0,0 +1,49 @@
+# file: utils/request_queue.py
+"""
+Admin review queues (upload requests, borrow requests, restricted access
+requests) ke shared helpers: page limits, status-wise badge counts aur
+batch review (set-based UPDATEs).
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+
+QUEUE_DEFAULT_LIMIT = 50
+QUEUE_MAX_LIMIT = 200
+
+
+def status_summary(db: Session, status_col) -> dict:
+    """Badge numbers: ek GROUP BY, (status, created_at) index se index-only scan."""
+    counts = {row_status: n for row_status, n in db.query(status_col, func.count()).group_by(status_col)}
+    return {"total": sum(counts.values()), "counts": counts}
+
+
+# ==================================
+# 📦 BATCH REVIEW
+# ==================================
+
+def latest_per_id(items: Iterable) -> dict:
+    """Ek id do baar aaye to aakhri decision (input order preserve)."""
+    return {item.id: item for item in items}
+
+
+def batch_result(request_id: int, status: Optional[str] = None, detail: Optional[str] = None) -> dict:
+    return {"id": request_id, "ok": detail is None, "status": status, "detail": detail}
+
+
+def apply_grouped_updates(db: Session, model, groups: Dict[tuple, List[int]], columns: Sequence[str], **common):
+    """
+    Same decision wale ids ek UPDATE ... WHERE id IN (...) mein: 500 approvals
+    = 1 statement (har distinct (status, remarks) par ek), na ke 500 round trips.
+    """
+    for values, ids in groups.items():
+        db.execute(
+            update(model).where(model.id.in_(ids)).values(**dict(zip(columns, values)), **common)
+            .execution_options(synchronize_session=False)
+        )
+
+
+def batch_summary(results: List[dict]) -> dict:
+    updated = sum(1 for r in results if r["ok"])
+    return {"updated": updated, "failed": len(results) - updated, "results": results}
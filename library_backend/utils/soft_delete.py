@@ -0,0 +1,128 @@
+# file: utils/soft_delete.py
+"""
+Soft delete: global active-row filter + purge job.
+
+- Jis model mein `deleted_at` column hai (Book, Category, Subcategory,
+  BookCopy, User, Role, Permission), us par har ORM SELECT mein
+  `deleted_at IS NULL` khud lag jata hai (`with_loader_criteria`). Controllers
+  ke purane haath se likhe filters redundant hain, par nuksan nahi karte.
+- Filter sirf un entities par lagta hai jo query mein select ho rahi hain
+  (aur unke joins). Relationship lazy/selectin loads aur refresh par nahi -
+  purane linked rows (e.g. deleted book wali upload request) pehle jaise dikhte hain.
+- Bypass (admin / purge): `query.execution_options(include_deleted=True)`.
+- `purge_deleted()`: N din se purane soft-deleted rows batches mein hard delete
+  (`scripts/purge_deleted.py`).
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, event, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, with_loader_criteria
+
+from database import Base
+
+INCLUDE_DELETED = "include_deleted"
+PURGE_BATCH_SIZE = 500
+
+
+_models_cache: Dict[int, List[type]] = {}
+
+
+def soft_delete_models() -> List[type]:
+    """`deleted_at` wale mapped models, parent se pehle child (FK order)."""
+    mappers = Base.registry.mappers
+    cached = _models_cache.get(len(mappers))
+    if cached is None:
+        by_table = {m.local_table: m.class_ for m in mappers if "deleted_at" in m.columns}
+        cached = [by_table[t] for t in reversed(Base.metadata.sorted_tables) if t in by_table]
+        _models_cache.clear()
+        _models_cache[len(mappers)] = cached
+    return cached
+
+
+def _active(cls):
+    return cls.deleted_at.is_(None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _filter_deleted_rows(orm_execute_state):
+    if (
+        not orm_execute_state.is_select
+        or orm_execute_state.is_column_load
+        or orm_execute_state.is_relationship_load
+        or orm_execute_state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        return
+    # Top-level entities na hon (e.g. Query.count() = SELECT count(*) FROM (subquery))
+    # to saare soft-delete models par criteria - subquery ke andar lag jata hai.
+    mappers = orm_execute_state.all_mappers or [m.__mapper__ for m in soft_delete_models()]
+    options = [
+        with_loader_criteria(mapper.class_, _active, include_aliases=True, propagate_to_loaders=False)
+        for mapper in mappers
+        if "deleted_at" in mapper.columns
+    ]
+    if options:
+        orm_execute_state.statement = orm_execute_state.statement.options(*options)
+
+
+# ==================================
+# 🧹 PURGE (hard delete after retention)
+# ==================================
+
+def _delete_ids(db: Session, model, ids: List[int]) -> int:
+    """
+    Poora batch ek statement mein; FK (e.g. copies / logs) ki wajah se fail ho
+    to row-by-row, aur jo rows abhi bhi referenced hain unhe skip.
+    """
+    pk = model.__mapper__.primary_key[0]
+    try:
+        with db.begin_nested():
+            db.execute(delete(model).where(pk.in_(ids)).execution_options(synchronize_session=False))
+        return len(ids)
+    except IntegrityError:
+        pass
+
+    deleted = 0
+    for row_id in ids:
+        try:
+            with db.begin_nested():
+                db.execute(delete(model).where(pk == row_id).execution_options(synchronize_session=False))
+            deleted += 1
+        except IntegrityError:
+            continue
+    return deleted
+
+
+def purge_deleted(db: Session, older_than_days: int, batch_size: int = PURGE_BATCH_SIZE,
+                  dry_run: bool = False, now: Optional[datetime] = None) -> Dict[str, dict]:
+    """
+    `deleted_at < now - older_than_days` wale rows hard delete. Har batch
+    alag transaction (lambe locks nahi). Returns {table: {"found", "deleted"}}.
+    """
+    cutoff = (now or datetime.utcnow()) - timedelta(days=older_than_days)
+    report = {}
+
+    for model in soft_delete_models():
+        pk = model.__mapper__.primary_key[0]
+        found = deleted = 0
+        last_id = None
+
+        while True:
+            stmt = select(pk).where(model.deleted_at < cutoff).order_by(pk).limit(batch_size)
+            if last_id is not None:
+                stmt = stmt.where(pk > last_id)
+            ids = list(db.execute(stmt.execution_options(**{INCLUDE_DELETED: True})).scalars())
+            if not ids:
+                break
+
+            found += len(ids)
+            last_id = ids[-1]
+            if not dry_run:
+                deleted += _delete_ids(db, model, ids)
+                db.commit()
+            if len(ids) < batch_size:
+                break
+
+        report[model.__tablename__] = {"found": found, "deleted": deleted}
+    return report
@@ -0,0 +1,75 @@
+# file: utils/static_files.py
+"""
+StaticFiles variants with cache headers.
+
+Content-addressed files (jin ka URL content hash se banta hai, jaise
+/static/catalog/page-0.<hash>.json) kabhi nahi badalte, is liye browser/CDN unhe
+ek saal tak bina revalidate kiye cache kar sakte hain.
+"""
+import mimetypes
+
+from fastapi.staticfiles import StaticFiles
+from starlette.exceptions import HTTPException
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Har build par badalne wali index files (catalog manifest): CDN thodi der rakhe
+SHORT_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    `<file>.br` / `<file>.gz` pehle se disk par hon aur browser ka
+    Accept-Encoding allow kare to wahi file (Content-Encoding ke saath) serve
+    hoti hai - request par compression nahi. Content-hashed files immutable;
+    `short_cache` wale naam (e.g. manifest.json) sirf thodi der cache hote hain.
+    """
+
+    ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+    def __init__(self, *args, short_cache=("manifest.json",), short_cache_control=SHORT_CACHE_CONTROL, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.short_cache = set(short_cache)
+        self.short_cache_control = short_cache_control
+
+    async def get_response(self, path: str, scope):
+        accepted = _accepted_encodings(scope)
+        response = None
+        for encoding, suffix in self.ENCODINGS:
+            if encoding not in accepted:
+                continue
+            try:
+                response = await super().get_response(path + suffix, scope)
+            except HTTPException:
+                continue
+            if response.status_code in (200, 304):
+                response.headers["Content-Encoding"] = encoding
+                response.headers["Content-Type"] = _media_type(path)
+                break
+            response = None
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        response.headers["Vary"] = "Accept-Encoding"
+        if response.status_code in (200, 304):
+            short = path.rsplit("/", 1)[-1] in self.short_cache
+            response.headers["Cache-Control"] = self.short_cache_control if short else IMMUTABLE_CACHE_CONTROL
+        return response
+
+
+def _accepted_encodings(scope) -> set:
+    for key, value in scope.get("headers", ()):
+        if key == b"accept-encoding":
+            accepted = set()
+            for part in value.decode("latin-1").lower().split(","):
+                name, _, params = part.partition(";")
+                if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                    accepted.add(name.strip())
+            return accepted
+    return set()
+
+
+def _media_type(path: str) -> str:
+    media_type, _ = mimetypes.guess_type(path)
+    if media_type is None:
+        return "application/octet-stream"
+    return media_type + "; charset=utf-8" if media_type.endswith("json") or media_type.startswith("text/") else media_type
@@ -1,35 +1,46 @@
-import os
+import logging
 import uuid
-from supabase import create_client, Client
+from functools import lru_cache
+
 from fastapi import UploadFile
-from dotenv import load_dotenv
 
-# Environment Variables Load karein
-load_dotenv()
+from config import get_settings
+from utils.pdf_storage import linearize_pdf
+
+logger = logging.getLogger(__name__)
+
 
-# Supabase Client Init
-url: str = os.environ.get("SUPABASE_URL")
-key: str = os.environ.get("SUPABASE_KEY")
+@lru_cache(maxsize=1)
+def get_supabase():
+    """
+    Supabase client pehli upload par banta hai (import par nahi), taake
+    worker boot tez rahe aur tests ko network client na chahiye ho.
+    """
+    settings = get_settings()
+
+    # Safety Check
+    if not settings.supabase_url or not settings.supabase_key:
+        logger.error("SUPABASE_URL or SUPABASE_KEY is missing in .env")
+        return None
+
+    from supabase import create_client
+    return create_client(settings.supabase_url, settings.supabase_key)
 
-# Safety Check
-if not url or not key:
-    print("❌ Error: SUPABASE_URL or SUPABASE_KEY is missing in .env")
-    supabase = None
-else:
-    supabase: Client = create_client(url, key)
 
 def upload_pdf_to_supabase(file: UploadFile, bucket_name="library_db"):
     """
     Uploads PDF to Supabase Storage (Bucket: library_db) and returns Public URL.
     """
-    if not file or not supabase:
+    if not file:
         return None
 
-    try:
-        print(f"🚀 Uploading to Supabase: {file.filename}")
+    supabase = get_supabase()
+    if not supabase:
+        return None
 
+    try:
         if not file.filename.lower().endswith(".pdf"):
-            print("❌ Only PDF files allowed")
+            logger.warning("Supabase upload rejected: not a PDF", extra={"upload_file": file.filename})
             return None
                 
 
@@ -39,6 +50,8 @@ def upload_pdf_to_supabase(file: UploadFile, bucket_name="library_db"):
         # 2. File content read karein
         file.file.seek(0)
         file_content = file.file.read()
+        # 2b. Linearize (fast web view) - proxy se pehla page jaldi khulta hai
+        file_content = linearize_pdf(file_content)
         
         # 3. Upload to Supabase
         # Note: Bucket name wahi hona chahiye jo aapne dashboard par banaya hai (library_db)
@@ -51,9 +64,9 @@ def upload_pdf_to_supabase(file: UploadFile, bucket_name="library_db"):
         # 4. Get Public URL
         public_url = supabase.storage.from_(bucket_name).get_public_url(unique_filename)
         
-        print(f"✅ Supabase Upload Success: {public_url}")
+        logger.info("Supabase upload done", extra={"upload_file": file.filename, "url": public_url})
         return public_url
 
-    except Exception as e:
-        print(f"❌ Supabase Error: {e}")
+    except Exception:
+        logger.exception("Supabase upload error", extra={"upload_file": file.filename})
         return None
\ No newline at end of file
@@ -0,0 +1,63 @@
+# file: utils/text_extraction.py
+"""
+Per-page text extraction (process pool workers ke andar chalta hai).
+
+Is module mein DB/FastAPI imports nahi hain taake worker process halka rahe.
+Har call sirf `start..stop` pages nikalti hai: 1000 page ki book bhi chhote
+batches mein index hoti hai aur beech mein ruk kar resume ho sakti hai.
+"""
+import re
+from typing import List, Tuple
+
+TXT_PAGE_CHARS = 3000
+_WHITESPACE = re.compile(r"[ \t\r\f\v]+")
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+
+
+def clean_text(text: str) -> str:
+    # Postgres TEXT mein NUL byte allowed nahi
+    text = (text or "").replace("\x00", " ")
+    text = _WHITESPACE.sub(" ", text)
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+def extract_pdf_pages(path: str, start: int, stop: int) -> Tuple[int, List[Tuple[int, str]]]:
+    """0-based [start, stop) pages -> (total_pages, [(page_number 1-based, text)])."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(path)
+    total = len(reader.pages)
+    pages = []
+    for index in range(start, min(stop, total)):
+        try:
+            text = reader.pages[index].extract_text() or ""
+        except Exception:
+            text = ""  # Ek kharab page poori book ko fail na kare
+        pages.append((index + 1, clean_text(text)))
+    return total, pages
+
+
+def split_txt_pages(text: str) -> List[str]:
+    """Form feed ho to wahi page break, warna ~3000 chars ke pages (line boundary par)."""
+    if "\f" in text:
+        return text.split("\f")
+    pages, current, size = [], [], 0
+    for line in text.splitlines(keepends=True):
+        if size + len(line) > TXT_PAGE_CHARS and current:
+            pages.append("".join(current))
+            current, size = [], 0
+        current.append(line)
+        size += len(line)
+    if current:
+        pages.append("".join(current))
+    return pages
+
+
+def extract_txt_pages(path: str, start: int, stop: int) -> Tuple[int, List[Tuple[int, str]]]:
+    with open(path, "rb") as f:
+        text = f.read().decode("utf-8", errors="replace")
+    pages = split_txt_pages(text)
+    return len(pages), [(i + 1, clean_text(pages[i])) for i in range(start, min(stop, len(pages)))]
+
+
+EXTRACTORS = {"pdf": extract_pdf_pages, "txt": extract_txt_pages}
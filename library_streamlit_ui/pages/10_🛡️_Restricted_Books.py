@@ -1,8 +1,7 @@
 # file: pages/10_🛡️_Restricted_Books.py
 import streamlit as st
 import pandas as pd
-import requests
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from services.api_client import get_data, post_data, get_many, api_request
 
 st.set_page_config(layout="wide", page_title="Restricted Book Permissions")
 if not st.session_state.get("is_authenticated", False): st.error("Please log in."); st.stop()
@@ -12,9 +11,9 @@ st.info("Grant specific users or roles permission to view books marked as 'Restr
 # --- Data Fetching ---
 @st.cache_data(ttl=30)
 def load_data():
-    all_books, b_err = get_data("/api/books/?approved_only=true")
-    users, u_err = get_data("/api/users/")
-    roles, r_err = get_data("/api/users/roles/")
+    (all_books, b_err), (users, u_err), (roles, r_err) = get_many(
+        "/api/books/?approved_only=true", "/api/users/", "/api/users/roles/"
+    )
     return all_books, b_err, users, u_err, roles, r_err
 
 all_books, b_err, users, u_err, roles, r_err = load_data()
@@ -79,7 +78,7 @@ if selected_book_display:
                 perm_desc = row['Assigned To']
                 if st.button(f"Revoke from: {perm_desc}", key=f"revoke_{perm_id}", use_container_width=True):
                     with st.spinner("Revoking..."):
-                        response = requests.delete(f"{BASE_URL}/api/book-permissions/{perm_id}", headers=get_auth_headers())
+                        response = api_request("DELETE", f"/api/book-permissions/{perm_id}")
                         if response.ok:
                             st.success("Permission revoked!"); st.cache_data.clear(); st.rerun()
                         else: st.error(f"Failed: {response.json().get('detail')}")
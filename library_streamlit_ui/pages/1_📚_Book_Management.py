@@ -1,8 +1,8 @@
  # file: pages/1_📚_Book_Management.py
 import streamlit as st
 import pandas as pd
-import requests
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from services.api_client import get_data, post_data, api_request
+from services.pagination import cursor_page, search_options
 
 # Page ka configuration set karein
 st.set_page_config(layout="wide", page_title="Book Management")
@@ -15,16 +15,17 @@ if not st.session_state.get("is_authenticated", False):
 st.title("📚 Book Management")
 
 # --- Data Fetching (with Caching) ---
+# Books poori list mein nahi aati: tables / selectors server se page-by-page (services/pagination)
 @st.cache_data(ttl=60)
 def load_all_data():
-    books, b_err = get_data("/api/books/?approved_only=false")
-    languages, l_err = get_data("/api/languages/")
-    subcategories, s_err = get_data("/api/subcategories/")
-    return books, b_err, languages, l_err, subcategories, s_err
+    # Languages + subcategories ek hi cached bundle se (do alag requests nahi)
+    ref, r_err = get_data("/api/reference-data/")
+    ref = ref or {}
+    return ref.get("languages"), r_err, ref.get("subcategories"), r_err
 
-books, b_err, languages, l_err, subcategories, s_err = load_all_data()
+languages, l_err, subcategories, s_err = load_all_data()
 
-if b_err or l_err or s_err:
+if l_err or s_err:
     st.error("Could not load necessary data. Please check the API and refresh."); st.stop()
 
 # --- Tabs for Different Actions ---
@@ -38,23 +39,15 @@ with tab1:
     if st.button("Refresh Book List"):
         st.cache_data.clear(); st.rerun()
 
-    if books:
-        search_query = st.text_input("Search by Title, Author, or ISBN", placeholder="Type here to search...")
-        
+    search_query = st.text_input("Search by Title, Author, or ISBN", placeholder="Type here to search...")
+    # Search server par (DB filter), table mein sirf current page
+    books, b_err = cursor_page("books", "/api/books/browse", {"search": search_query})
+
+    if b_err:
+        st.error(f"Could not load books: {b_err}")
+    elif books:
         df = pd.DataFrame(books)
-        
-        # Search functionality
-        if search_query:
-            mask = (
-                df['title'].str.contains(search_query, case=False, na=False) |
-                df['author'].str.contains(search_query, case=False, na=False) |
-                df['isbn'].str.contains(search_query, case=False, na=False)
-            )
-            df_search = df[mask]
-        else:
-            df_search = df
-
-        st.dataframe(df_search[['id', 'title', 'author', 'isbn', 'is_approved', 'is_restricted']], use_container_width=True, hide_index=True)
+        st.dataframe(df[['id', 'title', 'author', 'isbn', 'is_approved', 'is_restricted']], use_container_width=True, hide_index=True)
     else:
         st.info("No books found in the library.")
 
@@ -70,7 +63,7 @@ with tab2:
         files = {'file': (uploaded_file.name, uploaded_file, uploaded_file.type)}
         with st.spinner('Uploading image...'):
             try:
-                response = requests.post(f"{BASE_URL}/api/upload/image", files=files, headers=get_auth_headers())
+                response = api_request("POST", "/api/upload/image", files=files)
                 response.raise_for_status()
                 st.session_state.cover_image_url = response.json().get('url')
                 st.success("Image uploaded!"); st.image(uploaded_file, width=200)
@@ -118,10 +111,14 @@ with tab2:
 # --- TAB 3: EDIT / DELETE BOOK (Naya Hissa) ---
 with tab3:
     st.header("Edit or Delete a Book")
-    if not books:
+    edit_query = st.text_input("Find a book (Title, Author, or ISBN)", key="edit_book_search")
+    matches, m_err = search_options("/api/books/browse", {"search": edit_query})
+    if m_err:
+        st.error(f"Could not load books: {m_err}")
+    elif not matches:
         st.info("No books to edit or delete.")
     else:
-        book_map = {f"{b['title']} (ID: {b['id']})": b for b in books}
+        book_map = {f"{b['title']} (ID: {b['id']})": b for b in matches}
         selected_book_display = st.selectbox("Select a Book to Modify", options=book_map.keys(), index=None)
 
         if selected_book_display:
@@ -148,7 +145,7 @@ with tab3:
                         "is_restricted": is_restricted
                     }
                     with st.spinner("Saving..."):
-                        response = requests.put(f"{BASE_URL}/api/books/{selected_book['id']}", json=update_data, headers=get_auth_headers())
+                        response = api_request("PUT", f"/api/books/{selected_book['id']}", json=update_data)
                         if response.ok:
                             st.success("Book updated!"); st.cache_data.clear(); st.rerun()
                         else: st.error(f"Update failed: {response.json().get('detail')}")
@@ -160,7 +157,7 @@ with tab3:
                 st.error("Warning: This will permanently soft-delete the book.")
                 if st.button("DELETE This Book Permanently", type="primary"):
                     with st.spinner("Deleting..."):
-                        response = requests.delete(f"{BASE_URL}/api/books/{selected_book['id']}", headers=get_auth_headers())
+                        response = api_request("DELETE", f"/api/books/{selected_book['id']}")
                         if response.status_code == 204:
                             st.success("Book deleted!"); st.cache_data.clear(); st.rerun()
                         else: st.error(f"Deletion failed: {response.json().get('detail')}")
\ No newline at end of file
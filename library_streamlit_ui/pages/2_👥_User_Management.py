@@ -1,8 +1,8 @@
 # file: pages/2_👥_User_Management.py
 import streamlit as st
 import pandas as pd
-import requests
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from services.api_client import get_data, post_data
+from services.pagination import cursor_page, search_options
 
 # Page ka configuration set karein
 st.set_page_config(layout="wide", page_title="User Management")
@@ -14,15 +14,15 @@ if not st.session_state.get("is_authenticated", False):
 st.title("👥 User & Role Management")
 
 # --- Data Fetching (with Caching) ---
+# Users poori list mein nahi aate: table / selector server se page-by-page (services/pagination)
 @st.cache_data(ttl=60)
 def load_data():
-    users, u_err = get_data("/api/users/")
     roles, r_err = get_data("/api/users/roles/")
-    return users, u_err, roles, r_err
+    return roles, r_err
 
-users, user_error, roles, role_error = load_data()
+roles, role_error = load_data()
 
-if user_error or role_error:
+if role_error:
     st.error("Could not load initial data. Please check API connection and permissions."); st.stop()
 
 # --- Naya Layout: 3 TABS ---
@@ -35,29 +35,25 @@ with tab1:
     if st.button("Refresh User List"):
         st.cache_data.clear(); st.rerun()
 
-    if users:
-        search_query = st.text_input("Search by Name, Username, or Email", placeholder="Type here to search...")
-        
+    search_query = st.text_input("Search by Name, Username, or Email", placeholder="Type here to search...")
+    users, user_error = cursor_page("users", "/api/users/", {"search": search_query})
+
+    if user_error:
+        st.error(f"Could not load users: {user_error}")
+    elif users:
         df = pd.DataFrame(users)
-        
-        if search_query:
-            mask = (df['fullName'].str.contains(search_query, case=False, na=False) |
-                    df['username'].str.contains(search_query, case=False, na=False) |
-                    df['email'].str.contains(search_query, case=False, na=False))
-            df_search = df[mask]
-        else:
-            df_search = df
-
-        df_search['role_name'] = df_search['role'].apply(lambda r: r.get('name', 'N/A') if isinstance(r, dict) else 'N/A')
-        st.dataframe(df_search[['id', 'fullName', 'username', 'email', 'role_name', 'status']], use_container_width=True, hide_index=True)
+        df['role_name'] = df['role'].apply(lambda r: r.get('name', 'N/A') if isinstance(r, dict) else 'N/A')
+        st.dataframe(df[['id', 'fullName', 'username', 'email', 'role_name', 'status']], use_container_width=True, hide_index=True)
     else:
         st.info("No users found.")
     
     # Inline Edit/Delete Section
     st.divider()
     st.subheader("Modify a User")
-    if users:
-        user_map = {f"{u['username']} (ID: {u['id']})": u for u in users}
+    modify_query = st.text_input("Find a user (Name, Username, or Email)", key="modify_user_search")
+    matches, _ = search_options("/api/users/", {"search": modify_query})
+    if matches:
+        user_map = {f"{u['username']} (ID: {u['id']})": u for u in matches}
         selected_user_display = st.selectbox("Select a User to Modify", options=user_map.keys(), index=None)
 
         if selected_user_display:
@@ -1,8 +1,7 @@
 # file: pages/3_🗂️_Category_Management.py
 import streamlit as st
 import pandas as pd
-import requests
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from services.api_client import post_data, get_many, api_request
 
 st.set_page_config(layout="wide", page_title="Category Management")
 if not st.session_state.get("is_authenticated", False): st.error("Please log in."); st.stop()
@@ -10,8 +9,7 @@ st.title("🗂️ Category & Subcategory Management")
 
 @st.cache_data(ttl=30)
 def load_data():
-    cats, c_err = get_data("/api/categories/")
-    subcats, s_err = get_data("/api/subcategories/")
+    (cats, c_err), (subcats, s_err) = get_many("/api/categories/", "/api/subcategories/")
     return cats, c_err, subcats, s_err
 
 categories, cat_error, subcategories, sub_error = load_data()
@@ -41,7 +39,7 @@ with tab1:
                 c1.write(f"**{cat['name']}** (ID: {cat['id']})")
                 if c2.button("Edit", key=f"edit_cat_{cat['id']}"): st.session_state.editing_id = f"cat_{cat['id']}"
                 if c3.button("Delete", key=f"del_cat_{cat['id']}", type="primary"):
-                    response = requests.delete(f"{BASE_URL}/api/categories/{cat['id']}", headers=get_auth_headers())
+                    response = api_request("DELETE", f"/api/categories/{cat['id']}")
                     if response.ok: st.success("Deleted!"); st.cache_data.clear(); st.rerun()
                     else: st.error(f"Failed: {response.json().get('detail')}")
 
@@ -51,7 +49,7 @@ with tab1:
                         new_desc = st.text_area("New Desc", value=cat.get('description', ''))
                         if st.form_submit_button("Save"):
                             data = {"name": new_name, "description": new_desc}
-                            response = requests.put(f"{BASE_URL}/api/categories/{cat['id']}", json=data, headers=get_auth_headers())
+                            response = api_request("PUT", f"/api/categories/{cat['id']}", json=data)
                             if response.ok: st.success("Updated!"); del st.session_state.editing_id; st.cache_data.clear(); st.rerun()
                             else: st.error(f"Failed: {response.json().get('detail')}")
 
@@ -84,7 +82,7 @@ with tab2:
                 c1.write(f"**{sub['name']}** in *{sub.get('category', {}).get('name', 'N/A')}* (ID: {sub['id']})")
                 if c2.button("Edit", key=f"edit_sub_{sub['id']}"): st.session_state.editing_id = f"sub_{sub['id']}"
                 if c3.button("Delete", key=f"del_sub_{sub['id']}", type="primary"):
-                    response = requests.delete(f"{BASE_URL}/api/subcategories/{sub['id']}", headers=get_auth_headers())
+                    response = api_request("DELETE", f"/api/subcategories/{sub['id']}")
                     if response.ok: st.success("Deleted!"); st.cache_data.clear(); st.rerun()
                     else: st.error(f"Failed: {response.json().get('detail')}")
 
@@ -102,6 +100,6 @@ with tab2:
 
                         if st.form_submit_button("Save"):
                             data = {"name": new_sub_name, "description": new_sub_desc, "category_id": cat_map[new_parent_name]}
-                            response = requests.put(f"{BASE_URL}/api/subcategories/{sub['id']}", json=data, headers=get_auth_headers())
+                            response = api_request("PUT", f"/api/subcategories/{sub['id']}", json=data)
                             if response.ok: st.success("Updated!"); del st.session_state.editing_id; st.cache_data.clear(); st.rerun()
                             else: st.error(f"Failed: {response.json().get('detail')}")
\ No newline at end of file
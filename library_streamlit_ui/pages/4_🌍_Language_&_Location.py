@@ -1,8 +1,7 @@
 # file: pages/4_🌍_Language_&_Location.py
 import streamlit as st
 import pandas as pd
-import requests
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from services.api_client import post_data, get_many
 
 st.set_page_config(layout="wide", page_title="Settings")
 if not st.session_state.get("is_authenticated", False): st.error("Please log in."); st.stop()
@@ -10,8 +9,7 @@ st.title("🌍 Languages & Locations")
 
 @st.cache_data(ttl=60)
 def load_data():
-    langs, l_err = get_data("/api/languages/")
-    locs, loc_err = get_data("/api/locations/")
+    (langs, l_err), (locs, loc_err) = get_many("/api/languages/", "/api/locations/")
     return langs, l_err, locs, loc_err
 
 languages, lang_error, locations, loc_error = load_data()
@@ -1,8 +1,7 @@
 # file: pages/5_🔑_Permission_Management.py
 import streamlit as st
 import pandas as pd
-import requests
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from services.api_client import get_data, post_data, get_many
 
 st.set_page_config(layout="wide", page_title="Permission Management")
 if not st.session_state.get("is_authenticated", False): st.error("Please log in."); st.stop()
@@ -10,8 +9,7 @@ st.title("🔑 Role & Permission Management")
 
 @st.cache_data(ttl=30)
 def load_data():
-    roles, r_err = get_data("/api/users/roles/")
-    perms, p_err = get_data("/api/permissions/permissions")
+    (roles, r_err), (perms, p_err) = get_many("/api/users/roles/", "/api/permissions/permissions")
     return roles, r_err, perms, p_err
 
 roles, role_error, permissions, perm_error = load_data()
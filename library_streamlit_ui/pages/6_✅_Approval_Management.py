@@ -1,8 +1,7 @@
 # file: pages/6_✅_Approval_Management.py
 import streamlit as st
 import pandas as pd
-import requests
-from services.api_client import get_data, get_auth_headers, BASE_URL
+from services.api_client import get_data, BASE_URL, api_request
 
 # Page ka configuration set karein
 st.set_page_config(layout="wide", page_title="Approval Management")
@@ -61,7 +60,7 @@ with tab1:
                         if st.button("Approve", key=f"approve_{request['id']}", type="primary", use_container_width=True):
                             with st.spinner("Approving..."):
                                 review_data = {"status": "Approved", "remarks": "Approved via UI"}
-                                response = requests.put(f"{BASE_URL}/api/requests/{request['id']}/review", json=review_data, headers=get_auth_headers())
+                                response = api_request("PUT", f"/api/requests/{request['id']}/review", json=review_data)
                                 if response.ok:
                                     st.success("Book Approved!")
                                     st.cache_data.clear()
@@ -82,7 +81,7 @@ with tab1:
                                 if st.form_submit_button("Confirm Rejection", type="primary"):
                                     with st.spinner("Rejecting..."):
                                         review_data = {"status": "Rejected", "remarks": remarks}
-                                        response = requests.put(f"{BASE_URL}/api/requests/{request['id']}/review", json=review_data, headers=get_auth_headers())
+                                        response = api_request("PUT", f"/api/requests/{request['id']}/review", json=review_data)
                                         if response.ok:
                                             st.warning("Book Rejected!")
                                             del st.session_state.rejecting_id
@@ -1,66 +1,83 @@
 # file: pages/8_📚_Copies_&_Issuing.py
 import streamlit as st
 import pandas as pd
-import requests
 from datetime import datetime, timedelta
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from urllib.parse import quote
+from services.api_client import get_data, post_data, api_request
+from services.pagination import cursor_page, search_options
 
 st.set_page_config(layout="wide", page_title="Copies & Issuing")
 if not st.session_state.get("is_authenticated", False): st.error("Please log in."); st.stop()
 st.title("📚 Book Copies & Issuing System")
 
+# Books / copies / users / issues poori list mein nahi aate: har table aur
+# selector server se filtered page leta hai (services/pagination)
 @st.cache_data(ttl=30)
 def load_data():
-    books, b_err = get_data("/api/books/?approved_only=true")
-    locations, l_err = get_data("/api/locations/")
-    copies, c_err = get_data("/api/copies/")
-    users, u_err = get_data("/api/users/")
-    issues, i_err = get_data("/api/issues/")
-    return books, b_err, locations, l_err, copies, c_err, users, u_err, issues, i_err
+    ref, l_err = get_data("/api/reference-data/")  # Locations cached bundle se
+    return (ref or {}).get("locations"), l_err
 
-books, b_err, locations, l_err, copies, c_err, users, u_err, issues, i_err = load_data()
-if any([b_err, l_err, c_err, u_err, i_err]): st.error("Could not load necessary data."); st.stop()
+locations, l_err = load_data()
+if l_err: st.error("Could not load necessary data."); st.stop()
 
-tab1, tab2, tab3 = st.tabs(["Manage Book Copies", "Issue a Book", "Return a Book"])
+tab1, tab2, tab3, tab4 = st.tabs(["Manage Book Copies", "Issue a Book", "Return a Book", "Holds Queue"])
 
 # --- TAB 1: MANAGE BOOK COPIES ---
 with tab1:
     st.header("Add & View Book Copies")
     with st.expander("➕ Add New Copy"):
+        book_query = st.text_input("Find Book (Title, Author, or ISBN)", key="copy_book_search")
+        books, _ = search_options("/api/books/browse", {"search": book_query, "approved": "true"})
         with st.form("add_copy_form", clear_on_submit=True):
             book_options = {f"{b['title']} (ID: {b['id']})": b['id'] for b in books} if books else {}
             location_options = {f"{l['name']} (ID: {l['id']})": l['id'] for l in locations} if locations else {}
             selected_book_display = st.selectbox("Select Book *", book_options.keys(), index=None)
             selected_location_display = st.selectbox("Select Location *", location_options.keys(), index=None)
+            barcode = st.text_input("Barcode (optional)")
             if st.form_submit_button("Add Copy", type="primary"):
                 if not all([selected_book_display, selected_location_display]):
                     st.warning("Please select a book and a location.")
                 else:
-                    data = {"book_id": book_options[selected_book_display], "location_id": location_options[selected_location_display]}
+                    data = {"book_id": book_options[selected_book_display], "location_id": location_options[selected_location_display], "barcode": barcode.strip() or None}
                     res, err = post_data("/api/copies/", data)
                     if err: st.error(f"Failed: {err}")
                     else: st.success("Copy added!"); st.cache_data.clear(); st.rerun()
 
     st.subheader("All Book Copies")
-    if copies:
-        search_query = st.text_input("Search Copies by Book Title", key="copy_search")
+    search_query = st.text_input("Search Copies by Book Title", key="copy_search")
+    copies, c_err = cursor_page("copies", "/api/copies/", {"search": search_query})
+    if c_err: st.error(f"Could not load copies: {c_err}")
+    elif copies:
         df_copies = pd.DataFrame(copies)
         df_copies['book_title'] = df_copies['book'].apply(lambda x: x.get('title', 'N/A') if x else 'N/A')
         df_copies['location_name'] = df_copies['location'].apply(lambda x: x.get('name', 'N/A') if x else 'N/A')
-        
-        if search_query:
-            df_copies = df_copies[df_copies['book_title'].str.contains(search_query, case=False, na=False)]
-        
-        st.dataframe(df_copies[['id', 'book_title', 'location_name', 'status']], use_container_width=True, hide_index=True)
+        st.dataframe(df_copies[['id', 'barcode', 'book_title', 'location_name', 'status']], use_container_width=True, hide_index=True)
     else: st.info("No book copies found.")
 
 # --- TAB 2: ISSUE A BOOK ---
 with tab2:
     st.header("Issue a Book to a Client")
+    scanned_code = st.text_input("📷 Scan Barcode / Copy ID", key="issue_scan")
+    col_a, col_b = st.columns(2)
+    copy_query = col_a.text_input("Find Available Copy (Book Title)", key="issue_copy_search", disabled=bool(scanned_code.strip()))
+    client_query = col_b.text_input("Find Client (Name, Username, or Email)", key="issue_client_search")
+    if scanned_code.strip():
+        # Scanner: ek indexed lookup (/api/copies/lookup), poori list nahi
+        scanned, s_err = get_data(f"/api/copies/lookup?code={quote(scanned_code.strip())}")
+        available_copies = []
+        if s_err: st.error("No copy found for this barcode / ID.")
+        elif scanned['status'] == "On Hold": st.info(f"Copy ID {scanned['id']} is reserved for a hold - issue it to that member."); available_copies = [scanned]
+        elif scanned['status'] not in ("Available", "New"): st.warning(f"Copy ID {scanned['id']} is not available (Status: {scanned['status']}).")
+        else: available_copies = [scanned]
+    else:
+        available_copies, _ = search_options("/api/copies/", {"search": copy_query, "status": "Available"})
+    # Typeahead: indexed /api/users/search (sirf tab jab kuch type kiya ho)
+    users = []
+    if client_query.strip():
+        users, _ = search_options("/api/users/search", {"q": client_query.strip()}, limit=20)
     with st.form("issue_book_form", clear_on_submit=True):
-        available_copies = [c for c in copies if c.get('status') == 'Available'] if copies else []
-        copy_options = {f"Copy ID: {c['id']} ({c.get('book', {}).get('title', 'N/A')})": c['id'] for c in available_copies}
-        user_options = {f"{u['username']} (ID: {u['id']})": u['id'] for u in users} if users else {}
+        copy_options = {f"Copy ID: {c['id']} ({(c.get('book') or {}).get('title', 'N/A')})": c['id'] for c in available_copies or []}
+        user_options = {f"{u['username']} - {u.get('full_name') or u['email']} (ID: {u['id']})": u['id'] for u in users} if users else {}
         
         selected_copy_display = st.selectbox("Select Available Book Copy *", copy_options.keys(), index=None)
         selected_user_display = st.selectbox("Select Client *", user_options.keys(), index=None)
@@ -78,9 +95,11 @@ with tab2:
 # --- TAB 3: RETURN A BOOK ---
 with tab3:
     st.header("Return an Issued Book")
-    on_loan_books = [b for b in issues if b.get('status') == 'Issued'] if issues else []
+    on_loan_books, i_err = cursor_page("issues", "/api/issues/", {"status": "Issued"})
 
-    if not on_loan_books:
+    if i_err:
+        st.error(f"Could not load issues: {i_err}")
+    elif not on_loan_books:
         st.info("No books are currently on loan.")
     else:
         df_issued = pd.DataFrame(on_loan_books)
@@ -98,7 +117,51 @@ with tab3:
                 st.warning("Please select an issue to return.")
             else:
                 issue_id = return_options[selected_issue_display]
-                response = requests.post(f"{BASE_URL}/api/issues/return/{issue_id}", headers=get_auth_headers())
+                response = api_request("POST", f"/api/issues/return/{issue_id}")
                 if response.ok:
                     st.success("Book returned!"); st.cache_data.clear(); st.rerun()
-                else: st.error(f"Failed: {response.json().get('detail')}")
\ No newline at end of file
+                else: st.error(f"Failed: {response.json().get('detail')}")
+
+# --- TAB 4: HOLDS QUEUE ---
+# Return hote hi copy queue ke agle member ko milti hai (backend utils/holds)
+with tab4:
+    st.header("Reservation Queue")
+    with st.expander("➕ Place Hold for a Member"):
+        col_a, col_b = st.columns(2)
+        hold_book_query = col_a.text_input("Find Book (Title, Author, or ISBN)", key="hold_book_search")
+        hold_client_query = col_b.text_input("Find Client (Name, Username, or Email)", key="hold_client_search")
+        hold_books, _ = search_options("/api/books/browse", {"search": hold_book_query, "approved": "true"})
+        hold_users = []
+        if hold_client_query.strip():
+            hold_users, _ = search_options("/api/users/search", {"q": hold_client_query.strip()}, limit=20)
+        with st.form("place_hold_form", clear_on_submit=True):
+            book_options = {f"{b['title']} (ID: {b['id']})": b['id'] for b in hold_books} if hold_books else {}
+            user_options = {f"{u['username']} - {u.get('full_name') or u['email']} (ID: {u['id']})": u['id'] for u in hold_users} if hold_users else {}
+            selected_book_display = st.selectbox("Select Book *", book_options.keys(), index=None)
+            selected_user_display = st.selectbox("Select Client *", user_options.keys(), index=None)
+            if st.form_submit_button("Place Hold", type="primary"):
+                if not all([selected_book_display, selected_user_display]):
+                    st.warning("Please select both a book and a client.")
+                else:
+                    data = {"book_id": book_options[selected_book_display], "user_id": user_options[selected_user_display]}
+                    res, err = post_data("/api/holds/", data)
+                    if err: st.error(f"Failed: {err}")
+                    else: st.success(f"Hold placed ({res['status']})."); st.cache_data.clear(); st.rerun()
+
+    hold_status = st.selectbox("Status", ["Waiting", "Ready", "Fulfilled", "Expired", "Cancelled"], key="hold_status")
+    holds, h_err = cursor_page("holds", "/api/holds/", {"status": hold_status})
+    if h_err: st.error(f"Could not load holds: {h_err}")
+    elif not holds: st.info("No holds found.")
+    else:
+        df_holds = pd.DataFrame(holds)
+        st.dataframe(df_holds[['id', 'book_id', 'user_id', 'status', 'queue_position', 'copy_id', 'created_at', 'expires_at']], use_container_width=True, hide_index=True)
+        cancel_options = {f"Hold ID: {h['id']} (Book ID: {h['book_id']}, User ID: {h['user_id']})": h['id'] for h in holds if h['status'] in ("Waiting", "Ready")}
+        selected_hold_display = st.selectbox("Select a Hold to Cancel", cancel_options.keys(), index=None)
+        if st.button("Cancel Hold"):
+            if not selected_hold_display:
+                st.warning("Please select a hold to cancel.")
+            else:
+                response = api_request("POST", f"/api/holds/{cancel_options[selected_hold_display]}/cancel")
+                if response.ok:
+                    st.success("Hold cancelled!"); st.cache_data.clear(); st.rerun()
+                else: st.error(f"Failed: {response.json().get('detail')}")
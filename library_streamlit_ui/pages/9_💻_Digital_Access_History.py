@@ -1,9 +1,8 @@
 # file: pages/8_📚_Copies_&_Issuing.py
 import streamlit as st
 import pandas as pd
-import requests
 from datetime import datetime, timedelta
-from services.api_client import get_data, post_data, get_auth_headers, BASE_URL
+from services.api_client import post_data, get_many, api_request
 
 st.set_page_config(layout="wide", page_title="Copies & Issuing")
 if not st.session_state.get("is_authenticated", False): st.error("Please log in."); st.stop()
@@ -11,11 +10,9 @@ st.title("📚 Book Copies & Issuing System")
 
 @st.cache_data(ttl=30)
 def load_data():
-    books, b_err = get_data("/api/books/?approved_only=true")
-    locations, l_err = get_data("/api/locations/")
-    copies, c_err = get_data("/api/copies/")
-    users, u_err = get_data("/api/users/")
-    issues, i_err = get_data("/api/issues/")
+    (books, b_err), (locations, l_err), (copies, c_err), (users, u_err), (issues, i_err) = get_many(
+        "/api/books/?approved_only=true", "/api/locations/", "/api/copies/", "/api/users/", "/api/issues/"
+    )
     return books, b_err, locations, l_err, copies, c_err, users, u_err, issues, i_err
 
 books, b_err, locations, l_err, copies, c_err, users, u_err, issues, i_err = load_data()
@@ -98,7 +95,7 @@ with tab3:
                 st.warning("Please select an issue to return.")
             else:
                 issue_id = return_options[selected_issue_display]
-                response = requests.post(f"{BASE_URL}/api/issues/return/{issue_id}", headers=get_auth_headers())
+                response = api_request("POST", f"/api/issues/return/{issue_id}")
                 if response.ok:
                     st.success("Book returned!"); st.cache_data.clear(); st.rerun()
                 else: st.error(f"Failed: {response.json().get('detail')}")
\ No newline at end of file
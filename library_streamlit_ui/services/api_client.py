@@ -1,33 +1,88 @@
 # file: services/api_client.py
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Aapke FastAPI backend ka URL
 BASE_URL = "http://127.0.0.1:8000"
 
+# (connect, read) seconds - backend down ho to page hamesha ke liye atka na rahe
+TIMEOUT = (3.05, 30)
+# Ek page ek saath kitni requests chala sakta hai (get_many)
+MAX_PARALLEL = 8
+
+
 def get_session_state():
     """Streamlit ke session state ko access karta hai."""
     return st.session_state
 
+
+@st.cache_resource
+def get_http_session():
+    """
+    Poore Streamlit process ka ek shared requests.Session (keep-alive pool):
+    har call par naya TCP/TLS handshake nahi. Auth header yahan nahi lagta -
+    session sab users share karte hain, token har request ke saath jata hai.
+
+    Retry: connection errors aur 502/503/504 par backoff ke saath (0.3s, 0.6s,
+    1.2s). POST retry nahi hota (duplicate create ka khatra), sirf connect fail par.
+    """
+    retry = Retry(
+        total=3,
+        connect=3,
+        read=2,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_PARALLEL * 2, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Accept": "application/json"})
+    return session
+
+
+@st.cache_resource
+def _get_executor():
+    return ThreadPoolExecutor(max_workers=MAX_PARALLEL, thread_name_prefix="api-client")
+
+
+def api_request(method, endpoint, headers=None, **kwargs):
+    """
+    Shared session se request (timeout + retry ke saath). `headers` na diye
+    hon to logged-in user ka auth header. Response object return karta hai.
+    """
+    if headers is None:
+        headers = get_auth_headers()
+    kwargs.setdefault("timeout", TIMEOUT)
+    return get_http_session().request(method, f"{BASE_URL}{endpoint}", headers=headers, **kwargs)
+
+
 def login(username, password):
     """Login karke token haasil karta hai."""
     try:
         # Streamlit me data form-encoded format me bhejna padta hai
-        response = requests.post(
-            f"{BASE_URL}/token",
-            data={"grant_type": "password", "username": username, "password": password}
+        response = api_request(
+            "POST", "/token",
+            data={"grant_type": "password", "username": username, "password": password},
+            headers={}
         )
         response.raise_for_status()  # Agar 4xx/5xx error ho toh exception raise karega
-        
+
         data = response.json()
-        
+
         # Token aur user details ko session state me save karein
         session = get_session_state()
         session.token = data.get("access_token")
         session.role = data.get("role")
         session.username = username
         session.is_authenticated = True
-        
+
         return True, None
     except requests.exceptions.HTTPError as e:
         if e.response.status_code == 401:
@@ -52,24 +107,38 @@ def get_auth_headers():
         return {"Authorization": f"Bearer {token}"}
     return {}
 
-def get_data(endpoint):
-    """Backend se data (GET request) fetch karta hai."""
+def _get(endpoint, headers):
     try:
-        headers = get_auth_headers()
-        response = requests.get(f"{BASE_URL}{endpoint}", headers=headers)
+        response = api_request("GET", endpoint, headers=headers)
         response.raise_for_status()
         return response.json(), None
     except Exception as e:
         return None, str(e)
 
+def get_data(endpoint):
+    """Backend se data (GET request) fetch karta hai."""
+    return _get(endpoint, get_auth_headers())
+
+def get_many(*endpoints):
+    """
+    Kai endpoints ek saath (parallel) fetch karta hai - page load sab calls ka
+    total nahi, sirf sab se slow call jitna. Har endpoint ke liye (data, error),
+    usi order mein:
+
+        (books, b_err), (users, u_err) = get_many("/api/books/", "/api/users/")
+    """
+    # session_state sirf Streamlit ke script thread mein milta hai: headers yahin bana lo
+    headers = get_auth_headers()
+    futures = [_get_executor().submit(_get, endpoint, headers) for endpoint in endpoints]
+    return [future.result() for future in futures]
+
 def post_data(endpoint, data):
     """Backend par data (POST request) bhejta hai."""
     try:
-        headers = get_auth_headers()
-        response = requests.post(f"{BASE_URL}{endpoint}", json=data, headers=headers)
+        response = api_request("POST", endpoint, json=data)
         response.raise_for_status()
         return response.json(), None
     except requests.exceptions.HTTPError as e:
          return None, e.response.json().get('detail', str(e))
     except Exception as e:
-        return None, str(e)
\ No newline at end of file
+        return None, str(e)
@@ -0,0 +1,81 @@
+# file: services/pagination.py
+"""
+Server-side pagination helpers (cursor / X-Next-Cursor) for admin tables.
+
+Backend har page ke saath agle page ka cursor `X-Next-Cursor` header mein
+bhejta hai. Page sirf cursors ka stack (session state) rakhta hai - "Next"
+naya cursor push karta hai, "Previous" pop. Filters badlein to stack reset.
+Har page (endpoint + filters + cursor) alag se cache hota hai, is liye memory
+aur render time table ke size par depend nahi karte.
+"""
+import streamlit as st
+
+from services.api_client import api_request, get_session_state
+
+PAGE_SIZE = 25
+
+
+def _filter_state(filters):
+    """Khali filters hata kar stable, hashable tuple (cache key + reset check)."""
+    return tuple(sorted((k, v) for k, v in (filters or {}).items() if v not in (None, "")))
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_page(endpoint, filter_state, cursor, limit, auth_token):
+    """
+    Ek page: (rows, next_cursor). `auth_token` cache key ka hissa hai - ek
+    user ka page doosre ko na mile. Errors raise hote hain (cache nahi hote).
+    """
+    params = dict(filter_state)
+    params["limit"] = limit
+    if cursor:
+        params["cursor"] = cursor
+    headers = {"Authorization": f"Bearer {auth_token}"} if auth_token else {}
+    response = api_request("GET", endpoint, headers=headers, params=params)
+    response.raise_for_status()
+    return response.json(), response.headers.get("X-Next-Cursor")
+
+
+def cursor_page(key, endpoint, filters=None, limit=PAGE_SIZE):
+    """
+    Current page ki rows + Previous / Next controls render karta hai.
+    Returns (rows, error). `key` har table ke liye unique ho.
+    """
+    state = get_session_state()
+    filter_state = _filter_state(filters)
+    pager_key = f"{key}_pager"
+    pager = state.get(pager_key)
+    if not pager or pager["filters"] != filter_state:
+        pager = {"filters": filter_state, "cursors": [None]}  # cursors[i] = page i+1 ka cursor
+        state[pager_key] = pager
+
+    try:
+        rows, next_cursor = fetch_page(endpoint, filter_state, pager["cursors"][-1], limit, state.get("token"))
+    except Exception as e:
+        return None, str(e)
+
+    page_number = len(pager["cursors"])
+    col1, col2, col3 = st.columns([2, 1, 2])
+    with col1:
+        if st.button("⬅️ Previous Page", key=f"{key}_prev", disabled=page_number <= 1):
+            pager["cursors"].pop()
+            st.rerun()
+    with col2:
+        st.write(f"Page {page_number}")
+    with col3:
+        if st.button("Next Page ➡️", key=f"{key}_next", disabled=not next_cursor):
+            pager["cursors"].append(next_cursor)
+            st.rerun()
+    return rows, None
+
+
+def search_options(endpoint, filters=None, limit=PAGE_SIZE):
+    """
+    Selectbox ke liye pehla page (e.g. search term se milti books / users) -
+    poori list download kiye bina. Returns (rows, error).
+    """
+    try:
+        rows, _ = fetch_page(endpoint, _filter_state(filters), None, limit, get_session_state().get("token"))
+        return rows, None
+    except Exception as e:
+        return None, str(e)